@@ -119,48 +119,74 @@ import re
 import copy
 import os, sys
 import math
+import tempfile
+from collections import deque
 from codecs import BOM_UTF8, BOM_UTF16_BE, BOM_UTF16_LE, BOM_UTF32_BE, BOM_UTF32_LE
-from asteval import Interpreter
-from functools import partial
-aeval=Interpreter(raise_errors=True, show_errors=False)
+import threading
+from asteval import Interpreter, make_symbol_table
+from functools import partial, lru_cache
+from scipy import sparse
+# memory budget (bytes) and directory for weight blocks of full cumomer system (cf. cumo_sys_coo())
+fullsys_maxmem=1<<30
+fullsys_dirtmp=None
 #import pdb
 
 class oset(dict):
+    """Ordered set: a dict with values 1 whose keys keep insertion order.
+    Arguments of set operations are not copied if they are already
+    sets or dicts (used for membership tests only)."""
+    __slots__=()
     def __init__(*args, **kwds):
         self, *args = args
         if len(args) == 1:
-            for k in args[0]:
-                self[k]=1
+            dict.update(self, dict.fromkeys(args[0], 1))
         elif len(args) > 1:
             raise TypeError('expected at most 1 arguments, got %d' % len(args))
     def copy(self):
         tmp=oset()
-        tmp.update(self)
+        dict.update(tmp, self)
         return(tmp)
     def add(self, x):
         self[x]=1
     def difference_update(self, x):
         for k in x:
-            if k in self:
-                del(self[k])
+            self.pop(k, None)
     def difference(self, x):
-        return(self - oset(x))
+        return(self - x)
     def update(self, x):
         if x:
-            for i in x:
-                self[i]=1
+            dict.update(self, dict.fromkeys(x, 1))
     def intersection(self, x):
-        return self & oset(x)
+        return self & x
     def __sub__(self, x):
-        tmp=oset(x)
-        return oset(i for i in self if i not in tmp)
+        tmp=_mset(x)
+        res=oset()
+        dict.update(res, ((i, 1) for i in self if i not in tmp))
+        return res
     def __and__(self, x):
-        tmp=oset(x)
-        return oset(i for i in self if i in tmp)
+        tmp=_mset(x)
+        res=oset()
+        dict.update(res, ((i, 1) for i in self if i in tmp))
+        return res
     def __or__(self, x):
+        # elements of x come first
         tmp=oset(x)
-        tmp.update(self)
+        dict.update(tmp, dict.fromkeys(self, 1))
         return tmp
+    def __isub__(self, x):
+        self.difference_update(x)
+        return self
+    def __iand__(self, x):
+        tmp=_mset(x)
+        for i in [i for i in self if i not in tmp]:
+            del(self[i])
+        return self
+    def __ior__(self, x):
+        self.update(x)
+        return self
+def _mset(x):
+    "x as a container for membership tests (not copied if it is a set or a dict)"
+    return x if isinstance(x, (set, frozenset, dict)) else set(x)
 
 BOMS = (
     (BOM_UTF8, "UTF-8"),
@@ -222,14 +248,158 @@ req_prl=(
 )
 if "ffguess" not in locals():
     ffguess=False
-aeval.symtable=globals()
+# names available in numeric expressions (in addition to math functions)
+expr_sym={"NA": NA, "NaN": NaN, "np": np, "math": math}
+# one interpreter per thread, parsed expressions are shared
+_tloc=threading.local()
+def expr_interp():
+    "Sandboxed asteval interpreter of the current thread"
+    ae=getattr(_tloc, "aeval", None)
+    if ae is None:
+        sym=make_symbol_table(use_numpy=False, **expr_sym)
+        sym.pop("open", None)
+        ae=_tloc.aeval=Interpreter(symtable=sym, minimal=True, raise_errors=True, show_errors=False)
+    return ae
+@lru_cache(maxsize=4096)
+def expr_ast(e):
+    "Parsed expression e"
+    return expr_interp().parse(e)
 def eval_expr(e, werr=werr):
+    """Evaluate numeric expression e. Plain numbers are converted by int() or float()
+    (like python literals), other expressions are parsed once and run in a sandbox (cf. expr_sym).
+    Return None on error (reported by werr if not None)"""
+    if type(e) == str:
+        for conv in (int, float):
+            try:
+                return conv(e)
+            except ValueError:
+                pass
     try:
-        return aeval(e, raise_errors=True, show_errors=False)
+        ae=expr_interp()
+        ae.error=[]
+        ae.error_msg=None
+        try:
+            node=expr_ast(e)
+            ae.expr=e
+            res=ae.run(node, with_raise=True)
+        except Exception:
+            if not ae.error:
+                raise
+        if ae.error:
+            # asteval keeps a detailed message
+            err=ae.error[-1]
+            raise err.exc(err.get_error()[1])
+        return res
     except Exception as err:
         if werr:
             werr("In expression '"+str(e)+"' got the error:\n"+str(err)+"\n")
         return None
+@lru_cache(maxsize=8)
+def _ftbl_text(fp, mtime, size):
+    "Decoded content of file fp (cf. ftbl_text())"
+    with open(fp, "rb") as fc:
+        raw=fc.read()
+    co=[encoding for bom, encoding in BOMS if raw.startswith(bom)]
+    if co:
+        inp=raw.decode(co[0])
+    else:
+        try:
+            inp=raw.decode("utf-8")
+        except UnicodeDecodeError:
+            # never fails
+            inp=raw.decode("latin9")
+        inp=inp.replace("\x00", "")
+    if inp.startswith("\ufeff"):
+        inp=inp[1:]
+    return inp
+def ftbl_text(f):
+    """Decoded text of FTBL file f. The encoding is detected once: by BOM, otherwise
+    UTF-8 or latin9 (NUL chars are removed). The text is cached while the file is unchanged
+    (same mtime and size) so a driver reading the file (e.g. for commandArgs) and ftbl_parse() decode it once.
+    A file rewritten in place within mtime resolution can keep the same key, so writers
+    (e.g. txt2ftbl) call ftbl_text.cache_clear() after writing."""
+    st=os.stat(f)
+    return _ftbl_text(os.path.abspath(f), st.st_mtime_ns, st.st_size)
+ftbl_text.cache_clear=_ftbl_text.cache_clear
+# precompiled patterns of FTBL tokenizer
+re_ftbl_path=re.compile(r"^[\t ]*//##[\t ]*(.*)[\t ]*$")
+re_ftbl_comm=re.compile(r"^([^(//)]+|.+)//.*$")
+def ftbl_tokens(lines, name=""):
+    """Tokenize FTBL lines (iterable of str) in one pass.
+    Yield records (section, subsection, row, irow) where row is
+
+     - None at the beginning of a section or subsection;
+     - str for a pathway comment '//## name' (the name);
+     - dict {"irow": str(irow), column name: field, ...} for a data row.
+
+    irow is the line number (from 1), name is used in error messages."""
+    sec_name=subsec_name=""
+    reading=""
+    col_names=[]
+    skiptab=1
+    for irow,l in enumerate(lines, 1):
+        if not l:
+            continue
+        # strip out double quotes at the very beginning/end and at field boundaries
+        if '"' in l:
+            if l[0] == '"':
+                l=l[1:]
+            if l[-1:] == '"':
+                l=l[:-1]
+            l=l.replace('\t"', "\t").replace('"\t', "\t")
+        s=l.lstrip("\t ")
+        if s[:2] == "//":
+            # check for pathway name "//## pathname"
+            m=re_ftbl_path.match(l)
+            if m:
+                yield (sec_name, subsec_name, m.group(1).rstrip(), irow)
+            continue
+        if not s:
+            continue
+        # skip the comments at the end of the row
+        if "//" in l:
+            l=re_ftbl_comm.sub(r"\1", l)
+        l=l.rstrip()
+        flds=l.split("\t")
+        if len(flds) == 1:
+            # new section starts here
+            sec_name=flds[0]
+            subsec_name=""
+            if not sec_name in defsec:
+                raise Exception("FTBL: Illegal section name '%s' (%s: %d)"%(sec_name, name, irow))
+            skiptab=1
+            reading="col_names"
+            yield (sec_name, subsec_name, None, irow)
+            continue
+        if len(flds) == 2 and len(flds[0]) == 0 and sec_name in defsec and len(defsec[sec_name]):
+            # we are expecting a subsection
+            subsec_name=flds[1]
+            if subsec_name not in defsec[sec_name]:
+                raise Exception("A subsection '%s' cannot appear in the section '%s' (%s: %d)."%(subsec_name, sec_name, name, irow))
+            skiptab=2
+            reading="col_names"
+            yield (sec_name, subsec_name, None, irow)
+            continue
+        if reading == "col_names" and len(flds) > 2:
+            # read column names
+            if l[:skiptab] != "\t"*skiptab:
+                raise Exception("Expected at least %d tabulation(s) at the row beginning. Got '%s' (%s: %d)"%(skiptab, l[:skiptab], name, irow))
+            col_names=flds[skiptab:]
+            if any(not item.strip() for item in col_names):
+                raise Exception("FTBL: row %d has empty column names:\n%s"%(irow, l))
+            reading="data"
+            continue
+        if reading == "data":
+            if l[:skiptab] != "\t"*skiptab:
+                raise Exception("Expected at least %d tabulation(s) at the row beginning. Got '%s' (%s: %d)"%(skiptab, l[:skiptab], name, irow))
+            data=[it.strip() for it in flds[skiptab:]]
+            if len(data) > len(col_names):
+                raise Exception("FTBL: data have more columns (%d) than column names (%d) (%s: %d)"%(len(data), len(col_names), name, irow))
+            dic={"irow": str(irow)}
+            dic.update(zip(col_names, data))
+            for c in col_names[len(data):]:
+                dic[c]=""
+            yield (sec_name, subsec_name, dic, irow)
 def ftbl_parse(f, wout=wout, werr=werr):
     """ftbl_parse(f) -> dict
     read and parse .ftbl file. The only input parameter f is a stream pointer
@@ -237,8 +407,6 @@ def ftbl_parse(f, wout=wout, werr=werr):
     This function parses the input and returns a dictionnary
     with items corresponding to sections in .ftbl. One section is added.
     "TRANS" correponds to carbon transitions."""
-    import re
-    import codecs
     ftbl=dict();    # main dictionary to be returned
     
     #print("f=", f)
@@ -249,205 +417,75 @@ def ftbl_parse(f, wout=wout, werr=werr):
     ftbl["name"]=f
     ftbl["base_name"]=os.path.basename(f)[:-5]
     ftbl["abs_path"]=os.path.abspath(f)
-    fc=open(f, "rb")
-    raw=fc.read()
-    fc.close()
-    co=[encoding for bom, encoding in BOMS if raw.startswith(bom)]
-    if len(co):
-        inp=raw.decode(co[0])
-    else:
-        for co in ["utf-8", "latin9", "utf-16", "utf-32"]:
-            try:
-                inp="".join(c for c in raw.decode(co) if c != '\x00')
-                break;
-            except UnicodeDecodeError:
-                pass
-    #pdb.set_trace()
-    inp=inp.encode("utf-8").decode("utf-8-sig")
-    lines=inp.splitlines()
-    # fc=codecs.open(f, "r", encoding="utf-32")
-    # try:
-        # lines=fc.readlines()
-        # fc.close()
-    # except:
-        # fc.close()
-        # try:
-            # fc=codecs.open(f, "r", encoding="utf-16")
-            # lines=fc.readlines()
-            # fc.close()
-        # except:
-            # fc.close()
-            # try:
-                # fc=codecs.open(f, "r", encoding="utf-8-sig")
-                # lines=fc.readlines()
-                # fc.close()
-            # except:
-                # fc.close()
-                # fc=open(f, "r")
-                # lines=fc.readlines()
-                # fc.close()
     ftbl["pathway"]=dict()
-    
-    #print f;##
-    reblank=re.compile(r"^[\t ]*$")
-    recomm=re.compile(r"^[\t ]*//.*$")
-    repath=re.compile(r"^[\t ]*//##[\t ]*(.*)[\t ]*$")
-    comm=re.compile(r"^([^(//)]+|.+)//.*$")
-    reading="sec_name"
-    col_names=[]
-    sec_name=subsec_name=""
-    irow=0
-    dic=dict()
     pathway=""
-    #pdb.set_trace()
-    for l in lines:
-        irow+=1
-        #print "raw l="+l;##
-        # strip out \r
-        l=l.replace("\r", "")
-        if len(l) == 0:
-            continue
-        #print "-ctrl-r l="+l;##
-        # strip out double quots
-        if l[0] == '"': l=l[1:];    # very begining
-        #print "-fq l="+l;##
-        if l[-1] == '"': l=l[:-1];    # very end
-        #print "-lq l="+l;##
-        l=l.replace("\t\"", "\t");    # at the field begining
-        #print "-ffq l="+l;##
-        l=l.replace("\"\t", "\t");    # at the end
-        #print "-lfq l="+l;##
-        
-        # check for pathway name "//## pathname"
-        if repath.match(l):
-            pathway=repath.sub(r"\1", l).rstrip()
-        # skip comments and emty rows
-        if recomm.match(l) or reblank.match(l): continue
-        
-        # skip the comments at the end of the row
-        l=comm.sub(r"\1",l).rstrip()
-        
-        # split in fields
-        flds=l.split("\t")
-        
-        #print "proceeding:"+l;##
-        if len(flds) == 1:
-            # new section starts here
-            sec_name=flds[0]
-            subsec_name=""
-            if not sec_name in defsec:
-                #pdb.set_trace()
-                raise Exception("FTBL: Illegal section name '%s' (%s: %d)"%(sec_name, ftbl["name"], irow))
-            # prepare storage
-            ftbl[sec_name]=[]
-            # prepare storage for carbon transitions
-            if sec_name=="NETWORK":
-               #print "TRANS prepared";##
-               ftbl["TRANS"]=[]
-            try: del stock
-            except NameError: pass
-            stock=ftbl[sec_name]
-            skiptab=1
-            data_count=0
-            reading="col_names"
-            col_names=[]
-            subsec_name=""
-            continue
-        if len(flds) == 2 and len(flds[0]) == 0:
-            # read subsection name or what ?
-            if len(sec_name) and sec_name in defsec and len(defsec[sec_name]):
-                # we are expecting a subsection
-                subsec_name=flds[1]
-                if subsec_name not in defsec[sec_name]:
-                    raise Exception("A subsection '%s' cannot appear in the section '%s' (%s: %d)."%(subsec_name, sec_name, ftbl["name"], irow))
-                # prepare sub-storage
+    reading=""
+    stock=None
+    data_count=0
+    dic=dict()
+    for (sec_name, subsec_name, row, irow) in ftbl_tokens(ftbl_text(f).splitlines(), ftbl["name"]):
+        if row is None:
+            # new section or subsection, prepare storage
+            if not subsec_name:
+                ftbl[sec_name]=[]
+                if sec_name == "NETWORK":
+                    # storage for carbon transitions
+                    ftbl["TRANS"]=[]
+                stock=ftbl[sec_name]
+            else:
                 if not ftbl[sec_name]:
                     # replace an empty list by an empty dictionary
                     ftbl[sec_name]=dict()
-                #print (irow, reading)##
                 ftbl[sec_name][subsec_name]=[]
-                try: del stock
-                except NameError: pass
                 stock=ftbl[sec_name][subsec_name]
-                skiptab=2
-                data_count=0
-                reading="col_names"
-                continue
-            else:
-                # just a very short line
-                # it will fall in plain reading data
-                pass
-        if reading=="col_names" and len(flds) > 2:
-            # read column names
-            if len(l) < skiptab or l[:skiptab] != "\t"*skiptab:
-                raise Exception("Expected at least %d tabulation(s) at the row beginning. Got '%s' (%s: %d)"%(skiptab, l[:min(skiptab, len(l))], ftbl["name"], irow))
-            col_names=l[skiptab:].split("\t")
-            if len([ item for item in col_names if re.match(r"^\s*$", item) ]):
-                raise Exception("FTBL: row %d has empty column names:\n%s"%(irow,l))
+            data_count=0
             reading="data"
-            #print "col_names=", col_names;##
             continue
-        if reading=="data" or reading=="transitions":
-            if len(l) < skiptab or l[:skiptab] != "\t"*skiptab:
-                raise Exception("Expected at least %d tabulation(s) at the row beginning. Got '%s' (%s: %d)"%(skiptab, l[:min(skiptab, len(l))], ftbl["name"], irow))
-            data=[it.strip() for it in l[skiptab:].split("\t")]
-            prevdic=dic
-            dic={"irow": str(irow)}
-            if reading=="data" and sec_name == "NETWORK" and len(data[0]) != 0:
+        if isstr(row):
+            pathway=row
+            continue
+        prevdic=dic
+        dic=row
+        if sec_name == "NETWORK":
+            col_names=list(dic)[1:]
+            if reading == "data" and len(dic[col_names[0]]) != 0:
                 reading="transitions"
-            elif reading=="transitions":
+            elif reading == "transitions":
                 # here, we are at carbon transition line (e.g. #ABC -> #AB +#C)
-                #print "data_count="+str(data_count), \
-                #    "\ndata="+str([l for l in enumerate(data)]), \
-                #    "\nstock="+str(stock);##
-                if sec_name == "NETWORK" and len(data[0]) != 0:
-                    raise Exception("Expected label transitions. Got '%s' (%s: %d)"%(l, ftbl["name"], irow))
+                if len(dic[col_names[0]]) != 0:
+                    raise Exception("Expected label transitions. Got '%s' (%s: %d)"%("\t".join(dic[c] for c in col_names), ftbl["name"], irow))
                 reading="data"
                 fl_name=str(stock[data_count-1][col_names[0]]) if data_count else ""
                 if col_names[0] not in prevdic or len(prevdic[col_names[0]]) == 0:
-                    raise Exception("Carbon transition row '%s' is orphan (%s: %d)."%(l[skiptab:], ftbl["name"], irow))
-                for i in range(len(col_names)):
-                    item=data[i] if i < len(data) else ""
-                    dic[col_names[i]]=item
-                    metab=stock[data_count-1][col_names[i]]
+                    raise Exception("Carbon transition row '%s' is orphan (%s: %d)."%("\t".join(dic[c] for c in col_names), ftbl["name"], irow))
+                for i,c in enumerate(col_names):
+                    item=dic[c]
+                    metab=stock[data_count-1][c]
                     if i > 0 and ((len(metab) and not len(item)) or (not len(metab) and len(item))):
-                        #print "i=%d, co='%s', m='%s', tr='%s';"%(i, col_names[i], metab, item)
                         raise Exception("In the reaction '%s', metabolites are misaligned with carbon transitions (%s: %d)."%(fl_name, ftbl["name"], irow))
                 ftbl["TRANS"].append(dic)
                 continue
-            for i in range(len(col_names)):
-                # classic data
-                if len(data) > len(col_names):
-                    raise Exception("FTBL: data have more columns (%d) than column names (%d) (%s: %d)"%(len(data), len(col_names), ftbl["name"], irow))
-                try:
-                    # decimal point conversion
-                    dic[col_names[i]]=data[i].strip() if i < len(data) else ""
-                    if col_names[i] in float_conv:
-                        oldval=dic[col_names[i]]
-                        val=oldval.replace(",", ".")
-                        try:
-                            fval=float(val)
-                            dic[col_names[i]]=val
-                        except:
-                            dic[col_names[i]]=oldval
-                except IndexError:
-                    pass
-            #import pdb; pdb.set_trace()
-            if sec_name == "NETWORK" and pathway:
-                if pathway not in ftbl["pathway"]:
-                    ftbl["pathway"][pathway]=[]
-                ftbl["pathway"][pathway]+=[dic["FLUX_NAME"]]
-            if sec_name == "FLUXES" and subsec_name in ("NET", "XCH") and dic["FCD"] in ("F", "C"):
-                try:
-                    val=float(eval_expr(dic["VALUE(F/C)"]))
-                except:
-                    raise Exception("In the field 'VALUE(F/C)', a float value expected (%s: %d)"%(ftbl["name"], irow))
-            stock.append(dic)
-            data_count+=1
-            #print "sec, subsec=", sec_name, subsec_name, data_count, dic;##
-        #print "len(flds)=", len(flds), flds, l, data;##
-        #print "keys", ftbl.keys(), (ftbl[sec_name].keys() \
-        #        if type(ftbl[sec_name])==type({}) else "");##
+        # decimal point conversion
+        for c in float_conv:
+            if c not in dic:
+                continue
+            val=dic[c].replace(",", ".")
+            try:
+                float(val)
+                dic[c]=val
+            except ValueError:
+                pass
+        if sec_name == "NETWORK" and pathway:
+            if pathway not in ftbl["pathway"]:
+                ftbl["pathway"][pathway]=[]
+            ftbl["pathway"][pathway]+=[dic["FLUX_NAME"]]
+        if sec_name == "FLUXES" and subsec_name in ("NET", "XCH") and dic["FCD"] in ("F", "C"):
+            try:
+                val=float(eval_expr(dic["VALUE(F/C)"]))
+            except:
+                raise Exception("In the field 'VALUE(F/C)', a float value expected (%s: %d)"%(ftbl["name"], irow))
+        stock.append(dic)
+        data_count+=1
     if "NETWORK" not in ftbl:
         return ftbl
     # prepare translator reac -> pathway
@@ -461,15 +499,16 @@ def ftbl_parse(f, wout=wout, werr=werr):
     tr=ftbl["TRANS"]
     if (len(nw) != len(tr)):
         raise Exception("Number of reactions (%d) is not equal to label transition number (%d)"%(len(nw), len(tr)) )
-    ureac=oset(row["FLUX_NAME"] for row in ftbl["NETWORK"])
+    # row indexes per reaction
+    ureac=dict()
+    for (i, row) in enumerate(nw):
+        ureac.setdefault(row["FLUX_NAME"], []).append(i)
     long_reac=dict()
     long_trans=dict()
-    for reac in ureac:
+    for reac,irows in ureac.items():
         if reac not in long_reac:
             long_reac[reac]={"left": [], "right": []}
             long_trans[reac]={"left": [], "right": []}
-        # get rows
-        irows=[i for (i, row) in enumerate(nw) if row["FLUX_NAME"] == reac]
         if len(irows) > 1:
             # check that rows are contiguous
             if not all(r == i+irows[0] for i,r in enumerate(irows)):
@@ -524,7 +563,7 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
      - mass measurements (mass_meas)
      - cumomer ordered lists (vcumo)
      - unknown fluxes ordered lists (vflux)
-     - linear problem on fluxes (Afl, bfl)
+     - linear problem on fluxes (Afl as scipy.sparse.csr_matrix, bfl)
      - free fluxes ordered lists (vflux_free)
      - fw-rv fluxes ordered lists (vflux_fwrv)
      - row names ordered lists for Afl (vrowAfl)
@@ -532,7 +571,7 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
      - measured concentrations (metab_measured)
     """
     global eval_expr
-    eval_expr=partial(eval_expr, werr=werr)
+    eval_expr=partial(getattr(eval_expr, "func", eval_expr), werr=werr)
     # init named sets
     if type(netan)!=type(dict()):
         raise("netan argument must be a dictionary")
@@ -887,6 +926,8 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
                 row["FORMULA"]+"="+row["VALUE"]+": "+str(row["irow"])))
     netan["eqflux"]=oset(f for row in netan["flux_equal"]["net"] for f in [*row[1].keys()]) | oset(f for row in netan["flux_equal"]["xch"] for f in [*row[1].keys()])
     eqflux=netan["eqflux"]
+    # all fluxes (for membership tests below)
+    reac_eq=netan["reac"]|eqflux
     # metab EQAULITIES
     netan["metab_equal"]=list()
     for row in ftbl.get("EQUALITIES", dict()).get("METAB",[]):
@@ -922,10 +963,11 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
 ##        aff("net", net)
         # check that all fluxes are defined in network section
         allreac=netan["reac"] | netan["flux_inout"]
-        unk=[ row["NAME"] for row in net if row["FCD"] in fcd and row["NAME"] not in allreac|eqflux ]
+        allreac_eq=allreac|eqflux
+        unk=[ row["NAME"] for row in net if row["FCD"] in fcd and row["NAME"] not in allreac_eq ]
         if len(unk):
             raise Exception("The flux name(s) '%s' from the FLUX/NET section is (are) not defined in the NETWORK neither EQUALITY section."%(", ".join(unk)))
-        unk=[ row["NAME"] for row in xch if row["FCD"] in fcd and row["NAME"] not in allreac|eqflux ]
+        unk=[ row["NAME"] for row in xch if row["FCD"] in fcd and row["NAME"] not in allreac_eq ]
         if len(unk):
             raise Exception("The flux name(s) '%s' from the FLUX/XCH section is (are) not defined in the NETWORK neither EQUALITY section."%(", ".join(unk)))
 
@@ -948,12 +990,19 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
     #print "list reac=", netan["reac"];##
     try:
         #print( netan["reac"] | netan["flux_inout"])
+        # rows of xch and net per flux name
+        xrows=dict()
+        for row in xch:
+            xrows.setdefault(row["NAME"], []).append(row)
+        nrows=dict()
+        for row in (net or []):
+            nrows.setdefault(row["NAME"], []).append(row)
         for reac in netan["reac"] | netan["flux_inout"] | eqflux:
             #print("reac=", reac)
             # get xch condition for this reac
-            cond=[row for row in xch if row["NAME"]==reac]
+            cond=xrows.get(reac, [])
             # get net condition for this reac
-            ncond=([row for row in net if row["NAME"]==reac]) if net else []
+            ncond=nrows.get(reac, [])
             # no xch dispatch check for input/output fluxes as they are
             # constrained by definition
             #print "r,c,n=", reac, len(cond), len(ncond);##
@@ -1037,7 +1086,7 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
     
     # measured fluxes
     for row in ftbl.get("FLUX_MEASUREMENTS",[]):
-        if row["FLUX_NAME"] not in netan["reac"]|eqflux:
+        if row["FLUX_NAME"] not in reac_eq:
             raise Exception("Mesured flux `%s` is not defined in NETWORK section neither in EQUALITIES (%s: %s)."%(row["FLUX_NAME"], ftbl["name"], row["irow"]))
         if row["FLUX_NAME"] not in netan["flux_free"]["net"] and \
             row["FLUX_NAME"] not in netan["flux_dep"]["net"]:
@@ -1121,7 +1170,7 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
     for (afftype, ftype) in (("Net", "net"), ("Exchange", "xch")):
         for row in netan["flux_inequal"][ftype]:
             for fl in row[2]:
-                if fl not in netan["reac"]|eqflux:
+                if fl not in reac_eq:
                     raise Exception("%s flux `%s` in the inequality\n%s\nis not defined in NETWORK neither EQUALITY sections."%
                         (afftype, fl, join("", row)))
     # metabolite inequalities (like the flux ones)
@@ -1154,7 +1203,7 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
         for (affdfcg, dfcg, dfcgsh) in (("Dependent", "flux_dep", "d."), ("Free", "flux_free", "f."), ("Constrained", "flux_constr", "c."), ("Variable growth", "flux_vgrowth", "g.")):
             #print netan[dfcg][nx];##
             for fl in netan[dfcg][nx]:
-                if fl not in netan["reac"]|eqflux:
+                if fl not in reac_eq:
                     raise Exception("%s %s flux `%s` is not defined in NETWORK neither EQUALITY sections."%
                        (affdfcg, affnx, fl))
                 netan["nx2dfcg"][nxsh+fl]=dfcgsh+nxsh+fl
@@ -1215,124 +1264,17 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
     # b is a list of right hand parts (still in weight order)
     # the dimensions of various weights in b are not the same
     # too short metabolites are dropped when going to higher weights.
-    res=netan["cumo_sys"]
-    res["A"]=[{} for i in range(Cmax)]
-    res["b"]=[{} for i in range(Cmax)]
-    try:
-        # run through all reactions and update bilan of involved cumomers
-        for (reac,lrdict) in iter(netan["carbotrans"].items()) if fullsys else []:
-            # run through metabs
-            ## aff("lrdict", lrdict);#
-            for (imetab,lr,metab,cstr) in ((imetab,lr,metab,cstr)
-                    for (lr,lst) in lrdict.items()
-                    for (imetab,(metab,cstr)) in enumerate(lst)):
-                # if output metab then influx is set to 1
-                # so its cumomer distribution is directly
-                # defined by cumodistr of inputs
-                Clen=netan["Clen"][metab]
-                # input metabolite has fixed value so put it in rhs
-                # when it is an influx for some internal cumomer
-                if metab in netan["input"] or metab in netan["output"]:
-                    continue
-                # 'out' part of this metab
-                fwd_rev=("fwd." if lr=="left" else "rev.")
-                flux=fwd_rev+reac
-                #if (fwd_rev=="fwd." or reac not in netan["notrev"]):
-                if (fwd_rev=="fwd." or reac not in netan["flux_inout"]):
-                    # add this out-flux
-                    # run through all cumomers of metab
-                    for icumo in range(1,1<<Clen):
-                        cumo=metab+":"+str(icumo)
-                        w=sumbit(icumo)
-                        #print "w,i,clen,metab=", w, icumo,Clen,metab;##
-                        if cumo not in res["A"][w-1]:
-                            res["A"][w-1][cumo]={cumo:[]}
-                        # main diagonal term ('out' part)
-                        res["A"][w-1][cumo][cumo].append(flux)
-                        ##print 'm,ic,w='+metab, icumo, w;#
-                        ##aff("res["A"][w-1][cumo][cumo]", res["A"][w-1][cumo][cumo]);#
-                # 'in' part
-                fwd_rev=("rev." if lr=="left" else "fwd.")
-                flux=fwd_rev+reac
-                in_lr=("left" if lr=="right" else "right")
-                #if (fwd_rev=="rev." and reac in netan["notrev"]):
-                if (fwd_rev=="rev." and reac in netan["flux_inout"]):
-                    # this cannot be by definition
-                    continue
-                # add this in-flux
-                for (in_i,(in_metab, in_cstr)) in enumerate(lrdict[in_lr]):
-                    # run through all cumomers of metab
-                    for icumo in range(1,1<<Clen):
-                        cumo=metab+":"+str(icumo)
-                        w=sumbit(icumo)
-                        # get in_cumo
-                        in_icumo=src_ind(in_cstr, cstr, icumo)
-                        if in_icumo==None:
-                            continue
-                        in_cumo=in_metab+":"+str(in_icumo)
-                        in_w=sumbit(in_icumo)
-                        if cumo not in res["A"][w-1]:
-                            res["A"][w-1][cumo]={cumo:[]}
-                        if in_w==w:
-                            if in_metab in netan["input"]:
-                                # put it in rhs
-                                if cumo not in res["b"][w-1]:
-                                    res["b"][w-1][cumo]=dict()
-                                if flux not in res["b"][w-1][cumo]:
-                                    res["b"][w-1][cumo][flux]=dict()
-                                if imetab not in res["b"][w-1][cumo][flux]:
-                                    res["b"][w-1][cumo][flux][imetab]=[]
-                                if not netan["cumo_input"] or in_cumo not in netan["cumo_input"][0]:
-                                    # put this in_cumo ih the dict
-                                    iso2cumo(netan, "cumo_input", in_cumo, in_icumo, in_metab)
-                                res["b"][w-1][cumo][flux][imetab].append(in_cumo)
-                            else:
-                                if in_cumo not in res["A"][w-1][cumo]:
-                                    res["A"][w-1][cumo][in_cumo]=[]
-                                # matrix: linearized off-diagonal term
-                                res["A"][w-1][cumo][in_cumo].append(flux)
-                        elif in_w < w:
-                            # put lighter cumomer product in rhs list[iterm]
-                            if cumo not in res["b"][w-1]:
-                                res["b"][w-1][cumo]=dict()
-                            if flux not in res["b"][w-1][cumo]:
-                                res["b"][w-1][cumo][flux]=dict()
-                            if imetab not in res["b"][w-1][cumo][flux]:
-                                res["b"][w-1][cumo][flux][imetab]=[]
-                            #res["b"][w-1][cumo][flux][imetab].append(
-                            #    in_cumo if in_metab not in netan["input"] else
-                            #    netan["cumo_input"][in_cumo])
-                            res["b"][w-1][cumo][flux][imetab].append(in_cumo)
-                            #print "b="+str(res["b"][w-1][cumo][flux]);##
-                        # if in_w==0 then in_cumo=1 by definition => ignore here
-                        # in_w cannot be > w because of src_ind()
-    except Exception as inst:
-        werr(": ".join(inst)+"\n")
-    #netan["cumo_input"]=[dict((k,(v if v==v else 0.)) for k,v in d.items()) for d in netan["cumo_input"]]
-    # ordered cumomer lists
-    #for w in range(1,netan["Cmax"]+1):
-        # weight 1 equations have all metabolites
-        ##aff("A "+str(w), netan["cumo_sys"]["A"][w-1]);#
-        ##aff("b "+str(w), netan["cumo_sys"]["b"][w-1]);#
-        # order cumos along pathways
-        # starts are input cumomers
-    #    starts=[cumo for cumo in netan["cumo_sys"]["A"][w-1] \
-    #        if cumo.split(":")[0] in netan["input"]]
-        ##aff("st "+str(w), starts)
-        # complete starts by all others cumomers
-    #    starts+=[c for c in netan["cumo_sys"]["A"][w-1] if not c in starts]
-    #    cumo_paths=cumo_path(starts, netan["cumo_sys"]["A"][w-1], oset())
-        # order
-    #    netan["vcumo"].append([cumo for cumo in valval(cumo_paths)])
-    netan["vcumo"]=[[*a.keys()] for a in netan["cumo_sys"]["A"]]
+    netan["cumo_sys"]["A"]=[{} for i in range(Cmax)]
+    netan["cumo_sys"]["b"]=[{} for i in range(Cmax)]
+    netan["vcumo"]=[[] for i in range(Cmax)]
 
     # ordered unknown flux lists
     # get all reactions which are not constrained, not free and not growth
-    netan["vflux"]["net"].extend(reac for reac in netan["reac"]|eqflux
+    netan["vflux"]["net"].extend(reac for reac in reac_eq
         if reac not in netan["flux_constr"]["net"] and
         reac not in netan["flux_free"]["net"] and
         reac not in netan["flux_vgrowth"]["net"])
-    netan["vflux"]["xch"].extend(reac for reac in netan["reac"]|eqflux
+    netan["vflux"]["xch"].extend(reac for reac in reac_eq
         if reac not in netan["flux_constr"]["xch"] and
         reac not in netan["flux_free"]["xch"] and
         reac not in netan["flux_vgrowth"]["xch"])
@@ -1458,6 +1400,9 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
     # easy index finder
     netan["vflux_fwrv"]["fwrv2i"]=dict((fl,i) for (i,fl) in
         enumerate(netan["vflux_fwrv"]["fwrv"]))
+    if fullsys:
+        # needs fwrv2i
+        cumo_sys_coo(netan, fullsys_maxmem, fullsys_dirtmp, wout=wout)
         
     # ordered metabolite pools
     netan["vpool"]={
@@ -1477,8 +1422,9 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
     # - stocheometic equations (only .net fluxes are involved)
     # - flux equalities
     # constrained to non zero value fluxes are replaced by their values in rhs
-    # Afl is a list of lists (two dim array). Primary list is a matrix row,
-    # columns are values in the secondary list and contains matrix coefficients
+    # Afl is built as a list of sparse rows (dicts {icol: coef}) and is
+    # stored at the end as scipy.sparse.csr_matrix. Redundant rows (equal up to
+    # the sign) are found by hashing their sign normalized form (cf. sprow_key())
     # bfl is a list of linear expressions. Each expression is a dict
     # where keys are variable names like "f.n.flx" and values are
     # numeric coefficients
@@ -1493,7 +1439,12 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
     # and <reac> correspond to the reaction name
     
     # stocheometric part
-    res=netan["Afl"]
+    res=[]
+    rowkeys=dict()
+    net2i=netan["vflux"]["net2i"]
+    nb_fl=len(netan["vflux"]["net"])+len(netan["vflux"]["xch"])
+    afl_cols=netan["vflux"]["net"]+netan["vflux"]["xch"]
+    vfnet=set(netan["vflux"]["net"])
     for (metab,lr) in netan["sto_m_r"].items():
         #if metab == "M_adp_c":
             #pdb.set_trace()
@@ -1506,29 +1457,29 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
         # 'right' part produces metab
         _=[coefs[rea].append(co) for rea,co in lr["right"]]
         coefs=dict((rea, sum(li)) for rea,li in coefs.items())
-        deps=oset(coefs.keys()).intersection(netan["vflux"]["net"])
+        deps=oset(coefs.keys()).intersection(vfnet)
         if not deps:
             raise Exception("A balance on metabolite '%s' does not contain any dependent flux.\nAt least one of the following net fluxes %s\nmust be declared dependent in the FLUX/NET section (put letter 'D' in the column 'FCD' for some flux)."%(metab, list(coefs.keys())))
-        qry=[coefs.get(fl,0) for fl in netan["vflux"]["net"]]
-        qry.extend([0]*len(netan["vflux"]["xch"]))
-        mqry=-np.array(qry)
-        #if qry==[0]*len(qry): must be included even if all zeros, so an R warning will work
+        qry=dict((net2i[fl], co) for (fl,co) in coefs.items() if fl in net2i and co != 0)
+        #if not qry: must be included even if all zeros, so an R warning will work
         #    # degenerated equation, skip it
         #    #netan["flux_equal"]["net"].append((0., coefs))
         #    raise Exception("Stocheometric equation is zero for metab "+metab+"\n"+str(lr)+"\n"+str(coefs))
         #    continue
         # check if this line was already entered before
-        for (i,row) in enumerate(res):
-            if not ffguess and (row == qry or (np.array(row) == mqry).all()):
-                inz=set(i for i,coef in enumerate(row) if coef !=0)
-                wout("***Warning: when trying to add a balance equation for metabolite '"+metab+
-                    "', got equation redundant with those for '"+netan["vrowAfl"][i]+"'\n")
-                wout("metab:\t"+join("\t", [fl for i,fl in enumerate(netan["vflux"]["net"]+netan["vflux"]["xch"]) if i in inz])+"\n")
-                wout(netan["vrowAfl"][i]+":\t"+join("\t", [coef for i,coef in enumerate(row) if i in inz])+"\n")
-                wout(metab+":\t"+join("\t", [coef for i,coef in enumerate(qry) if i in inz])+"\n")
-                break
+        key=sprow_key(qry)
+        i=None if ffguess else rowkeys.get(key)
+        if i is not None:
+            row=res[i]
+            inz=sorted(row)
+            wout("***Warning: when trying to add a balance equation for metabolite '"+metab+
+                "', got equation redundant with those for '"+netan["vrowAfl"][i]+"'\n")
+            wout("metab:\t"+join("\t", [afl_cols[i] for i in inz])+"\n")
+            wout(netan["vrowAfl"][i]+":\t"+join("\t", [row[i] for i in inz])+"\n")
+            wout(metab+":\t"+join("\t", [qry[i] for i in inz])+"\n")
         else:
             # identique row is not found, add it
+            rowkeys.setdefault(key, len(res))
             res.append(qry)
             netan["vrowAfl"].append(metab)
             # prepare right hand side
@@ -1545,28 +1496,22 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
             #print "dtmp=", dtmp
 
     # flux equality part
-    res=netan["Afl"]
     for (nx, nxl) in (("net", "n"), ("xch", "x")):
+        # column shift for xch fluxes
+        sh=0 if nx == "net" else len(netan["vflux"]["net"])
+        nx2i=netan["vflux"][nx+"2i"]
         for eq in netan["flux_equal"][nx]:
-            qry=[]
-            qry.extend(eq[1].get(fl,0) for fl in netan["vflux"][nx])
-            if nx == "net":
-                # add xch zeros
-                qry.extend([0]*len(netan["vflux"]["xch"]))
-            else:
-                # prepend zeros for net fluxes
-                qry[0:0]=[0]*len(netan["vflux"]["net"])
+            qry=dict((nx2i[fl]+sh, co) for (fl,co) in eq[1].items() if fl in nx2i and co != 0)
             # check qry
-            if qry == [0]*len(qry):
+            if not qry:
                 # degenerated equality
                 raise Exception("Equality in "+nx.upper()+" section: "+str(eq)+" must have at least one dependent flux\n")
             # check if this line was already entered before
-            if not ffguess:
-                mqry=-np.array(qry)
-                for row in res:
-                    if row == qry or (np.array(row) == mqry).all():
-                        raise Exception("An equality in "+nx.upper()+" section is redundant. eq:"+str(eq)+
-                            "\nqry="+str(qry)+"\nrow="+str(row))
+            key=sprow_key(qry)
+            if not ffguess and key in rowkeys:
+                raise Exception("An equality in "+nx.upper()+" section is redundant. eq:"+str(eq)+
+                    "\nqry="+str(sprow_dense(qry, nb_fl))+"\nrow="+str(sprow_dense(res[rowkeys[key]], nb_fl)))
+            rowkeys.setdefault(key, len(res))
             res.append(qry)
             netan["vrowAfl"].append("eq "+nx+": "+eq[2])
             netan["bfl"].append({"":eq[0]})
@@ -1583,6 +1528,7 @@ def ftbl_netan(ftbl, netan, emu_framework=False, fullsys=False, case_i=False, wo
             for fl in netan["flux_vgrowth"][nx]:
                 if fl in eq[1]:
                     dtmp["g."+nxl+"."+fl]=dtmp.get("c."+nxl+"."+fl,0)-float(eq[1][fl])
+    netan["Afl"]=sprows2csr(res, nb_fl)
 
     # read parallel experiments if any
     proc_kinopt(ftbl, netan)
@@ -1665,6 +1611,31 @@ def cumo_path(starts, A, visited=oset()):
 ##    aff('r', res)
     return res
     
+@lru_cache(maxsize=None)
+def src_ind_tab(substrate, product):
+    """
+    Carbon mapping tables for a given substrate and product carbon strings.
+    Return a tuple (tabs, atabs, inter) where tabs is a tuple of lists,
+    one per 8-bit chunk of product index: substrate index is obtained
+    as OR of tabs[k][(iprod>>(8*k)) & 255]. atabs are the same tables
+    as numpy arrays. inter is True if product and substrate strings
+    have a common carbon.
+    Tables are cached per (substrate, product) pair.
+    """
+    rsubstr=substrate[::-1]
+    rprod=product[::-1]
+    # substrate bit for each product bit (0 if not found)
+    sbit=[1<<rsubstr.find(c) if c in rsubstr else 0 for c in rprod]
+    tabs=[]
+    for ba in range(0, len(rprod), 8):
+        chunk=sbit[ba:ba+8]
+        tab=[0]*256
+        for i in range(1, 256):
+            # OR (not sum) as several product carbons can come from the same substrate one
+            nb=(i & -i).bit_length()-1 # lowest bit set in i
+            tab[i]=tab[i & (i-1)] | (chunk[nb] if nb < len(chunk) else 0)
+        tabs.append(tab)
+    return (tuple(tabs), tuple(np.array(tab, dtype=np.int64) for tab in tabs), bool(set(product) & set(substrate)))
 def src_ind(substrate, product, iprod):
     """
     For a given substrate and product carbon strings (e.g. "abc", "ab")
@@ -1672,21 +1643,25 @@ def src_ind(substrate, product, iprod):
     Return None if no source found.
     Return 0 if iprod==0 and intersection of product and substrate strings
     is not empty"""
-    movbit=1
+    tabs,atabs,inter=src_ind_tab(substrate, product)
     isubstr=0
-    substrate=substrate[::-1]
-    product=product[::-1]
-    for nb in range(len(product)):
-        if (movbit & iprod):
-            # algo: if the current bit is set in product search for its origin
-            # and set the corresponding bit in substrate
-            try:
-                isubstr|=1<<substrate.find(product[nb])
-            except ValueError:
-                pass
-        movbit<<=1
-    return isubstr if (isubstr or
-        (iprod==0 and (oset(product) & oset(substrate)))) else None
+    i=iprod
+    for tab in tabs:
+        isubstr|=tab[i & 255]
+        i>>=8
+    return isubstr if (isubstr or (iprod==0 and inter)) else None
+def src_ind_vec(substrate, product, iprod):
+    """
+    Vectorized version of src_ind() for an array of product indexes iprod.
+    Return an integer array of substrate indexes where -1 stands for None.
+    """
+    tabs,atabs,inter=src_ind_tab(substrate, product)
+    iprod=np.asarray(iprod, dtype=np.int64)
+    isubstr=np.zeros(iprod.shape, dtype=np.int64)
+    for (k,tab) in enumerate(atabs):
+        isubstr|=tab[(iprod>>(8*k)) & 255]
+    isubstr[(isubstr == 0) & ~((iprod == 0) & inter)]=-1
+    return isubstr
 def labprods(prods, metab, isostr, strs):
     """labprods(prods, metab, isostr, strs)
     Return a set of tuples (vmetab,visostr) which receive at least
@@ -1847,6 +1822,139 @@ def iso2emu(netan, inmetab, mask, mpi, e):
         d=netan["iso_input"][ili][inmetab]
         netan["emu_input"][ili][e]=sum([val for (frag, val) in d.items() if sumbit(frag&mask) == mpi])
 
+def iso_input_arr(netan, metab):
+    """iso_input_arr(netan, metab)->(isos, v, vnan, vflt)
+    Isotopomer fractions of input metabolite for all label inputs:
+    isos is an integer array of given isotopomers (in order of appearance),
+    v is a float array (len(isos), nb_exp) where NaN are replaced by 0,
+    vnan and vflt are boolean arrays of NaN and non int positions.
+    Return None if some fractions are not numeric.
+    """
+    lid=[d[metab] for d in netan["iso_input"]]
+    isos=list(oset(i for d in lid for i in d))
+    try:
+        v=np.array([[d.get(i, 0.) for d in lid] for i in isos], dtype=float).reshape((len(isos), len(lid)))
+    except (TypeError, ValueError):
+        return None
+    vnan=np.isnan(v)
+    v[vnan]=0.
+    vflt=np.array([[type(d.get(i, 0)) is not int for d in lid] for i in isos], dtype=bool).reshape(v.shape)
+    return (np.array(isos, dtype=np.int64), v, vnan, vflt)
+def sum_obj(y, ynan, yflt, yany):
+    """Convert batched sums y to python objects of the same type as plain sum() would give:
+    int 0 for empty sums (yany is False), int if no term is float (yflt is False)
+    and NaN where ynan is True. Return a list of lists."""
+    y[ynan]=np.nan
+    yo=y.astype(object)
+    i=yany & ~yflt & ~ynan
+    yo[i]=y[i].astype(np.int64).astype(object)
+    yo[~yany]=0
+    return yo.tolist()
+def iso2cumo_batch(netan, strin, items):
+    """Batched version of iso2cumo(): items is a list of tuples (in_cumo, icumo, in_metab)
+    whose cumomer fractions are stored in netan[strin] (in items order) for all label inputs.
+    For each metabolite, fractions are sums over given isotopomers or, when it is cheaper,
+    are taken from the whole cumomer vector obtained with iso2cumo_vec().
+    """
+    n=len(netan["iso_input"])
+    if len(netan[strin]) != n:
+        netan[strin]=[{} for i in range(n)]
+    bym=dict()
+    for (in_cumo,icumo,in_metab) in items:
+        bym.setdefault(in_metab, []).append(icumo)
+    val=dict()
+    for (metab,li) in bym.items():
+        arr=iso_input_arr(netan, metab)
+        if arr is None:
+            continue
+        (isos,v,vnan,vflt)=arr
+        r=np.array(li, dtype=np.int64)
+        clen=netan["Clen"][metab]
+        if len(r)*len(isos) > clen<<clen:
+            # values, NaN, float and term counts are transformed together
+            x=np.zeros((1<<clen, 4, n))
+            x[isos,0]=v
+            x[isos,1]=vnan
+            x[isos,2]=vflt
+            x[isos,3]=1.
+            x=iso2cumo_vec(x)[r]
+            (y,ynan,yflt,yany)=(x[:,0], x[:,1] > 0., x[:,2] > 0., x[:,3] > 0.)
+        else:
+            # sequential sums in isotopomer order (as in iso2cumo())
+            y=np.zeros((len(r), n))
+            ynan=np.zeros((len(r), n), dtype=bool)
+            yflt=np.zeros((len(r), n), dtype=bool)
+            yany=np.zeros((len(r), n), dtype=bool)
+            for (j,iso) in enumerate(isos.tolist()):
+                i=(r & iso) == r
+                y[i]+=v[j]
+                ynan[i]|=vnan[j]
+                yflt[i]|=vflt[j]
+                yany[i]=True
+        val[metab]=dict(zip(li, sum_obj(y, ynan, yflt, yany)))
+    for (in_cumo,icumo,in_metab) in items:
+        if in_metab not in val:
+            # not numeric fractions
+            iso2cumo(netan, strin, in_cumo, icumo, in_metab)
+            continue
+        for (ili,x) in enumerate(val[in_metab][icumo]):
+            netan[strin][ili][in_cumo]=x
+def iso2emu_batch(netan, items):
+    """Batched version of iso2emu(): items is a list of tuples (e, inmetab, mask, mpi)
+    whose fractions are stored in netan["emu_input"] (in items order) for all label inputs.
+    """
+    n=len(netan["iso_input"])
+    if len(netan["emu_input"]) != n:
+        netan["emu_input"]=[{} for i in range(n)]
+    bym=dict()
+    for (ii,(e,inmetab,mask,mpi)) in enumerate(items):
+        bym.setdefault(inmetab, []).append(ii)
+    val=dict()
+    for (metab,li) in bym.items():
+        arr=iso_input_arr(netan, metab)
+        if arr is None:
+            continue
+        (isos,v,vnan,vflt)=arr
+        masks=np.array([items[ii][2] for ii in li], dtype=np.int64)
+        mpi=np.array([items[ii][3] for ii in li], dtype=np.int64)
+        y=np.zeros((len(li), n))
+        ynan=np.zeros((len(li), n), dtype=bool)
+        yflt=np.zeros((len(li), n), dtype=bool)
+        yany=np.zeros((len(li), n), dtype=bool)
+        for (j,iso) in enumerate(isos.tolist()):
+            i=sumbit_vec(masks & iso) == mpi
+            y[i]+=v[j]
+            ynan[i]|=vnan[j]
+            yflt[i]|=vflt[j]
+            yany[i]=True
+        val.update(zip(li, sum_obj(y, ynan, yflt, yany)))
+    for (ii,(e,inmetab,mask,mpi)) in enumerate(items):
+        if ii not in val:
+            iso2emu(netan, inmetab, mask, mpi, e)
+            continue
+        for (ili,x) in enumerate(val[ii]):
+            netan["emu_input"][ili][e]=x
+
+def sprow_key(row):
+    """Hashable key of a sparse row (dict {icol: coef}) normalized for the sign:
+    a tuple of (icol, coef) sorted by icol whose first coef is positive.
+    Rows equal up to the sign have the same key."""
+    key=sorted((i, co) for (i,co) in row.items() if co != 0)
+    if key and key[0][1] < 0:
+        key=[(i, -co) for (i,co) in key]
+    return tuple(key)
+def sprow_dense(row, ncol):
+    """Dense list of length ncol from a sparse row (dict {icol: coef})"""
+    res=[0]*ncol
+    for (i,co) in row.items():
+        res[i]=co
+    return res
+def sprows2csr(rows, ncol):
+    """scipy.sparse.csr_matrix from a list of sparse rows (dicts {icol: coef})"""
+    ir=[i for (i,row) in enumerate(rows) for ic in row]
+    ic=[ic for row in rows for ic in row]
+    v=[co for row in rows for co in row.values()]
+    return sparse.csr_matrix((np.array(v, dtype=float), (ir, ic)), shape=(len(rows), ncol))
 def formula2dict(f, pterm=re.compile(r'([+-])'), pflux=re.compile(r'(?P<coef>\d+\.?\d*|^)?\s*\*?\s*(?P<var>[a-zA-Z_[\]()][\w\. -\[\]]*)\W*')):
     """parse a linear combination sum([+|-][a_i][*]f_i) where a_i is a 
     positive number and f_i is a string starting by non-digit and not white
@@ -1934,16 +2042,7 @@ def label_meas2matrix_vec_dev(netan):
                     vec.append(row["val"])
                     dev.append(row["dev"])
                     ids.append(row["id"])
-                    res=dict()
-                    for cumostr in row["bcumos"]:
-                        decomp=bcumo_decomp(cumostr)
-                        for icumo in decomp["+"]:
-                            res.setdefault(icumo,0)
-                            res[icumo]+=1
-                        for icumo in decomp["-"]:
-                            res.setdefault(icumo,0)
-                            res[icumo]-=1
-                    emuco=dict((str(ic)+"+"+str(sumbit(ic)), c) for (ic, c) in res.items())
+                    (res,emuco)=bcumo_coefs(tuple(row["bcumos"]))
                     if len(row["pooled"]) > 1:
                         # init index list
                         pooled.append([row["id"]])
@@ -1982,8 +2081,6 @@ def mass_meas2matrix_vec_dev(netan):
             #print "mass matx calc for ", metab;##
             (l, metabs, frag, m_irow)=m_id.split(":")
             for (fmask,weights) in frag_masks.items():
-                onepos=[b_no for (b_no,b) in iternumbit(fmask) if b]
-                nmask=sumbit(fmask)
     #            aff("weights for met,fmask "+", ".join((metab,strbit(fmask))), weights);##
                 for (weight,row) in weights.items():
                     vec.append(row["val"])
@@ -1992,26 +2089,10 @@ def mass_meas2matrix_vec_dev(netan):
                     metabl=row["pooled"]
                     metab0=metabl[0]
                     n=netan["Clen"][metab0]
-                    str0="0"*n
-                    strx="x"*n
-                    str1="1"*n
-                    fmask0x=setcharbit(strx,"0",fmask)
-                    fmask01=setcharbit(str0,"1",fmask)
+                    fmask01=setcharbit("0"*n,"1",fmask)
                     if not emu:
-                        # for a given weight construct bcumo sum: #x10x+#x01x+...
-                        bcumos=["#"+setcharbit(fmask0x,"1",expandbit(iw,onepos))
-                                for iw in range(1<<nmask) if sumbit(iw)==weight]
-        #                aff("bcumos for met,fmask,w "+", ".join((metab,strbit(fmask),str(weight))), [b for b in bcumos]);##
-                        res=dict()
-                        for cumostr in bcumos:
-                            #print cumostr;##
-                            decomp=bcumo_decomp(cumostr)
-                            for icumo in decomp["+"]:
-                                res.setdefault(icumo,0)
-                                res[icumo]+=1
-                            for icumo in decomp["-"]:
-                                res.setdefault(icumo,0)
-                                res[icumo]-=1
+                        # for a given weight: bcumo sum #x10x+#x01x+... and its cumomers
+                        (bcumos,res)=mass_decomp(fmask, weight, n)
                     else:
                         bcumos=None
                         res=None
@@ -2080,7 +2161,6 @@ def peak_meas2matrix_vec_dev(netan, dmask={"S": 2, "D-": 6, "D+": 3, "T": 7, "DD
                     vec.append(row["val"])
                     dev.append(row["dev"])
                     ids.append(row["id"])
-                    res=dict()
                     # for a given (c_no,peak) construct bcumo sum: #x10x+#x01x+...
                     # shift the 3-bit mask to the right carbon position
                     if c_no < n:
@@ -2097,16 +2177,7 @@ def peak_meas2matrix_vec_dev(netan, dmask={"S": 2, "D-": 6, "D+": 3, "T": 7, "DD
                             pmask=dmask["D+"]>>1
                         bcumos.append(setcharbit(pmask0x,"1",pmask))
     #                aff("bcumos for met,fmask,w "+", ".join((metab,strbit(fmask),str(weight))), [b for b in bcumos]);##
-                    for cumostr in bcumos:
-                        #print cumostr;##
-                        decomp=bcumo_decomp(cumostr)
-                        for icumo in decomp["+"]:
-                            res.setdefault(icumo,0)
-                            res[icumo]+=1
-                        for icumo in decomp["-"]:
-                            res.setdefault(icumo,0)
-                            res[icumo]-=1
-                    emuco=dict((str(ic)+"+"+str(sumbit(ic)), c) for (ic, c) in res.items())
+                    (res,emuco)=bcumo_coefs(tuple(bcumos))
                     if len(row["pooled"]) > 1:
                         # init index list
                         pooled.append([row["id"]])
@@ -2122,37 +2193,84 @@ def peak_meas2matrix_vec_dev(netan, dmask={"S": 2, "D-": 6, "D+": 3, "T": 7, "DD
         mli[ili]={"ids": ids, "mat": mat, "vec": vec, "dev": dev, "pooled": pooled}
     return mli
 
+@lru_cache(maxsize=None)
 def bcumo_decomp(bcumo):
     """bcumo is a string of the form #[01x]+. It has to be decomposed
     in the linear combination of cumomers #[1x]+. The coefficients
     of this linear combination are 1 or -1. So it can be represented as
     sum(cumos_positive)-sum(cumos_negative). The result of this function
     is a dictionary {"+": list of icumos, "-": list of icumos}. icumo is
-    an integer whose binary form indicates 1's positions in a cumomer."""
+    an integer whose binary form indicates 1's positions in a cumomer.
+    Results are cached per pattern (and thus per carbon length) and must
+    not be modified."""
     
     # take zero positions
     zpos=[ i for i in range(len(bcumo)-1) if bcumo[-i-1]=="0" ]
     
     # basic 1's cumomer mask
-    icumo_base=0
-    for i in range(len(bcumo)-1):
-        if bcumo[-i-1]=="1":
-            icumo_base|=1<<i
+    icumo_base=int(bcumo[1:].replace("x", "0") or "0", 2)
     
     # run through all 2^n zero masks separating positive and negative
     # cumomers
-    res={"+": [], "-": []}
-    nz=len(zpos)
-    for zmask in range(1<<nz):
-        # odd or even bit number?
-        sign="-" if sumbit(zmask)%2 else "+"
-        
-        # get full cumomer mask
-        icumo=icumo_base|expandbit(zmask,zpos)
-        # put in result dict
-        res[sign].append(icumo)
+    zmask=np.arange(1<<len(zpos), dtype=np.int64)
+    icumo=(icumo_base|expandbit_vec(zmask,zpos)).tolist()
+    odd=(sumbit_vec(zmask)%2).tolist()
+    res={"+": [i for (i,o) in zip(icumo, odd) if not o], "-": [i for (i,o) in zip(icumo, odd) if o]}
     #print bcumo+"=" + "+".join(setcharbit("x"*len(bcumo),"1",i) for i in res["+"])+("-" if res["-"] else "") +"-".join(setcharbit("x"*len(bcumo),"1",i) for i in res["-"]);##
     return res
+@lru_cache(maxsize=None)
+def bcumo_coefs(bcumos):
+    """Cumomer linear combination of a sum of bcumos (tuple of strings #[01x]+).
+    Return a tuple (coefs, emuco) of dicts {icumo: coef} and {"icumo+weight": coef}
+    (cumomers are in order of their first appearance in bcumo_decomp()).
+    Results are cached and must not be modified."""
+    res=dict()
+    for cumostr in bcumos:
+        decomp=bcumo_decomp(cumostr)
+        for icumo in decomp["+"]:
+            res[icumo]=res.get(icumo, 0)+1
+        for icumo in decomp["-"]:
+            res[icumo]=res.get(icumo, 0)-1
+    return (res, dict((str(ic)+"+"+str(sumbit(ic)), c) for (ic, c) in res.items()))
+@lru_cache(maxsize=None)
+def mass_decomp_loc(nmask, weight):
+    """Cumomers (in fragment local bits) of mass isotopomer M+weight of
+    a fragment having nmask carbons. Return a tuple of int arrays (icumo, coef).
+    A cumomer with s>=weight labeled carbons enters with coefficient
+    (-1)^(s-weight)*binomial(s, weight). Order is the same as in sequential
+    decomposition of bcumos by bcumo_decomp(): sorted by the weight lowest
+    bits of icumo, then positive before negative coefficients, then by icumo."""
+    icumo=np.arange(1<<nmask, dtype=np.int64)
+    s=sumbit_vec(icumo)
+    i=s >= weight
+    (icumo,s)=(icumo[i],s[i])
+    # clear the weight lowest bits
+    rest=icumo.copy()
+    for j in range(weight):
+        rest&=rest-1
+    o=np.lexsort((icumo, (s-weight)%2, icumo^rest))
+    (icumo,s)=(icumo[o],s[o])
+    binom=np.zeros(nmask+1, dtype=np.int64)
+    c=1
+    for k in range(weight, nmask+1):
+        binom[k]=c
+        c=c*(k+1)//(k+1-weight)
+    coef=np.where((s-weight)%2, -1, 1)*binom[s]
+    return (icumo, coef)
+@lru_cache(maxsize=None)
+def mass_decomp(fmask, weight, n):
+    """For a fragment mask fmask in a metabolite of n carbons, return
+    a tuple (bcumos, coefs) where bcumos is a list of strings #[01x]+
+    summing to mass isotopomer M+weight and coefs is a dict {icumo: coef}
+    of their cumomer linear combination (cf. bcumo_coefs()).
+    Results are cached and must not be modified."""
+    onepos=bitpos(fmask)
+    nmask=len(onepos)
+    iw=cumo_masks(nmask)[weight] if weight <= nmask else []
+    fmask0x=setcharbit("x"*n,"0",fmask)
+    bcumos=["#"+setcharbit(fmask0x,"1",i) for i in expandbit_vec(iw,onepos).tolist()]
+    (icumo,coef)=mass_decomp_loc(nmask, weight)
+    return (bcumos, dict(zip(expandbit_vec(icumo,onepos).tolist(), coef.tolist())))
 def mat2graph(A, fp):
     """write digraph file on file pointer fp representing
     links in matrix A given as bi-level dictionnary. A key of
@@ -2186,100 +2304,6 @@ def mat2pbm(A, v, fp):
                 p=0
         fp.write("\n")
         p=0
-def aglom_loop1(A):
-    """Agglomerate nodes of A if they mutually influence each other
-    i.e. they are in a loop of length 1.
-    Return a new dictionary of influence where entries are those of A aglomerated and glued "by" tab symbol"""
-    # i->loop_name(=min of all nodes in this loop)
-    na=copy.deepcopy(A)
-    loop=dict()
-    while aglom(na,transpose(na),loop):
-        pass
-    return({"na": na, "loop":loop})
-def aglom(na,ta,loop):
-    """new matrix A (na), transpose A (ta) are used to
-    aglomerate neigbour mutually influencing nodes in a supernode.
-    Aglomerated noeds are put in the loop dictionnary.
-    Return False if no nodes were aglomerated.
-    """
-    found=False
-    for i in na:
-        for j in na[i]:
-            if j==i:
-                continue
-            if i in na[j]:
-                # agglomerate i and j in na
-                # which means keep lowest netween i and j
-                # lo=min(i,j)
-                # hi=max(i,j)
-                # and imports influences of hi to lo
-                found=True
-                lo=min(i,j)
-                hi=max(i,j)
-                del(na[hi][hi])
-                del(ta[hi][hi])
-                #print "aglom: "+i+"+"+j+"->"+lo;##
-                #print "elim row "+hi+str(na[hi].keys());##
-                #print "influenced rows "+str(ta[hi].keys());##
-                # update na rows influenced by hi
-                for ii in [*ta[hi].keys()]:
-                    #print "\nold row "+ii+str(na[ii].keys());##
-                    na[ii].update(na[hi])
-                    del(na[ii][hi])
-                    for jj in na[ii]:
-                        ta[jj][ii]=na[ii][jj]
-                    #print "new row "+ii+str(na[ii].keys());##
-                # remove na[hi], ta[hi] and ta's corresponding to na[hi]
-                for ii in na[hi]:
-                    del(ta[ii][hi])
-                del(na[hi])
-                del(ta[hi])
-                # update loop dictionary
-                loop[lo]=loop.get(lo,oset((lo,)))
-                loop[lo].update(loop.get(hi, oset((hi,))))
-                if hi in loop:
-                    del(loop[hi])
-                #print "loop:"+str(loop)
-                return(found)
-def lowtri(A):
-    """Try low triangular ordering of matrix A entries"""
-    unsrt=[*A.keys()]
-    srt=list()
-    # first get inputs (no influences on them)
-    srt=[k for k in unsrt if len(A[k])==1]
-    for k in srt:
-        unsrt.remove(k)
-    # now move to lower number keys that influence others
-    while unsrt:
-        for k in list(unsrt):
-            srt.extend(oset(A[k].keys()).difference(oset(srt)))
-            for i in [*A[k].keys()]:
-                try:
-                    unsrt.remove(i)
-                except:
-                    pass
-    return srt
-def topo_order(A, tA):
-    """Try to sort keys of A in topological order. tA is just a transpose of A"""
-    unsrt=oset(A.keys())
-    srtin=list()
-    srtout=list()
-    
-    while unsrt:
-        # shave inputs and outputs
-        inps=oset(k for k in unsrt if len(oset(A[k]).difference(srtin))==1)
-        srtin.extend(inps)
-        unsrt.difference_update(inps)
-        outs=oset(k for k in unsrt if len(oset(tA[k]).difference(unsrt))==1)
-        if outs:
-            srtout.insert(0, outs)
-            unsrt.difference_update(outs)
-        if not inps and not outs:
-            # this is not a dag
-            srtin.extend(unsrt)
-            #print "not a dag"
-            break
-    return(srtin+srtout)
 def transpose(A):
     """Transpose a matrix defined as a dict."""
     tA=dict()
@@ -2288,12 +2312,387 @@ def transpose(A):
             tA[j]=tA.get(j, dict())
             tA[j][i]=A[i][j]
     return(tA)
+def cumo_sys_dict(netan, werr=werr):
+    """Full cumomer systems A*x=b as nested dicts (one by weight) in
+    netan["cumo_sys"] and ordered cumomer lists in netan["vcumo"].
+    A[w-1][cumo][in_cumo] is a list of fluxes, b[w-1][cumo][flux][imetab]
+    is a list of lighter (or input) cumomers whose product is multiplied by flux.
+    Cf. cumo_sys_coo() for a vectorized version.
+    """
+    Cmax=netan["Cmax"]
+    res=netan["cumo_sys"]
+    res["A"]=[{} for i in range(Cmax)]
+    res["b"]=[{} for i in range(Cmax)]
+    try:
+        # run through all reactions and update bilan of involved cumomers
+        for (reac,lrdict) in netan["carbotrans"].items():
+            # run through metabs
+            ## aff("lrdict", lrdict);#
+            for (imetab,lr,metab,cstr) in ((imetab,lr,metab,cstr)
+                    for (lr,lst) in lrdict.items()
+                    for (imetab,(metab,cstr)) in enumerate(lst)):
+                # if output metab then influx is set to 1
+                # so its cumomer distribution is directly
+                # defined by cumodistr of inputs
+                Clen=netan["Clen"][metab]
+                # input metabolite has fixed value so put it in rhs
+                # when it is an influx for some internal cumomer
+                if metab in netan["input"] or metab in netan["output"]:
+                    continue
+                # 'out' part of this metab
+                fwd_rev=("fwd." if lr=="left" else "rev.")
+                flux=fwd_rev+reac
+                #if (fwd_rev=="fwd." or reac not in netan["notrev"]):
+                if (fwd_rev=="fwd." or reac not in netan["flux_inout"]):
+                    # add this out-flux
+                    # run through all cumomers of metab
+                    for icumo in range(1,1<<Clen):
+                        cumo=metab+":"+str(icumo)
+                        w=sumbit(icumo)
+                        #print "w,i,clen,metab=", w, icumo,Clen,metab;##
+                        if cumo not in res["A"][w-1]:
+                            res["A"][w-1][cumo]={cumo:[]}
+                        # main diagonal term ('out' part)
+                        res["A"][w-1][cumo][cumo].append(flux)
+                        ##print 'm,ic,w='+metab, icumo, w;#
+                        ##aff("res["A"][w-1][cumo][cumo]", res["A"][w-1][cumo][cumo]);#
+                # 'in' part
+                fwd_rev=("rev." if lr=="left" else "fwd.")
+                flux=fwd_rev+reac
+                in_lr=("left" if lr=="right" else "right")
+                #if (fwd_rev=="rev." and reac in netan["notrev"]):
+                if (fwd_rev=="rev." and reac in netan["flux_inout"]):
+                    # this cannot be by definition
+                    continue
+                # add this in-flux
+                for (in_i,(in_metab, in_cstr)) in enumerate(lrdict[in_lr]):
+                    # run through all cumomers of metab
+                    for icumo in range(1,1<<Clen):
+                        cumo=metab+":"+str(icumo)
+                        w=sumbit(icumo)
+                        # get in_cumo
+                        in_icumo=src_ind(in_cstr, cstr, icumo)
+                        if in_icumo==None:
+                            continue
+                        in_cumo=in_metab+":"+str(in_icumo)
+                        in_w=sumbit(in_icumo)
+                        if cumo not in res["A"][w-1]:
+                            res["A"][w-1][cumo]={cumo:[]}
+                        if in_w==w:
+                            if in_metab in netan["input"]:
+                                # put it in rhs
+                                if cumo not in res["b"][w-1]:
+                                    res["b"][w-1][cumo]=dict()
+                                if flux not in res["b"][w-1][cumo]:
+                                    res["b"][w-1][cumo][flux]=dict()
+                                if imetab not in res["b"][w-1][cumo][flux]:
+                                    res["b"][w-1][cumo][flux][imetab]=[]
+                                if not netan["cumo_input"] or in_cumo not in netan["cumo_input"][0]:
+                                    # put this in_cumo ih the dict
+                                    iso2cumo(netan, "cumo_input", in_cumo, in_icumo, in_metab)
+                                res["b"][w-1][cumo][flux][imetab].append(in_cumo)
+                            else:
+                                if in_cumo not in res["A"][w-1][cumo]:
+                                    res["A"][w-1][cumo][in_cumo]=[]
+                                # matrix: linearized off-diagonal term
+                                res["A"][w-1][cumo][in_cumo].append(flux)
+                        elif in_w < w:
+                            # put lighter cumomer product in rhs list[iterm]
+                            if cumo not in res["b"][w-1]:
+                                res["b"][w-1][cumo]=dict()
+                            if flux not in res["b"][w-1][cumo]:
+                                res["b"][w-1][cumo][flux]=dict()
+                            if imetab not in res["b"][w-1][cumo][flux]:
+                                res["b"][w-1][cumo][flux][imetab]=[]
+                            #res["b"][w-1][cumo][flux][imetab].append(
+                            #    in_cumo if in_metab not in netan["input"] else
+                            #    netan["cumo_input"][in_cumo])
+                            res["b"][w-1][cumo][flux][imetab].append(in_cumo)
+                            #print "b="+str(res["b"][w-1][cumo][flux]);##
+                        # if in_w==0 then in_cumo=1 by definition => ignore here
+                        # in_w cannot be > w because of src_ind()
+    except Exception as inst:
+        werr(": ".join(inst)+"\n")
+    #netan["cumo_input"]=[dict((k,(v if v==v else 0.)) for k,v in d.items()) for d in netan["cumo_input"]]
+    # ordered cumomer lists
+    #for w in range(1,netan["Cmax"]+1):
+        # weight 1 equations have all metabolites
+        ##aff("A "+str(w), netan["cumo_sys"]["A"][w-1]);#
+        ##aff("b "+str(w), netan["cumo_sys"]["b"][w-1]);#
+        # order cumos along pathways
+        # starts are input cumomers
+    #    starts=[cumo for cumo in netan["cumo_sys"]["A"][w-1] \
+    #        if cumo.split(":")[0] in netan["input"]]
+        ##aff("st "+str(w), starts)
+        # complete starts by all others cumomers
+    #    starts+=[c for c in netan["cumo_sys"]["A"][w-1] if not c in starts]
+    #    cumo_paths=cumo_path(starts, netan["cumo_sys"]["A"][w-1], oset())
+        # order
+    #    netan["vcumo"].append([cumo for cumo in valval(cumo_paths)])
+    netan["vcumo"]=[[*a.keys()] for a in netan["cumo_sys"]["A"]]
+    return netan["cumo_sys"]
+@lru_cache(maxsize=None)
+def cumo_masks(clen):
+    """List of integer arrays (one per weight 0..clen) of cumomer indexes
+    in [0; 2**clen) having this weight (in increasing order)."""
+    masks=np.arange(1<<clen, dtype=np.int64)
+    pc=sumbit_vec(masks)
+    return [masks[pc == w] for w in range(clen+1)]
+def cumo_sys_coo(netan, maxmem=None, dirtmp=None, wout=wout):
+    """Full cumomer systems A*x=b as index arrays, one system by weight.
+    It is a vectorized equivalent of cumo_sys_dict() producing the same
+    cumomer order (in netan["vcumo"]) and the same order of entries.
+    Result is stored in netan["cumo_sys_coo"] and returned as a dict:
+
+     - A: list of integer arrays (nnz, 3) with columns (ifwrv, ir, ic),
+       ifwrv being 0-based index in netan["vflux_fwrv"]["fwrv"] and ir, ic 0-based
+       cumomer indexes in netan["vcumo"][w-1]. Diagonal terms (ir==ic) are outgoing
+       fluxes, off-diagonal are incoming ones.
+     - b: list of integer arrays (nb, 2+maxprod) with columns (ifwrv, ir, incu_1, ...)
+       where incu_i are 1-based indexes in incu=c(1, cumo_input, cumomers)
+       whose product is multiplied by the flux. Unused incu_i are set to 1.
+     - nb_c: cumomer numbers by weight.
+
+    Expected system size is reported with wout() before building.
+    If a weight block occupies more than maxmem bytes, it is saved
+    in a .npy file in dirtmp (temporary dir by default) and memory mapped.
+    """
+    minput=netan["input"]
+    moutput=netan["output"]
+    notin=netan["flux_inout"]
+    Clen=netan["Clen"]
+    fwrv2i=netan["vflux_fwrv"]["fwrv2i"]
+    Cmax=netan["Cmax"]
+    # cumomer keys are (mid<<Cmax) | icumo
+    m2i,i2m,_=metab_ids(netan)
+    # events are (metab, cstr, ifl_out, ifl_in, in_list) in the loop order of cumo_sys_dict()
+    # ifl_out=-1 (ifl_in=-1) if there is no 'out' ('in') part
+    events=[]
+    for (reac,lrdict) in netan["carbotrans"].items():
+        for (lr,lst) in lrdict.items():
+            in_lr="left" if lr == "right" else "right"
+            fout=("fwd." if lr == "left" else "rev.")+reac
+            fin=("rev." if lr == "left" else "fwd.")+reac
+            ifout=fwrv2i[fout] if (lr == "left" or reac not in notin) else -1
+            ifin=-1 if (lr == "left" and reac in notin) else fwrv2i[fin]
+            lin=[(m2i[in_metab], in_metab in minput, in_cstr) for (in_metab,in_cstr) in lrdict[in_lr]]
+            for (metab,cstr) in lst:
+                if metab in minput or metab in moutput:
+                    continue
+                events.append((metab, cstr, ifout, ifin, lin))
+    # expected size
+    smet=oset(e[0] for e in events)
+    nb_c=[sum(math.comb(Clen[m], w) for m in smet) for w in range(1, Cmax+1)]
+    nb_a=sum(((1<<Clen[m])-1)*((ifo >= 0)+(ifi >= 0)*len(lin)) for (m,c,ifo,ifi,lin) in events)
+    nb_b=sum(((1<<Clen[m])-1)*len(lin) for (m,c,ifo,ifi,lin) in events if ifi >= 0)
+    wout("cumo_sys_coo: full cumomer system: %d cumomers (by weight: %s), at most %d entries in A and %d in b (%.1f MB)\n"%(sum(nb_c), ", ".join(str(n) for n in nb_c), nb_a, nb_b, (3*nb_a+4*nb_b)*8/2**20))
+
+    A=[]
+    b=[]
+    ckeys=[] # sorted cumomer keys (mid<<Cmax | icumo) by weight
+    corder=[] # their order index in vcumo
+    nb_c=[]
+    # input cumomers: key -> [order tuple, order tuple if only lighter, in_metab, icumo, provisional id]
+    dinput=dict()
+    def cumo_ind(keys, w, what):
+        "indexes of cumomer keys in vcumo[w-1]"
+        ks=ckeys[w-1]
+        i=np.searchsorted(ks, keys)
+        i[i >= len(ks)]=0
+        bad=(ks[i] != keys) if len(ks) else np.ones(len(keys), dtype=bool)
+        if bad.any():
+            k=int(keys[np.where(bad)[0][0]])
+            raise Exception("cumo_sys_coo: cumomer '%s:%d' used in %s is not defined in weight %d"%(i2m[k>>Cmax], k&((1<<Cmax)-1), what, w))
+        return corder[w-1][i]
+    for w in range(1, Cmax+1):
+        # row candidates (key, e, part, in_i, icumo)
+        rk=[]; ro=[]
+        # A entries (row key, col key, ifl, e, part, in_i)
+        ar=[]; ac=[]; af=[]; ao=[]
+        # b members (row key, e, ifl, in_i, ref) where ref>=0 is a lighter cumomer key
+        # and ref<0 is an input cumomer with provisional id -ref-1
+        br=[]; bo=[]; bf=[]; bref=[]
+        for (e,(metab,cstr,ifout,ifin,lin)) in enumerate(events):
+            clen=Clen[metab]
+            if w > clen:
+                continue
+            icumo=cumo_masks(clen)[w]
+            n=len(icumo)
+            mkey=(m2i[metab]<<Cmax) | icumo
+            if ifout >= 0:
+                rk.append(mkey)
+                okey=np.empty((n, 3), dtype=np.int64)
+                okey[:]=(e, 0, 0)
+                ro.append(okey)
+                ar.append(mkey); ac.append(mkey); af.append(np.full(n, ifout)); ao.append(okey)
+            if ifin < 0:
+                continue
+            for (in_i,(in_mid,in_input,in_cstr)) in enumerate(lin):
+                in_icumo=src_ind_vec(in_cstr, cstr, icumo)
+                iv=in_icumo > 0
+                if not iv.any():
+                    continue
+                in_icumo=in_icumo[iv]
+                nv=len(in_icumo)
+                okey=np.empty((nv, 3), dtype=np.int64)
+                okey[:]=(e, 1, in_i)
+                rk.append(mkey[iv])
+                ro.append(okey)
+                in_w=sumbit_vec(in_icumo)
+                in_key=(in_mid<<Cmax) | in_icumo
+                if in_input:
+                    # provisional ids for input cumomers
+                    ref=np.empty(nv, dtype=np.int64)
+                    for (j,(k,iw,ic)) in enumerate(zip(in_key.tolist(), in_w.tolist(), icumo[iv].tolist())):
+                        o=(e, in_i, ic)
+                        d=dinput.get(k)
+                        if d is None:
+                            d=dinput[k]=[None, None, in_mid, k&((1<<Cmax)-1), len(dinput)]
+                        if iw == w:
+                            d[0]=o if d[0] is None else min(d[0], o)
+                        else:
+                            d[1]=o if d[1] is None else min(d[1], o)
+                        ref[j]=-d[4]-1
+                    br.append(mkey[iv]); bo.append(okey); bf.append(np.full(nv, ifin)); bref.append(ref)
+                else:
+                    ie=in_w == w
+                    if ie.any():
+                        ar.append(mkey[iv][ie]); ac.append(in_key[ie]); af.append(np.full(ie.sum(), ifin)); ao.append(okey[ie])
+                    il=~ie
+                    if il.any():
+                        br.append(mkey[iv][il]); bo.append(okey[il]); bf.append(np.full(il.sum(), ifin)); bref.append(in_key[il])
+        # cumomer order
+        if rk:
+            rk=np.concatenate(rk)
+            ro=np.vstack(ro)
+            rico=rk & ((1<<Cmax)-1)
+            o=np.lexsort((rico, ro[:,2], ro[:,1], ro[:,0]))
+            uk,ifirst=np.unique(rk[o], return_index=True)
+            # uk is sorted, its order in vcumo is given by ifirst
+            rank=np.empty(len(uk), dtype=np.int64)
+            rank[np.argsort(ifirst, kind="stable")]=np.arange(len(uk))
+        else:
+            uk=np.zeros(0, dtype=np.int64)
+            rank=np.zeros(0, dtype=np.int64)
+        ckeys.append(uk)
+        corder.append(rank)
+        nc=len(uk)
+        nb_c.append(nc)
+        vc=np.empty(nc, dtype=np.int64)
+        vc[rank]=uk
+        netan["vcumo"][w-1]=[i2m[k>>Cmax]+":"+str(k&((1<<Cmax)-1)) for k in vc.tolist()]
+        # matrix A
+        if ar:
+            ir=cumo_ind(np.concatenate(ar), w, "A rows")
+            ic=cumo_ind(np.concatenate(ac), w, "A")
+            af=np.concatenate(af)
+            ao=np.vstack(ao)
+            o=np.lexsort((ao[:,2], ao[:,1], ao[:,0]))
+            ir=ir[o]; ic=ic[o]; af=af[o]
+            # group rank: diagonal first, then in order of first appearance
+            pair=ir*nc+ic
+            _,ifirst,inv=np.unique(pair, return_index=True, return_inverse=True)
+            grp=ifirst[inv]
+            grp[ir == ic]=-1
+            o=np.lexsort((np.arange(len(ir)), grp, ir))
+            Aw=np.column_stack((af[o], ir[o], ic[o]))
+        else:
+            Aw=np.zeros((0, 3), dtype=np.int64)
+        # rhs b
+        if br:
+            ir=cumo_ind(np.concatenate(br), w, "b rows")
+            bo=np.vstack(bo)
+            bf=np.concatenate(bf)
+            bref=np.concatenate(bref)
+            # lighter cumomers to provisional incu codes: >=0 are global cumomer indexes
+            il=bref >= 0
+            if il.any():
+                lk=bref[il]
+                lw=sumbit_vec(lk & ((1<<Cmax)-1))
+                g=np.empty(len(lk), dtype=np.int64)
+                for lwi in np.unique(lw):
+                    j=lw == lwi
+                    g[j]=cumo_ind(lk[j], int(lwi), "b")+sum(nb_c[:lwi-1])
+                bref[il]=g
+            # terms are (ir, e), members are ordered by in_i
+            o=np.lexsort((bo[:,2], bo[:,0], ir))
+            ir=ir[o]; bo=bo[o]; bf=bf[o]; bref=bref[o]
+            tkey=ir*len(events)+bo[:,0]
+            newt=np.r_[True, tkey[1:] != tkey[:-1]]
+            it=np.cumsum(newt)-1
+            pos=np.arange(len(ir))-np.flatnonzero(newt)[it]
+            maxprod=int(pos.max())+1
+            nt=int(it[-1])+1
+            bw=np.full((nt, 2+maxprod), np.iinfo(np.int64).min, dtype=np.int64)
+            bw[:,0]=bf[newt]
+            bw[:,1]=ir[newt]
+            bw[it,2+pos]=bref
+        else:
+            bw=np.zeros((0, 2), dtype=np.int64)
+        if maxmem is not None and Aw.nbytes+bw.nbytes > maxmem:
+            if dirtmp is None:
+                dirtmp=tempfile.mkdtemp(prefix="influx_cumo_sys_")
+            os.makedirs(dirtmp, exist_ok=True)
+            for (nm,arr) in (("A",Aw), ("b",bw)):
+                fnm=os.path.join(dirtmp, "cumo_sys_w%d_%s.npy"%(w, nm))
+                np.save(fnm, arr)
+                if nm == "A":
+                    Aw=np.load(fnm, mmap_mode="r")
+                else:
+                    bw=np.load(fnm, mmap_mode="r+")
+        A.append(Aw)
+        b.append(bw)
+    # input cumomers in order of appearance (first, those of equal weight)
+    li=sorted(dinput.values(), key=lambda d: (d[0] is None, d[0] or d[1]))
+    ninp=len(li)
+    pid2incu=np.empty(ninp, dtype=np.int64)
+    items=[]
+    for (i,d) in enumerate(li):
+        in_metab=i2m[d[2]]
+        in_cumo=in_metab+":"+str(d[3])
+        if not netan["cumo_input"] or in_cumo not in netan["cumo_input"][0]:
+            items.append((in_cumo, d[3], in_metab))
+        pid2incu[d[4]]=i+2
+    iso2cumo_batch(netan, "cumo_input", items)
+    # final incu indexes in b
+    for bw in b:
+        if bw.shape[1] > 2:
+            x=bw[:,2:]
+            unused=x == np.iinfo(np.int64).min
+            inp=(x < 0) & ~unused
+            x[inp]=pid2incu[-x[inp]-1]
+            x[~inp & ~unused]+=ninp+2
+            x[unused]=1
+        if isinstance(bw, np.memmap):
+            bw.flush()
+    netan["cumo_sys_coo"]={"A": A, "b": b, "nb_c": nb_c}
+    return netan["cumo_sys_coo"]
+def metab_ids(netan):
+    """metab_ids(netan)->(m2i, i2m, cbits)
+    Integer ids of metabolites (in the order of netan["Clen"]) used in integer
+    cumomer keys key=(id<<cbits)|icumo where cbits=netan["Cmax"].
+    m2i maps metabolite names to ids, i2m is the reverse list.
+    Integer keys are internal to rcumo_sys() and ms_frag_gath(). Measurement
+    matrices and other netan entries keep "metab:icumo" strings as they are
+    written in kvh and read by ftbl2code.
+    """
+    i2m=list(netan["Clen"])
+    return (dict((m,i) for (i,m) in enumerate(i2m)), i2m, netan["Cmax"])
+def cumo_key(cumo, m2i, cbits):
+    """Integer key of a cumomer "metab:icumo" (cf. metab_ids())"""
+    (metab, icumo)=cumo.split(":")
+    return (m2i[metab]<<cbits) | int(icumo)
+def key2cumo(key, i2m, cbits):
+    """Cumomer string "metab:icumo" from its integer key (cf. metab_ids())"""
+    return i2m[key>>cbits]+":"+str(key & ((1<<cbits)-1))
 def rcumo_sys(netan, emu=False):
     """Calculate reduced cumomers or EMU systems A*x=b
     we start with observed cumomers (emus) of max weight
     and we include only needed involved cumomers (emus)
     A list of cumomer (emu) lists (by weight) is stored
     in netan["vrcumo"] (netan["vemu"])
+    Cumomers are handled as integer keys (cf. metab_ids()),
+    strings "metab:icumo" are made only for the resulting systems.
     """
     # generate measurements dico if not yet done
     if "measures" not in netan:
@@ -2309,22 +2708,24 @@ def rcumo_sys(netan, emu=False):
         # init rcumo_input list of dicts
         netan["rcumo_input"]=[{} for i in range(n)]
     
+    m2i,i2m,cbits=metab_ids(netan)
+    cmask=(1<<cbits)-1
     # get cumomers involved in measurements
     meas_cumos=oset()
     if emu:
         for meas in measures:
             for item in measures[meas]:
                 for row in item["mat"]:
-                    metab=row["metab"]
-                    meas_cumos.update(metab+":"+i.split("+")[0] for i in [*row["emuco"].keys()]) # if i[-2:]!="+0")
+                    mid=m2i[row["metab"]]<<cbits
+                    meas_cumos.update(mid | int(i.split("+")[0]) for i in [*row["emuco"].keys()]) # if i[-2:]!="+0")
     else:
         for meas in measures:
             for item in measures[meas]:
                 for row in item["mat"]:
-                    metab=row["metab"]
-                    meas_cumos.update(metab+":"+str(icumo) for icumo in [*row["coefs"].keys()] if icumo != 0)
+                    mid=m2i[row["metab"]]<<cbits
+                    meas_cumos.update(mid | icumo for icumo in [*row["coefs"].keys()] if icumo != 0)
     # make list of observed weights
-    weights=oset(sumbit(int(cumo.split(":")[1])) for cumo in meas_cumos)
+    weights=oset(sumbit(key & cmask) for key in meas_cumos)
     if not weights:
         netan["vrcumo"]=[]
         netan["rcumo2i0"]=dict()
@@ -2335,93 +2736,106 @@ def rcumo_sys(netan, emu=False):
     weights=list(range(1,maxw+1))
     weights.reverse()
     
-    # cumomers to visit are stored in lists by weights
-    to_visit=dict((w,[]) for w in weights)
+    # cumomers to visit are stored in FIFO queues by weights
+    # queued[w] keeps all cumomers ever put in to_visit[w]
+    to_visit=dict((w,deque()) for w in weights)
+    queued=dict((w,set()) for w in weights)
     A=[{} for i in range(maxw)]; # store matrices by weight
     b=[{} for i in range(maxw)]; # store rhs by weight
-    used=oset()
+    used=set()
+    # (non labeled metabolites like growth outputs have no id)
+    minput=set(m2i[m] for m in netan["input"] if m in m2i)
+    moutput=set(m2i[m] for m in netan["output"] if m in m2i)
+    infl_idx=cumo_infl_index(netan)
+    inp_seen=set()
+    cumo_items=[]
+    emu_items=[]
 
     # initialize to_visit, we'll stop when it's empty
-    for cumo in meas_cumos:
-        (m,w)=cumo.split(":")
-        if m in netan["input"]:
+    for key in meas_cumos:
+        if key>>cbits in minput:
             continue
-        w=sumbit(int(w))
-        to_visit[w].append(cumo)
+        w=sumbit(key & cmask)
+        to_visit[w].append(key)
+        queued[w].add(key)
 
     # run through the network starting with heaviest cumomers
     for w in weights:
-        cumo_i=0
-        while cumo_i < len(to_visit[w]):
-            for cumo in to_visit[w]:
-                cumo_i+=1
-                if cumo in used:
-                    continue
-                # add this cumo to used
-                used.add(cumo)
-                (metab, icumo)=cumo.split(":")
-                if metab in netan["output"]:
-                    # no equation for output metabs
+        Aw=A[w-1]
+        bw=b[w-1]
+        qw=to_visit[w]
+        while qw:
+            cumo=qw.popleft()
+            if cumo in used:
+                continue
+            # add this cumo to used
+            used.add(cumo)
+            if cumo>>cbits in moutput:
+                # no equation for output metabs
+                continue
+            Aw[cumo]=Aw.get(cumo,{cumo:[]})
+            Ac=Aw[cumo]
+            # get the influents to cumo of all weights: equal and lower
+            # equals go to A and lowers go to b
+            infl=cumo_infl_key(cumo, infl_idx[i2m[cumo>>cbits]], cbits)
+            for (incumo,fl,imetab,iinmetab) in infl:
+                if incumo==cumo:
+                    # no equation as no transformation
                     continue
-                icumo=int(icumo)
-                A[w-1][cumo]=A[w-1].get(cumo,{cumo:[]})
-                # get the influents to cumo of all weights: equal and lower
-                # equals go to A and lowers go to b
-                infl=cumo_infl(netan, cumo)
-                #print("cumo=", cumo, "infl=", infl)
-                for (incumo,fl,imetab,iinmetab) in infl:
-                    if incumo==cumo:
-                        # no equation as no transformation
-                        continue
-                    (inmetab, inw)=incumo.split(":")
-                    inicumo=int(inw)
-                    inw=sumbit(inicumo)
-                    # input metabolites are to rhs, others are to visit
-                    if inmetab not in netan["input"] and inw != 0 and incumo not in to_visit[inw]:
-                        to_visit[inw].append(incumo)
-                    if inmetab in netan["input"]:
+                inmid=incumo>>cbits
+                inicumo=incumo & cmask
+                inw=sumbit(inicumo)
+                # input metabolites are to rhs, others are to visit
+                if inmid in minput:
+                    if incumo not in inp_seen:
+                        # input fractions are calculated in batch after the traversal
+                        inp_seen.add(incumo)
+                        inmetab=i2m[inmid]
+                        scumo=inmetab+":"+str(inicumo)
                         if emu:
-                            # tuple emu (mask, m+i, string)
-                            for mask, mpi, e in ((inicumo, i, incumo+"+"+str(i)) for i in range(inw+1)):
-                                iso2emu(netan, inmetab, mask, mpi, e)
-                        if not netan["rcumo_input"] or incumo not in netan["rcumo_input"][0]:
-                            iso2cumo(netan, "rcumo_input", incumo, inicumo, inmetab)
-                        #netan["rcumo_input"][incumo]=netan["cumo_input"][incumo]
-                    # main part: write equations
-                    if inw==w :
-                        # equal weight => A
-                        if inmetab in netan["input"]:
-                            b[w-1][cumo]=b[w-1].get(cumo, dict())
-                            b[w-1][cumo][fl]=b[w-1][cumo].get(fl, dict())
-                            b[w-1][cumo][fl][imetab]=b[w-1][cumo][fl].get(imetab,[])
-                            #b[w-1][cumo][fl][imetab].append(netan["cumo_input"][incumo])
-                            b[w-1][cumo][fl][imetab].append(incumo)
-                            continue
-                        A[w-1][cumo][incumo]=A[w-1][cumo].get(incumo,[])
-                        A[w-1][cumo][incumo].append(fl)
-                        #aff("A "+str(w)+cumo, A[w-1][cumo]);##
-                    elif inw < w:
-                        # lower weight => b
-                        b[w-1][cumo]=b[w-1].get(cumo, dict())
-                        b[w-1][cumo][fl]=b[w-1][cumo].get(fl, dict())
-                        b[w-1][cumo][fl][imetab]=b[w-1][cumo][fl].get(imetab,[])
-                        b[w-1][cumo][fl][imetab].append(incumo)
-                # gather all influx in diagonal term
-                #aff("A "+str(w)+" "+cumo, A[w-1][cumo]);##
-                #aff("b "+str(w)+" "+cumo, b[w-1].get(cumo));##
-                for incumo in A[w-1][cumo]:
-                    if incumo == cumo:
+                            # tuple emu (string, metab, mask, m+i)
+                            emu_items += [(scumo+"+"+str(i), inmetab, inicumo, i) for i in range(inw+1)]
+                        if not netan["rcumo_input"] or scumo not in netan["rcumo_input"][0]:
+                            cumo_items.append((scumo, inicumo, inmetab))
+                elif inw != 0 and incumo not in queued[inw]:
+                    to_visit[inw].append(incumo)
+                    queued[inw].add(incumo)
+                # main part: write equations
+                if inw==w :
+                    # equal weight => A
+                    if inmid in minput:
+                        bw[cumo]=bw.get(cumo, dict())
+                        bw[cumo][fl]=bw[cumo].get(fl, dict())
+                        bw[cumo][fl][imetab]=bw[cumo][fl].get(imetab,[])
+                        bw[cumo][fl][imetab].append(incumo)
                         continue
-                    A[w-1][cumo]=A[w-1].get(cumo,{cumo:[]})
-                    #print("adding A:", incumo, "->", cumo, A[w-1][cumo][incumo]);##
-                    A[w-1][cumo][cumo]+=A[w-1][cumo][incumo]
-                if cumo in b[w-1]:
-                    A[w-1][cumo]=A[w-1].get(cumo,{cumo:[]})
-                    #print("adding b:", cumo, b[w-1][cumo].keys());##
-                    A[w-1][cumo][cumo]+=[*b[w-1][cumo].keys()]
-    #import pdb; pdb.set_trace()
-    #netan["rcumo_input"]=[dict((k, (v if v==v else 0.)) for k,v in d.items()) for d in netan["rcumo_input"]]
-    #aff("to_v", to_visit);##
+                    Ac[incumo]=Ac.get(incumo,[])
+                    Ac[incumo].append(fl)
+                elif inw < w:
+                    # lower weight => b
+                    bw[cumo]=bw.get(cumo, dict())
+                    bw[cumo][fl]=bw[cumo].get(fl, dict())
+                    bw[cumo][fl][imetab]=bw[cumo][fl].get(imetab,[])
+                    bw[cumo][fl][imetab].append(incumo)
+            # gather all influx in diagonal term
+            for incumo in Ac:
+                if incumo == cumo:
+                    continue
+                Ac[cumo]+=Ac[incumo]
+            if cumo in bw:
+                Ac[cumo]+=[*bw[cumo].keys()]
+    iso2cumo_batch(netan, "rcumo_input", cumo_items)
+    if emu:
+        iso2emu_batch(netan, emu_items)
+    # integer keys -> strings (one string per cumomer)
+    k2s=dict()
+    def kstr(key):
+        s=k2s.get(key)
+        if s is None:
+            s=k2s[key]=i2m[key>>cbits]+":"+str(key & cmask)
+        return s
+    A=[dict((kstr(c), dict((kstr(ic), lf) for (ic,lf) in Ac.items())) for (c,Ac) in Aw.items()) for Aw in A]
+    b=[dict((kstr(c), dict((fl, dict((im, [kstr(k) for k in l]) for (im,l) in d.items())) for (fl,d) in bc.items())) for (c,bc) in bw.items()) for bw in b]
     # make ordered list for reduced cumomer set
     netan["vrcumo"]=[[*a.keys()] for a in A]
     netan["rcumo2i0"]=dict((cumo,i) for (i, cumo) in enumerate(valval(netan["vrcumo"])))
@@ -2438,51 +2852,75 @@ def rcumo_sys(netan, emu=False):
         netan["emu2i0"]=dict((emu,i) for (i, emu) in enumerate(valval(netan["vemu"])))
     return netan["rcumo_sys"]
 
-def cumo_infl(netan, cumo):
-    """cumo_infl(netan, cumo)->list(tuple(in_cumo, fl, imetab, iin_metab))
+def cumo_infl_index(netan, metabs=None):
+    """cumo_infl_index(netan, metabs=None)->dict(metab: list(tuple(fl, imetab, cstr, in_list)))
+    Index of label transitions producing metabolites from 'metabs'
+    (all metabolites from netan["sto_m_r"] if None).
+    fl is a flux (fwd.fl or rev.fl), imetab is the index of metab in
+    reaction side, cstr its carbon string and in_list is a list of
+    tuples (iin_metab, in_metab, in_str, in_mid) from the opposite side of reaction,
+    in_mid being the integer id of in_metab (cf. metab_ids()).
+    Tuples are in the order used by cumo_infl().
+    """
+    notin=netan["notrev"] if clownr else netan["flux_inout"]
+    carbotrans=netan["carbotrans"]
+    m2i=metab_ids(netan)[0]
+    res=dict()
+    for metab in (netan["sto_m_r"] if metabs is None else metabs):
+        sto=netan["sto_m_r"][metab]
+        li=[]
+        # run through input forward fluxes of this metab
+        for reac,coef in oset(sto["right"]):
+            if reac not in carbotrans:
+                continue # it can happen because of NOTRACER_NETWORK
+            lin=[(iin_metab, in_metab, in_str, m2i[in_metab]) for (iin_metab, (in_metab,in_str)) in enumerate(carbotrans[reac]["left"])]
+            li += [("fwd."+reac, imetab, cstr, lin) for (imetab,(m,cstr)) in enumerate(carbotrans[reac]["right"]) if m==metab]
+        # run through input reverse fluxes of this metab
+        # (non reversible reactions are all positive if clownr
+        # otherwise they can change sens => keep reverse flux just in case)
+        for reac in oset(f for f,c in sto["left"]):
+            if reac in notin or reac not in carbotrans:
+                continue
+            lin=[(iin_metab, in_metab, in_str, m2i[in_metab]) for (iin_metab, (in_metab,in_str)) in enumerate(carbotrans[reac]["right"])]
+            li += [("rev."+reac, imetab, cstr, lin) for (imetab,(m,cstr)) in enumerate(carbotrans[reac]["left"]) if m==metab]
+        res[metab]=li
+    return res
+def cumo_infl(netan, cumo, infl_idx=None):
+    """cumo_infl(netan, cumo, infl_idx=None)->list(tuple(in_cumo, fl, imetab, iin_metab))
     return the list of tuples (in_cumo, fl, imetab, iin_metab):
     input cumomer, flux (fwd.fl or rev.fl), index of metab and index of in_metab
     generating cumo. cumo is in format "metab:icumo".
     Condenstation reaction will give the same flux and icumo but various
     iin_metab.
     Convergent point will give multiple fluxes.
+    infl_idx is an index from cumo_infl_index(). If None, it is built
+    for the metabolite of cumo only.
+    Cf. cumo_infl_key() for integer cumomer keys.
     """
     (metab, icumo)=cumo.split(":")
     icumo=int(icumo)
+    if infl_idx is None:
+        infl_idx=cumo_infl_index(netan, (metab,))
     res=[]
-    # run through input forward fluxes of this metab
-    for reac,coef in oset(netan["sto_m_r"][metab]["right"]):
-        if reac not in netan["carbotrans"]:
-            continue # it can happen because of NOTRACER_NETWORK
-        # get all cstr for given metab
-        for (imetab,cstr) in ((i,s) for (i,(m,s)) in enumerate(netan["carbotrans"][reac]["right"])
-            if m==metab):
-            # get all input cumomer in this reaction for this cstr
-            for (iin_metab, (in_metab,in_str)) in enumerate(netan["carbotrans"][reac]["left"]):
-                in_icumo=src_ind(in_str, cstr, icumo)
-                if in_icumo != None:
-                    in_cumo=in_metab+":"+str(in_icumo)
-                    res.append((in_cumo, "fwd."+reac, imetab, iin_metab))
-    # run through input reverse fluxes of this metab
-    fluxset=oset(f for f,c in netan["sto_m_r"][metab]["left"])
-    if (clownr):
-        # non reversible reactions are all positive
-        fluxset=fluxset.difference(netan["notrev"])
-    else:
-        # non reversible reactions can change sens => keep reverse flux just in case
-        fluxset=fluxset.difference(netan["flux_inout"])
-    for reac in fluxset:
-        # get all cstr for given metab
-        if reac not in netan["carbotrans"]:
-            continue
-        for (imetab,cstr) in ((i,s) for (i,(m,s)) in enumerate(netan["carbotrans"][reac]["left"])
-            if m==metab):
-            # get all input cumomer in this reaction for this cstr
-            for (iin_metab, (in_metab,in_str)) in enumerate(netan["carbotrans"][reac]["right"]):
-                in_icumo=src_ind(in_str, cstr, icumo)
-                if in_icumo != None:
-                    in_cumo=in_metab+":"+str(in_icumo)
-                    res.append((in_cumo, "rev."+reac, imetab, iin_metab))
+    for (fl, imetab, cstr, lin) in infl_idx[metab]:
+        # get all input cumomer in this reaction for this cstr
+        for (iin_metab, in_metab, in_str, in_mid) in lin:
+            in_icumo=src_ind(in_str, cstr, icumo)
+            if in_icumo != None:
+                res.append((in_metab+":"+str(in_icumo), fl, imetab, iin_metab))
+    return res
+def cumo_infl_key(key, infl_li, cbits):
+    """cumo_infl_key(key, infl_li, cbits)->list(tuple(in_key, fl, imetab, iin_metab))
+    Same as cumo_infl() but for an integer cumomer key (cf. metab_ids()).
+    infl_li is the entry of cumo_infl_index() for the metabolite of key.
+    """
+    icumo=key & ((1<<cbits)-1)
+    res=[]
+    for (fl, imetab, cstr, lin) in infl_li:
+        for (iin_metab, in_metab, in_str, in_mid) in lin:
+            in_icumo=src_ind(in_str, cstr, icumo)
+            if in_icumo != None:
+                res.append(((in_mid<<cbits) | in_icumo, fl, imetab, iin_metab))
     return res
 def infl(metab, netan):
     """infl(metab, netan)->oset(fluxes)
@@ -2501,11 +2939,7 @@ def t_iso2m(n):
     n - carbon number
     return numpy array of size (n+1,2**n)
     """
-    # isotopomer number
-    ni=2**n
-    return np.array(
-        [[1. if sumbit(ii)==im else 0 for ii in range(ni)] for im in range(n+1)]
-    )
+    return (sumbit_vec(np.arange(1<<n))==np.arange(n+1)[:,None]).astype(float)
 
 def t_iso2cumo(n):
     """t_iso2cumo(n) return transition matrix from isotopomers fractions to cumomer vector
@@ -2522,6 +2956,48 @@ def t_iso2cumo(n):
     m[0:nc1,0:nc1],m[0:nc1,nc1:],m[nc1:,nc1:]=m_1,m_1,m_1
     return m
 
+def iso2cumo_vec(x):
+    """iso2cumo_vec(x) return cumomer vector(s) from isotopomer fractions x
+    without building t_iso2cumo() matrix (superset sum transform in O(n*2^n)).
+    The first dimension of x is 2^n, other dimensions if any
+    are batch ones (e.g. parallel label inputs).
+    """
+    return zeta_sup(x, 1.)
+
+def cumo2iso_vec(x):
+    """cumo2iso_vec(x) return isotopomer fractions from cumomer vector(s) x
+    (inverse of iso2cumo_vec(), Moebius transform in O(n*2^n)).
+    """
+    return zeta_sup(x, -1.)
+
+def zeta_sup(x, sign):
+    """Superset sum (sign=1) or its inverse (sign=-1) transform along the first dimension of x.
+    Return a new float array."""
+    x=np.array(x, dtype=float)
+    ni=x.shape[0]
+    n=ni.bit_length()-1
+    if ni != 1<<n:
+        raise Exception("zeta_sup: first dimension (%d) must be a power of 2"%ni)
+    y=x.reshape((ni, -1))
+    for k in range(n):
+        v=y.reshape((ni>>(k+1), 2, 1<<k, -1))
+        v[:,0]+=sign*v[:,1]
+    return x
+
+def iso2mid_vec(x):
+    """iso2mid_vec(x) return MID vector(s) of size n+1 from isotopomer fractions x
+    whose first dimension is 2^n (cf. t_iso2m()).
+    """
+    x=np.asarray(x, dtype=float)
+    n=x.shape[0].bit_length()-1
+    res=np.zeros((n+1,)+x.shape[1:])
+    np.add.at(res, sumbit_vec(np.arange(x.shape[0])), x)
+    return res
+
+def cumo2mid_vec(x):
+    """cumo2mid_vec(x) return MID vector(s) from cumomer vector(s) x"""
+    return iso2mid_vec(cumo2iso_vec(x))
+
 def t_iso2pos(n):
     """t_iso2pos(n) return transition matrix from isotopomers fractions to positional
     labelling vector (cumomers of weight 1)
@@ -2548,26 +3024,27 @@ def ms_frag_gath(netan):
     observed in MS measurements.
     The fragment mask is encoded in the same way as cumomers, Met:7 <=> Met#(0)111
     """
-    frags=oset()
+    m2i,i2m,cbits=metab_ids(netan)
     to_visit=oset()
     for di in netan["mass_meas"]:
         for m_id in di:
             for mask in di[m_id]:
                 # just the first weight item is sufficient
                 item=[*di[m_id][mask].values()][0]
-                to_visit.update(met+":"+str(mask) for met in item["pooled"])
+                to_visit.update((m2i[met]<<cbits) | mask for met in item["pooled"])
+    frags=[]
+    queued=set(to_visit)
+    to_visit=deque(to_visit)
+    infl_idx=cumo_infl_index(netan)
     while to_visit:
-        for frag in list(to_visit):
-            if frag in frags:
-                # already accounted
-                to_visit.remove(frag)
-                continue
-            frags.add(frag)
-            to_visit.remove(frag)
-            # add its contributors for visiting
-            to_visit.update(incumo for (incumo,fl,imetab,iinmetab) in cumo_infl(netan, frag))
-            break
-    return(frags)
+        frag=to_visit.popleft()
+        frags.append(frag)
+        # add its contributors for visiting
+        for (incumo,fl,imetab,iinmetab) in cumo_infl_key(frag, infl_idx[i2m[frag>>cbits]], cbits):
+            if incumo not in queued:
+                queued.add(incumo)
+                to_visit.append(incumo)
+    return(oset(key2cumo(k, i2m, cbits) for k in frags))
 def ntimes(n):
     """Return charcater string 'once' for n=1, 'twice' for n=2 and 'n times' for other n"""
     return("once" if n==1 else "twice" if n==2 else "%d times"%n)
@@ -33,23 +33,82 @@ dirr=os.path.join(os.path.dirname(os.path.realpath(influx_si.__file__)), "R")
 from tools_ssg import *
 import C13_ftbl
 
-def netan2Abcumo_spr(varname, Al, bl, vcumol, minput, f, fwrv2i, incu2i_b1):
-    """
-    Transform cumomer linear sytems collection (from ftbl file)
-    to a R code calculating sparse matrix A and vector b
-    in A*x+b=0 for a given weight of fragment iw (index in resulting list)
-    Flux vector fl of all fwd. and rev. fluxes are known at R runtime.
-    
-    Resulting code is a list sprAb indexed by cumomer weight
-    (cf. generated R comments for details on sprAb)
-    cumomer vector incu=c(1, xi, xl), xi - input cumomers, xl - lighter cumomers.
-    
-    incu2i_b1 gives i in incu from cumomer name. i=1 corresponds to the constant 1.
-    """
-    #2012-02-08 sokol
-    #2016-09-23 sokol: any number of fused fragments in b (not limited to 2 as before)
-    
-    nb_cumu=cumsum(len(l) for l in vcumol)
+# binary sidecar for big vectors of generated R code (cf. bin_open(), rvec()).
+# If None, vectors are written as R literals c(...)
+fbin=None
+# vectors shorter than bin_min are always written as R literals
+bin_min=100
+# digest of inputs written in the header of R code (cf. ftbl_cache.ftbl_key())
+digest=None
+# position of the digest in the header, it is written when the code is complete (cf. digest_write())
+digest_pos=None
+
+def bin_open(n_R):
+    """Open binary sidecar <n_R without .R>.Rbin for big vectors of R code n_R.
+    Its manifest (tab separated: name, mode, offset, length) is written in
+    <sidecar>.tsv by bin_close(). Return the sidecar path."""
+    global fbin
+    if fbin is not None:
+        bin_close()
+    p=Path(n_R).with_suffix(".Rbin")
+    fbin={"path": p, "f": p.open("wb"), "man": dict()}
+    return p
+
+def bin_close():
+    """Close binary sidecar and write its manifest"""
+    global fbin
+    if fbin is None:
+        return
+    fbin["f"].close()
+    with open(str(fbin["path"])+".tsv", "w") as fm:
+        fm.write("name\tmode\toffset\tlength\n")
+        fm.write("".join("%s\t%s\t%d\t%d\n"%(nm, mode, off, n) for (nm, (mode, off, n)) in fbin["man"].items()))
+    fbin=None
+
+def digest_write(f):
+    """Write input digest in the header of complete R code f (cf. netan2Rinit())"""
+    global digest_pos
+    if not digest or digest_pos is None:
+        return
+    f.seek(digest_pos)
+    f.write("# Input digest: %s\n"%digest)
+    f.seek(0, os.SEEK_END)
+    digest_pos=None
+
+def rvec(nm, v, mode="integer"):
+    """R expression giving the vector v (list or array).
+    mode is one of "integer" (written as int32), "double" (float64) or "character"
+    (NUL terminated UTF-8 strings).
+    If binary sidecar is open and len(v) >= bin_min, v is appended to it
+    under the name nm and the expression rbin("nm") is returned.
+    Otherwise, v is formatted as R literal c(...) (as.integer(c(...)) for integers)."""
+    if fbin is None or len(v) < bin_min:
+        if mode == "integer":
+            return "as.integer(c(%s))"%join(", ", v, width=120)
+        elif mode == "double":
+            return "c(%s)"%join(", ", v, width=120).replace("nan", "NA")
+        elif mode == "character":
+            return "c(%s)"%join(", ", v, '"', '"', width=120)
+        raise Exception("rvec: unknown mode '%s'"%mode)
+    if nm in fbin["man"]:
+        raise Exception("rvec: vector '%s' is already in binary sidecar"%nm)
+    if mode == "integer":
+        a=np.asarray(v, dtype=np.int64)
+        if len(a) and (a.min() < -2**31+1 or a.max() > 2**31-1):
+            raise Exception("rvec: vector '%s' does not fit in R integers"%nm)
+        b=a.astype("<i4").tobytes()
+    elif mode == "double":
+        b=np.asarray(v, dtype="<f8").tobytes()
+    elif mode == "character":
+        b=b"".join(str(s).encode("utf-8")+b"\0" for s in v)
+    else:
+        raise Exception("rvec: unknown mode '%s'"%mode)
+    fbin["man"][nm]=(mode, fbin["f"].tell(), len(v))
+    fbin["f"].write(b)
+    return 'rbin("%s")'%nm
+
+def Abcumo_spr_head(varname, f, nb_fwrv, nb_w):
+    """Write R header of sparse cumomer systems (cf. netan2Abcumo_spr())"""
     f.write(
     """
 # sparse matrix static parts
@@ -65,7 +124,7 @@ def netan2Abcumo_spr(varname, Al, bl, vcumol, minput, f, fwrv2i, incu2i_b1):
 #  b - unsigned sparse vector of right hand side
 
 if (TIMEIT) {
-   cat("%(var)-8s: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("%(var)-8s", fclog)
 }
 
 nb_fwrv=%(n)d
@@ -73,56 +132,17 @@ nb_w=%(nb_w)d
 %(var)s=list()
     """%{
     "var": varname,
-    "n": len(fwrv2i),
-    "nb_w": len(Al),
+    "n": nb_fwrv,
+    "nb_w": nb_w,
     })
-    # base of cumomers in composed vector incu=c(1, input, xcumo)
-    # +1 for c(1,...)
-    ba_x=len(incu2i_b1) - sum(len(l) for l in vcumol)+1
-    ba_xw=ba_x; # base for current weigth cumomer in incu
-    ncucumo=0
-    for (iwl,A) in enumerate(Al):
-        w=iwl+1
-        b=bl[iwl]
-        cumos=vcumol[iwl]
-        ncumo=len(cumos)
-        c2i=dict((c,i) for (i,c) in enumerate(cumos))
-        #d=[c for c in netan['cumo_sys']['A'][w-1] if not c in cumos]
-        if ncumo != len(A):
-            raise Exception("wrongCumomerNumber: ncumo=%d, nrow(A)=%d"%(ncumo, len(A)))
-        l_ia=[]; # list of non zero off-diagonal elements in A / row
-        l_ib=[]; # list of non zero elements in b / row
-        nb_maxfa=0; # how many fluxes in an off-diagonal term in a
-        if ncumo != 0 and len(b) == 0:
-            raise Exception(f"ftbl2code: netan2Abcumo_spr: at the label weight N° {iwl+1}, the right-hand-sides are all 0 which cannot be as the corresponding {ncumo} cumomers will be 0 too. The cumomer list is:\n\t"+"\n\t".join(cumos))
-        nb_maxprod=0 if ncumo == 0 else max(len(li) for cu,rdi in b.items() for fl,d in rdi.items() for i,li in d.items()); # how many cumomer fragments are fused in b
-        for irow in range(ncumo):
-            cr=cumos[irow]
-            row=A[cr]
-            # atuple is list of (icumo, list(fluxes))
-            atuple=[(c2i[c], [fwrv2i[fl] for fl in row[c]])
-                for c in row] #cumos if c in row and c!=cr]
-            #if atuple:
-            #    nb_maxfa=max(nb_maxfa, max(len(lf) for (ic, lf) in atuple))
-            #elif cr not in b:
-            #    raise Exception("Empty row in cumomer matrix, weight=%d (base 1), cumo=%s"%(w, cr))
-            # btuple is list of [iflux, [icumo1, icumo2, icumo_i,...]]
-            if cr in b:
-                btuple=[[fwrv2i[fl], [incu2i_b1[v] for v in l]+[1]*(nb_maxprod-len(l))]
-                    for (fl, d) in b[cr].items()
-                    for (i,l) in d.items()]
-                #nb_maxfb=max(nb_maxfb, len(btuple))
-            else:
-                btuple=[]
-            # one list per row
-            l_ia.append(atuple)
-            #nb_ax+=len(atuple)
-            l_ib.append(btuple)
-        #print("w=", w, "A=", A, "l_ia=", l_ia, "\n")
-        f.write(
+
+def Abcumo_spr_w(varname, f, w, ncumo, ncucumo, ba_x, maxprod, ind_a, ind_b):
+    """Write R code of sparse cumomer system for weight w (cf. netan2Abcumo_spr()).
+    ind_a and ind_b are flat lists (or arrays) of integers stored by rows (cf. rvec())."""
+    f.write(
 """
 if (TIMEIT) {
-   cat("weight %(w)2d: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("weight %(w)2d", fclog)
 }
 w=%(w)d
 nb_c=%(nbc)d
@@ -135,12 +155,12 @@ l$nb_cl=%(ncucumo)d # number of lighter cumomers
 maxprod=%(maxprod)d
 if (nb_c > 0) {
    # matrix a
-   ind_a=matrix(as.integer(c(%(ind_a)s)), ncol=3, byrow=TRUE)
+   ind_a=matrix(%(ind_a)s, ncol=3, byrow=TRUE)
    colnames(ind_a)=c("indf", "ir0", "ic0")
    l$ind_a=ind_a
    
    # vector b
-   ind_b=matrix(as.integer(c(%(ind_b)s)), ncol=2+%(maxprod)d, byrow=TRUE)
+   ind_b=matrix(%(ind_b)s, ncol=2+%(maxprod)d, byrow=TRUE)
    colnames(ind_b)=c("indf", "irow", paste("indx", seq_len(%(maxprod)d), sep=""))
    l$ind_b=ind_b
    
@@ -165,19 +185,109 @@ if (nb_c > 0) {
    "nbc": ncumo,
    "ncucumo": ncucumo,
    "ba_x": ba_x,
-   "maxprod": nb_maxprod,
-   "ind_a": join(", ", valval((ifl, ir, ic)
-      for (ir, lt) in enumerate(l_ia)
-      for (ic, lf) in lt
-      for ifl in lf), width=120),
-   "ind_b": join(", ", valval((ifl, ir+1, ", ".join(str(i) for i in ii))
-       for (ir, lt) in enumerate(l_ib)
-       for (ifl, ii) in lt
-   ), width=120),
+   "maxprod": maxprod,
+   "ind_a": rvec("%s.%d.ind_a"%(varname, w), ind_a),
+   "ind_b": rvec("%s.%d.ind_b"%(varname, w), ind_b),
 })
+
+def netan2Abcumo_spr(varname, Al, bl, vcumol, minput, f, fwrv2i, incu2i_b1):
+    """
+    Transform cumomer linear sytems collection (from ftbl file)
+    to a R code calculating sparse matrix A and vector b
+    in A*x+b=0 for a given weight of fragment iw (index in resulting list)
+    Flux vector fl of all fwd. and rev. fluxes are known at R runtime.
+    
+    Resulting code is a list sprAb indexed by cumomer weight
+    (cf. generated R comments for details on sprAb)
+    cumomer vector incu=c(1, xi, xl), xi - input cumomers, xl - lighter cumomers.
+    
+    incu2i_b1 gives i in incu from cumomer name. i=1 corresponds to the constant 1.
+    """
+    #2012-02-08 sokol
+    #2016-09-23 sokol: any number of fused fragments in b (not limited to 2 as before)
+    
+    nb_cumu=cumsum(len(l) for l in vcumol)
+    Abcumo_spr_head(varname, f, len(fwrv2i), len(Al))
+    # base of cumomers in composed vector incu=c(1, input, xcumo)
+    # +1 for c(1,...)
+    ba_x=len(incu2i_b1) - sum(len(l) for l in vcumol)+1
+    ba_xw=ba_x; # base for current weigth cumomer in incu
+    ncucumo=0
+    for (iwl,A) in enumerate(Al):
+        w=iwl+1
+        b=bl[iwl]
+        cumos=vcumol[iwl]
+        ncumo=len(cumos)
+        c2i=dict((c,i) for (i,c) in enumerate(cumos))
+        #d=[c for c in netan['cumo_sys']['A'][w-1] if not c in cumos]
+        if ncumo != len(A):
+            raise Exception("wrongCumomerNumber: ncumo=%d, nrow(A)=%d"%(ncumo, len(A)))
+        l_ia=[]; # list of non zero off-diagonal elements in A / row
+        l_ib=[]; # list of non zero elements in b / row
+        nb_maxfa=0; # how many fluxes in an off-diagonal term in a
+        if ncumo != 0 and len(b) == 0:
+            raise Exception(f"ftbl2code: netan2Abcumo_spr: at the label weight N° {iwl+1}, the right-hand-sides are all 0 which cannot be as the corresponding {ncumo} cumomers will be 0 too. The cumomer list is:\n\t"+"\n\t".join(cumos))
+        nb_maxprod=0 if ncumo == 0 else max(len(li) for cu,rdi in b.items() for fl,d in rdi.items() for i,li in d.items()); # how many cumomer fragments are fused in b
+        for irow in range(ncumo):
+            cr=cumos[irow]
+            row=A[cr]
+            # atuple is list of (icumo, list(fluxes))
+            atuple=[(c2i[c], [fwrv2i[fl] for fl in row[c]])
+                for c in row] #cumos if c in row and c!=cr]
+            #if atuple:
+            #    nb_maxfa=max(nb_maxfa, max(len(lf) for (ic, lf) in atuple))
+            #elif cr not in b:
+            #    raise Exception("Empty row in cumomer matrix, weight=%d (base 1), cumo=%s"%(w, cr))
+            # btuple is list of [iflux, [icumo1, icumo2, icumo_i,...]]
+            if cr in b:
+                btuple=[[fwrv2i[fl], [incu2i_b1[v] for v in l]+[1]*(nb_maxprod-len(l))]
+                    for (fl, d) in b[cr].items()
+                    for (i,l) in d.items()]
+                #nb_maxfb=max(nb_maxfb, len(btuple))
+            else:
+                btuple=[]
+            # one list per row
+            l_ia.append(atuple)
+            #nb_ax+=len(atuple)
+            l_ib.append(btuple)
+        #print("w=", w, "A=", A, "l_ia=", l_ia, "\n")
+        Abcumo_spr_w(varname, f, w, ncumo, ncucumo, ba_x, nb_maxprod,
+            [*valval((ifl, ir, ic)
+                for (ir, lt) in enumerate(l_ia)
+                for (ic, lf) in lt
+                for ifl in lf)],
+            [*valval([ifl, ir+1]+ii
+                for (ir, lt) in enumerate(l_ib)
+                for (ifl, ii) in lt)])
         ba_xw+=ncumo
         ncucumo+=ncumo
 
+def netan2Abcumo_coo(varname, coo, vcumol, f, nb_fwrv, nb_input):
+    """
+    Same R code as netan2Abcumo_spr() but written from index arrays
+    built by C13_ftbl.cumo_sys_coo() (flux and row indexes are 0-based there).
+    nb_input is the number of input cumomers in incu=c(1, xi, xl).
+    """
+    Abcumo_spr_head(varname, f, nb_fwrv, len(coo["A"]))
+    ba_x=nb_input+1
+    ncucumo=0
+    for (iwl,Aw) in enumerate(coo["A"]):
+        w=iwl+1
+        bw=coo["b"][iwl]
+        ncumo=len(vcumol[iwl])
+        if ncumo != coo["nb_c"][iwl]:
+            raise Exception("wrongCumomerNumber: ncumo=%d, nrow(A)=%d"%(ncumo, coo["nb_c"][iwl]))
+        if ncumo != 0 and len(bw) == 0:
+            raise Exception(f"ftbl2code: netan2Abcumo_coo: at the label weight N° {w}, the right-hand-sides are all 0 which cannot be as the corresponding {ncumo} cumomers will be 0 too. The cumomer list is:\n\t"+"\n\t".join(vcumol[iwl]))
+        maxprod=bw.shape[1]-2 if len(bw) else 0
+        ia=np.array(Aw)
+        ia[:,0]+=1
+        ib=np.array(bw)
+        ib[:,:2]+=1
+        Abcumo_spr_w(varname, f, w, ncumo, ncucumo, ba_x, maxprod,
+            ia.ravel().tolist(), ib.ravel().tolist())
+        ncucumo+=ncumo
+
 def netan2Rinit(netan, org, f, fullsys, emu=False, ropts=[], dirres=""):
     r"""Write R code for initialization of all variables before
 cumomer system resolution by chi2 minimization.
@@ -283,6 +393,12 @@ cumomer system resolution by chi2 minimization.
     # header
     f.write("# This is an automatically generated R code. Don't edit.\n")
     f.write("# Generated by \n# "+join(" ", sys.argv)+"\n# at "+time.ctime()+".\n")
+    global digest_pos
+    digest_pos=None
+    if digest:
+        # placeholder, a partial code must not match the digest
+        digest_pos=f.tell()
+        f.write("# Input digest: %s\n"%("-"*len(digest)))
     f.write("""
 # Copyright 2011-%d, INRAE/INSA/CNRS, France.
     """%time.localtime()[0])
@@ -303,7 +419,7 @@ dirr="%(dirr)s"
 # short base name of the FTBL (withount '.ftbl')
 baseshort="%(org)s"
 
-if (nchar(dirres)) {
+%(rbin)sif (nchar(dirres)) {
     fcerr=file(file.path(dirres, sprintf("%%s.err", baseshort)), "ab")
     fclog=file(file.path(dirres, sprintf("%%s.log", baseshort)), "ab")
 } else {
@@ -358,6 +474,8 @@ tol=1.e-10
 
 # get runtime arguments
 %(ropts)s
+if (TIMEIT)
+    trace_open(file.path(if (write_res) file.path(dirres, "tmp") else dirw, sprintf("%%s.trace.json", baseshort)))
 
 # synonymous
 myver=version
@@ -475,6 +593,28 @@ jx_f=new.env()
         "vernum": influx_si.__version__,
         "org": escape(fp.stem, '"'),
         "ropts": ropts,
+        "rbin": "" if fbin is None else r"""# binary sidecar with big vectors (cf. ftbl2code.rvec()) and its manifest
+fbin=file.path(dirw, "%(fbin)s")
+binman=read.delim(paste0(fbin, ".tsv"), row.names=1L, as.is=TRUE)
+rbin=function(nm) {
+   m=binman[nm,]
+   if (is.na(m$mode))
+      stop("vector '", nm, "' is not found in '", fbin, ".tsv'")
+   con=file(fbin, "rb")
+   on.exit(close(con))
+   seek(con, m$offset)
+   if (m$mode == "integer") {
+      readBin(con, "integer", n=m$length, size=4L, endian="little")
+   } else if (m$mode == "double") {
+      v=readBin(con, "double", n=m$length, size=8L, endian="little")
+      v[is.nan(v)]=NA
+      v
+   } else {
+      readBin(con, "character", n=m$length)
+   }
+}
+
+"""%{"fbin": escape(fbin["path"].name, '\\"')},
         })
 
     # parse optctrl in netan["opt"]
@@ -506,7 +646,7 @@ lab_sim=param2fl_usm_rich
 """)
     f.write("""
 if (TIMEIT) {
-   cat("rinit   : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("rinit   ", fclog)
 }
 
 # R profiling
@@ -656,7 +796,7 @@ if (emu) {
         "meas_pool": len(netan["metab_measured"]),
         "eqe": len(netan["flux_equal"]["net"])+len(netan["flux_equal"]["xch"]),
         "eqi": len(netan["flux_inequal"]["net"])+len(netan["flux_inequal"]["xch"]),
-        "lncumo": ",".join(str(len(a)) for a in netan["cumo_sys"]["A"]),
+        "lncumo": ",".join(str(len(a)) for a in netan["vcumo"]),
         "lnrcumo": ",".join(str(len(a)) for a in netan["rcumo_sys"]["A"]),
         "nb_exp": len(netan["iso_input"])
         })
@@ -725,7 +865,7 @@ def netan2R_fl(netan, org, f):
 
     f.write("""
 if (TIMEIT) {
-   cat("r_flux  : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("r_flux  ", fclog)
 }
 """)
     # auxiliary dict for edge-flux coupling
@@ -745,7 +885,7 @@ if (TIMEIT) {
                f2edge[fl].append(fl+" ("+fl+(str(i+1) if same_prods else "")+") "+m)
     f.write("""
 # fwd-rev flux names
-nm_fwrv=c(%(nm_fwrv)s)
+nm_fwrv=%(nm_fwrv)s
 
 # edge to netflux name translator
 edge2fl=c(%(edge2fl)s)
@@ -807,8 +947,8 @@ nb_flr=%(nb_flr)d
 if (nb_fl) {
    Afl=matrix(0, nrow=nb_flr, ncol=nb_fl)
     """%{
-        "nb_flr": len(netan["Afl"]),
-        "nm_fwrv": join(", ", netan["vflux_fwrv"]["fwrv"], '"', '"', width=120),
+        "nb_flr": netan["Afl"].shape[0],
+        "nm_fwrv": rvec("nm_fwrv", netan["vflux_fwrv"]["fwrv"], "character"),
         "nm_fln": join(", ", netan["vflux"]["net"], '"d.n.', '"', width=120),
         "fln": join(", ", (netan["flux_dep"]["net"][k] for k in netan["vflux"]["net"]), width=120),
         "nm_flx": join(", ", netan["vflux"]["xch"], '"d.x.', '"', width=120),
@@ -822,13 +962,14 @@ if (nb_fl) {
         "poolc": join(", ", (netan["met_pools"][m] for m in netan["vpool"]["constrained"]), width=120),
         "nm_poolc": join(", ", netan["vpool"]["constrained"], '"pc:', '"', width=120),
     })
-    for (i,row) in enumerate(netan["Afl"]):
+    afl=netan["Afl"].tocoo()
+    if afl.nnz:
+        # sparse triplets (ir, ic, v)
         f.write(
-"""   Afl[%(i)d, c(%(ic)s)]=c(%(v)s)
+"""   ind_afl=matrix(%(iricval)s, ncol=3, byrow=TRUE)
+   Afl[ind_afl[,1:2,drop=FALSE]]=ind_afl[,3]
         """%{
-            "i": i+1,
-            "ic": join(", ", (i+1 for (i,v) in enumerate(row) if v!=0.), width=120),
-            "v": join(", ", (v for v in row if v!=0.), width=120),
+            "iricval": rvec("ind_afl", [*valval(zip((afl.row+1).tolist(), (afl.col+1).tolist(), afl.data.tolist()))], "double"),
         })
     #pdb.set_trace()
     f.write(
@@ -952,24 +1093,14 @@ colnames(g2bfl)=nm_fgr
         row["c"]=dict((k,v) for (k,v) in item.items() if k[0:2]=="c.")
         row["g"]=dict((k,v) for (k,v) in item.items() if k[0:2]=="g.")
         f.write("\n")
-        if row["f"]:
-            f.write("p2bfl[%(i)d, pmatch(c(%(if)s), nm_par)]=c(%(rowf)s);\n"%\
-                {"i": i+1,
-                "if": join(", ", list(row["f"].keys()), p='"', s='"', width=120),
-                "rowf": join(", ", list(row["f"].values()), width=120),
-                })
-        if row["c"]:
-            f.write("c2bfl[%(i)d, pmatch(c(%(ic)s), nm_fc)]=c(%(rowc)s);\n"%\
-                {"i": i+1,
-                "ic": join(", ", list(row["c"].keys()), p='"', s='"', width=120),
-                "rowc": join(", ", list(row["c"].values()), width=120),
-                })
-        if row["g"]:
-            f.write("g2bfl[%(i)d, pmatch(c(%(ig)s), nm_fgr)]=c(%(rowg)s);\n"%\
-                {"i": i+1,
-                "ig": join(", ", list(row["g"].keys()), p='"', s='"', width=120),
-                "rowg": join(", ", list(row["g"].values()), width=120),
-                })
+        for (t,m,nm) in (("f", "p2bfl", "nm_par"), ("c", "c2bfl", "nm_fc"), ("g", "g2bfl", "nm_fgr")):
+            if not row[t]:
+                continue
+            f.write("%s[%d, pmatch(c("%(m, i+1))
+            fjoin(f, ", ", row[t].keys(), p='"', s='"', width=120)
+            f.write("), %s)]=c("%nm)
+            fjoin(f, ", ", row[t].values(), width=120)
+            f.write(");\n")
         if row["cnst"]:
             f.write("cnst2bfl[%(i)d]=%(rowcnst)s;\n"%{"i": i+1, "rowcnst": row["cnst"],})
     f.write("""
@@ -1058,7 +1189,7 @@ nb_f$ixch2ifwrv=pmatch(paste(".x.", sh_fwrv, sep=""), sh_nx)
 #nb_f$ixch2ifwrv=sapply(nm_fwrv[1:(nb_fwrv/2)], function(f) grep(sprintf("^.\\\\.x\\\\.%s$", substring(f, 5)), nm_fallnx))
 
 if (TIMEIT) {
-   cat("Afl qr(): ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("Afl qr()", fclog)
 }
 
 qrAfl=qr(Afl, LAPACK=TRUE)
@@ -1192,7 +1323,7 @@ if (fdfit) {
 }
 # intermediate jacobian
 if (TIMEIT) {
-   cat("dfl_dffg: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("dfl_dffg", fclog)
 }
 
 dfl_dffg=invAfl%stm%p2bfl
@@ -1232,18 +1363,21 @@ if (nb_fgr > 0) {
     netan["fwrv2i"]=fwrv2i
     netan["tfallnx"]=tfallnx
 
-def netan2R_meas(netan, org, f, emu=False):
-    """netan2R_meas(netan, org, f)
-    generate code for measure treatment
-    """
-    # prepare python measures
+def netan_measures(netan):
+    """Return netan["measures"] (label, mass and peak measurement matrices and vectors).
+    They are calculated on the first call."""
     if "measures" not in netan:
-        #print("Calculate measures in netan2R_meas.")
         measures=dict()
         for meas in ("label", "mass", "peak"):
             measures[meas]=eval("C13_ftbl.%s_meas2matrix_vec_dev(netan)"%meas)
         netan["measures"]=measures
-    measures=netan["measures"]
+    return netan["measures"]
+def netan2R_meas(netan, org, f, emu=False):
+    """netan2R_meas(netan, org, f)
+    generate code for measure treatment
+    """
+    # prepare python measures
+    measures=netan_measures(netan)
     nexp=len(netan["iso_input"])
     #aff("got measures in netan2R_meas", measures);##
     # get scaling factors and their indexes, measure matrices, and measured cumomer value vector
@@ -1285,7 +1419,7 @@ def netan2R_meas(netan, org, f, emu=False):
     # create R equivalent structures with indices for scaling
     f.write("""
 if (TIMEIT) {
-   cat("measure : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("measure ", fclog)
 }
 if (!noscale) {
    # make place for scaling factors
@@ -1386,17 +1520,17 @@ nm_measmat=nm_meas=nb_meas=nb_measmat=measmat=memaone=measvec=measdev=ipooled=ve
         imcumo2i=dict((cumo, i) for (i, cumo) in enumerate(o_mcumos))
         nb_mcumo=len(o_mcumos)
         f.write("""
-nm_measmat[[%(ili)d]]=c(%(idmeasmat)s)
+nm_measmat[[%(ili)d]]=%(idmeasmat)s
 if (length(nm_measmat[[%(ili)d]]) == 0)
    stop_mes("At least one labeling measurement must be given in experiment '", nm_exp[%(ili)d], "'", file=fcerr)
-nm_meas[[%(ili)d]]=c(%(idmeas)s)
+nm_meas[[%(ili)d]]=%(idmeas)s
 nb_meas[[%(ili)d]]=length(nm_meas[[%(ili)d]])
 nb_measmat[[%(ili)d]]=length(nm_measmat[[%(ili)d]])
 measmat[[%(ili)d]]=simple_triplet_zero_matrix(nrow=nb_measmat[[%(ili)d]], ncol=%(ncol)d)
 dimnames(measmat[[%(ili)d]])=list(nm_measmat[[%(ili)d]], nm_x)
 memaone[[%(ili)d]]=numeric(nb_measmat[[%(ili)d]])
-measvec[[%(ili)d]]=c(%(vmeas)s)
-measdev[[%(ili)d]]=c(%(dev)s)
+measvec[[%(ili)d]]=%(vmeas)s
+measdev[[%(ili)d]]=%(dev)s
 names(measvec[[%(ili)d]])=nm_meas[[%(ili)d]]
 names(measdev[[%(ili)d]])=nm_meas[[%(ili)d]]
 ipooled[[%(ili)d]]=list(ishort=pmatch(nm_meas[[%(ili)d]], nm_measmat[[%(ili)d]]))
@@ -1404,13 +1538,11 @@ ipooled[[%(ili)d]]=list(ishort=pmatch(nm_meas[[%(ili)d]], nm_measmat[[%(ili)d]])
     "ili": ili+1,
     "nrow": len([measures[meas][ili]["vec"] for meas in measures]),
     "ncol": sum(len(l) for l in (netan["vemu"] if emu else netan["vrcumo"])),
-    "idmeasmat": join(", ", (row["id"] for row in
-        valval(measures[o][ili]["mat"] for o in o_meas)),
-        p='"', s='"', width=120),
-    "idmeas": join(", ",  valval([v for o in o_meas for v in measures[o][ili]["ids"]]), p='"', s='"', width=120),
-    "vmeas": join(", ", valval(measures[o][ili]["vec"] for o in o_meas), width=120).replace("nan", "NA"),
-    "dev": join(", ", (sd for sd in valval(measures[o][ili]["dev"]
-        for o in o_meas)), width=120),
+    "idmeasmat": rvec("nm_measmat.%d"%(ili+1), [row["id"] for row in
+        valval(measures[o][ili]["mat"] for o in o_meas)], "character"),
+    "idmeas": rvec("nm_meas.%d"%(ili+1), [*valval([v for o in o_meas for v in measures[o][ili]["ids"]])], "character"),
+    "vmeas": rvec("measvec.%d"%(ili+1), [*valval(measures[o][ili]["vec"] for o in o_meas)], "double"),
+    "dev": rvec("measdev.%d"%(ili+1), [*valval(measures[o][ili]["dev"] for o in o_meas)], "double"),
     })
     f.write("""
 nm_meas_tot=unlist(nm_meas)
@@ -1473,28 +1605,22 @@ if (!noscale) {
     onelab="0+0" if emu else 0
     fcoef="emuco" if emu else "coefs"
     for ili in range(nexp):
-        f.write("""
-ind_mema=matrix(c(
-""")
+        # triplets (ir, ic, v) stored by rows
+        iricval=[]
         i=0
         for meas in o_meas:
-            if not measures[meas][ili]["mat"]:
-                continue
             for row in measures[meas][ili]["mat"]:
                 i+=1
                 metab=row["metab"]
-                f.write("""%(iricval)s,
-                    """%{
-                        "iricval": join(", ", valval((i, lab2i0[metab+":"+str(k)]+1, v)
-                            for (k, v) in row[fcoef].items() if k != onelab), width=120)
-                    })
-
+                iricval += valval((i, lab2i0[metab+":"+str(k)]+1, v)
+                    for (k, v) in row[fcoef].items() if k != onelab)
         f.write(r"""
-NULL), ncol=3, byrow=TRUE); # close ind_mema creation
+ind_mema=matrix(%(iricval)s, ncol=3, byrow=TRUE)
 measmat[[%(iexp)d]][ind_mema[,1:2,drop=FALSE]]=ind_mema[,3]
 memaone[[%(iexp)d]]=c(%(memaone)s)
         """%{
             "iexp": ili+1,
+            "iricval": rvec("ind_mema.%d"%(ili+1), iricval, "double"),
             "memaone": join(", ", (row[fcoef].get(onelab, 0.)
                 for meas in o_meas
                 for row in measures[meas][ili]["mat"]), width=120),
@@ -1633,12 +1759,12 @@ nb_rw=%(nb_rw)d
 nb_rcumos=c(%(nb_rc)s)
 nbc_rcumos=c(0, cumsum(nb_rcumos))
 # cumo names
-nm_rcumo=c(%(nm_rcumo)s)
+nm_rcumo=%(nm_rcumo)s
 nm_list$rcumo=nm_rcumo
     """%{
         "nb_rw": len(rAb["A"]),
         "nb_rc": join(", ", (len(a) for a in rAb["A"]), width=120),
-        "nm_rcumo": join(", ", valval(netan['vrcumo']), '"', '"', width=120),
+        "nm_rcumo": rvec("nm_rcumo", [*valval(netan['vrcumo'])], "character"),
     })
     f.write("""
 if (case_i) {
@@ -1669,12 +1795,16 @@ def netan2R_cumo(netan, org, f):
     # composite cumomer vector
     incu2i_b1=dict((c,i+2) for (i,c) in enumerate(list(netan["cumo_input"][0].keys())+cumos))
 
-    netan2Abcumo_spr("spAbr_f", netan["cumo_sys"]["A"], netan["cumo_sys"]["b"],
-        netan["vcumo"], netan["input"], f, netan["fwrv2i"], incu2i_b1)
+    if "cumo_sys_coo" in netan:
+        netan2Abcumo_coo("spAbr_f", netan["cumo_sys_coo"], netan["vcumo"], f,
+            len(netan["fwrv2i"]), len(netan["cumo_input"][0]))
+    else:
+        netan2Abcumo_spr("spAbr_f", netan["cumo_sys"]["A"], netan["cumo_sys"]["b"],
+            netan["vcumo"], netan["input"], f, netan["fwrv2i"], incu2i_b1)
     # write R constants and names
     f.write("""
 if (TIMEIT) {
-   cat("cumo   : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("cumo   ", fclog)
 }
 
 # weight count
@@ -1687,13 +1817,13 @@ nb_f$xf=nb_cumos
 nb_f$nbc_xf=nbc_cumos
 
 # cumo names
-nm_cumo=c(%(nm_cumo)s)
+nm_cumo=%(nm_cumo)s
 nm_list$cumo=nm_cumo
 nm_list$cumo=nm_cumo
 """%{
-        "nb_w": len(netan["cumo_sys"]["A"]),
-        "nb_c": join(", ", (len(a) for a in netan["cumo_sys"]["A"]), width=120),
-        "nm_cumo": join(", ", valval(netan['vcumo']), '"', '"', width=120),
+        "nb_w": len(netan["vcumo"]),
+        "nb_c": join(", ", (len(a) for a in netan["vcumo"]), width=120),
+        "nm_cumo": rvec("nm_cumo", [*valval(netan['vcumo'])], "character"),
     })
     netan["cumo2i"]=cumo2i
     return {
@@ -1711,7 +1841,7 @@ def netan2R_ineq(netan, org, f):
     nb_ineq=len(netan["flux_inequal"]["net"])+len(netan["flux_inequal"]["xch"])
     f.write("""
 if (TIMEIT) {
-   cat("ineq    : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("ineq    ", fclog)
 }
 #browser()
 # prepare mi matrix and li vector
@@ -110,13 +110,17 @@ ftbl=C13_ftbl.ftbl_parse(fftbl)
 
 # analyse network
 netan=dict()
-C13_ftbl.ftbl_netan(ftbl, netan, emu, fullsys, case_i)
+C13_ftbl.ftbl_netan(ftbl, netan, emu, False, case_i)
+if fullsys:
+    # nested dict form of full system is written below
+    netan["fullsys"]=True
+    C13_ftbl.cumo_sys_dict(netan)
 f.write("# This is automatically generated text. Don't edit.\n")
 f.write("# Generated by "+me+" at "+time.ctime()+".\n")
 
 # assign A and b weight by weight
 # prepare numpy Afl and bfl for dependent flux solving
-Afl=np.array(netan["Afl"])
+Afl=netan["Afl"].toarray()
 # prepare dictionary with dependent, free, constraint and growth flux values
 # (dependent are added later)
 dfc_val=dict(("f.n."+f, v) for (f,v) in netan["flux_free"]["net"].items())
@@ -156,7 +160,7 @@ if len(ikeep) < Afl.shape[0]:
     sys.stderr.write(f"Warning: found {Afl.shape[0] - len(ikeep)} linearly dependent rows in stoechiometric matrix.\nThe following rows will be ignored:\n\t"+"\n\t".join(np.array(netan["vrowAfl"])[np.abs(rd) < 1.e-10])+"\n")
     Afl=Afl[ikeep,:]
     bfl=bfl[ikeep]
-    netan["Afl"]=seli(netan["Afl"], ikeep)
+    netan["Afl"]=netan["Afl"][ikeep]
     netan["vrowAfl"]=seli(netan["vrowAfl"], ikeep)
     netan["bfl"]=seli(netan["bfl"], ikeep)
 # solve Afl*d=bfl
@@ -178,7 +182,7 @@ else:
         sys.stderr.write("nrow x ncol = %d x %d\n"%Afl.shape)
         sys.stderr.write("dependent net fluxes="+str(netan["vflux"]["net"])+"\n")
         sys.stderr.write("dependent xch fluxes="+str(netan["vflux"]["xch"])+"\n")
-        sys.stderr.write("Afl="+str(netan["Afl"])+"\n")
+        sys.stderr.write("Afl="+str(Afl.tolist())+"\n")
         sys.stderr.write("bfl="+str(netan["bfl"])+"\n")
         sys.stderr.write(str(err)+"\n")
         d_avail=False
@@ -225,7 +229,7 @@ Full flux equations:
 metab:net fluxes\t|exchange fluxes\t=b\n
 """)
 nb_fnet=len(netan["vflux"]["net"])
-for (ir,row) in enumerate(netan["Afl"]):
+for (ir,row) in enumerate(netan["Afl"].toarray().tolist()):
     f.write("%(metab)s:%(fnet)s\t|%(fxch)s\t=%(b)s\n"%{
         "metab": netan["vrowAfl"][ir],
         "fnet": "\t".join(("" if coef==0 else ssign(coef)+(str(abs(coef)) if abs(coef) !=1. else "")+
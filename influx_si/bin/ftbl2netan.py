@@ -15,6 +15,11 @@ if __name__ == "__main__" or __name__ == "influx_si.cli":
     
     def usage():
         print(__doc__)
+    def netan2kvh(netan, f):
+        "write netan in kvh, sparse Afl is written as dense rows"
+        if hasattr(netan.get("Afl"), "toarray"):
+            netan=dict(netan, Afl=netan["Afl"].toarray().tolist())
+        tools_ssg.dict2kvh(netan, f)
 
     me=os.path.basename(__file__)
     try:
@@ -73,15 +78,18 @@ if __name__ == "__main__" or __name__ == "influx_si.cli":
     netan=dict()
     #import pdb; pdb.set_trace()
     try:
-        C13_ftbl.ftbl_netan(ftbl, netan, emu, fullsys, case_i)
-        
+        # nested full cumomer system (not COO blocks) is written in kvh
+        C13_ftbl.ftbl_netan(ftbl, netan, emu, False, case_i, wout=sys.stderr.write, werr=sys.stderr.write)
+        if fullsys:
+            netan["fullsys"]=True
+            C13_ftbl.cumo_sys_dict(netan, werr=sys.stderr.write)
     except Exception as e:
         sys.stderr.write("ftbl2netan: Exception\n"+str(e)+"\n")
-        tools_ssg.dict2kvh(netan, f)
+        netan2kvh(netan, f)
         raise e
         #sys.exit(1)
     #pdb.set_trace()
-    tools_ssg.dict2kvh(netan, f)
+    netan2kvh(netan, f)
     # calculate measure matrices
     if "measures" not in netan:
         measures=dict()
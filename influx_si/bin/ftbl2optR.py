@@ -21,7 +21,13 @@ usage: ./ftbl2optR.py [opts] organism
 where organism is the ftbl informative part of file name
 (before .ftbl), e.g. organism.ftbl
 after execution a file organism.R will be created.
-If it already exists, it will be silently overwritten.
+Big vectors used by this R code (indexes of cumomer systems, names,
+measurements, ...) are written in binary sidecar organism.Rbin
+and its manifest organism.Rbin.tsv (cf. ftbl2code.rvec()).
+If they already exist, they will be silently overwritten.
+Results of network analysis (netan, rAb) are kept in an on-disk
+cache (cf. ftbl_cache) unless --no-cache is given. Its place can be
+set with --cache-dir.
 The system Afl*flnx=bfl is created from the ftbl file.
 
 Important python variables:
@@ -118,18 +124,49 @@ import influx_si
 from tools_ssg import *
 import C13_ftbl
 import ftbl2code
+import ftbl_cache
+import stage_trace
+
+# R code being generated: {"f": file, "n_R": path} (cf. main())
+rpart=None
+
+def netan_key(n_ftbl, emu=False, fullsys=False, clownr=False, case_i=False, ffguess=False):
+    "Key of network analysis (netan, rAb, msgs) of FTBL n_ftbl in on-disk cache (cf. ftbl_cache)"
+    return ftbl_cache.ftbl_key(n_ftbl, {"emu": emu, "fullsys": fullsys, "clownr": clownr, "case_i": case_i, "ffguess": ffguess})
 
 def main(argv=sys.argv[1:], wout=sys.stdout.write, werr=sys.stderr.write):
+    """Generate R code (cf. gen_R()). If generation fails, partial R code
+    and its binary sidecar are removed."""
+    global rpart
+    rpart=None
+    try:
+        return gen_R(argv, wout, werr)
+    finally:
+        if rpart is not None:
+            rpart["f"].close()
+            if ftbl2code.fbin is not None:
+                ftbl2code.fbin["f"].close()
+                ftbl2code.fbin=None
+            fR=Path(rpart["n_R"])
+            for p in (fR, fR.with_suffix(".Rbin"), fR.with_suffix(".Rbin.tsv")):
+                try:
+                    p.unlink()
+                except OSError:
+                    pass
+            rpart=None
+
+def gen_R(argv, wout, werr):
+    global rpart
     me=os.path.basename(__file__)
     dirbin=os.path.join(os.path.dirname(influx_si.__file__), "bin")
     sys.path.append(dirbin)
 
     def usage():
-        sys.stderr.write("usage: "+me+" [-h|--help] [--fullsys] [--emu] [--clownr] [--tblimit[=0]] [--ropts ROPTS] network_name[.ftbl]\n")
+        sys.stderr.write("usage: "+me+" [-h|--help] [--fullsys] [--emu] [--clownr] [--tblimit[=0]] [--ropts ROPTS] [--no-cache] [--cache-dir DIR] network_name[.ftbl]\n")
 
     #<--skip in interactive session
     try:
-        opts,args=getopt.getopt(argv, "h", ["help", "fullsys", "emu", "clownr", "tblimit=", "ropts=", "case_i", "ffguess", "dirres="])
+        opts,args=getopt.getopt(argv, "h", ["help", "fullsys", "emu", "clownr", "tblimit=", "ropts=", "case_i", "ffguess", "dirres=", "no-cache", "no_cache", "cache-dir=", "cache_dir="])
     except getopt.GetoptError as err:
         #pass
         sys.stderr.write(str(err)+"\n")
@@ -143,6 +180,9 @@ def main(argv=sys.argv[1:], wout=sys.stdout.write, werr=sys.stderr.write):
     ropts=['""']
     case_i=False
     tblimit=0
+    dirres=""
+    cache=True
+    cache_dir=None
     for o,a in opts:
         if o in ("-h", "--help"):
             usage()
@@ -163,6 +203,10 @@ def main(argv=sys.argv[1:], wout=sys.stdout.write, werr=sys.stderr.write):
             ffguess=True
         elif o=="--dirres":
            dirres=a
+        elif o in ("--no-cache", "--no_cache"):
+            cache=False
+        elif o in ("--cache-dir", "--cache_dir"):
+            cache_dir=a
         else:
             #assert False, "unhandled option"
             # unknown options can come from shell
@@ -191,33 +235,95 @@ def main(argv=sys.argv[1:], wout=sys.stdout.write, werr=sys.stderr.write):
     C13_ftbl.ffguess=ffguess
     C13_ftbl.werr=werr
     C13_ftbl.wout=wout
+    if dirres:
+        C13_ftbl.fullsys_dirtmp=os.path.join(dirres, "tmp")
     
     #org="ex3"
     #org="PPP_exact"
 
     n_ftbl=fullorg+".ftbl"
     n_R=fullorg+".R"
+    # stage timing trace (cf. stage_trace)
+    if any("TIMEIT=TRUE" in v for v in ropts):
+        stage_trace.trace_open(stage_trace.res_trace(n_ftbl, dirres))
+    else:
+        stage_trace.trace_close()
     #n_fort=fullorg+".f"
+    # skip code generation if R code of a previous run (possibly moved to dirres/tmp)
+    # has the same input digest in its header
+    if cache:
+        dig=ftbl_cache.ftbl_key(n_ftbl, {"argv": [(o,a) for (o,a) in opts if o not in ("--no-cache", "--no_cache", "--cache-dir", "--cache_dir")]+args},
+            src=[os.path.join(dirbin, "ftbl2code.py"), os.path.join(dirbin, "ftbl2optR.py")])
+        fp=ftbl_cache.find_digest(n_R, dig, [os.path.join(dirres, "tmp")] if dirres else [])
+        if fp is not None:
+            fsides=[fp.with_suffix(".Rbin"), fp.with_suffix(".Rbin.tsv")]
+            if all(v.is_file() for v in fsides) or "rbin(" not in fp.read_text(encoding="utf8", errors="replace"):
+                if fp != Path(n_R):
+                    for v in [fp]+fsides:
+                        if v.is_file():
+                            v.chmod(v.stat().st_mode | stat.S_IWRITE)
+                            v.replace(Path(n_R).with_suffix(v.name[len(fp.stem):]))
+                wout("ftbl2optR: inputs of '%s' are unchanged, its generation is skipped.\n"%n_R)
+                return 0
+        ftbl2code.digest=dig
+    else:
+        ftbl2code.digest=None
     try:
         os.chmod(n_R, stat.S_IWRITE)
     except:
         pass
     f=open(n_R, "w")
-
-    # parse ftbl
-    ftbl=C13_ftbl.ftbl_parse(n_ftbl, wout=wout, werr=werr)
-
-    # analyse network
-    # reload(C13_ftbl)
-
-    netan=dict();
-    C13_ftbl.ftbl_netan(ftbl, netan, emu, fullsys, case_i, wout=wout, werr=werr)
-
-    # prepare rcumo system
-    rAb=C13_ftbl.rcumo_sys(netan, emu)
+    rpart={"f": f, "n_R": n_R}
+    # big vectors go to binary sidecar
+    ftbl2code.bin_open(n_R)
+
+    # analysed network can come from on-disk cache
+    if cache:
+        key=netan_key(n_ftbl, emu, fullsys, clownr, case_i, ffguess)
+        with stage_trace.stage("cache load"):
+            res=ftbl_cache.load(key, cache_dir)
+    else:
+        res=None
+    if res is None:
+        # messages are recorded to be replayed on cache hit
+        msgs=[]
+        def rout(s):
+            msgs.append((0, s))
+            wout(s)
+        def rerr(s):
+            msgs.append((1, s))
+            werr(s)
+        C13_ftbl.wout=rout
+        C13_ftbl.werr=rerr
+        # parse ftbl
+        with stage_trace.stage("ftbl_parse"):
+            ftbl=C13_ftbl.ftbl_parse(n_ftbl, wout=rout, werr=rerr)
+
+        # analyse network
+        netan=dict();
+        with stage_trace.stage("ftbl_netan"):
+            C13_ftbl.ftbl_netan(ftbl, netan, emu, fullsys, case_i, wout=rout, werr=rerr)
+
+        # prepare rcumo system
+        with stage_trace.stage("rcumo_sys"):
+            rAb=C13_ftbl.rcumo_sys(netan, emu)
+        C13_ftbl.wout=wout
+        C13_ftbl.werr=werr
+        if cache:
+            try:
+                ftbl_cache.save(key, (netan, rAb, msgs), cache_dir)
+            except Exception as e:
+                werr("Warning: could not save network analysis in cache: %s\n"%e)
+    else:
+        netan,rAb,msgs=res
+        for (i,s) in msgs:
+            (werr if i else wout)(s)
 
     # write initialization part of R code
-    ftbl2code.netan2Rinit(netan, org, f, fullsys, emu, ropts, dirres)
+    with stage_trace.stage("netan2Rinit"):
+        ftbl2code.netan2Rinit(netan, org, f, fullsys, emu, ropts, dirres)
+    t0=time.time()
+    c0=time.process_time()
 
     ropts_s="\n\t\t".join(ropts)
     if ropts_s and ropts_s[0]=='"':
@@ -608,7 +714,7 @@ nm_resid=c(if (case_i) unlist(lapply(seq_len(nb_exp), function(iexp) {m=outer(ro
 nm_list$resid=nm_resid
 
 if (TIMEIT) {
-   cat("preopt  : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("preopt  ", fclog)
 }
 #browser()
 names(param)=nm_par
@@ -716,7 +822,7 @@ nm_labargs=c("jx_f", "nb_f", "nm_list", "nb_x", "invAfl", "p2bfl", "g2bfl", "bp"
         f.write('nm_labargs=c(nm_labargs, "ti", "tifull", "tifull2", "x0", "time_order")')
     f.write("""
 if (TIMEIT) {
-   cat("labargs : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("labargs ", fclog)
 }
 tmp=lapply(nm_labargs, function(nm) assign(nm, get(nm), labargs))
 #for (nm in nm_labargs) {
@@ -759,11 +865,11 @@ if ((case_i && (time_order %in% c("1,2", "2"))) || sensitive == "mc") {
       labargs[["cl"]]=cl
       nodes=length(cl)
       if (TIMEIT) {
-         cat("cl expor: ", format(Sys.time()), " cpu=", proc.time()[1], "\n", sep="", file=fclog)
+         tchrono("cl expor", fclog)
       }
       clusterExport(cl, c("lsi_fun", "df_dffp", "lab_sim", "is.diff", "lab_resid", "ui", "ci", "ep", "cp", "control_ftbl", "methods", "sln", "labargs", "dirr", "emu", "%stm%", "case_i", "time_order", "fullsys", "nm_inp"))
       if (TIMEIT) {
-         cat("cl sourc: ", format(Sys.time()), " cpu=", proc.time()[1], "\n", sep="", file=fclog)
+         tchrono("cl sourc", fclog)
       }
       clusterEvalQ(cl, {
          #idth=myinfo$id
@@ -807,7 +913,7 @@ if ((case_i && (time_order %in% c("1,2", "2"))) || sensitive == "mc") {
 }
 for (irun in seq_len(nseries)) {
    if (TIMEIT) {
-      cat(sprintf("run %4d: %s cpu=%g\n", irun, format(Sys.time()), proc.time()[1]), "\n", sep="", file=fclog)
+      tchrono(sprintf("run %4d", irun), fclog)
    }
    param[nm_pseries]=pstart[nm_pseries, irun]
 #browser()
@@ -844,7 +950,7 @@ for (irun in seq_len(nseries)) {
       paste0(apply(cbind(nm_par, param), 1, paste0, collapse="\t"), collapse="\n\t"))
    if (nbad > 0) {
       if (TIMEIT) {
-         cat(sprintf("put_ins : %s cpu=%g\n", format(Sys.time()), proc.time()[1]), "\n", sep="", file=fclog)
+         tchrono("put_ins ", fclog)
       }
       cat("The following ", nbad, " inequalities are not respected at starting point", runsuf, ":\n", sep="", file=fclog)
       i=ineq[ineq<= -tol_ineq]
@@ -880,7 +986,7 @@ for (irun in seq_len(nseries)) {
    li_zc=NULL
    if (!noopt && zerocross && length(grep("^[df]\\.n\\.", nm_fallnx))>0) {
       if (TIMEIT) {
-         cat("zc ineq : ", format(Sys.time()), " cpu=", proc.time()[1], "\n", sep="", file=fclog)
+         tchrono("zc ineq ", fclog)
       }
 #browser()
       # prepare fluxes that are already in inequalities in alone mode
@@ -974,7 +1080,7 @@ for (irun in seq_len(nseries)) {
    if (nb_sc_tot > 0) {
       if (TRUE) { # always estimate scaling params even for --noopt
          if (TIMEIT) {
-            cat("res esti: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+            tchrono("res esti", fclog)
          }
          if (write_res) {
             capture.output(rres <- lab_resid(param, cjac=FALSE, labargs), file=fclog)
@@ -1032,7 +1138,7 @@ for (irun in seq_len(nseries)) {
 
     f.write("""
    if (TIMEIT && wkvh) {
-      cat("kvh init: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+      tchrono("kvh init", fclog)
    }
 """)
     # main part: call optimization
@@ -1104,7 +1210,7 @@ for (irun in seq_len(nseries)) {
       if (!(least_norm || sln || !"nlsic" %in% methods)) {
          # check if at starting position all fluxes can be resolved
          if (TIMEIT) {
-            cat("check ja: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+            tchrono("check ja", fclog)
          }
          rres=lab_resid(param, cjac=TRUE, labargs)
          if (sum(is.infinite(rres$res))) {
@@ -1149,7 +1255,7 @@ for (irun in seq_len(nseries)) {
          }
       }
       if (TIMEIT) {
-         cat("optim   : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+         tchrono("optim   ", fclog)
       }
       # pass control to the chosen optimization method
       if (time_order=="1,2")
@@ -1183,7 +1289,7 @@ for (irun in seq_len(nseries)) {
 #browser()
          if (zerocross && !is.null(mi_zc)) {
             if (TIMEIT) {
-               cat("secondzc: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+               tchrono("secondzc", fclog)
             }
             # inverse active "zc" inequalities
             nm_inv=names(which((ui%*%res$par-ci)[,1]<=tol_ineq))
@@ -1255,7 +1361,7 @@ for (irun in seq_len(nseries)) {
                i=grep("^zc ", nm_i)
                if (length(i) > 0) {
                   if (TIMEIT) {
-                     cat("last zc : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+                     tchrono("last zc ", fclog)
                   }
                   ui=ui[-i,,drop=FALSE]
                   ci=ci[-i]
@@ -1292,7 +1398,7 @@ for (irun in seq_len(nseries)) {
       if (excl_outliers != F) {
          # detect outliers
          if (TIMEIT) {
-            cat("outliers: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+            tchrono("outliers", fclog)
          }
          iva=!is.na(res$res)
          zpval=rz.pval.bi(res$res)
@@ -1333,7 +1439,7 @@ for (irun in seq_len(nseries)) {
       }
       if (case_i && time_order=="1,2") {
          if (TIMEIT) {
-            cat("order 2 : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+            tchrono("order 2 ", fclog)
          }
          labargs$time_order="2" # continue with the 2-nd order
          if (write_res) {
@@ -1367,12 +1473,12 @@ for (irun in seq_len(nseries)) {
       rres=res$retres
    } else {
       if (TIMEIT) {
-         cat("residjac: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+         tchrono("residjac", fclog)
       }
       rres=lab_resid(param, TRUE, labargs)
    }
    if (TIMEIT) {
-      cat("postopt : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+      tchrono("postopt ", fclog)
    }
    # active constraints
    if (!all(is.na(param))) {
@@ -1692,7 +1798,7 @@ for (irun in seq_len(nseries)) {
 #browser()
    while (sensitive=="mc" && !all(is.na(param))) {
       if (TIMEIT) {
-         cat("monte-ca: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+         tchrono("monte-ca", fclog)
       }
       if (set_seed) {
          set.seed(seed)
@@ -1867,7 +1973,7 @@ for (irun in seq_len(nseries)) {
    }
 
    if (TIMEIT) {
-      cat("linstats: ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+      tchrono("linstats", fclog)
    }
    # Linear method based on jacobian x_f
    # reset fluxes and jacobians according to param
@@ -2100,7 +2206,7 @@ if (write_res) {
    }
 }
 if (TIMEIT) {
-   cat("rend    : ", format(Sys.time()), " cpu=", proc.time()[1], "\\n", sep="", file=fclog)
+   tchrono("rend    ", fclog)
 }
 """)
     f.write("""
@@ -2132,7 +2238,11 @@ if (!interactive() && format(parent.frame()) == format(.GlobalEnv))
          "postlist": escape(netan["opt"].get("posttreat_R", ""), '\\"'),
          })
 
+    ftbl2code.digest_write(f)
     f.close()
+    ftbl2code.bin_close()
+    rpart=None
+    stage_trace.event("R code writing", t0, time.time()-t0, time.process_time()-c0)
     # try to make output files just readable to avoid later casual edition
     try:
         os.chmod(n_R, stat.S_IREAD)
@@ -0,0 +1,132 @@
+"""Stationary simulation of reduced cumomer systems in Python.
+
+Systems A*x=b are taken from netan["rcumo_sys"] (as built by C13_ftbl.rcumo_sys())
+and solved weight by weight with scipy.sparse for one or many
+fwd-rev flux vectors ordered as in netan["vflux_fwrv"]["fwrv"].
+Matrix conventions are the same as in generated R code (cf. ftbl2code.netan2Abcumo_spr()):
+off-diagonal terms of A are incoming fluxes from cumomers of the same weight,
+diagonal terms are sums of all incoming fluxes and b is made of fluxes
+multiplied by products of lighter (or input) cumomers.
+So that for each weight w: diag(A)*x_w - offdiag(A)*x_w = b(x_1, ..., x_{w-1}, x_input).
+
+Typical usage:
+    netan=dict()
+    C13_ftbl.ftbl_netan(C13_ftbl.ftbl_parse("e_coli.ftbl"), netan)
+    C13_ftbl.rcumo_sys(netan)
+    spr=cumo_sim.rcumo_spr(netan)
+    x=cumo_sim.fwrv2rcumo(spr, fwrv) # fwrv can be a matrix (one flux vector per column)
+
+Copyright 2026, INRAE, INSA, CNRS
+License: Gnu Public License (GPL) v2 http://www.gnu.org/licenses/gpl.html
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from tools_ssg import *
+
+def rcumo_spr(netan, iexp=0):
+    """Prepare index arrays for reduced cumomer systems found in netan["rcumo_sys"].
+    iexp is the index of parallel experiment whose label input is used.
+    Return a dict with fields:
+     - vrcumo: list of cumomer names in the order of simulated vector x
+     - fwrv: list of fwd-rev flux names (order of rows in fwrv vector/matrix)
+     - incu0: vector c(1, xinput)
+     - nb_c: cumomer number by weight
+     - ind_a: list (by weight) of integer matrices (indf, ir, ic)
+     - ind_b: list (by weight) of integer matrices (indf, irow, indx1, ...)
+       indx are indexes in the vector incu=c(1, xinput, x)
+    """
+    rAb=netan["rcumo_sys"]
+    fwrv=netan["vflux_fwrv"]["fwrv"]
+    fwrv2i=netan["vflux_fwrv"]["fwrv2i"]
+    vrcumo=netan["vrcumo"]
+    rinput=netan["rcumo_input"][iexp] if netan["rcumo_input"] else {}
+    incu2i=dict((c,i+1) for (i,c) in enumerate(list(rinput.keys())+list(valval(vrcumo))))
+    ind_a=[]
+    ind_b=[]
+    for (iw,A) in enumerate(rAb["A"]):
+        b=rAb["b"][iw]
+        cumos=vrcumo[iw]
+        c2i=dict((c,i) for (i,c) in enumerate(cumos))
+        ind_a.append(np.array([(fwrv2i[fl], ir, c2i[c])
+            for (ir,cr) in enumerate(cumos)
+            for (c,lf) in A[cr].items()
+            for fl in lf], dtype=int).reshape((-1, 3)))
+        maxprod=max((len(l) for d in b.values() for dfl in d.values() for l in dfl.values()), default=0)
+        ind_b.append(np.array([[fwrv2i[fl], ir]+[incu2i[v] for v in l]+[0]*(maxprod-len(l))
+            for (ir,cr) in enumerate(cumos) if cr in b
+            for (fl,d) in b[cr].items()
+            for l in d.values()], dtype=int).reshape((-1, 2+maxprod)))
+    return {
+        "vrcumo": list(valval(vrcumo)),
+        "fwrv": fwrv,
+        "incu0": np.array([1.]+[v if v == v else 0. for v in rinput.values()]),
+        "nb_c": [len(l) for l in vrcumo],
+        "ind_a": ind_a,
+        "ind_b": ind_b,
+    }
+
+def fwrv2Ab(fwrv, ind_a, ind_b, incu, nb_c):
+    """Assemble block diagonal sparse matrix A and rhs b for one weight
+    and nco flux vectors given as columns of fwrv (nb_fwrv x nco).
+    incu is a matrix (nb_incu x nco). Return (A, b) where b is a flat vector
+    of length nb_c*nco (column-major blocks).
+    """
+    nco=fwrv.shape[1]
+    base=np.arange(nco)*nb_c
+    # matrix A: diagonal terms are positive, off-diagonal are negative
+    sgn=np.where(ind_a[:,1] == ind_a[:,2], 1., -1.)
+    v=(fwrv[ind_a[:,0],:]*sgn[:,None]).ravel(order="F")
+    ir=(ind_a[:,1][:,None]+base).ravel(order="F")
+    ic=(ind_a[:,2][:,None]+base).ravel(order="F")
+    A=sp.csc_matrix((v, (ir, ic)), shape=(nb_c*nco, nb_c*nco))
+    # rhs b
+    if len(ind_b):
+        bv=fwrv[ind_b[:,0],:]*np.prod(incu[ind_b[:,2:],:], axis=1)
+        b=np.zeros((nb_c, nco))
+        np.add.at(b, ind_b[:,1], bv)
+    else:
+        b=np.zeros((nb_c, nco))
+    return (A, b.ravel(order="F"))
+
+def fwrv2rcumo(spr, fwrv):
+    """Solve reduced cumomer systems prepared by rcumo_spr() for flux vector fwrv.
+    fwrv is a vector (nb_fwrv) or a matrix (nb_fwrv x nco), in the latter case
+    all nco systems of a given weight are solved in one sparse block-diagonal system.
+    Return a vector (nb_rcumo) or matrix (nb_rcumo x nco) of cumomers
+    ordered as in spr["vrcumo"].
+    """
+    fwrv=np.asarray(fwrv, dtype=float)
+    vec=fwrv.ndim == 1
+    if vec:
+        fwrv=fwrv[:,None]
+    if fwrv.shape[0] != len(spr["fwrv"]):
+        raise Exception("fwrv2rcumo: flux vector length %d is different from expected %d"%(fwrv.shape[0], len(spr["fwrv"])))
+    nco=fwrv.shape[1]
+    incu=np.vstack((np.repeat(spr["incu0"][:,None], nco, axis=1), np.zeros((sum(spr["nb_c"]), nco))))
+    ba_x=len(spr["incu0"])
+    for (iw,nb_c) in enumerate(spr["nb_c"]):
+        if nb_c == 0:
+            continue
+        A,b=fwrv2Ab(fwrv, spr["ind_a"][iw], spr["ind_b"][iw], incu, nb_c)
+        try:
+            x=splu(A).solve(b)
+        except RuntimeError as e:
+            raise Exception("fwrv2rcumo: cumomer matrix is singular at weight %d (%s). Zero flux(es) in the network?"%(iw+1, str(e)))
+        incu[ba_x:ba_x+nb_c,:]=x.reshape((nb_c, nco), order="F")
+        ba_x+=nb_c
+    x=incu[len(spr["incu0"]):,:]
+    return x[:,0] if vec else x
+
+def rcumo_sim(netan, fwrv, iexp=0):
+    """Simulate reduced cumomer vector from netan (cf. C13_ftbl.rcumo_sys()).
+    Return a dict {cumo_name: value} if fwrv is a vector and
+    (vrcumo, x) tuple if fwrv is a matrix (one flux vector per column).
+    """
+    spr=rcumo_spr(netan, iexp)
+    x=fwrv2rcumo(spr, fwrv)
+    if x.ndim == 1:
+        return dict(zip(spr["vrcumo"], x))
+    return (spr["vrcumo"], x)
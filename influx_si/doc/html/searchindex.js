@@ -1 +1 @@
-Search.setIndex({docnames:["changelog","consulting","ftblevo","howto","index","install","intro","license","manual","progdoc","quick","trouble"],envversion:{"sphinx.domains.c":2,"sphinx.domains.changeset":1,"sphinx.domains.citation":1,"sphinx.domains.cpp":4,"sphinx.domains.index":1,"sphinx.domains.javascript":2,"sphinx.domains.math":2,"sphinx.domains.python":3,"sphinx.domains.rst":2,"sphinx.domains.std":2,"sphinx.ext.viewcode":1,sphinx:56},filenames:["changelog.rst","consulting.rst","ftblevo.rst","howto.rst","index.rst","install.rst","intro.rst","license.rst","manual.rst","progdoc.rst","quick.rst","trouble.rst"],objects:{"":[[9,0,0,"-","C13_ftbl"],[9,0,0,"-","ftbl2code"],[9,0,0,"-","ftbl2mtf"],[9,0,0,"-","ftbl2netan"],[9,0,0,"-","ftbl2optR"],[9,0,0,"-","ftbl2xgmml"],[9,0,0,"-","tools_ssg"],[9,0,0,"-","txt2ftbl"]],"C13_ftbl.oset":[[9,3,1,"","add"],[9,3,1,"","copy"],[9,3,1,"","difference"],[9,3,1,"","difference_update"],[9,3,1,"","intersection"],[9,3,1,"","update"]],C13_ftbl:[[9,1,1,"","aglom"],[9,1,1,"","aglom_loop1"],[9,1,1,"","allprods"],[9,1,1,"","bcumo_decomp"],[9,1,1,"","conv_mid"],[9,1,1,"","cumo_infl"],[9,1,1,"","cumo_iw"],[9,1,1,"","cumo_path"],[9,1,1,"","dom_cmp"],[9,1,1,"","enum_path"],[9,1,1,"","eval_expr"],[9,1,1,"","formula2dict"],[9,1,1,"","frag_prod"],[9,1,1,"","ftbl_netan"],[9,1,1,"","ftbl_parse"],[9,1,1,"","infl"],[9,1,1,"","iso2cumo"],[9,1,1,"","iso2emu"],[9,1,1,"","label_meas2matrix_vec_dev"],[9,1,1,"","labprods"],[9,1,1,"","lowtri"],[9,1,1,"","mass_meas2matrix_vec_dev"],[9,1,1,"","mat2graph"],[9,1,1,"","mat2pbm"],[9,1,1,"","mecoparse"],[9,1,1,"","mkfunlabli"],[9,1,1,"","ms_frag_gath"],[9,1,1,"","ntimes"],[9,2,1,"","oset"],[9,1,1,"","peak_meas2matrix_vec_dev"],[9,1,1,"","proc_kinopt"],[9,1,1,"","proc_label_input"],[9,1,1,"","proc_label_meas"],[9,1,1,"","proc_mass_meas"],[9,1,1,"","proc_peak_meas"],[9,1,1,"","prod"],[9,1,1,"","rcumo_sys"],[9,1,1,"","src_ind"],[9,1,1,"","t_iso2cumo"],[9,1,1,"","t_iso2m"],[9,1,1,"","t_iso2pos"],[9,1,1,"","topo_order"],[9,1,1,"","transpose"],[9,1,1,"","werr"],[9,1,1,"","wout"]],ftbl2code:[[9,1,1,"","netan2Abcumo_spr"],[9,1,1,"","netan2R_cumo"],[9,1,1,"","netan2R_fl"],[9,1,1,"","netan2R_ineq"],[9,1,1,"","netan2R_meas"],[9,1,1,"","netan2R_rcumo"],[9,1,1,"","netan2Rinit"]],ftbl2mtf:[[9,1,1,"","dtstamp"],[9,1,1,"","ftbl2suff"],[9,1,1,"","main"],[9,1,1,"","usage"],[9,1,1,"","warn"],[9,1,1,"","werr"]],ftbl2optR:[[9,1,1,"","main"]],ftbl2xgmml:[[9,1,1,"","werr"],[9,1,1,"","wout"]],tools_ssg:[[9,1,1,"","aff"],[9,1,1,"","arr2pbm"],[9,1,1,"","asort"],[9,1,1,"","cumsum"],[9,1,1,"","expandbit"],[9,1,1,"","icumo2iiso"],[9,1,1,"","isstr"],[9,1,1,"","iterbit"],[9,1,1,"","iternumbit"],[9,1,1,"","join"],[9,1,1,"","joint"],[9,1,1,"","list2count"],[9,1,1,"","read_table"],[9,1,1,"","reverse"],[9,1,1,"","rstrbit"],[9,1,1,"","setbit32"],[9,1,1,"","setcharbit"],[9,1,1,"","ssign"],[9,1,1,"","strbit"],[9,1,1,"","strbit2int"],[9,1,1,"","strbit32"],[9,1,1,"","sumbit"],[9,1,1,"","trd"],[9,1,1,"","ulong"],[9,1,1,"","valval"],[9,1,1,"","wxlay2py"]],txt2ftbl:[[9,1,1,"","compile"],[9,1,1,"","dfconcat"],[9,1,1,"","dsec2out"],[9,1,1,"","dtstamp"],[9,1,1,"","itvl2li"],[9,1,1,"","main"],[9,1,1,"","natural_sort_key"],[9,1,1,"","parse_cnstr"],[9,1,1,"","parse_linp"],[9,1,1,"","parse_mflux"],[9,1,1,"","parse_miso"],[9,1,1,"","parse_mmet"],[9,1,1,"","parse_opt"],[9,1,1,"","parse_tvar"],[9,1,1,"","plain_natural_key"],[9,1,1,"","revineq"],[9,1,1,"","try_ext"],[9,1,1,"","tsv2df"],[9,1,1,"","txt_parse"],[9,1,1,"","usage"],[9,1,1,"","warn"],[9,1,1,"","werr"],[9,1,1,"","work_compile"]]},objnames:{"0":["py","module","Python module"],"1":["py","function","Python function"],"2":["py","class","Python class"],"3":["py","method","Python method"]},objtypes:{"0":"py:module","1":"py:function","2":"py:class","3":"py:method"},terms:{"0":[3,5,6,7,8,9],"000000":8,"0001":8,"0007686513":8,"001":[2,8],"0010":8,"002":8,"005":8,"01":[2,8],"010":8,"01183004":8,"01260362":8,"0144652":6,"01x":[8,9],"02":[5,8],"02110":7,"02369":8,"03304418":8,"03960991":8,"05":[5,8],"1":[2,3,5,6,7,8,9],"10":[2,5,6,7,8,9],"100":8,"10000":8,"100000":8,"1016":8,"10\u00b2":8,"10\u00b3":8,"10x":8,"11":[7,8],"111":9,"111111":8,"12":[5,6,7,8],"1207158":8,"1250":9,"1252":9,"12601":8,"1301":7,"1371":6,"1397":3,"13c":[6,8],"13cflux":[0,2,6],"14":5,"15":8,"16":8,"17":[5,6],"1989":7,"1990":2,"1991":7,"1999":6,"1s":9,"1x":9,"1xx":8,"2":[2,3,5,6,7,8,9,10],"20":8,"200":3,"2000":2,"2006":6,"2007":6,"2011":[2,6,7],"2012":[2,6,8],"2013":8,"2014":[5,9],"2015":6,"2016":8,"2018":6,"2019":7,"2021":[8,9],"2022":[5,8,9],"2023":6,"21":8,"2301":8,"234":6,"25":[5,8],"251":6,"26":8,"28":6,"2nd":0,"3":[5,6,7,8,9],"300":3,"32":[0,2,5,8,9],"33":8,"38":8,"4":[5,7,8,9],"40":0,"400":[3,8],"4263681348074568":8,"43":2,"44":5,"469998855791378":8,"47158569399681":8,"47828321758155":8,"48":8,"49":8,"5":[3,5,7,8,9],"50":[3,5,8],"505":8,"50ghz":6,"51":[5,7],"511098":8,"5141593189625":8,"52":5,"53":5,"54":8,"55":[5,8],"56":5,"57":5,"58":5,"6":[3,5,7,8,9],"60":0,"61":8,"632":8,"64":[0,5],"65":8,"66":[6,8],"66034545348219":8,"68":[6,8],"687":6,"69":[6,7],"693":6,"694":8,"6n":8,"6pg":9,"7":[7,8,9],"72":8,"75":0,"778786":8,"8":[2,7,8,9],"83932":8,"85":6,"86":6,"86406543390795":8,"8893144279264":8,"9":[2,3,6,7,8],"91":8,"94":6,"95":[0,8],"96":8,"97":8,"998130284339227":8,"999":8,"\u00b2h":6,"\u00b5":8,"\u00b9\u00b3c":[6,8],"\u00b9\u2075n":[6,8],"\u03b1":8,"\u03b2":8,"boolean":0,"break":0,"byte":8,"c\u00e9cilia":0,"case":[0,2,3,5,6,7,9,10],"char":9,"class":[8,9],"default":[0,2,3,8,9],"del\u00e9pin":0,"do":[0,3,5,7,8,10],"final":[2,6,7,8],"float":[0,8,9],"function":[0,3,8,9],"import":[2,3,6,9,10],"int":9,"long":[0,7,8],"m\u00e9taboliqu":1,"m\u00f6llnei":6,"n\u00f6h":6,"new":[0,1,2,3,6,7,8,9,11],"no\u00e9mi":0,"public":[6,7,8,9],"r\u00e9seaux":1,"r\u00e9seauxm\u00e9taboliqu":11,"return":[0,8,9],"short":[5,6,7,8,9],"st\u00e9phane":0,"true":[7,8,9],"try":[3,5,8,9,11],"var":9,"void":7,"while":[0,2,6,8,9,10],A:[0,1,2,6,7,8,9,10],AND:7,AS:[6,7,11],And:[3,7,8],As:[0,2,5,6,8],At:[2,8],BE:7,BEING:7,BUT:7,BY:7,But:[3,7,8],By:[3,7,8],FOR:7,For:[1,2,5,6,7,8,9],IF:7,IN:[0,7],IS:[6,7,11],If:[0,1,2,3,5,6,7,8,9,10,11],In:[0,2,3,5,6,7,8,9,10],It:[0,2,3,5,6,7,8,9,10,11],Its:[2,8],NO:7,NOT:7,No:[8,9],Not:8,OF:[6,7],ONE:6,OR:[6,7],Of:7,On:[0,2,5,10],One:[5,8,9],SUCH:7,Such:[0,7,8],THE:7,THERE:7,TO:7,That:8,The:[0,2,3,5,6,7,8,9,10,11],Then:8,There:8,These:[2,7,8],To:[2,5,7,8,9],WILL:7,WITH:7,Will:8,_:9,__file__:0,__name__:0,_build:9,_fwd:0,_gr:8,_i:6,_io:9,_net:0,_re:[0,8,9],_rev:0,_s:6,a_i:9,ab:[0,9],abandon:2,abc:[2,8,9],abcd:[2,8],abcdef:[8,9],abcef:2,abil:5,abl:[6,8],abort:9,about:[0,1,2,3,8],abov:[6,7,8,9],absenc:[0,7,8],absent:[0,8,9,10],absolut:[0,2,7,8],abstol:8,ac:8,ac_c:8,acceler:[0,3,8],accept:[0,7],access:[0,5,7],accident:0,accoa:8,accompani:[2,7,8],accord:[2,7,8,9],accordingli:8,account:[6,8],accuraci:6,achiev:[0,7,8],acitl:8,act:7,action:[7,8],activ:[7,8],actual:[0,8,10],ad:[0,2,8,9],adapt:[0,8],adaptbt:8,add:[0,2,3,7,8,9],addit:[0,2,6,7,9],addition:[0,8],addnois:[0,3,8],address:7,adjust:8,admit:[2,8,10],adopt:2,adp:[6,8],advanc:8,advantag:6,advic:11,advis:[0,7,8],aff:9,affect:[0,8],afl:[0,8,9],after:[2,3,5,8,9],again:[0,5,8],agglomer:9,aggreg:7,aglom:9,aglom_loop1:9,aglomer:9,ago:0,agre:[6,7],agreement:7,aim:9,akg:2,al:9,ala:8,alanin:8,albert:0,algo:9,algorithm:[0,6,8],align:2,alik:0,all:[0,2,3,5,6,7,8,9,10,11],alleg:7,allflux_mc:3,alloc:3,allow:[0,2,3,6,7,8,9],allprod:9,almost:[3,5,8,9],alon:9,along:[7,9],alpha:8,alphabet:8,alreadi:[2,8,9,11],also:[0,2,5,6,7,8,10],alter:7,altern:[0,7,9],alwai:[8,9],ambigu:8,among:[0,5,7,8],amplitud:8,an:[0,2,3,5,6,7,8,9,10],anaconda:5,analys:9,analysi:[0,6,8,9],analyz:8,ani:[0,2,5,6,7,8,9,10,11],announc:7,anoth:[2,3,7,8],answer:11,antoniewicz:[6,8],anymor:0,anyon:7,anyth:7,anywai:3,api:9,appear:[0,2,6,8],append:10,append_ilin:9,appli:[0,2,3,7,8,9],applic:[3,6,7,8,9],approach:8,appropri:[0,7,8,10],approxim:[0,8,9],april:7,ar:[0,2,3,5,6,7,8,9,10,11],arbitrari:8,architectur:8,archiv:0,arg:[8,9],argument:[0,8,9],argv:[0,9],aris:7,arithmet:8,around:[0,8],arr2pbm:9,arrai:9,arrappli:5,arrow:8,ask:[1,7,8,11],asn:2,asort:9,asp:[2,8],assembl:[2,8],assign:[0,8],associ:[5,7,9],assum:[7,8],atom:[0,2,8],atp:[0,2,6,8],attach:7,attempt:7,attr:[0,8,10],attract:8,attribut:[8,9,10],au:8,author:[2,6,7,8,9],auto:0,automat:[0,2,6,7,8,9],auxiliari:[0,8],avail:[0,1,2,5,6,8,10],averag:8,avoid:[2,3,5,7,8],awai:7,b:[0,2,7,9],back:0,backtrack:[0,8],backward:8,badli:[0,10],balanc:[0,2,3,6,7,8,9],base:[0,2,3,5,6,7,8,9],basenam:8,baseshort:8,basi:[6,8,9],basic:10,bat:0,batch:8,baudoin:0,bc:9,bcumo:9,bcumo_decomp:9,becam:2,becaus:[2,7,8,10],becom:[0,2,8,11],been:7,befor:[0,2,8,9,10],begin:[2,6,8],behavior:[0,8],behind:[6,8],being:[0,2,8],believ:7,below:[5,7,8],bendtsen:[6,8],benefit:11,berg:0,best:[7,8,10],beta:8,better:[0,6,8],between:[0,2,3,6,8],bfg:[0,8],bfl:[8,9],bi:9,bidirect:6,big:[0,6,8],bin:5,binari:[7,8,9,10],biochem:[8,9],biochemistri:10,bioconda:5,bioeng:6,bioengin:6,bioinformat:6,biolog:[3,8,9],biologist:8,biomass:[0,2,8],biotechnol:6,biotechnolog:[0,1,6,8],bit:[0,5,9],bitlength:9,bitop:0,bl:9,bla:5,blabla:9,black:8,blank:9,blue:8,bm:8,bodi:[7,9],bom:0,bool:9,bordeaux:0,border:0,borrow:8,boston:7,both:[0,5,6,7,8,9],box:8,bp:9,brace:8,bracket:[0,8],break_long_lin:9,break_long_word:9,breviti:8,brief:[0,1,6,7],bring:[7,8,10],broken:0,brought:[6,8],browser:5,btdesc:[0,8],btfrac:8,btmaxit:8,btstart:8,bug:[0,1,6,9,11],build:0,built:9,bunch:8,butin:0,byproduct:8,c13:9,c13_ftbl:0,c13ftbl:0,c:[0,5,6,7,8,9],c_no:9,cahoreau:0,calcul:[0,3,5,6,8,9,10],call:[0,2,5,7,8],came:8,can:[0,1,2,3,5,6,7,8,9,10,11],cancel:[0,8],candid:[0,8],cannot:[0,2,7,8,9],canon:8,capac:8,capit:6,carb1:9,carb:9,carb_i:9,carbon:[0,2,6,9,10],carbotran:9,care:8,carefulli:8,carlo:[0,3,8],carnic:0,carri:[0,6,7],case_i:9,catalyz:8,caus:[7,8],caution:[8,9],cd:5,cell:[1,2,10],center:8,central:8,certain:7,cf:[0,2,3,5,6,8,9,11],cfrag:9,ch:9,chain:[0,6],chanc:8,chang:[2,3,4,6,7,8,9],channel:8,chapter:[2,6,9],charact:[2,8,9],character:8,characterist:8,charcat:9,charg:[5,7,8],check:[0,3,5],chemic:[0,2,6,8,9],chi2:[0,6,8,9],chi2_valu:8,chi:0,choic:[0,6,7,8],choos:[3,7],chosen:8,christoph:8,chromatographi:[0,8],chunk:9,ci:[0,8,9],cinout:8,circl:8,circumst:7,ciso:9,cisostr:9,cisotop:9,cit_c:8,cit_gr:8,cite:[6,8],citrat:8,cjac:8,claim:7,clamp:0,classic:8,clau:[6,8],clear:[7,8],clen:9,cli:9,click:7,client:11,clock:3,close:[0,5,6,8],closer:[6,8],closest:8,clownr:[0,8,9],clowp:8,clue:8,cluster:[0,3,8],cmd:9,cmetab:9,cnr:[0,6,8,9],cnstr:[0,9],cntsr:10,co2:2,co:[0,2,8,9,10],code:[0,5,6,7,8,9],coef:9,coeff:9,coeffici:[0,2,8,9],coelut:[0,6],cofactor:8,coher:0,col_nam:9,collabor:8,collaps:9,collect:[0,6,7,8,9,10],colon:[2,8],color:[0,8,10],column:[0,2,3,6,8,9,10],com:[6,8,11],coma:8,combin:[6,8,9],come:[5,7,8,9],command:[0,5,6,7],commandarg:[0,8],comment:[0,8,9],commit:7,common:8,commun:2,comp:2,compact:8,compar:[5,6,8,9],compart:0,compartment:[0,2,6,8],compat:[0,9],compel:7,compiegn:0,compil:[0,7,8,9],complementari:8,complet:[0,7,8,9],complianc:[6,7],compon:[7,8,9],compos:[8,9,10],composit:[2,8],comput:[6,8],concat:9,concaten:0,conceiv:2,concentr:[0,2,5,6,8,9,10],concern:[2,7],conclud:6,conclus:8,concord:8,concur:0,concurr:[0,6],cond1:8,conda:0,condens:[0,8],condenst:9,condit:[0,6,7,8],conduct:1,confid:8,configur:[0,5],confound:2,confront:8,confus:6,conjunct:8,connect:0,consequ:[0,7],consequenti:7,consid:[0,2,7,8,9,10],consist:[0,7,8],conspicu:7,constant:[2,5,8,9],constantli:7,constitut:7,constr:9,constrain:[0,2,3,8,9],constraint:[0,2,6,8,9,10],construct:[0,8,9],consult:[0,4,10,11],consum:[2,8],consumpt:[0,8],contact:[1,7,11],contain:[3,5,7,8],content:[7,8,9],contest:7,contex:9,context:[0,5,6,8,10],continu:[2,5,8,9],contradict:[7,8],contrari:[8,10],contrast:[2,7],contribut:[7,8,9],control:[0,7,8],conv_mid:9,convei:7,conveni:[6,8],convent:[0,8],converg:[0,3,6,9],convers:2,convert:[0,8,9],convolut:9,coon:7,cope:6,copi:[0,3,5,6,7,8,9],copy_doc:[5,8],copy_test:[5,8,10],copyright:[6,7,8,9],core:[0,3,5,6,8],cornel:0,correct:[5,7,8,10],correctli:5,correpond:9,correspond:[0,2,3,6,7,8,9,10],cosmet:0,cost:[0,3,7,8,9],cost_mc:3,could:[0,7,8],count:[7,8,9],counter:9,counterpart:0,countri:7,coupl:8,cours:7,court:7,covari:[8,9],cover:[7,9],cpu:[0,5,8],cran:[6,8],creat:[0,3,5,8,9,10],creation:[0,1,2],creator:8,criterion:[3,8],critic:[0,8],cross:[0,8],crown:8,cryptic:8,cs:9,csv:[0,8],ctrl:0,cumbersom:2,cumo2i:9,cumo:9,cumo_cost:[3,9],cumo_gradj:9,cumo_infl:9,cumo_input:9,cumo_iw:9,cumo_m_r_m:9,cumo_path:9,cumom:[0,3,6,8,9],cumos_neg:9,cumos_posit:9,cumos_vector:9,cumsum:9,cumul:9,cupn:[0,8],cupp:8,cupx:8,curiou:8,curl:8,current:[0,5,8,10],custom:[0,1,3],customarili:7,cv:8,cy:8,cygwin:[5,8],cysbml:8,cytoscap:[0,9,10],d:[2,8,9],damag:7,danger:7,dash:8,data:[0,2,3,5,6,7,9,10],datafram:[0,9],dataset:8,date:[7,9],dbg_dr_dff_singular:8,dcba:8,dd:[0,9],de:[6,8],dead:[0,8],deal:[6,8],debbugg:0,debug:0,decid:[2,7,8],decim:8,deciph:8,decis:[7,8],declar:[0,8],decompos:9,decreas:8,dedic:[1,8,11],deduc:8,def:[0,2,3,8],defect:7,defici:[0,8],defin:[0,3,9,10],definit:[3,6,7,8,9],degre:8,degrees_of_freedom:8,deliv:[0,8],dellero:0,demand:8,deni:7,depend:[0,3,7,8,9,10],deprec:[0,3,8],deriv:[0,7,8,9],descend:8,describ:[0,2,5,6,8,9,10],descript:[5,10],descriptor:9,design:[1,2,6,7,8,11],desir:[2,8,9],despit:8,detail:[1,5,6,7,8,9,10],detect:[0,8],determin:[0,2,8],determinist:8,dev:[0,9],develop:[0,2,5,6,7,8],deviat:[0,2,8,9],devot:6,df1:9,df2:9,df:8,dfconcat:9,dfl:9,diagon:9,diamet:8,diasappear:3,dict2kvh:0,dict:[0,9],dictionari:9,dictionnari:9,did:0,diff:5,differ:[0,2,5,6,7,8,9,10],difference_upd:9,differenti:6,digit:[8,9],digraph:9,dilut:8,diminish:2,dimnam:0,dir:0,direct:8,directli:[1,7,8],directori:[0,3,5,8,9,10],dirr:9,dirw:8,dirx:[3,8],disappear:8,disclaim:7,disconnect:0,discret:8,discuss:[0,1,11],disgrac:0,disk:[0,3,5,8],dispatch:5,displai:7,disposit:8,distant:3,distinct:8,distinguish:[7,8],distribut:[0,3,5,6,7,8,10],distutil:0,diverg:8,divid:[8,9],dll:0,dmask:9,doc:[0,5,8,9],doctre:9,document:[0,7,8],doe:[0,2,7,8,9],doi:[6,8],dom_cmp:9,domain:[0,6,8],don:[0,1,2,3,5,8,11],done:[0,1,5,8,10],donor:7,dot:[0,1,8,9],doubl:[0,5,8,9],doublet:8,downhil:8,download:[0,8],dr_dff:8,dr_dp:8,drag:8,dramat:8,drastic:8,draw:[1,8],drawn:8,drop:[0,8],drug:0,dry:[8,10],dsec2out:9,dsec:9,dt:[8,9],dtstamp:9,due:[0,2,8],duli:[0,8],dump:8,dure:[0,2,6,8],dynam:[0,2,6,8],e0144652:6,e10:8,e3:8,e5:8,e:[0,2,3,5,6,8,9,10],e_coli:[0,5,8,10],e_coli_glc1:8,e_coli_glc2n:8,e_coli_glc3n:8,e_coli_glc4n:8,e_coli_glc5n:8,e_coli_glc6n:8,e_coli_growth:[5,8],e_coli_gx_m:8,e_coli_gx_prl:8,e_coli_gx_x:8,e_coli_gx_x_m:8,e_coli_i:[5,6,8],e_coli_i_r:5,e_coli_iv:8,e_coli_iv_funlab:8,e_coli_msen:8,e_coli_r:5,each:[0,2,3,7,8,9],earli:0,easi:6,easier:0,easiest:8,easili:8,ec:8,echang:9,echo:0,ecl:0,ecoli:8,ecoli_glc1:8,economi:0,edd:8,edern:0,edg:[0,8,9,10],edit:[3,8],editor:8,edu:0,educt_1:2,educt_2:2,effect:[0,7,8],effici:[0,8],effort:[5,8],either:[6,7,8,9],elabor:8,electron:[6,7],element:[8,9],elementari:6,elimin:[0,6,8],els:[3,7],elsewher:8,elut:[2,8],email:[1,11],emp1:8,emp2:8,employ:7,empti:[0,2,6,8,9,10],emu:[0,6,8,9],emu_framework:9,enabl:8,enclos:8,encod:[0,8,9],encount:8,end:[0,2,3,5,7,8],endlin:0,energi:6,enforc:[0,7],eng:[6,8],engin:8,english:1,enhanc:8,enough:8,ensur:8,enter:[0,2],entir:[7,8],entiti:8,entri:[0,8,9],enum_path:9,enumer:[8,9],environ:[0,3,5,8],enzym:8,eprl:[0,8],eq:9,eqal:0,equal:[0,6,8,9],equat:[0,2,6,9],equilibr:5,equival:[5,7,10],err:[0,5,10],erron:0,error:[0,2,3,5,8,9,10,11],errx:[3,8],es:8,especi:8,essenti:[0,6],estim:[0,5,6,8,10],etc:[0,3,8,9,10],eval:0,eval_expr:[0,9],evalu:[0,6,8],even:[0,2,3,5,6,7,8,10],event:[5,7],ever:[0,7],everi:[2,6,7,8],everyon:[7,8],everyth:5,everywher:[6,9],evolut:4,evolv:2,exact:8,examin:8,exampl:[0,2,3,5,6,7,8,9,10,11],except:[0,6,7,8,9],exchang:[2,7,8,9,10],excl_outli:8,exclud:[0,7,8],exclus:[0,2,7],excus:7,exec:0,execut:[0,3,5,6,7,8,9,10],exercis:7,exist:[0,8,9],exit:[0,8,9],exp:9,expa2ftbl:0,expa:[0,8],expand:2,expandbit:9,expect:8,experi:[0,1,2,3,5,6,9,11],experiment:[5,6,8,10],explanatori:[2,8],explicit:[0,6,7,8,11],explicitli:[0,8],exploit:8,explor:[0,8],expos:1,express:[0,2,6,7,8,10],expressli:7,extend:[2,3,7,9],extens:[0,2,5,8,9],extent:7,extern:0,extra:[0,5,8],extract:[8,9,10],extrem:8,extremepathwayanalysi:0,f6p:9,f:[8,9],f_ftbl:9,f_i:9,face:[8,11],facilit:[0,2,6,8],fact:8,factor:[0,8,9],fail:[0,5],failur:[0,7],fallnx:[3,8,9],fals:[0,3,8,9],far:8,fast:6,faster:8,fatal:0,fatarova:0,faulti:8,fc:9,fcn:9,fcx:9,feasibl:[0,8],featur:[0,1,2,6,9],fee:7,few:[0,2,8],fewer:8,ff2ftbl:[0,8],ff:9,ffguess:[0,8],ffres2ftbl:[0,3],fftbl:9,fictiti:8,field:[0,2],fifth:7,figur:5,file:[0,2,3,5,6,7,9,10,11],file_labcin:[0,8,9],fill:9,filter:[0,3,8],fina:0,find:[5,8,9,11],finer:0,finger:8,finish:0,first:[0,2,3,5,6,8,9],fisrt:9,fit:[0,2,3,6,7,8,9],fittabl:8,fix:[0,6,8,9,11],fl:9,flag:[0,8],flnx:9,floor:7,flow:10,flux:[0,2,3,5,6,9,10],flux_constr:9,flux_eq:9,flux_fre:9,flux_in:9,flux_ineq:9,flux_m_r:9,flux_measur:9,flux_nam:2,flux_out:9,flux_vgrowth:9,fluxml:2,fluxom:8,fluxomet:8,fmiso:9,fmn:9,fname:9,fnscale:8,focus:8,follow:[0,2,3,5,6,7,8,9,10,11],forbid:7,forc:[0,8,9],foreign:8,forg:5,fork:0,form:[0,2,5,7,8,9],format:[0,3,4,5,6,9,10],former:[2,8],formula2dict:9,formula:[0,2,8,9],fortran:[0,9],forum:11,forward:[0,8],found:[0,2,3,6,7,8,9,10],foundat:7,fout:9,fp:9,fr:[0,1,6,8,9],fraction:[0,8,9],frag:9,frag_prod:9,fragment:[0,8,9],fragment_mask:9,framework:[0,6,8,9],franc:[0,1,6,9],franklin:7,free:[0,2,3,6,7,9,10],free_mc:3,freedom:7,from:[0,2,3,5,6,7,8,9,10,11],front:[0,2,8],fru6p:[2,8],fseri:[0,8],ftbl2:0,ftbl2cumoab:0,ftbl2cytoscap:0,ftbl2kvh:0,ftbl2labcin:0,ftbl2metxml:[0,5],ftbl2mft:[8,9],ftbl2mtf:0,ftbl2netan:0,ftbl2rsif:0,ftbl2suff:9,ftbl2xgmml:[0,10],ftbl:[0,3,4,9],ftbl_eq:8,ftbl_mea:8,ftbl_netan:9,ftbl_pars:9,ftxt:9,fu:0,full:[0,3,7,8,9],fulli:[0,8],fullsi:[0,8,9],fum:8,funlab:[0,8,9],funlabr:[0,8],further:[7,8],futil:0,futur:8,fw:9,fwd:[8,9],fwrv2i:9,fwrv:[8,9],g6p:9,g:[0,2,3,5,6,8,9,10],ga3p:8,gather:[8,9],gaussian:8,gave:8,gc:8,gcm:8,gcrg:0,gen:5,gener:[0,3,5,6,7,8,9,10],geograph:7,get:[0,3,5,7,8,9,11],ghijk:2,github:[1,11],give:[0,2,6,7,8,9],given:[0,2,3,5,7,8,9,10],glc1:8,glc4:8,glc6:8,global:0,glu08c1_02u:8,glu:[2,9],gluc_1:8,gluc_u:8,glucos:8,glucoseu:8,glucupt_1:8,glucupt_u:8,glyc:9,glycogen:8,glycolysi:9,gmail:[6,8],gnomovis:7,gnt6p:8,gnu:[6,7,8,9],go:[0,8,10],goal:7,goe:8,gonzalez:8,good:[0,6,8],googl:11,googlegroup:11,govern:[3,6,8],gpl:[6,8,9],graaf:6,gradient:[8,9],gradual:8,grant:7,graph:[0,8],graphic:[0,5,6,8,10],grater:8,grati:7,greater:[8,9],greatest:7,greatli:0,green:8,gregam:0,grep:8,grid:[0,8],group:[8,9,11],growth:[0,2,9],guarante:[7,11],guaranti:8,guess:[0,8,10],guid:7,guionnet:0,h1:9,h2o:6,h:[8,9,10],ha:[0,2,5,7,8,9,10],hacker:7,had:[0,2],hand:[0,5,8],handl:0,hang:0,happen:[0,8,10],hardli:8,hardwar:3,harm:[0,8],hash:8,have:[0,1,2,5,6,7,8,9,10,11],he:[6,7,8],header:[0,9],height:8,held:7,help:[0,1,5,8,9,10,11],helper:8,henc:6,here:[2,3,5,6,7,8,10],hereaft:[2,3,8],herebi:7,herein:7,hereinaft:7,hi:[2,8,10],hidden:0,hierarch:8,high:[5,6,8],higher:[0,5,6,8,9],highest:9,highli:[0,8],hint:8,histori:[0,8],hold:6,holder:7,homonym:0,hope:[7,8],how:[4,6,7,8],howev:[5,7,8,10],hplc:2,hsqc:8,html:[5,6,8,9],http:[0,2,5,6,8,9,11],huge:8,hypothet:[7,8],i:[0,2,5,6,8,9],icntl_14:3,icntl_nn:0,icon:8,icumo2iiso:9,icumo:9,id:[8,9],idea:[7,8,10],idem:0,ident:[5,8,9],identif:[0,8],identifi:[5,6,7],ignor:[0,8,9],iii:6,iin_metab:9,ikib:0,ikin:[0,8],ilin:9,illus:8,illustr:2,imag:9,imetab:9,impact:[0,2,8,10],implement:[7,8],impli:[6,7],implicit:[9,11],implicitli:8,impos:[7,8,9],imposed_sen:9,improv:0,in_cumo:9,in_metab:9,inabl:7,inaccur:7,inc:7,inca:6,incident:7,includ:[0,2,5,6,7,8,9],include_growth_flux:[0,8],inclus:[0,3],incoher:[0,3],incom:[8,9],incomplet:0,incorpor:[7,8],incr:9,increas:[3,6,8],increment:[0,8,9],incu2i_b1:9,incu:9,inde:8,indent:2,independ:[0,5,7,8],index:[4,8,9],indic:[0,2,7,8,9],indici:9,indirectli:7,individu:7,induc:[7,8],ine:9,ineq:9,inequ:[0,6,8,9],inequa:9,inf:[0,8],infinit:0,infl:9,influanc:9,influenc:[8,9],influx:[0,8,11],influx_:[0,2,3,5,8,10],influx_i:[0,2,3,5,10],influx_si:[1,2,3,5,10,11],info:3,inform:[0,1,3,5,7,8,9],informat:8,infrastructur:0,infring:7,init:8,initi:[0,2,6,8,9,10],inject:8,inmetab:9,input:[0,2,3,5,6,9,10,11],inra:[0,6,7,8,9],insa:[0,1,6,8,9],inserm:0,insid:[0,3],insight:8,inspir:[8,10],inst:[0,8],instal:[0,4,6,7,8],install_rdep:[0,5,8],instationari:[0,2,5,6,8,10],instead:[0,3,7,8],institut:[0,1,8],institutet:0,instruct:6,instrument:8,intact:7,integ:[8,9],integr:[6,7],intel:6,intend:[7,8,10],intens:8,intent:7,intention:8,inter:5,interact:[0,3,7,8],interchang:7,interest:[2,5,6,7,8,10],interfac:[0,6,7,9],intermedi:8,intern:[0,2,8],internet:0,interpret:[1,5,8,9],interrupt:[0,8],intersect:9,interv:[0,8,9],introduc:[0,2,3,5,7,8],introduct:[4,8],invafl:9,invalid:7,invalu:8,invers:[0,8],invert:8,invis:[0,8,9],involv:[0,2,8,9],io:0,iprod:9,ir2isc:9,ir:9,irand:[0,8],irow:9,isc:9,iseri:[0,8],isermann:6,iso2cumo:9,iso2emu:9,iso:9,iso_input:9,isod:8,isodes:8,isom:0,isospeci:8,isostr:9,isotop:[2,6,8,9],isotop_int_index:9,isotopologu:8,isotopom:[6,8,9],isstr:9,issu:[0,7,8,11],item:[7,8,9],iter:[0,2,3,8,9],iterbit:9,iternumbit:9,itnal_met:9,its:[0,2,3,5,7,8,9],itself:[1,5,7,8],itvl2li:9,iw:9,j:[6,8,9],jacobian:[0,8],jacquelin:8,jame:7,jennif:8,job:[0,3,8],join:9,joint:[0,9],journal:6,judgment:7,june:7,just:[0,2,3,5,8,9],jx_f:8,k:[6,8,9],karolinska:0,katharina:6,keep:[0,2,7,8],keepnon:9,kei:[8,9],kelleh:6,kept:8,kernel:7,kind:[3,6,7,8,11],kinet:[0,5,8,9,10],knot:[0,8],know:[2,7,8],knowledg:8,known:[2,8,9,10],kouakou:0,kvh:[0,3,8,9],kvt:9,kw:9,kwd:9,l2:8,l:[8,9],lab:[8,9],lab_resid:[3,8],lab_sim:[8,9],labarg:[3,8],label:[0,1,2,3,5,6,9,10,11],label_input:[0,9],label_mea:9,label_meas2matrix_vec_dev:9,label_measur:[0,9],label_measurements_vector:9,lablen:9,labpat:9,labprod:9,lack:[0,8,9],languag:[6,7,8],lapack:5,larg:[3,8],last:[0,8],late:2,later:[0,7,8],latest:11,latin:8,latter:[2,6,8],launch:[0,5,8],law:[6,7],layout:[8,9],le:0,lead:[0,3,8],least:[0,6,7,8,9,10],leav:8,led:8,left:[8,9],legaci:8,legal:7,legend:0,leighti:8,lement:9,len:9,length:[8,9],less:[0,8,10],lesser:7,let:[2,3,6,8,10],letter:[8,9],level:[8,9],lf:8,lgpl:6,li:[6,9],liabl:7,lib:[0,3],libpath:8,librari:[0,5,7],libsbml:[0,5],licenc:[7,8],licens:[0,4,8,9],license:7,licensor:7,lie:8,lighter:9,ligr:9,like:[0,2,3,5,6,7,8,9,10,11],lim:[0,5,8],limit:[0,2,3,6,7,8],limsolv:[0,5,8],line:[0,2,3,5,6,7,9],line_nb:9,linear:[0,3,8,9],linearli:0,link:[0,7,9],linp:[0,9,10],linterp:[0,8],linux:[0,5,6,8],lisbp:6,list2count:9,list:[0,1,5,6,8,9],literatur:8,littl:0,ll:[5,8,11],ln:[0,8],load:[0,3,8],local:[5,6,8],locat:[1,8],log2pool:[8,10],log:[4,6,10],log_2:10,logarithm:[8,10],logic:9,loic:0,longer:[0,2,8],look:[2,5,6,8],loop:9,loss:7,low:[6,8,9],low_mc:8,lower:[0,8,9],lowest:9,lowtri:9,ls:8,lsei:8,lsi:8,lsi_ln:8,lucil:0,m0:8,m1:8,m2:8,m3:8,m:[0,2,6,8,10],m_gr:8,ma:7,machin:7,maciek:8,maco:[5,6,8],made:[0,1,7,8],mae:8,magali:0,mai:[0,2,6,7,8,9],mail:7,main:[0,2,5,6,8,9],mainli:8,major:7,make:[0,3,5,6,7,8],mal:8,maldh:8,malic:8,mammalian:8,manag:[0,5],manchest:0,mandatori:[2,5,8,9,10],mani:[0,2,3,5,6,7,8],manifest:[0,8],manner:[2,8],manual:[0,4,5,6],map:[0,6,8,9,10],mapper:8,mar:8,marc:0,maria:0,mark:[0,2],mask:[8,9],mass:[0,8,9],mass_mea:9,mass_meas2matrix_vec_dev:9,mass_measur:0,mass_measures_vector:9,massou:0,mat2graph:9,mat2pbm:9,mat:9,math:8,mathemat:1,mathrm:9,matric:[0,3,8,9],matrix:[0,3,8,9],matter:8,matthieu:0,matx_lab:9,matx_mass:9,matx_peak:9,max:[8,9],maxf:8,maxim:8,maximum:8,maxit:[2,3,8],maxstep:0,mc:[0,3,8],md:9,me:[8,9],mea:9,mead:8,mean:[0,3,5,7,8,9],meaning:[0,8],meaningless:[3,8],meant:8,measmat:9,measur:[0,3,6,8,9,10],measvec:9,mecopars:9,medium:7,meet:7,memaon:9,memori:[0,3,8],mention:[0,8],menu:7,merchant:7,mere:7,messag:[0,5,8,9,10],met:[8,9],meta_nam:2,meta_s:2,metab1:9,metab2:9,metab:[0,6,8,9],metab_i:9,metab_measur:[0,9],metab_netw:9,metab_pool_diag:9,metab_scal:0,metabilit:9,metabilite_pool:0,metabol:[0,2,6,8,10],metabolit:[0,5,6,8,9,10],metabolite_pool:0,metabolom:8,metasi:[6,8],metatoul:[0,1,8,11],metexplor:0,meth:[0,8],method:[0,2,5,9,10],methodolog:[6,8],mf:9,mfa:8,mflux:[9,10],mi:9,microbi:8,mid:[0,8,9],middl:9,might:[3,5],millard:[0,6,8],min:8,min_:9,mind:8,miniconda:5,minim:[0,6,8,9],minima:6,minimum:8,minor:0,minput:9,minut:8,miso:[0,6,9,10],miss:[0,2],mix:[0,8],mkfunlabl:9,mm:[2,8],mmet:[9,10],mode:[0,6,7,8,9],model:[0,2,6,8],model_wt_bw_1:8,model_wt_bw_2:8,model_zwf_1:8,modif:[6,7],modifi:[0,7,8],modul:[0,4,5,7,8,9],molecul:[0,2,8],moment:[5,6,10],mono:0,monoton:[0,8],mont:[0,3,8],more:[0,2,4,5,6,7,8,9,10,11],moreov:[6,8],most:[2,3,6,7,8,10],mottelet:0,mous:7,move:0,mpi:9,mpvar:9,mr:8,ms:[0,6,8,9],ms_frag_gath:9,ms_nmr_data:8,mtf:[0,2,3,5,9,10],mu:[2,8],much:[2,8],mult_bxxc:0,multbxxc:[0,5],multi:[6,8],multicor:0,multipl:[0,2,5,6,8,9,10],multiplex:[5,8],multipli:9,multiprocess:0,mump:[0,3],must:[0,2,7,8,9,10],mutual:9,my:3,my_r:3,mynetwok:10,mynetwok_net:8,mynetwok_r:10,mynetwork:[0,3,9,10],mynetwork_fwd:8,mynetwork_r:[8,10],mynetwork_rev:8,mynetwotk:8,mytework:8,n1:9,n:[6,8,9],n_fort:9,n_ftbl:9,n_i:9,n_r:9,na:[0,3,8,9,10],nadh:2,nadp:[0,8],nadph:[2,8],name:[0,2,3,5,6,7,8,9],nan:9,nativ:0,natur:8,natural_sort_kei:9,nb:[8,9],nb_cumo:9,nb_f:8,nb_fc:9,nb_fcn:9,nb_fcx:9,nb_ff:9,nb_ffn:9,nb_ffx:9,nb_fl:9,nb_fln:9,nb_flx:9,nb_fmn:9,nb_ineq:9,nb_param:9,nb_rw:9,nb_w:9,necessari:[2,3,7,8,9],necessarili:0,need:[0,1,3,5,7,8,9],neg:[2,8],neglect:8,neigbour:9,neighbor:8,neighbour:9,neither:[0,5,8],nelder:8,nest:9,net:[0,2,3,8,9,10],netan2abcumo_spr:9,netan2r_cumo:9,netan2r_fl:9,netan2r_ineq:9,netan2r_mea:9,netan2r_rcumo:9,netan2rinit:9,netan:[0,8,9],netflux:[0,8,10],netw:[0,3,9,10],network:[0,2,3,6,9,10],nevertheless:8,new_label:8,new_na:3,new_na_r:3,new_na_sim1:3,new_na_sim2:3,newli:[0,3,5],next:[2,6,9,10],nh3:2,nilsson:0,nlen:9,nlsic:[0,2,3,6],nm_cumo:9,nm_fallnx:9,nm_fcn:9,nm_fcx:9,nm_ffn:9,nm_ffx:9,nm_fl:9,nm_fln:9,nm_flx:9,nm_fmn:9,nm_fwrv:9,nm_list:8,nm_mcumo:9,nm_par:9,nmr:[0,6,8],nnl:[0,5],nocalc:[0,8],node:[3,8,9,10],noeds:9,nois:8,non:[0,3,6,9,10],noncommerci:7,none:[8,9],nonstationari:9,noo:8,noopt:[0,3,8,10],nor:[5,8],norm:[0,6,8],normal:[0,5,7,8],nos:8,noscal:8,notat:8,note:[2,3,6,8,11],noth:[7,8],notic:[6,7],notion:8,notracer_network:0,notrev:9,novel:6,now:[0,2,5,8],np:[0,8,9],nrow:[0,9],nsubdiv_dt:[8,9],ntime:9,nu:8,number:[0,2,3,7,8,9],number_of_available_cor:0,number_of_measur:8,number_of_paramet:8,numer:[0,3,5,6,8,9,10],numpi:[0,8,9],nutshel:8,o2:2,o:[0,8,9],o_mcumo:9,o_mea:9,o_sc:9,obj:9,object:[0,7,8,9],oblig:7,observ:[8,9],obsolet:0,obtain:[3,6,7,8,9],obviou:[8,10],obvious:8,occupi:2,occur:[0,5,8],occurr:8,od:[6,8],offer:[0,7,8],often:[5,8],ok:[5,9],old:[0,6],omit:[2,5,8,10],onc:[0,8,9],one:[0,2,3,5,7,8,9,11],ones:[8,9],onli:[0,2,5,7,8,9,11],open:[0,3,5,8],openflux:6,opensourc:[0,8],oper:[0,5,7,8,9],operand:0,opp:9,opportun:[6,8],opposit:8,opt:[3,9,10],opt_cumo_tool:3,opt_icumo_tool:3,optctrl:[0,2,3,8],optctrl_:2,optctrl_maxit:2,optim:[0,6,9],option:[0,2,3,5,6,7,9,10],orang:0,order:[0,6,7,8,9],ordinari:[6,7],org:[5,6,8,9],organ:[2,8,9],orgin:9,origin:[6,7,8],oset:9,other:[0,2,3,5,6,7,9],otherwis:[7,8,9],our:[2,6,7,8,11],out:[0,2,5,7,8,9],outdat:[0,8],outdir:0,outlier:[0,6,8],outlin:3,output:[0,2,5,6,7,9],outsid:[0,7],over:[0,6,8,9],overcom:[2,8],overrid:8,overwrit:[8,9],overwritten:[8,9],owerriten:8,own:[5,8],oxid:8,p2bfl:9,p:[0,3,6,8,9,10],packag:[0,5,6,8],page:4,pairwis:8,palama:0,panda:0,paper:[6,7,8],papyru:[6,8],par:8,paragraph:[0,8],parallel:[0,3,5,6,9],param2fl:3,param:[8,9],paramet:[0,3,9,10],parent:9,parenthesi:[0,8],pars:[0,9],parse_cnstr:9,parse_linp:9,parse_mflux:9,parse_miso:9,parse_mmet:9,parse_opt:9,parse_tvar:9,parser:0,parsimoni:0,part:[0,2,5,6,7,8,9],parti:[0,7,11],partial:[0,8],particip:[0,2,8],particl:8,particular:[0,2,3,6,7,8,11],particularli:[5,8],partit:[0,3,8,9],partner:[8,11],pass:[0,3,7,8],past:[0,3,8],patent:7,path:[3,5,8,9,10],pathwai:[0,8,9],pattern:[8,9],pattern_of_x_and_1:8,pbm:0,pdf:[0,5,8],peak:[0,8,9],peak_mea:9,peak_meas2matrix_vec_dev:9,peak_measur:[0,9],peak_measures_vector:9,peopl:7,pep:[2,8],per:[3,8],percentag:8,perfectli:8,perform:[0,7],period:[6,8],permiss:[6,7,8,9],permit:7,persist:[3,8],person:[0,1,5],pertin:7,pfk:8,pflux:9,phenomenon:0,phrase:8,physic:7,piec:[7,8],pierr:[0,8],pip3:5,pip:0,place:[0,2,7,8],placement:0,plai:8,plain:[0,8,9],plain_natural_kei:9,plan:8,platform:[0,1,5,6,8,11],plausibl:8,pleas:[8,11],plo:6,plot:[0,8],plot_ilab:[0,8],plot_im:0,plot_imass:0,plot_smea:[0,8],plu:7,plugin:8,pm:8,pmeco:9,po:9,pocovi:0,point:[0,6,8,9],pointer:[7,8,9],poirier:0,pone:6,pool:[0,2,6,8,9],poolid:9,poorli:8,pop:8,portai:6,portion:[7,8],posit:[2,8,9],possibl:[0,3,6,7,8,10,11],post:[0,3,6],postfix:8,postmortem:0,posttreat_r:[0,3,8],potenti:8,powershel:5,ppdk:8,ppp2:8,ppp3:8,ppuls:8,ppulseslinpath:8,practic:[7,8],pre:[0,8],preambl:[0,7,8],prece:8,preced:[0,5,6,8],precis:[0,3,6,7,8],precompil:[0,5],predefin:8,predict:9,pref:[8,10],prefer:[5,7,8],prefix:[0,2,5,8,9,10],prefus:8,preliminari:[2,8],prepar:[0,3],presenc:[2,6,9],present:[0,2,5,6,7,8,9,10,11],preserv:[0,7,8,9],presid:7,presum:[2,10],prevail:0,prevent:[0,7,8],previou:[0,6,8,9],price:[7,8],prime:8,principl:6,print:[0,7,8,9],prioriti:8,privat:11,prl:9,prl_exp:[0,8],prl_ftbl:9,probabl:[3,8],problem:[0,1,5,6,7,8,9,10,11],problemat:0,proc_kinopt:9,proc_label_input:9,proc_label_mea:9,proc_mass_mea:9,proc_peak_mea:9,proce:[8,9],procedur:[0,5],proceed:[0,5,8],process:[0,5,6,8,9],prod:9,produc:[0,2,5,8,9,10],product:[0,8,9],product_1:2,product_2:2,prof:8,profil:8,program:[0,5,6,7,8,9],programm:[0,4,6,7],prohibit:7,project:[0,1,5,6,8],promin:7,promot:7,propag:[2,6,8],proper:[0,2,8],properli:0,properti:[0,7,8],proport:8,proportion:8,proposit:[0,6],proprietari:7,protect:[7,8],protocol:8,prove:7,provid:[0,5,6,7,8,10,11],provok:8,proxi:0,pso:[0,6],psock:0,psoptim_:6,pterm:9,publicli:6,publish:[2,6,7,8],puls:8,pure:5,purpos:[0,6,7,8,11],put:[0,2,3,8,9],pvalu:8,py:[0,3,5,8,9,10],pyk:8,pyr:[2,8],python2:5,python3:5,python:[0,6,8,9],qrafl:9,qualifi:8,qualiti:7,quantil:[0,8],quantiti:[0,8],question:[8,11],queue:0,quick:[4,5,6],quickli:[6,8,10],quit:5,quot:[1,8],r5p:2,r5p_c:2,r5p_m:2,r:[0,3,6,8,9],r_libs_us:8,rab:9,radic:8,rais:[0,9],ram:3,rand:8,random:[0,6,8],randomli:0,rang:[0,7],rank:[0,8],rare:8,rate:8,rather:[7,8],ratio:[0,8],rcond:8,rcost:0,rcpp_rmump:0,rcumo_input:9,rcumo_si:9,rdata:[0,3,8],re:[0,3,8,9],re_labpat:9,re_metab:9,reac:9,reac_nam:9,reach:8,reactant:8,reaction:[0,6,8,9,10],read:[0,2,5,7,8,9],read_tabl:9,readabl:[0,7],readi:[8,9],readthedoc:0,real:[8,9],realist:[0,2,3,8,10],realiz:[8,11],realli:[0,3],rearrang:2,reason:[2,7,8,9],recal:8,receiv:[7,8,9,11],recipi:7,recogn:[0,8],recommend:[0,3,8],recompil:[0,5],rectangular:8,redirect:[0,8],redistribut:7,redistributor:7,reduc:[0,3,8,9],reduct:8,redund:0,refer:[6,7,8],referenc:2,refin:8,reflect:7,refrain:7,regardless:7,regroup:[0,2,8,9],regular:[0,8],rel:[0,8],relat:1,relax:[3,8],releas:[0,1,11],reliabl:[6,8],relianc:7,reltol:8,remain:[6,7,8],remind:5,remov:[0,8],renam:[0,8],render:7,renew:0,renn:0,rep_len:8,repair:[0,7],repeat:[0,8],repeatedli:0,repetit:8,replac:[0,2,8,9],replic:9,report:[0,2,5,8,11],repres:[8,9],represent:[0,9],representd:9,reproduc:[0,8,11],reput:7,request:[0,8],requir:[0,5,6,7,8],rerun:[5,8],res2ftbl_mea:[0,3],res_ftbl:9,research:9,resembl:8,resid_mc:3,residu:[0,3,8],resolut:[6,8,9],resolv:[8,11],respect:[0,8,9],respons:[7,8],rest:[6,7,8,9],restart:8,restor:8,restrict:[7,8,9],result:[0,2,3,5,6,9,10],resum:[0,5,6,8],retr:0,retri:10,retriev:0,retrun:9,reus:7,rev:[8,9],reveal:10,rever:8,revers:[0,8,9],review:8,revineq:9,revis:7,rework:0,rewrit:2,rewritten:0,rh:9,rib5p:8,right:[0,7,8,9],risk:7,rmn:8,rmump:[0,3,5],rna:8,robert:8,robust:0,rochel:0,roland:0,role:8,romero:0,ropt:9,round:8,routin:0,row:[0,8,9],royalti:7,rprof:0,rre:8,rsd:[0,8],rstrbit:9,rtool:0,rub5p:8,rule:[8,10],run:[0,2,3,5,6,7,8,10],runtim:9,rv:9,rx:8,s:[0,2,3,5,6,7],safe:[6,8,9],safest:7,sai:[0,7,8],sake:8,same:[0,3,5,6,7,8,9],sampl:[0,7,8],saniti:0,satisfactori:8,satisfi:7,save:[0,3,8],save_al:[0,3,8],save_minenv:0,sb:8,scalar:[8,9],scale:[0,8,9],scale_diag:9,scale_nam:9,scan:8,scene:8,scheme:[0,6,8],school:7,scientif:2,scipi:5,scope:[0,7],scrambl:8,scre:9,scred:9,screen:2,script:[0,5,6,7,8],scrutin:8,sd:[0,2,3,8,10],sd_exp:8,search:[4,8,11],second:[0,2,6,8,9],secondari:8,secret:8,section:[0,3,6,7,8,9,10],see:[0,2,5,6,7,8,9,10,11],seed:[0,8],seem:8,seen:[0,8],select:8,self:[0,2,8],semicolon:8,sen:[0,8,9],send:[0,11],sensit:8,sep:9,separ:[0,2,7,8,9],septemb:5,sequenc:8,sequenti:[0,2,8],ser:8,serguei:[6,8,9],seri:[0,8,9],serv:8,servic:[0,7],session:[0,3,5,8],set:[0,2,3,5,8,9,10],setbit32:9,setcharbit:9,sever:[0,2,8],sgsokol:11,sh:[0,8],shallow:9,share:[6,7,8],sharp:0,she:7,shell:[0,5],shift:[2,6],shoot:0,shorten:[0,8],shorter:8,should:[0,3,5,7,8],show:[0,7,8,9],shown:0,shuffl:0,si:0,side:[0,8,9,11],sightli:5,sigma:9,sign:[0,2,7,8,9],signal:[0,2,3,8],signatur:7,signific:8,significantli:[0,3,8],silent:[0,8,9],sim:[0,3,5,10],simfmn:8,similar:[3,5,7,8,10,11],simlab:8,simpl:[0,1,5,6,8,9],simpli:[0,2,3,5,8,10],simplifi:8,simpool:8,simul:[0,2,3,5,6,9,10],simultan:[0,2,7,8],sinc:[3,6,7,8],sing:9,singl:[8,9],singlet:8,singular:[0,3,8],site:[0,1,8],situat:[0,2,3,8,10],size:[0,8,9],skept:9,skip:[6,9],skip_blank_lin:9,slam:[0,5],slave:8,sln:[0,8],sm:9,small:[5,6,8],smallest:0,smet:9,snow:0,so4:8,so:[0,2,5,6,7,8,9,10],sock:0,softwar:[1,2,5,6,8,10,11],sokol:[1,6,8,9],sole:[0,7],solid:8,solut:[0,5,6,8],solv:[0,5,6,8,9,11],some:[0,2,3,5,6,7,8,9,10,11],somedir:8,someon:[7,10],someth:[3,5,7,8],sometim:[0,7,8],somewhat:8,somewher:0,sort:[8,9],sourc:[0,3,7,8,9],sp:9,spa:3,space:[0,2,5,8],spain:0,spars:[0,9],sparse2spa:3,speak:[7,8],speci:[0,6,8,9],special:[0,7,8,9],specie_concentr:8,specif:[0,6,8],specifi:[7,8],speed:[0,8],speedup:0,spirit:7,split:[2,8],sprab:9,spread:[0,2,6,8],spreadsheet:8,spso2007:8,spso2011:8,sqrt:8,squar:[0,8],src:9,src_ind:9,ssign:9,stabil:[6,8],stabl:[0,6,8],stage:8,stagnat:8,stai:8,stall:0,stamp:9,stand:8,standalon:0,standard:[0,2,8],stare:8,start:[0,2,3,4,5,6,7,8,9],startup:0,state:[0,7,8],statement:8,stationari:[0,2,5,6,8,9,10],statist:[0,3,6,8],statu:7,stderr:0,stdin:[8,9],stdout:[0,9],stem:[8,9],step:[0,2,3,5,6,7,8,10,11],stephan:0,stephanopoulo:6,steplinpath2:8,steplinpath:8,still:[0,6,8,11],sto_m_r:9,sto_r_m:9,stochast:8,stocheometr:9,stock:8,stoechiometr:[0,2,9],stoichiometr:[0,8,9],stop:[3,8,9],storag:7,store:[0,8,9],str:9,strategi:[6,8],strbit2int:9,strbit32:9,strbit:9,stream:9,street:7,stress:10,strictli:8,strin:9,string:[0,2,8,9],strip:[0,8],strongli:0,struct_identif:8,structur:[2,6,9],stuani:0,studi:[2,8],stuff:11,sturctur:9,sub:[0,5,8,9],subdir:8,subdirectori:[0,5,8],subfield:8,subject:7,sublicens:7,submiss:1,submit:0,subprocess:[0,8],subroutin:7,subscrib:[1,11],subsecond:0,subsect:[2,7,8],subset:[8,9],substrat:[3,8,9],suc:8,success:[2,8],successfulli:2,succinctli:8,suff:9,suffici:[0,3,8,10],suffix:[0,8,9,10],suggest:0,suit:7,suitabl:[0,8,9],sum:[0,2,8,9],sumbit:9,superflu:0,supernod:9,supersed:8,supplementari:5,suppli:[6,8],support:6,suppos:[0,2,3,8,10],sure:[5,7,8],surrend:7,surround:8,suspici:8,sustain:7,swap:3,swarm:8,sweden:0,sy:[0,8],symbol:[0,2,5,8,9],symmetr:8,synonym:[6,8],syntax:[5,10],syntaxwarn:0,synthes:8,synthet:[3,8],system:[0,2,3,5,6,7,8,9],sytem:9,t1:8,t2:8,t:[0,1,2,3,5,8,9,11],t_iso2cumo:9,t_iso2m:9,t_iso2po:9,ta:[8,9],tab:[2,8,9],tabl:8,tabul:[2,8],tag:0,tail:0,take:[0,1,6,7,8],taken:8,tappli:0,target:[8,9],task:[6,8],tbi:[0,6],tblimit:0,teach:8,team:[6,8],techniqu:[6,8],tell:7,ten:8,tenth:8,term:[0,2,6,7,8,9],termin:7,test:[0,6,8,10],text:[8,9],textiowrapp:9,textwrap:9,tfallnx:9,th:9,than:[0,2,5,6,7,8],thank:8,thei:[0,2,5,7,8,9,10],them:[0,2,5,7,8,9,10,11],themselv:[7,8],theoret:[6,8],theori:6,therefor:7,thereof:7,theta:9,thi:[0,2,3,5,6,7,8,9,10,11],thing:7,think:[8,11],third:[0,7,8,11],thoroughli:7,those:[0,2,6,7,8,9],though:7,thousand:8,thread:[0,8],threaten:7,three:[5,7],threshold:8,through:[7,8],throughout:8,throughput:[5,6,8],thu:[0,2,6,7,8],thumb:8,tier:8,tikhonov:[0,8],tikhreg:[0,8],till:[2,3,5,8,9],time:[0,3,5,6,7,8,9,10],time_ord:8,time_unit:2,timeit:[0,8],tini:8,tint:8,tip:8,titl:[0,2],tk1:8,tk2:8,tlist:9,tmax:[0,8,9],tmp:[0,3,8,10],togeth:[2,9],toler:8,tolineq:8,toni:0,too:[0,7,8],tool:[0,2,5],topic:1,topo_ord:9,topolog:[8,9],tot:9,total:9,toulous:[0,1,6,8,9],tp:8,trace:[0,8],tracer:2,track:[2,8],trail:8,tran:9,transfer:[0,2,7,8],transform:[0,8,9],transit:[0,8,9,10],translat:[0,2,7,9],transmit:11,transpos:9,trd:9,treat:[5,8],treatment:[0,3,6,9],triangular:9,tripl:8,troubl:[0,8],troubleshoot:[4,6],truncat:8,try_ext:9,tsv2df:9,tsv:[0,8,9,10],tune:[2,8],tupl:9,turn:[0,8,10],tutori:8,tvar:[3,5,9,10],twice:9,two:[2,5,7,8,9],txt2ftbl:[0,10],txt:[0,8,9],txt_pars:9,ty:7,type:[0,2,7,8,9],typic:[0,8],typo:0,u:0,uab:0,ubuntu:5,ucsd:0,udr_dp:8,ui:[8,9],uk:0,ulong:9,unchang:9,uncoment:3,uncondit:6,undefin:8,under:[6,7,8],underli:[5,8],understand:[7,8],understood:8,undertak:8,undertaken:[0,8],undetermin:8,unenforc:7,unexpect:0,unfamiliar:8,unfortun:8,uniformli:8,uniqu:[0,8,9],unit:[2,6,8],univers:[0,5,8],unix:[0,3,5,6,8],unknown:9,unlabel:[0,2,8],unless:[6,7],unlik:8,unnam:0,unreduc:8,unsaf:0,unscal:0,unsolv:8,up:[0,1,7,8],up_mc:8,updat:[0,9],upgrad:0,upper:[3,8],upt:8,ur:8,us:[0,2,3,5,6,7,8,9,10,11],usa:[0,7],usabl:0,usag:[0,2,6,9],useless:[0,8],user:[0,1,2,3,4,5,6,7,9],userspac:5,ussual:2,usual:[0,8],utf16:0,utf32:0,utf8:0,utf:[0,8,9],util:[0,8],v10:8,v1:[6,8],v2:[6,8,9],v3:[0,9],v41:2,v47:8,v4:8,v5:8,v61:2,v6:[2,5,8],v71:2,v7:[3,8],v8:2,v:[0,8,9],val:2,val_syn:2,valid:[0,7,8],valu:[0,2,3,5,6,9,10],valuabl:8,valval:9,vanilla:8,vari:[0,2,8],variabl:[0,2,3,5,8,9,10],variant:[6,9],variat:[0,5,8],variou:[0,8,9],varnam:9,vcumo:9,vcumol:9,vdf:9,vec:9,vector:[0,3,8,9],veloc:8,vemu:9,verbatim:7,veri:[0,2,8,10],versa:8,version:[1,2,5,6,7,8,11],vflux:9,vflux_fre:9,vflux_fwrv:9,via:[0,3,8],vice:[7,8],view:7,viewabl:5,violat:[2,8],visibl:2,visit:[1,9],visostr:9,visual:[0,5,10],vkvh:8,vmetab:9,vmtf:[0,5],vmtf_wt_bw_1:8,vmtf_wt_bw_2:8,vmtf_zwf_1:8,volum:7,vrcumo:9,vrowafl:9,vs:0,w:[6,7,8,9],wa:[0,2,5,6,8,11],wai:[0,2,6,7,8,9],wall:3,want:[2,3,5,7,8],warmo:0,warn:[0,8,9,10],warranti:[6,7,11],washington:0,we:[0,2,3,5,7,8,9,10,11],web:1,weight1:9,weight2:9,weight:[0,8,9],weird:8,welcom:[7,8],well:[0,2,3,5,6,8,10],went:5,were:[0,2,8,9],werr:9,wet:8,what:[1,5,6,7,8,9,10],whatev:[2,3,7,8],when:[0,2,7,8,10],where:[0,3,5,6,7,8,9,10],whether:[7,8],which:[0,2,3,5,6,7,8,9],white:[8,9],who:[5,7,8],whole:[0,6,7,8],whose:[7,8,9],why:[5,8],wide:[5,7],widget:9,width:[8,9,10],wiechert:6,willing:[7,8],window:[0,5,6,8,9],wise:8,wish:[1,5,7,8,11],without:[0,3,5,6,7,8,11],witten:0,wkvh:0,wolfgang:6,won:8,word:[0,8],work:[0,2,3,5,6,7,8,10],work_compil:9,workabl:8,workaround:[0,8,9],worker:0,workflow:8,workstat:6,world:8,worth:8,worthwhil:10,would:[3,7,8,11],wout:9,wrap:9,writabl:[0,8],write:[0,5,6,7,8,9],written:[0,2,5,6,7,8,9,10],wrong:[0,5,8],wrote:7,wurzel:6,www:[2,5,6,8,9],wxlay2pi:9,wxwindow:9,x1x:8,x5p:2,x64:5,x:[8,9],x_cumo:9,xch01:0,xch:[3,8,9],xchflux:[8,10],xeon:6,xgmml:[0,8,9,10],xi:9,xl:9,xml:[0,2,8,9],xo:9,xrang:[0,9],xsim:8,xul5p:8,xx1:8,xx1x:8,xylos:8,xylupt_1:8,y:[8,9],yanfen:0,ye:8,year:7,yet:[2,6,8,9],yield:9,ymben:8,you:[0,1,2,3,5,6,7,8,10,11],youn:0,your:[0,1,3,5,6,7,8,10,11],yoyodyn:7,z:[8,9],z_:9,za:9,zc:[0,8],zero:[0,6,8,9],zip:0,zone:8,zwf:8},titles:["Change Log for influx_si","Consulting and more","FTBL format evolution","How to \u2026","Welcome to influx_si\u2019s documentation!","Installation","Introduction","License for influx_si software","User\u2019s manual","Programmer\u2019s documentation for influx_si","Quick Start","Troubleshooting"],titleterms:{"0":[0,2],"01":0,"02":0,"03":0,"04":0,"05":0,"06":0,"07":0,"08":0,"09":0,"1":0,"10":0,"11":[0,2],"12":0,"13":0,"14":0,"15":0,"16":0,"17":0,"18":0,"19":0,"2":0,"20":0,"2011":0,"2013":0,"2014":0,"2015":0,"2016":0,"2017":0,"2019":0,"2020":0,"2021":0,"2022":0,"2023":0,"2024":0,"22":0,"23":0,"24":0,"25":0,"26":0,"27":0,"28":0,"29":0,"3":[0,2],"30":0,"4":0,"5":[0,2],"6":0,"7":0,"8":0,"9":0,"case":8,"import":8,"long":2,abort:8,addit:8,badli:8,basic:8,both:2,c13_ftbl:9,carbon:8,carri:8,chang:0,check:8,cnstr:8,cofactor:2,command:8,conda:5,consult:1,control:2,converg:8,convers:8,custom:8,cytoscap:8,data:8,defin:8,depend:5,document:[4,5,6,9],equal:2,equat:8,err:8,evolut:2,exclus:8,expa2ftbl:8,experi:8,ffres2ftbl:8,field:8,file:8,flux:8,format:[2,8],free:8,ftbl2code:9,ftbl2cumoab:8,ftbl2kvh:8,ftbl2metxml:8,ftbl2mtf:[8,9],ftbl2netan:[8,9],ftbl2optr:9,ftbl2xgmml:[8,9],ftbl:[2,8],growth:8,how:3,human:8,identifi:8,indic:4,inequ:2,influx_:6,influx_i:[6,8],influx_si:[0,4,6,7,8,9],input:8,instal:5,introduct:[2,6],isodesign:8,label:8,licens:[6,7],line:8,linp:8,log:[0,8],manual:8,measur:2,metab:2,metab_measur:2,metabolit:2,metabolite_pool:2,metexplor:8,method:8,mflux:8,miso:8,mmet:8,more:1,mtf:8,mynetwork:8,na:2,netw:8,network:8,nlsic:8,non:8,notracer_network:2,old:8,opt:8,optim:[2,8],option:8,organ:6,other:8,output:8,parallel:8,paramet:[2,8],pars:8,pip:5,post:8,prepar:8,problemat:8,programm:9,pso:8,python:5,quick:10,r:5,reaction:2,readabl:8,res2ftbl_mea:8,result:8,s:[4,8,9],same:2,section:2,side:2,sim:8,simul:8,slow:8,softwar:7,start:10,stat:8,structur:8,sub:2,tabl:4,test:5,tool:8,tools_ssg:9,treatment:8,troubleshoot:11,tvar:8,txt2ftbl:[8,9],usag:8,user:8,v2:2,v4:2,v5:2,valu:8,version:0,view:8,visual:8,vmtf:8,welcom:4}})
\ No newline at end of file
+Search.setIndex({"alltitles":{".cnstr":[[8,"cnstr"]],".linp":[[8,"linp"]],".mflux":[[8,"mflux"]],".miso":[[8,"miso"]],".mmet":[[8,"mmet"]],".netw":[[8,"netw"]],".opt":[[8,"opt"]],".tvar":[[8,"tvar"]],".vmtf":[[8,"vmtf"]],"2011-10-11 version 1.0":[[0,"version-1-0"]],"2013-02-05 version 2.0":[[0,"version-2-0"]],"2013-02-15 version 2.1":[[0,"version-2-1"]],"2013-03-13 version 2.2":[[0,"version-2-2"]],"2013-03-15 version 2.2.1":[[0,"version-2-2-1"]],"2013-03-28 version 2.3":[[0,"version-2-3"]],"2013-04-11 version 2.4":[[0,"version-2-4"]],"2013-06-28 version 2.5":[[0,"version-2-5"]],"2013-10-02 version 2.6":[[0,"version-2-6"]],"2013-10-22 version 2.7":[[0,"version-2-7"]],"2014-01-27 version 2.8":[[0,"version-2-8"]],"2014-02-05 version 2.9":[[0,"version-2-9"]],"2014-04-08 version 2.10":[[0,"version-2-10"]],"2014-06-11 version 2.11":[[0,"version-2-11"]],"2014-06-12 version 2.11.1":[[0,"version-2-11-1"]],"2014-07-02 version 2.12":[[0,"version-2-12"]],"2014-09-17 version 2.13":[[0,"version-2-13"]],"2015-01-19 version 2.14":[[0,"version-2-14"]],"2016-02-18 version 2.15":[[0,"version-2-15"]],"2016-04-15 version 3.0":[[0,"version-3-0"]],"2016-04-18 version 3.0.1":[[0,"version-3-0-1"]],"2016-06-13 version 3.1":[[0,"version-3-1"]],"2016-07-29 version 3.2":[[0,"version-3-2"]],"2016-12-19 version 4.0":[[0,"version-4-0"]],"2016-12-20 version 4.0.1":[[0,"version-4-0-1"]],"2017-03-03 version 4.1":[[0,"version-4-1"]],"2017-03-30 version 4.2":[[0,"version-4-2"]],"2017-04-28 version 4.3":[[0,"version-4-3"]],"2017-05-22 version 4.4":[[0,"version-4-4"]],"2017-05-24 version 4.4.1":[[0,"version-4-4-1"]],"2017-06-15 version 4.4.2":[[0,"version-4-4-2"]],"2017-07-04 version 4.4.3":[[0,"version-4-4-3"]],"2019-10-25 version 5.0":[[0,"version-5-0"]],"2020-01-10 version 5.0.1":[[0,"version-5-0-1"]],"2020-02-26 version 5.0.2":[[0,"version-5-0-2"]],"2020-03-05 version 5.0.3":[[0,"version-5-0-3"]],"2020-04-07 version 5.1.0":[[0,"version-5-1-0"]],"2020-05-28 version 5.2.0":[[0,"version-5-2-0"]],"2020-07-24 version 5.3.0":[[0,"version-5-3-0"]],"2021-02-26 version 5.4.0":[[0,"version-5-4-0"]],"2022-06-08 version 6.0":[[0,"version-6-0"]],"2022-06-13 version 6.0.1":[[0,"version-6-0-1"]],"2022-06-23 version 6.0.4":[[0,"version-6-0-4"]],"2022-10-11 version 6.1":[[0,"version-6-1"]],"2023-07-11 version 7.0":[[0,"version-7-0"]],"2023-10-04 version 7.0.1":[[0,"version-7-0-1"]],"2024-02-29 version 7.0.2":[[0,"version-7-0-2"]],"2024-03-13 version 7.0.3":[[0,"version-7-0-3"]],"2024-05-17 version 7.0.4":[[0,"version-7-0-4"]],"2024-10-10 version 7.1.0":[[0,"version-7-1-0"]],"2024-11-22 version 7.2.0":[[0,"version-7-2-0"]],"2024-11-26 version 7.2.1":[[0,"version-7-2-1"]],"2024-12-16 version 7.2.2":[[0,"version-7-2-2"]],"2025-01-09 version 7.2.3":[[0,"version-7-2-3"]],"Additional tools":[[8,"additional-tools"]],"Badly defined fluxes":[[8,"badly-defined-fluxes"]],"Basic influx_si usage":[[8,"basic-influx-si-usage"]],"C13_ftbl":[[9,"module-C13_ftbl"]],"Change Log for influx_si":[[0,null]],"Cofactors (v4.0)":[[2,"cofactors-v4-0"]],"Consulting and more":[[1,null]],"Convergence aborted":[[8,"convergence-aborted"]],"Custom files":[[8,"custom-files"]],"Documentation organization":[[6,"documentation-organization"]],"Exclusive influx_i options":[[8,"exclusive-influx-i-options"]],"FTBL format evolution":[[2,null]],"Growth flux option":[[8,"growth-flux-option"]],"How to \u2026":[[3,null]],"Indices and tables":[[4,"indices-and-tables"]],"Installation":[[5,null]],"Installation of documentation":[[5,"installation-of-documentation"]],"Installation with conda":[[5,"installation-with-conda"]],"Installation with pip":[[5,"installation-with-pip"]],"Introduction":[[2,"introduction"],[6,null]],"IsoDesign: optimizing input label":[[8,"isodesign-optimizing-input-label"]],"License for influx_si software":[[7,null]],"Licensing":[[6,"licensing"]],"Long reactions (v4.0)":[[2,"long-reactions-v4-0"]],"METABOLITE_POOLS and METAB_MEASUREMENTS (v2.0)":[[2,"metabolite-pools-and-metab-measurements-v2-0"]],"MTF format":[[8,"mtf-format"]],"NA in measurements (v2.5)":[[2,"na-in-measurements-v2-5"]],"NLSIC parameters":[[8,"nlsic-parameters"]],"Network values for Cytoscape":[[8,"network-values-for-cytoscape"]],"Old Result File Fields":[[8,"old-result-file-fields"]],"Old result files":[[8,"old-result-files"]],"Optimization control parameters (v5.3)":[[2,"optimization-control-parameters-v5-3"]],"Optimization options":[[8,"optimization-options"]],"Options in .opt file":[[8,"options-in-opt-file"]],"Other optimization methods":[[8,"other-optimization-methods"]],"Output format":[[8,"output-format"]],"PSO parameters":[[8,"pso-parameters"]],"Parallel experiments":[[8,"parallel-experiments"]],"Post treatment option":[[8,"post-treatment-option"]],"Problematic cases":[[8,"problematic-cases"]],"Programmer\u2019s documentation for influx_si":[[9,null]],"Python dependencies":[[5,"python-dependencies"]],"Quick Start":[[10,null]],"R dependencies":[[5,"r-dependencies"]],"Same metabolite on both sides of reaction (v4.0)":[[2,"same-metabolite-on-both-sides-of-reaction-v4-0"]],"Section NOTRACER_NETWORK (v4.0)":[[2,"section-notracer-network-v4-0"]],"Slow convergence":[[8,"slow-convergence"]],"Structurally non-identifiable fluxes":[[8,"structurally-non-identifiable-fluxes"]],"Sub-sections EQUALITY/METAB and INEQUALITY/METAB (v2.11)":[[2,"sub-sections-equality-metab-and-inequality-metab-v2-11"]],"Test of installation":[[5,"test-of-installation"]],"Troubleshooting":[[11,null]],"User\u2019s manual":[[8,null]],"Welcome to influx_si\u2019s documentation!":[[4,null]],"expa2ftbl: non-carbon carrying fluxes":[[8,"expa2ftbl-non-carbon-carrying-fluxes"]],"ffres2ftbl: import free fluxes":[[8,"ffres2ftbl-import-free-fluxes"]],"ftbl2code":[[9,"module-ftbl2code"]],"ftbl2cumoAb: human-readable equations":[[8,"ftbl2cumoab-human-readable-equations"]],"ftbl2kvh: check MTF/FTBL parsing":[[8,"ftbl2kvh-check-mtf-ftbl-parsing"]],"ftbl2metxml: prepare MetExplore visualization":[[8,"ftbl2metxml-prepare-metexplore-visualization"]],"ftbl2mtf":[[9,"module-ftbl2mtf"]],"ftbl2mtf: conversion of FTBL to MTF format":[[8,"ftbl2mtf-conversion-of-ftbl-to-mtf-format"]],"ftbl2netan":[[9,"module-ftbl2netan"]],"ftbl2netan: MTF/FTBL parsing":[[8,"ftbl2netan-mtf-ftbl-parsing"]],"ftbl2optR":[[9,"module-ftbl2optR"]],"ftbl2xgmml":[[9,"module-ftbl2xgmml"]],"ftbl2xgmml: Cytoscape view":[[8,"ftbl2xgmml-cytoscape-view"]],"influx_i":[[6,"influx-i"]],"influx_s":[[6,"influx-s"]],"influx_si":[[6,"influx-si"]],"influx_si command line options":[[8,"influx-si-command-line-options"]],"mynetwork.err":[[8,"mynetwork-err"]],"mynetwork.log":[[8,"mynetwork-log"]],"mynetwork.miso.sim, mynetwork.mflux.sim, mynetwork.mmet.sim":[[8,"mynetwork-miso-sim-mynetwork-mflux-sim-mynetwork-mmet-sim"]],"mynetwork.stat":[[8,"mynetwork-stat"]],"mynetwork.tvar.sim":[[8,"mynetwork-tvar-sim"]],"res2ftbl_meas: simulated data":[[8,"res2ftbl-meas-simulated-data"]],"tools_ssg":[[9,"module-tools_ssg"]],"txt2ftbl":[[9,"module-txt2ftbl"]],"txt2ftbl: conversion of MTF format to FTBL format":[[8,"txt2ftbl-conversion-of-mtf-format-to-ftbl-format"]]},"docnames":["changelog","consulting","ftblevo","howto","index","install","intro","license","manual","progdoc","quick","trouble"],"envversion":{"sphinx":66,"sphinx.domains.c":3,"sphinx.domains.changeset":1,"sphinx.domains.citation":1,"sphinx.domains.cpp":9,"sphinx.domains.index":1,"sphinx.domains.javascript":3,"sphinx.domains.math":2,"sphinx.domains.python":4,"sphinx.domains.rst":2,"sphinx.domains.std":2,"sphinx.ext.viewcode":1},"filenames":["changelog.rst","consulting.rst","ftblevo.rst","howto.rst","index.rst","install.rst","intro.rst","license.rst","manual.rst","progdoc.rst","quick.rst","trouble.rst"],"indexentries":{"abcumo_spr_head() (in module ftbl2code)":[[9,"ftbl2code.Abcumo_spr_head",false]],"abcumo_spr_w() (in module ftbl2code)":[[9,"ftbl2code.Abcumo_spr_w",false]],"add() (c13_ftbl.oset method)":[[9,"C13_ftbl.oset.add",false]],"aff() (in module tools_ssg)":[[9,"tools_ssg.aff",false]],"allprods() (in module c13_ftbl)":[[9,"C13_ftbl.allprods",false]],"arr2pbm() (in module tools_ssg)":[[9,"tools_ssg.arr2pbm",false]],"asort() (in module tools_ssg)":[[9,"tools_ssg.asort",false]],"bcumo_coefs() (in module c13_ftbl)":[[9,"C13_ftbl.bcumo_coefs",false]],"bcumo_decomp() (in module c13_ftbl)":[[9,"C13_ftbl.bcumo_decomp",false]],"bin_close() (in module ftbl2code)":[[9,"ftbl2code.bin_close",false]],"bin_open() (in module ftbl2code)":[[9,"ftbl2code.bin_open",false]],"bitpos() (in module tools_ssg)":[[9,"tools_ssg.bitpos",false]],"c13_ftbl":[[9,"module-C13_ftbl",false]],"cached_parse() (in module txt2ftbl)":[[9,"txt2ftbl.cached_parse",false]],"compile() (in module txt2ftbl)":[[9,"txt2ftbl.compile",false]],"conv_mid() (in module c13_ftbl)":[[9,"C13_ftbl.conv_mid",false]],"copy() (c13_ftbl.oset method)":[[9,"C13_ftbl.oset.copy",false]],"cumo2iso_vec() (in module c13_ftbl)":[[9,"C13_ftbl.cumo2iso_vec",false]],"cumo2mid_vec() (in module c13_ftbl)":[[9,"C13_ftbl.cumo2mid_vec",false]],"cumo_infl() (in module c13_ftbl)":[[9,"C13_ftbl.cumo_infl",false]],"cumo_infl_index() (in module c13_ftbl)":[[9,"C13_ftbl.cumo_infl_index",false]],"cumo_infl_key() (in module c13_ftbl)":[[9,"C13_ftbl.cumo_infl_key",false]],"cumo_iw() (in module c13_ftbl)":[[9,"C13_ftbl.cumo_iw",false]],"cumo_key() (in module c13_ftbl)":[[9,"C13_ftbl.cumo_key",false]],"cumo_masks() (in module c13_ftbl)":[[9,"C13_ftbl.cumo_masks",false]],"cumo_path() (in module c13_ftbl)":[[9,"C13_ftbl.cumo_path",false]],"cumo_sys_coo() (in module c13_ftbl)":[[9,"C13_ftbl.cumo_sys_coo",false]],"cumo_sys_dict() (in module c13_ftbl)":[[9,"C13_ftbl.cumo_sys_dict",false]],"cumsum() (in module tools_ssg)":[[9,"tools_ssg.cumsum",false]],"dfconcat() (in module txt2ftbl)":[[9,"txt2ftbl.dfconcat",false]],"difference() (c13_ftbl.oset method)":[[9,"C13_ftbl.oset.difference",false]],"difference_update() (c13_ftbl.oset method)":[[9,"C13_ftbl.oset.difference_update",false]],"digest_write() (in module ftbl2code)":[[9,"ftbl2code.digest_write",false]],"dom_cmp() (in module c13_ftbl)":[[9,"C13_ftbl.dom_cmp",false]],"dsec2out() (in module txt2ftbl)":[[9,"txt2ftbl.dsec2out",false]],"dtstamp() (in module ftbl2mtf)":[[9,"ftbl2mtf.dtstamp",false]],"dtstamp() (in module txt2ftbl)":[[9,"txt2ftbl.dtstamp",false]],"enum_path() (in module c13_ftbl)":[[9,"C13_ftbl.enum_path",false]],"eval_expr() (in module c13_ftbl)":[[9,"C13_ftbl.eval_expr",false]],"expandbit() (in module tools_ssg)":[[9,"tools_ssg.expandbit",false]],"expandbit_vec() (in module tools_ssg)":[[9,"tools_ssg.expandbit_vec",false]],"expr_ast() (in module c13_ftbl)":[[9,"C13_ftbl.expr_ast",false]],"expr_interp() (in module c13_ftbl)":[[9,"C13_ftbl.expr_interp",false]],"fjoin() (in module tools_ssg)":[[9,"tools_ssg.fjoin",false]],"formula2dict() (in module c13_ftbl)":[[9,"C13_ftbl.formula2dict",false]],"frag_prod() (in module c13_ftbl)":[[9,"C13_ftbl.frag_prod",false]],"ftbl2code":[[9,"module-ftbl2code",false]],"ftbl2mtf":[[9,"module-ftbl2mtf",false]],"ftbl2netan":[[9,"module-ftbl2netan",false]],"ftbl2optr":[[9,"module-ftbl2optR",false]],"ftbl2suff() (in module ftbl2mtf)":[[9,"ftbl2mtf.ftbl2suff",false]],"ftbl2xgmml":[[9,"module-ftbl2xgmml",false]],"ftbl_netan() (in module c13_ftbl)":[[9,"C13_ftbl.ftbl_netan",false]],"ftbl_parse() (in module c13_ftbl)":[[9,"C13_ftbl.ftbl_parse",false]],"ftbl_text() (in module c13_ftbl)":[[9,"C13_ftbl.ftbl_text",false]],"ftbl_tokens() (in module c13_ftbl)":[[9,"C13_ftbl.ftbl_tokens",false]],"gen_r() (in module ftbl2optr)":[[9,"ftbl2optR.gen_R",false]],"icumo2iiso() (in module tools_ssg)":[[9,"tools_ssg.icumo2iiso",false]],"infl() (in module c13_ftbl)":[[9,"C13_ftbl.infl",false]],"int_str() (in module tools_ssg)":[[9,"tools_ssg.int_str",false]],"intersection() (c13_ftbl.oset method)":[[9,"C13_ftbl.oset.intersection",false]],"iso2cumo() (in module c13_ftbl)":[[9,"C13_ftbl.iso2cumo",false]],"iso2cumo_batch() (in module c13_ftbl)":[[9,"C13_ftbl.iso2cumo_batch",false]],"iso2cumo_vec() (in module c13_ftbl)":[[9,"C13_ftbl.iso2cumo_vec",false]],"iso2emu() (in module c13_ftbl)":[[9,"C13_ftbl.iso2emu",false]],"iso2emu_batch() (in module c13_ftbl)":[[9,"C13_ftbl.iso2emu_batch",false]],"iso2mid_vec() (in module c13_ftbl)":[[9,"C13_ftbl.iso2mid_vec",false]],"iso_input_arr() (in module c13_ftbl)":[[9,"C13_ftbl.iso_input_arr",false]],"isstr() (in module tools_ssg)":[[9,"tools_ssg.isstr",false]],"iterbit() (in module tools_ssg)":[[9,"tools_ssg.iterbit",false]],"iternumbit() (in module tools_ssg)":[[9,"tools_ssg.iternumbit",false]],"itvl2li() (in module txt2ftbl)":[[9,"txt2ftbl.itvl2li",false]],"join() (in module tools_ssg)":[[9,"tools_ssg.join",false]],"joint() (in module tools_ssg)":[[9,"tools_ssg.joint",false]],"key2cumo() (in module c13_ftbl)":[[9,"C13_ftbl.key2cumo",false]],"label_meas2matrix_vec_dev() (in module c13_ftbl)":[[9,"C13_ftbl.label_meas2matrix_vec_dev",false]],"labprods() (in module c13_ftbl)":[[9,"C13_ftbl.labprods",false]],"list2count() (in module tools_ssg)":[[9,"tools_ssg.list2count",false]],"main() (in module ftbl2mtf)":[[9,"ftbl2mtf.main",false]],"main() (in module ftbl2optr)":[[9,"ftbl2optR.main",false]],"main() (in module txt2ftbl)":[[9,"txt2ftbl.main",false]],"mass_decomp() (in module c13_ftbl)":[[9,"C13_ftbl.mass_decomp",false]],"mass_decomp_loc() (in module c13_ftbl)":[[9,"C13_ftbl.mass_decomp_loc",false]],"mass_meas2matrix_vec_dev() (in module c13_ftbl)":[[9,"C13_ftbl.mass_meas2matrix_vec_dev",false]],"mat2graph() (in module c13_ftbl)":[[9,"C13_ftbl.mat2graph",false]],"mat2pbm() (in module c13_ftbl)":[[9,"C13_ftbl.mat2pbm",false]],"mecoparse() (in module c13_ftbl)":[[9,"C13_ftbl.mecoparse",false]],"metab_ids() (in module c13_ftbl)":[[9,"C13_ftbl.metab_ids",false]],"mkfunlabli() (in module c13_ftbl)":[[9,"C13_ftbl.mkfunlabli",false]],"module":[[9,"module-C13_ftbl",false],[9,"module-ftbl2code",false],[9,"module-ftbl2mtf",false],[9,"module-ftbl2netan",false],[9,"module-ftbl2optR",false],[9,"module-ftbl2xgmml",false],[9,"module-tools_ssg",false],[9,"module-txt2ftbl",false]],"ms_frag_gath() (in module c13_ftbl)":[[9,"C13_ftbl.ms_frag_gath",false]],"natural_sort_key() (in module txt2ftbl)":[[9,"txt2ftbl.natural_sort_key",false]],"netan2abcumo_coo() (in module ftbl2code)":[[9,"ftbl2code.netan2Abcumo_coo",false]],"netan2abcumo_spr() (in module ftbl2code)":[[9,"ftbl2code.netan2Abcumo_spr",false]],"netan2r_cumo() (in module ftbl2code)":[[9,"ftbl2code.netan2R_cumo",false]],"netan2r_fl() (in module ftbl2code)":[[9,"ftbl2code.netan2R_fl",false]],"netan2r_ineq() (in module ftbl2code)":[[9,"ftbl2code.netan2R_ineq",false]],"netan2r_meas() (in module ftbl2code)":[[9,"ftbl2code.netan2R_meas",false]],"netan2r_rcumo() (in module ftbl2code)":[[9,"ftbl2code.netan2R_rcumo",false]],"netan2rinit() (in module ftbl2code)":[[9,"ftbl2code.netan2Rinit",false]],"netan_key() (in module ftbl2optr)":[[9,"ftbl2optR.netan_key",false]],"netan_measures() (in module ftbl2code)":[[9,"ftbl2code.netan_measures",false]],"ntimes() (in module c13_ftbl)":[[9,"C13_ftbl.ntimes",false]],"num_expr() (in module txt2ftbl)":[[9,"txt2ftbl.num_expr",false]],"oset (class in c13_ftbl)":[[9,"C13_ftbl.oset",false]],"parse_cnstr() (in module txt2ftbl)":[[9,"txt2ftbl.parse_cnstr",false]],"parse_linp() (in module txt2ftbl)":[[9,"txt2ftbl.parse_linp",false]],"parse_mflux() (in module txt2ftbl)":[[9,"txt2ftbl.parse_mflux",false]],"parse_miso() (in module txt2ftbl)":[[9,"txt2ftbl.parse_miso",false]],"parse_mmet() (in module txt2ftbl)":[[9,"txt2ftbl.parse_mmet",false]],"parse_opt() (in module txt2ftbl)":[[9,"txt2ftbl.parse_opt",false]],"parse_tvar() (in module txt2ftbl)":[[9,"txt2ftbl.parse_tvar",false]],"parse_version() (in module tools_ssg)":[[9,"tools_ssg.parse_version",false]],"peak_meas2matrix_vec_dev() (in module c13_ftbl)":[[9,"C13_ftbl.peak_meas2matrix_vec_dev",false]],"plain_natural_key() (in module txt2ftbl)":[[9,"txt2ftbl.plain_natural_key",false]],"popcount() (in module c13_ftbl)":[[9,"C13_ftbl.popcount",false]],"popcount() (in module ftbl2code)":[[9,"ftbl2code.popcount",false]],"popcount() (in module ftbl2optr)":[[9,"ftbl2optR.popcount",false]],"popcount() (in module ftbl2xgmml)":[[9,"ftbl2xgmml.popcount",false]],"popcount() (in module tools_ssg)":[[9,"tools_ssg.popcount",false]],"proc_kinopt() (in module c13_ftbl)":[[9,"C13_ftbl.proc_kinopt",false]],"proc_label_input() (in module c13_ftbl)":[[9,"C13_ftbl.proc_label_input",false]],"proc_label_meas() (in module c13_ftbl)":[[9,"C13_ftbl.proc_label_meas",false]],"proc_mass_meas() (in module c13_ftbl)":[[9,"C13_ftbl.proc_mass_meas",false]],"proc_peak_meas() (in module c13_ftbl)":[[9,"C13_ftbl.proc_peak_meas",false]],"prod() (in module c13_ftbl)":[[9,"C13_ftbl.prod",false]],"rcumo_sys() (in module c13_ftbl)":[[9,"C13_ftbl.rcumo_sys",false]],"read_table() (in module tools_ssg)":[[9,"tools_ssg.read_table",false]],"reuse_ftbl() (in module txt2ftbl)":[[9,"txt2ftbl.reuse_ftbl",false]],"reverse() (in module tools_ssg)":[[9,"tools_ssg.reverse",false]],"revineq() (in module txt2ftbl)":[[9,"txt2ftbl.revineq",false]],"rstrbit() (in module tools_ssg)":[[9,"tools_ssg.rstrbit",false]],"rvec() (in module ftbl2code)":[[9,"ftbl2code.rvec",false]],"setbit32() (in module tools_ssg)":[[9,"tools_ssg.setbit32",false]],"setcharbit() (in module tools_ssg)":[[9,"tools_ssg.setcharbit",false]],"sprow_dense() (in module c13_ftbl)":[[9,"C13_ftbl.sprow_dense",false]],"sprow_key() (in module c13_ftbl)":[[9,"C13_ftbl.sprow_key",false]],"sprows2csr() (in module c13_ftbl)":[[9,"C13_ftbl.sprows2csr",false]],"src_ind() (in module c13_ftbl)":[[9,"C13_ftbl.src_ind",false]],"src_ind_tab() (in module c13_ftbl)":[[9,"C13_ftbl.src_ind_tab",false]],"src_ind_vec() (in module c13_ftbl)":[[9,"C13_ftbl.src_ind_vec",false]],"ssign() (in module tools_ssg)":[[9,"tools_ssg.ssign",false]],"strbit() (in module tools_ssg)":[[9,"tools_ssg.strbit",false]],"strbit2int() (in module tools_ssg)":[[9,"tools_ssg.strbit2int",false]],"strbit32() (in module tools_ssg)":[[9,"tools_ssg.strbit32",false]],"sum_obj() (in module c13_ftbl)":[[9,"C13_ftbl.sum_obj",false]],"sumbit() (in module tools_ssg)":[[9,"tools_ssg.sumbit",false]],"sumbit_vec() (in module tools_ssg)":[[9,"tools_ssg.sumbit_vec",false]],"t_iso2cumo() (in module c13_ftbl)":[[9,"C13_ftbl.t_iso2cumo",false]],"t_iso2m() (in module c13_ftbl)":[[9,"C13_ftbl.t_iso2m",false]],"t_iso2pos() (in module c13_ftbl)":[[9,"C13_ftbl.t_iso2pos",false]],"tools_ssg":[[9,"module-tools_ssg",false]],"transpose() (in module c13_ftbl)":[[9,"C13_ftbl.transpose",false]],"trd() (in module tools_ssg)":[[9,"tools_ssg.trd",false]],"try_ext() (in module txt2ftbl)":[[9,"txt2ftbl.try_ext",false]],"tsv2df() (in module txt2ftbl)":[[9,"txt2ftbl.tsv2df",false]],"txt2ftbl":[[9,"module-txt2ftbl",false]],"txt_parse() (in module txt2ftbl)":[[9,"txt2ftbl.txt_parse",false]],"ulong() (in module tools_ssg)":[[9,"tools_ssg.ulong",false]],"update() (c13_ftbl.oset method)":[[9,"C13_ftbl.oset.update",false]],"usage() (in module ftbl2mtf)":[[9,"ftbl2mtf.usage",false]],"usage() (in module txt2ftbl)":[[9,"txt2ftbl.usage",false]],"valval() (in module tools_ssg)":[[9,"tools_ssg.valval",false]],"warn() (in module ftbl2mtf)":[[9,"ftbl2mtf.warn",false]],"warn() (in module txt2ftbl)":[[9,"txt2ftbl.warn",false]],"werr() (in module c13_ftbl)":[[9,"C13_ftbl.werr",false]],"werr() (in module ftbl2mtf)":[[9,"ftbl2mtf.werr",false]],"werr() (in module ftbl2xgmml)":[[9,"ftbl2xgmml.werr",false]],"werr() (in module txt2ftbl)":[[9,"txt2ftbl.werr",false]],"work_compile() (in module txt2ftbl)":[[9,"txt2ftbl.work_compile",false]],"work_star() (in module txt2ftbl)":[[9,"txt2ftbl.work_star",false]],"wout() (in module c13_ftbl)":[[9,"C13_ftbl.wout",false]],"wout() (in module ftbl2xgmml)":[[9,"ftbl2xgmml.wout",false]],"wrapjoin() (in module tools_ssg)":[[9,"tools_ssg.wrapjoin",false]],"wxlay2py() (in module tools_ssg)":[[9,"tools_ssg.wxlay2py",false]],"zeta_sup() (in module c13_ftbl)":[[9,"C13_ftbl.zeta_sup",false]]},"objects":{"":[[9,0,0,"-","C13_ftbl"],[9,0,0,"-","ftbl2code"],[9,0,0,"-","ftbl2mtf"],[9,0,0,"-","ftbl2netan"],[9,0,0,"-","ftbl2optR"],[9,0,0,"-","ftbl2xgmml"],[9,0,0,"-","tools_ssg"],[9,0,0,"-","txt2ftbl"]],"C13_ftbl":[[9,1,1,"","allprods"],[9,1,1,"","bcumo_coefs"],[9,1,1,"","bcumo_decomp"],[9,1,1,"","conv_mid"],[9,1,1,"","cumo2iso_vec"],[9,1,1,"","cumo2mid_vec"],[9,1,1,"","cumo_infl"],[9,1,1,"","cumo_infl_index"],[9,1,1,"","cumo_infl_key"],[9,1,1,"","cumo_iw"],[9,1,1,"","cumo_key"],[9,1,1,"","cumo_masks"],[9,1,1,"","cumo_path"],[9,1,1,"","cumo_sys_coo"],[9,1,1,"","cumo_sys_dict"],[9,1,1,"","dom_cmp"],[9,1,1,"","enum_path"],[9,1,1,"","eval_expr"],[9,1,1,"","expr_ast"],[9,1,1,"","expr_interp"],[9,1,1,"","formula2dict"],[9,1,1,"","frag_prod"],[9,1,1,"","ftbl_netan"],[9,1,1,"","ftbl_parse"],[9,1,1,"","ftbl_text"],[9,1,1,"","ftbl_tokens"],[9,1,1,"","infl"],[9,1,1,"","iso2cumo"],[9,1,1,"","iso2cumo_batch"],[9,1,1,"","iso2cumo_vec"],[9,1,1,"","iso2emu"],[9,1,1,"","iso2emu_batch"],[9,1,1,"","iso2mid_vec"],[9,1,1,"","iso_input_arr"],[9,1,1,"","key2cumo"],[9,1,1,"","label_meas2matrix_vec_dev"],[9,1,1,"","labprods"],[9,1,1,"","mass_decomp"],[9,1,1,"","mass_decomp_loc"],[9,1,1,"","mass_meas2matrix_vec_dev"],[9,1,1,"","mat2graph"],[9,1,1,"","mat2pbm"],[9,1,1,"","mecoparse"],[9,1,1,"","metab_ids"],[9,1,1,"","mkfunlabli"],[9,1,1,"","ms_frag_gath"],[9,1,1,"","ntimes"],[9,2,1,"","oset"],[9,1,1,"","peak_meas2matrix_vec_dev"],[9,1,1,"","popcount"],[9,1,1,"","proc_kinopt"],[9,1,1,"","proc_label_input"],[9,1,1,"","proc_label_meas"],[9,1,1,"","proc_mass_meas"],[9,1,1,"","proc_peak_meas"],[9,1,1,"","prod"],[9,1,1,"","rcumo_sys"],[9,1,1,"","sprow_dense"],[9,1,1,"","sprow_key"],[9,1,1,"","sprows2csr"],[9,1,1,"","src_ind"],[9,1,1,"","src_ind_tab"],[9,1,1,"","src_ind_vec"],[9,1,1,"","sum_obj"],[9,1,1,"","t_iso2cumo"],[9,1,1,"","t_iso2m"],[9,1,1,"","t_iso2pos"],[9,1,1,"","transpose"],[9,1,1,"","werr"],[9,1,1,"","wout"],[9,1,1,"","zeta_sup"]],"C13_ftbl.oset":[[9,3,1,"","add"],[9,3,1,"","copy"],[9,3,1,"","difference"],[9,3,1,"","difference_update"],[9,3,1,"","intersection"],[9,3,1,"","update"]],"ftbl2code":[[9,1,1,"","Abcumo_spr_head"],[9,1,1,"","Abcumo_spr_w"],[9,1,1,"","bin_close"],[9,1,1,"","bin_open"],[9,1,1,"","digest_write"],[9,1,1,"","netan2Abcumo_coo"],[9,1,1,"","netan2Abcumo_spr"],[9,1,1,"","netan2R_cumo"],[9,1,1,"","netan2R_fl"],[9,1,1,"","netan2R_ineq"],[9,1,1,"","netan2R_meas"],[9,1,1,"","netan2R_rcumo"],[9,1,1,"","netan2Rinit"],[9,1,1,"","netan_measures"],[9,1,1,"","popcount"],[9,1,1,"","rvec"]],"ftbl2mtf":[[9,1,1,"","dtstamp"],[9,1,1,"","ftbl2suff"],[9,1,1,"","main"],[9,1,1,"","usage"],[9,1,1,"","warn"],[9,1,1,"","werr"]],"ftbl2optR":[[9,1,1,"","gen_R"],[9,1,1,"","main"],[9,1,1,"","netan_key"],[9,1,1,"","popcount"]],"ftbl2xgmml":[[9,1,1,"","popcount"],[9,1,1,"","werr"],[9,1,1,"","wout"]],"tools_ssg":[[9,1,1,"","aff"],[9,1,1,"","arr2pbm"],[9,1,1,"","asort"],[9,1,1,"","bitpos"],[9,1,1,"","cumsum"],[9,1,1,"","expandbit"],[9,1,1,"","expandbit_vec"],[9,1,1,"","fjoin"],[9,1,1,"","icumo2iiso"],[9,1,1,"","int_str"],[9,1,1,"","isstr"],[9,1,1,"","iterbit"],[9,1,1,"","iternumbit"],[9,1,1,"","join"],[9,1,1,"","joint"],[9,1,1,"","list2count"],[9,1,1,"","parse_version"],[9,1,1,"","popcount"],[9,1,1,"","read_table"],[9,1,1,"","reverse"],[9,1,1,"","rstrbit"],[9,1,1,"","setbit32"],[9,1,1,"","setcharbit"],[9,1,1,"","ssign"],[9,1,1,"","strbit"],[9,1,1,"","strbit2int"],[9,1,1,"","strbit32"],[9,1,1,"","sumbit"],[9,1,1,"","sumbit_vec"],[9,1,1,"","trd"],[9,1,1,"","ulong"],[9,1,1,"","valval"],[9,1,1,"","wrapjoin"],[9,1,1,"","wxlay2py"]],"txt2ftbl":[[9,1,1,"","cached_parse"],[9,1,1,"","compile"],[9,1,1,"","dfconcat"],[9,1,1,"","dsec2out"],[9,1,1,"","dtstamp"],[9,1,1,"","itvl2li"],[9,1,1,"","main"],[9,1,1,"","natural_sort_key"],[9,1,1,"","num_expr"],[9,1,1,"","parse_cnstr"],[9,1,1,"","parse_linp"],[9,1,1,"","parse_mflux"],[9,1,1,"","parse_miso"],[9,1,1,"","parse_mmet"],[9,1,1,"","parse_opt"],[9,1,1,"","parse_tvar"],[9,1,1,"","plain_natural_key"],[9,1,1,"","reuse_ftbl"],[9,1,1,"","revineq"],[9,1,1,"","try_ext"],[9,1,1,"","tsv2df"],[9,1,1,"","txt_parse"],[9,1,1,"","usage"],[9,1,1,"","warn"],[9,1,1,"","werr"],[9,1,1,"","work_compile"],[9,1,1,"","work_star"]]},"objnames":{"0":["py","module","Python module"],"1":["py","function","Python function"],"2":["py","class","Python class"],"3":["py","method","Python method"]},"objtypes":{"0":"py:module","1":"py:function","2":"py:class","3":"py:method"},"terms":{"01x":[8,9],"0b1101":9,"10s":6,"10x":8,"13c":[6,8],"13cflux":[0,2,6],"17s":6,"1s":9,"1x":9,"1xx":8,"2nd":0,"50ghz":6,"6n":8,"6pg":9,"A":[0,1,2,6,7,8,9,10],"ALL":7,"AND":7,"AS":[6,7,11],"After":[3,8],"All":[0,8],"An":[2,8,10],"And":[3,7,8],"As":[0,2,5,6,8],"At":[2,8],"BE":7,"BEEN":7,"BEING":7,"BUT":7,"BY":7,"Both":6,"But":[3,7,8],"By":[3,7,8],"Cannot":8,"Each":[7,8,9],"FOR":7,"Few":[0,8],"For":[1,2,5,6,7,8,9],"HAS":7,"Here":[2,7,8],"How":[4,6,7,8],"I":8,"IF":7,"IN":[0,7],"IS":[6,7,11],"If":[0,1,2,3,5,6,7,8,9,10,11],"In":[0,2,3,5,6,7,8,9,10],"It":[0,2,3,5,6,7,8,9,10,11],"Its":[2,8,9],"More":[2,8],"Most":8,"NO":7,"NOT":7,"No":[8,9],"Not":8,"OF":[6,7],"OR":[6,7,9],"OTHER":7,"OUT":[7,8],"Of":7,"On":[0,2,5,10],"Other":9,"Our":7,"SHOULD":7,"SUCH":7,"Same":9,"So":[0,2,5,6,8,9,10],"Some":[5,6,7,8],"Such":[0,7,8],"THE":7,"THERE":7,"TO":7,"That":8,"The":[0,2,3,5,6,7,8,9,10,11],"Then":8,"There":8,"These":[2,7,8],"They":[0,5,8,9],"This":[0,2,5,6,7,8,9],"Those":8,"To":[2,5,7,8,9],"WHEN":7,"WHO":7,"WITH":7,"We":[2,7,8,10],"What":8,"When":[2,7,8],"While":8,"With":9,"YOU":7,"You":[1,2,3,5,6,7,8,10],"Your":7,"_":9,"__file__":0,"__name__":0,"_build":9,"_fwd":0,"_gr":8,"_i":6,"_io":9,"_net":0,"_re":9,"_res":[0,8],"_rev":0,"_s":6,"a_i":9,"ab":[0,9],"abandon":2,"abc":[2,8,9],"abcd":[2,8],"abcdef":[8,9],"abcef":2,"abcumo_spr_head":9,"abcumo_spr_w":9,"abil":5,"abl":[6,8],"abort":9,"abov":[6,7,8,9],"absenc":[0,7,8],"absent":[0,8,9,10],"absolut":[0,2,7,8,9],"abstol":8,"ac":8,"ac_c":8,"acceler":[0,3,8],"accept":[0,7],"access":[0,5,7],"accident":0,"accoa":8,"accompani":[2,7,8],"accord":[2,7,8,9],"account":[6,8],"accuraci":6,"achiev":[0,7,8],"acitl":8,"act":7,"action":[7,8],"activ":[7,8],"actual":[0,8,10],"adapt":[0,8],"adaptbt":8,"add":[0,2,3,7,8,9],"addit":[0,2,6,7,9],"addnois":[0,3,8],"address":7,"adjust":8,"admit":[0,2,8,10],"adopt":2,"adp":[6,8],"advanc":8,"advantag":6,"advic":11,"advis":[0,7,8],"aff":9,"affect":[0,8],"afl":[0,8,9],"aggreg":7,"ago":0,"agre":[6,7],"agreement":7,"aim":9,"akg":2,"al":9,"ala":8,"alanin":8,"albert":0,"algo":9,"algorithm":[0,6,8],"align":2,"alik":0,"alleg":7,"allflux_mc":3,"alloc":3,"allow":[0,2,3,6,7,8,9],"allprod":9,"almost":[3,5,8,9],"alon":9,"along":[7,9],"alpha":8,"alphabet":8,"alreadi":[2,8,9,11],"also":[0,2,5,6,7,8,9,10],"alter":7,"altern":[0,7,9],"alway":[8,9],"ambigu":8,"among":[0,5,7,8],"amplitud":8,"anaconda":5,"analys":9,"analysi":[0,6,8,9],"analyz":8,"ani":[0,2,5,6,7,8,9,10,11],"announc":7,"anoth":[2,3,7,8],"answer":11,"antoniewicz":[6,8],"anymor":0,"anyon":7,"anyth":7,"anyway":3,"api":9,"appear":[0,2,6,8,9],"append":[9,10],"append_ilin":9,"appli":[0,2,3,7,8,9],"applic":[3,6,7,8,9],"approach":8,"appropri":[0,7,8,10],"approxim":[0,8,9],"april":7,"arbitrari":8,"architectur":8,"archiv":0,"arg":[8,9],"argument":[0,8,9],"argv":[0,9],"aris":7,"arithmet":8,"around":[0,8],"arr2pbm":9,"arrappli":5,"array":9,"arrow":8,"ask":[1,7,8,11],"asn":2,"asort":9,"asp":[2,8],"assembl":[2,8],"assign":[0,8],"associ":[5,7,9],"assum":[7,8],"astev":9,"atab":9,"atom":[0,2,8],"atp":[0,2,6,8],"attach":7,"attempt":7,"attr":[0,8,10],"attract":8,"attribut":[8,9,10],"au":8,"author":[2,6,7,8,9],"auto":0,"automat":[0,2,6,7,8,9],"auxiliari":[0,8],"avail":[0,1,2,5,6,8,10],"averag":8,"avoid":[2,3,5,7,8],"away":7,"b":[0,2,7,9],"ba_x":9,"back":[0,9],"backtrack":[0,8],"backward":8,"bad":[0,10],"balanc":[0,2,3,6,7,8,9],"base":[0,2,3,5,6,7,8,9],"basenam":8,"baseshort":8,"basi":[6,8,9],"basic":10,"bat":0,"batch":[8,9],"baudoin":0,"bc":9,"bcumo":9,"bcumo_coef":9,"bcumo_decomp":9,"becam":2,"becaus":[2,7,8,10],"becom":[0,2,8,11],"befor":[0,2,8,9,10],"begin":[2,6,8,9],"behavior":[0,8],"behind":[6,8],"believ":7,"bendtsen":[6,8],"benefit":11,"berg":0,"besid":8,"best":[7,8,10],"beta":8,"better":[0,6,8],"bfgs":[0,8],"bfl":[8,9],"bi":9,"bidirect":6,"big":[0,6,8,9],"bin":[5,9],"bin_clos":9,"bin_min":9,"bin_open":9,"binari":[7,8,9,10],"binomi":9,"biochem":[8,9],"biochemistri":10,"bioconda":5,"bioeng":6,"bioengin":6,"bioinformat":6,"biolog":[3,8,9],"biomass":[0,2,8],"biotechnol":6,"biotechnolog":[0,1,6,8],"bit":[0,5,9],"bit_count":9,"bitlength":9,"bitop":0,"bitpo":9,"bl":9,"blabla":9,"black":8,"blank":9,"blas":5,"block":9,"blue":8,"bm":8,"bodi":[7,9],"bom":[0,9],"bool":9,"boolean":[0,9],"bordeaux":0,"border":0,"borrow":8,"boston":7,"boths":9,"box":8,"bp":9,"brace":8,"bracket":[0,8],"break":0,"break_long_word":9,"breviti":8,"brief":[0,1,6,7],"bring":[7,8,10],"broken":[0,9],"brought":[6,8],"browser":5,"btdesc":[0,8],"btfrac":8,"btmaxit":8,"btstart":8,"bug":[0,1,6,9,11],"build":[0,9],"built":9,"bunch":8,"butin":0,"byproduct":8,"byte":[8,9],"c":[0,5,6,7,8,9],"c13":9,"c13_ftbl":0,"c13ftbl":0,"c_no":9,"cach":9,"cache_clear":9,"cached_pars":9,"cahoreau":0,"calcul":[0,3,5,6,8,9,10],"call":[0,2,5,7,8,9],"came":8,"can":[0,1,2,3,5,6,7,8,9,10,11],"cancel":[0,8],"candid":[0,8],"canon":8,"capac":8,"capit":6,"carb":9,"carb1":9,"carb_i":9,"carbon":[0,2,6,9,10],"carbotran":9,"care":8,"carlo":[0,3,8],"carnic":0,"carri":[0,6,7],"case":[0,2,3,5,6,7,9,10],"case_i":9,"catalyz":8,"caus":[7,8],"caution":[8,9],"cbit":9,"cd":5,"cell":[1,2,9,10],"center":8,"central":8,"certain":7,"cf":[0,2,3,5,6,8,9,11],"cfrag":9,"ch":9,"chain":[0,6],"chanc":8,"chang":[2,3,4,6,7,8,9],"channel":8,"chapter":[2,6,9],"char":9,"charact":[2,8,9],"character":8,"characterist":8,"charcat":9,"charg":[5,7,8],"cheaper":9,"check":[0,3,5,9],"chemic":[0,2,6,8,9],"chi":0,"chi2":[0,6,8,9],"chi2_valu":8,"choic":[0,6,7,8],"choos":[3,7],"chosen":8,"christoph":8,"chromatographi":[0,8],"chrome":8,"chunk":9,"ci":[0,8,9],"cinout":8,"circl":8,"circumst":7,"ciso":9,"cisostr":9,"cisotop":9,"cit_c":8,"cit_gr":8,"cite":[6,8],"citrat":8,"cjac":8,"claim":7,"clamp":0,"class":[8,9],"classic":8,"claus":[6,8],"clear":[7,8],"clen":9,"cli":9,"click":7,"client":11,"clock":3,"close":[0,5,6,8,9],"closer":[6,8],"closest":8,"clownr":[0,8,9],"clowp":8,"clue":8,"cluster":[0,3,8],"cmax":9,"cmd":9,"cmetab":9,"cnrs":[0,6,8,9],"cnstr":[0,9],"cntsr":10,"co":[0,2,8,9,10],"co2":2,"code":[0,5,6,7,8,9],"coef":9,"coeff":9,"coeffici":[0,2,8,9],"coelut":[0,6],"cofactor":8,"coher":0,"col_nam":9,"collabor":8,"collaps":[8,9],"collect":[0,6,7,8,9,10],"colon":[2,8],"color":[0,8,10],"column":[0,2,3,6,8,9,10],"com":[6,8,11],"coma":8,"combin":[6,8,9],"come":[5,7,8,9],"command":[0,5,6,7],"commandarg":[0,8,9],"comment":[0,8,9],"commit":7,"common":[8,9],"communiti":2,"comp":2,"compact":8,"compar":[5,6,8,9],"compart":0,"compartment":[0,2,6,8],"compat":[0,9],"compel":7,"compiegn":0,"compil":[0,7,8,9],"complementari":8,"complet":[0,7,8,9],"complianc":[6,7],"compon":[7,8,9],"compos":[8,9,10],"composit":[2,8],"comput":[6,8],"concat":9,"concaten":0,"conceiv":2,"concentr":[0,2,5,6,8,9,10],"concern":[2,7],"conclud":6,"conclus":8,"concord":8,"concur":0,"concurr":[0,6],"cond1":8,"conda":0,"condens":[0,8],"condenst":9,"condit":[0,6,7,8],"conduct":1,"confid":8,"configur":[0,5],"confound":2,"confront":8,"confus":6,"conjunct":8,"connect":0,"consequ":[0,7],"consequenti":7,"consid":[0,2,7,8,9,10],"consist":[0,7,8],"conspicu":7,"constant":[2,5,7,8,9],"constitut":7,"constr":9,"constrain":[0,2,3,8,9],"constraint":[0,2,6,8,9,10],"construct":[0,8,9],"consult":[0,4,10,11],"consum":[2,8],"consumpt":[0,8],"contact":[1,7,11],"contain":[3,5,7,8],"content":[7,8,9],"contest":7,"contex":9,"context":[0,5,6,8,10],"continu":[2,5,8,9],"contradict":[7,8],"contrari":[8,10],"contrast":[2,7],"contribut":[7,8,9],"control":[0,7,8],"conv_mid":9,"conveni":[6,8],"convent":[0,8],"converg":[0,3,6,9],"convers":2,"convert":[0,8,9],"convey":7,"convolut":9,"coo":9,"coon":7,"cope":6,"copi":[0,3,5,6,7,8,9],"copy_doc":[5,8],"copy_test":[5,8,10],"copyright":[6,7,8,9],"core":[0,3,5,6,8],"cornel":0,"correct":[5,7,8,10],"correpond":9,"correspond":[0,2,3,6,7,8,9,10],"cosmet":0,"cost":[0,3,7,8,9],"cost_mc":3,"count":[7,8,9],"counter":9,"counterpart":0,"countri":7,"coupl":8,"cours":7,"court":7,"covari":[8,9],"cover":[7,9],"cpu":0,"cpus":[5,8],"cran":[6,8],"creat":[0,3,5,8,9,10],"creation":[0,1,2],"creator":8,"criterion":[3,8],"critic":[0,8],"cross":[0,8],"crown":8,"cryptic":8,"cs":9,"csr_matrix":9,"cstr":9,"csv":[0,8],"ctrl":0,"cumbersom":2,"cumo":9,"cumo2i":9,"cumo2iso_vec":9,"cumo2mid_vec":9,"cumo_cost":[3,9],"cumo_gradj":9,"cumo_infl":9,"cumo_infl_index":9,"cumo_infl_key":9,"cumo_input":9,"cumo_iw":9,"cumo_key":9,"cumo_m_r_m":9,"cumo_mask":9,"cumo_path":9,"cumo_si":9,"cumo_sys_coo":9,"cumo_sys_dict":9,"cumom":[0,3,6,8,9],"cumos_neg":9,"cumos_posit":9,"cumos_vector":9,"cumsum":9,"cumul":9,"cupn":[0,8],"cupp":8,"cupx":8,"curious":8,"curl":8,"current":[0,5,8,9,10],"custom":[0,1,3],"customarili":7,"cv":8,"cygwin":[5,8],"cys":8,"cysbml":8,"cytoscap":[0,9,10],"c\u00e9cilia":0,"d":[2,8,9],"damag":7,"danger":7,"dash":8,"data":[0,2,3,5,6,7,9,10],"datafram":[0,9],"dataset":8,"date":[7,9],"dbg_dr_dff_singular":8,"dcba":8,"dd":[0,9],"de":[6,8],"dead":[0,8],"deal":[6,8],"debbugg":0,"debug":0,"decid":[2,7,8],"decim":8,"deciph":8,"decis":[7,8],"declar":[0,8],"decod":9,"decompos":9,"decomposit":9,"decreas":8,"dedic":[1,8,11],"deduc":8,"def":[0,2,3,8],"default":[0,2,3,8,9],"defect":7,"defici":[0,8],"defin":[0,3,9,10],"definit":[3,6,7,8,9],"degre":8,"degrees_of_freedom":8,"deliv":[0,8],"dellero":0,"del\u00e9pin":0,"demand":8,"deni":7,"dens":9,"depend":[0,3,7,8,9,10],"deprec":[0,3,8],"deriv":[0,7,8,9],"descend":8,"describ":[0,2,5,6,8,9,10],"descript":[5,10],"descriptor":9,"design":[1,2,6,7,8,11],"desir":[2,8,9],"despit":8,"detail":[1,5,6,7,8,9,10],"detect":[0,8,9],"determin":[0,2,8],"determinist":8,"dev":[0,8,9],"develop":[0,2,5,6,7,8],"deviat":[0,2,8,9],"devot":6,"df":8,"df1":9,"df2":9,"dfconcat":9,"dfl":9,"diagon":9,"diamet":8,"diasappear":3,"dict":[0,9],"dict2kvh":0,"dictionari":9,"dictionnari":9,"diff":5,"differ":[0,2,5,6,7,8,9,10],"difference_upd":9,"differenti":6,"dig":9,"digest":9,"digest_writ":9,"digit":[8,9],"digraph":9,"dilut":8,"dimens":9,"diminish":2,"dimnam":0,"dir":[0,9],"direct":[1,7,8],"directori":[0,3,5,8,9,10],"dirr":[8,9],"dirtmp":9,"dirw":8,"dirx":[3,8],"disappear":8,"disclaim":7,"disconnect":0,"discret":8,"discuss":[0,1,11],"disgrac":0,"disk":[0,3,5,8,9],"dispatch":5,"display":7,"disposit":8,"distant":3,"distinct":8,"distinguish":[7,8],"distribut":[0,3,5,6,7,8,10],"distutil":0,"diverg":8,"divid":[8,9],"dll":0,"dmask":9,"doc":[0,5,8,9],"doctre":9,"document":[0,7,8],"doe":[0,2,7,8,9],"doi":[6,8],"dom_cmp":9,"domain":[0,6,8],"don":[0,1,2,3,5,8,11],"done":[0,1,5,8,10],"donor":7,"dos":5,"dot":[0,1,8,9],"doubl":[0,5,8,9],"doublet":8,"downhil":8,"download":[0,8],"dr_dff":8,"dr_dp":8,"drag":8,"dramat":8,"drastic":8,"draw":[1,8],"drawn":8,"dri":[8,10],"driver":9,"drop":[0,8],"drug":0,"dsec":9,"dsec2out":9,"dt":[8,9],"dtstamp":9,"due":[0,2,8],"duli":[0,8],"dump":8,"dure":[0,2,6,8],"dynam":[0,2,6,8],"e":[0,2,3,5,6,8,9,10],"e0144652":6,"e10":8,"e3":8,"e5":8,"e_coli":[0,5,8,10],"e_coli_glc1":8,"e_coli_glc2n":8,"e_coli_glc3n":8,"e_coli_glc4n":8,"e_coli_glc5n":8,"e_coli_glc6n":8,"e_coli_growth":[5,8],"e_coli_gx_m":8,"e_coli_gx_prl":8,"e_coli_gx_x":8,"e_coli_gx_x_m":8,"e_coli_i":[5,6,8],"e_coli_i_r":5,"e_coli_iv":8,"e_coli_iv_funlab":8,"e_coli_msen":8,"e_coli_r":5,"earli":0,"easi":6,"easier":0,"easiest":8,"easili":8,"ec":8,"echang":9,"echo":0,"ecl":0,"ecoli":8,"ecoli_glc1":8,"economi":0,"edd":8,"edern":0,"edg":[0,8,9,10],"edit":[3,8],"editor":8,"edu":0,"educt_1":2,"educt_2":2,"effect":[0,7,8],"effici":[0,8],"effort":[5,8],"either":[6,7,8,9],"elabor":8,"electron":[6,7],"element":[8,9],"elementari":6,"elimin":[0,6,8],"els":[3,7],"elsewher":8,"elut":[2,8],"email":[1,11],"emp1":8,"emp2":8,"employ":7,"empti":[0,2,6,8,9,10],"emu":[0,6,8,9],"emu_framework":9,"emu_input":9,"emuco":9,"emus":[8,9],"enabl":8,"enclos":8,"encod":[0,8,9],"encount":8,"end":[0,2,3,5,7,8,9],"endlin":0,"energi":6,"enforc":[0,7],"eng":[6,8],"engin":8,"english":1,"enhanc":8,"enough":8,"ensur":8,"enter":[0,2,9],"entir":[7,8],"entiti":8,"entri":[0,8,9],"enum_path":9,"enumer":[8,9],"environ":[0,3,5,8],"enzym":8,"eprl":[0,8],"eq":9,"eqal":0,"equal":[0,6,8,9],"equat":[0,2,6,9],"equilibr":5,"equival":[5,7,9,10],"err":[0,5,10],"erron":0,"error":[0,2,3,5,8,9,10,11],"errx":[3,8],"es":8,"especi":8,"essenti":[0,6],"estim":[0,5,6,8,10],"etc":[0,3,8,9,10],"eval":0,"eval_expr":[0,9],"evalu":[0,6,8,9],"even":[0,2,3,5,6,7,8,10],"event":[5,7],"ever":[0,7],"everi":[2,6,7,8],"everyon":[7,8],"everyth":5,"everywher":[6,9],"evolut":4,"evolv":2,"exact":8,"examin":8,"exampl":[0,2,3,5,6,7,8,9,10,11],"except":[0,6,7,8,9],"exchang":[2,7,8,9,10],"excl_outli":8,"exclud":[0,7,8],"exclus":[0,2,7],"excus":7,"exec":0,"execut":[0,3,5,6,7,8,9,10],"exercis":7,"exist":[0,8,9],"exit":[0,8,9],"exp":9,"expa":[0,8],"expa2ftbl":0,"expand":2,"expandbit":9,"expandbit_vec":9,"expect":[8,9],"experi":[0,1,2,3,5,6,9,11],"experiment":[5,6,8,10],"explanatori":[2,8],"explicit":[0,6,7,8,11],"exploit":8,"explor":[0,8],"expos":1,"expr_ast":9,"expr_interp":9,"expr_sym":9,"express":[0,2,6,7,8,9,10],"expressli":7,"extend":[2,3,7,9],"extens":[0,2,5,8,9],"extent":7,"extern":0,"extra":[0,5,8],"extract":[8,9,10],"extrem":8,"extremepathwayanalysi":0,"f":[8,9],"f6p":9,"f_ftbl":9,"f_i":9,"face":[8,11],"facilit":[0,2,6,8],"fact":8,"factor":[0,8,9],"fail":[0,5,9],"failur":[0,7],"fallnx":[3,8,9],"fals":[0,3,8,9],"far":8,"fast":6,"faster":8,"fatal":0,"fatarova":0,"faulti":8,"fc":9,"fcn":9,"fcx":9,"feasibl":[0,8],"featur":[0,1,2,6,9],"fee":7,"fewer":8,"ff":9,"ff2ftbl":[0,8],"ffguess":[0,8,9],"ffres2ftbl":[0,3],"fftbl":9,"fictiti":8,"field":[0,2,9],"fifth":7,"figur":5,"file":[0,2,3,5,6,7,9,10,11],"file_labcin":[0,8,9],"fill":9,"filter":[0,3,8],"fina":0,"final":[2,6,7,8],"find":[5,8,9,11],"finer":0,"finger":8,"finish":0,"first":[0,2,3,5,6,8,9],"fisrt":9,"fit":[0,2,3,6,7,8,9],"fittabl":8,"fix":[0,6,8,9,11],"fjoin":9,"fl":9,"flag":[0,8],"flamegraph":8,"flat":9,"flnx":9,"float":[0,8,9],"float64":9,"floor":7,"flow":10,"flux":[0,2,3,5,6,9,10],"flux_constr":9,"flux_eq":9,"flux_fre":9,"flux_in":9,"flux_ineq":9,"flux_m_r":9,"flux_measur":9,"flux_nam":2,"flux_out":9,"flux_vgrowth":9,"fluxml":2,"fluxom":8,"fluxomet":8,"fmask":9,"fmiso":9,"fmn":9,"fname":9,"fnscale":8,"focus":8,"fold":8,"follow":[0,2,3,5,6,7,8,9,10,11],"forbid":7,"forc":[0,8,9],"foreign":8,"forg":5,"fork":0,"form":[0,2,5,7,8,9],"format":[0,3,4,5,6,9,10],"former":[2,8],"formula":[0,2,8,9],"formula2dict":9,"fortran":[0,9],"forum":11,"forward":[0,8],"found":[0,2,3,6,7,8,9,10],"foundat":7,"fout":9,"fp":9,"fpars":9,"fr":[0,1,6,8,9],"fraction":[0,8,9],"frag":9,"frag_prod":9,"fragment":[0,8,9],"fragment_mask":9,"framework":[0,6,8,9],"franc":[0,1,6,9],"franklin":7,"free":[0,2,3,6,7,9,10],"free_mc":3,"freedom":7,"front":[0,2,8],"fru6p":[2,8],"fseri":[0,8],"ftbl":[0,3,4,9],"ftbl2":0,"ftbl2cumoab":0,"ftbl2cytoscap":0,"ftbl2kvh":0,"ftbl2labcin":0,"ftbl2metxml":[0,5],"ftbl2mft":[8,9],"ftbl2mtf":0,"ftbl2netan":0,"ftbl2optr":8,"ftbl2rsif":0,"ftbl2suff":9,"ftbl2xgmml":[0,10],"ftbl_cach":9,"ftbl_eq":8,"ftbl_mea":8,"ftbl_netan":9,"ftbl_pars":9,"ftbl_text":9,"ftbl_token":9,"ftbls":[0,9],"ftxt":9,"fu":0,"full":[0,3,7,8,9],"fulli":[0,8],"fullsi":[0,8,9],"fum":8,"function":[0,3,8,9],"funlab":[0,8,9],"funlabr":[0,8],"futil":0,"futur":8,"fw":9,"fwd":[8,9],"fwrv":[8,9],"fwrv2i":9,"g":[0,2,3,5,6,8,9,10],"g6p":9,"ga3p":8,"gather":[8,9],"gaussian":8,"gave":8,"gc":8,"gcms":8,"gcrg":0,"gen":5,"gen_r":9,"general":[0,7,8,9,10],"generat":[0,3,5,6,8,9],"generous":7,"geograph":7,"get":[0,3,5,7,8,9,11],"ghijk":2,"github":[1,11],"give":[0,2,6,7,8,9],"given":[0,2,3,5,7,8,9,10],"glc1":8,"glc4":8,"glc6":8,"global":0,"glu":2,"glu08c1_02u":8,"gluc_1":8,"gluc_u":8,"glucos":8,"glucoseu":8,"glucupt_1":8,"glucupt_u":8,"glyc":9,"glycogen":8,"glycolysi":9,"gmail":[6,8],"gnomovis":7,"gnt6p":8,"gnu":[6,7,8,9],"go":[0,8,10],"goal":7,"goe":8,"gonzalez":8,"good":[0,6,8],"googl":11,"googlegroup":11,"govern":[3,6,8],"gpl":[6,8,9],"graaf":6,"gradient":[8,9],"gradual":8,"grant":7,"graph":[0,8],"graphic":[0,5,6,8,10],"grater":8,"grati":7,"great":0,"greater":[8,9],"greatest":7,"green":8,"gregam":0,"grep":8,"grid":[0,8],"group":[8,9,11],"growth":[0,2,9],"guarante":[7,11],"guaranti":8,"guess":[0,8,10],"guid":7,"guionnet":0,"h":[8,9,10],"h1":9,"h2o":6,"hacker":7,"hand":[0,5,8],"handl":[0,9],"hang":0,"happen":[0,8,10],"hard":8,"hardwar":3,"harm":[0,8],"hash":8,"hashabl":9,"header":[0,9],"height":8,"held":7,"help":[0,1,5,8,9,10,11],"helper":8,"henc":6,"hereaft":[2,3,8],"herebi":7,"herein":7,"hereinaft":7,"hidden":0,"hierarch":8,"high":[0,5,6,8],"higher":[0,5,6,8,9],"highest":9,"hint":8,"histori":[0,8],"hold":6,"holder":7,"homonym":0,"hope":[7,8],"howev":[5,7,8,10],"hplc":2,"hsqc":8,"html":[5,6,8,9],"http":[0,5,8,9],"https":[0,2,6,8,11],"huge":8,"hypothet":[7,8],"i2m":9,"ic":9,"icntl_14":3,"icntl_nn":0,"icol":9,"icon":8,"icumo":9,"icumo2iiso":9,"id":[8,9],"idea":[7,8,10],"idem":0,"ident":[5,8,9],"identif":[0,8],"identifi":[5,6,7],"ie":8,"ifwrv":9,"ignor":[0,8,9],"iii":6,"iin_metab":9,"ikib":0,"ikin":[0,8,9],"il":9,"ilin":9,"illus":8,"illustr":2,"imag":9,"imetab":9,"impact":[0,2,8,10],"implement":[7,8],"impli":[6,7],"implicit":[8,9,11],"import":[2,3,6,9,10],"impos":[7,8,9],"imposed_sen":9,"improv":0,"in_cumo":9,"in_list":9,"in_metab":9,"in_mid":9,"in_str":9,"inabl":7,"inaccur":7,"inc":7,"inca":6,"incident":7,"includ":[0,2,5,6,7,8,9],"include_growth_flux":[0,8],"inclus":[0,3],"incoher":[0,3],"incom":[8,9],"incomplet":0,"incorpor":[7,8],"incr":9,"increas":[3,6,8,9],"increment":[0,8,9],"incu":9,"incu2i_b1":9,"incu_1":9,"incu_i":9,"ind_a":9,"ind_b":9,"inde":8,"indent":2,"independ":[0,5,7,8],"index":[4,8,9],"indic":[0,2,7,8,9],"indici":9,"indirect":7,"individu":7,"induc":[7,8],"ine":9,"ineq":9,"inequ":[0,6,8,9],"inequa":9,"inf":[0,8],"infinit":0,"infl":9,"infl_idx":9,"infl_li":9,"influanc":9,"influenc":[8,9],"influx":[0,8,11],"influx_":[0,2,3,5,8,10],"influx_i":[0,2,3,5,10],"influx_si":[1,2,3,5,10,11],"info":3,"inform":[0,1,3,5,7,8,9],"informat":8,"infrastructur":0,"infring":7,"init":8,"initi":[0,2,6,8,9,10],"inject":8,"inmetab":9,"input":[0,2,3,5,6,9,10,11],"inra":[0,6,7,8,9],"insa":[0,1,6,8,9],"inserm":0,"insert":9,"insid":[0,3],"insight":8,"inspir":[8,10],"inst":[0,8],"instal":[0,4,6,7,8],"install_rdep":[0,5,8],"instationari":[0,2,5,6,8,10],"instead":[0,3,7,8,9],"institut":[0,1,8],"institutet":0,"instruct":6,"instrument":8,"int":9,"int32":9,"int_str":9,"intact":7,"integ":[8,9],"integr":[6,7],"intel":6,"intend":[7,8,10],"intens":8,"intent":[7,8],"inter":[5,9],"interact":[0,3,7,8],"interchang":7,"interest":[2,5,6,7,8,10],"interfac":[0,6,7,9],"intermedi":8,"internal":[0,2,8,9],"internet":0,"interpret":[1,5,8,9],"interrupt":[0,8],"intersect":9,"interval":[0,8,9],"introduc":[0,2,3,5,7,8],"introduct":[4,8],"invafl":9,"invalid":7,"invalu":8,"invers":[0,8,9],"invert":8,"invis":[0,8,9],"involv":[0,2,8,9],"io":0,"iprod":9,"ir":9,"ir2isc":9,"irand":[0,8],"irow":9,"isc":9,"iseri":[0,8],"isermann":6,"iso":9,"iso2cumo":9,"iso2cumo_batch":9,"iso2cumo_vec":9,"iso2emu":9,"iso2emu_batch":9,"iso2mid_vec":9,"iso_input":9,"iso_input_arr":9,"isod":8,"isodes":8,"isom":0,"isospeci":8,"isostr":9,"isotop":[2,6,8,9],"isotop_int_index":9,"isotopologu":8,"isotopom":[6,8,9],"isstr":9,"issu":[0,7,8,11],"item":[7,8,9],"iter":[0,2,3,8,9],"iterbit":9,"iternumbit":9,"itnal_met":9,"itvl2li":9,"iw":9,"j":[6,8,9],"jacobian":[0,8],"jacquelin":8,"jame":7,"jennif":8,"job":[0,3,8],"join":9,"joint":[0,9],"journal":6,"json":8,"judgment":7,"june":7,"just":[0,2,3,5,8,9],"jx_f":8,"k":[6,8,9],"karolinska":0,"katharina":6,"keep":[0,2,7,8,9],"keepnon":9,"kelleh":6,"kept":[8,9],"kernel":7,"key":[8,9],"key2cumo":9,"kind":[3,6,7,8,11],"kinet":[0,5,8,9,10],"knot":[0,8],"know":[2,7,8],"knowledg":8,"known":[2,8,9,10],"kouakou":0,"kvh":[0,3,8,9],"kvt":9,"kw":9,"kwds":9,"l":[8,9],"l2":8,"lab":[8,9],"lab_resid":[3,8],"lab_sim":[8,9],"labarg":[3,8],"label":[0,1,2,3,5,6,9,10,11],"label_input":[0,9],"label_mea":9,"label_meas2matrix_vec_dev":9,"label_measur":[0,9],"label_measurements_vector":9,"lablen":9,"labpat":9,"labprod":9,"lack":[0,8,9],"languag":[6,7,8],"lapack":5,"larg":[3,8],"last":[0,8],"late":2,"later":[0,7,8],"latest":11,"latin":8,"latin9":9,"latter":[2,6,8],"launch":[0,5,8],"law":[6,7],"layout":[8,9],"le":0,"lead":[0,3,8],"least":[0,6,7,8,9,10],"leav":8,"led":8,"left":[8,9],"legaci":8,"legal":7,"legend":0,"leighti":8,"lement":9,"len":9,"length":[8,9],"less":[0,8,10],"lesser":7,"let":[2,3,6,8,10],"letter":[8,9],"level":[8,9],"lf":8,"lgpl":6,"li":9,"liabl":7,"lib":[0,3],"libpath":8,"librari":[0,5,7],"libsbml":[0,5],"licenc":[7,8],"licens":[0,4,8,9],"license":7,"licensor":7,"lie":[6,8],"lighter":9,"like":[0,2,3,5,6,7,8,9,10,11],"lim":[0,5,8],"limit":[0,2,3,6,7,8],"limsolv":[0,5,8],"line":[0,2,3,5,6,7,9],"line_nb":9,"linear":[0,3,8,9],"link":[0,7,9],"linp":[0,9,10],"linterp":[0,8],"linux":[0,5,6,8],"lisbp":6,"list":[0,1,5,6,8,9],"list2count":9,"liter":9,"literatur":8,"littl":0,"ll":[5,8,11],"ln":[0,8],"load":[0,3,8],"local":[5,6,8,9],"locat":[1,8],"log":[4,6,10],"log2pool":[8,10],"log_2":10,"logarithm":[8,10],"logic":9,"loic":0,"long":[0,7,8],"longer":[0,2,8,9],"look":[2,5,6,8],"loss":7,"low":[6,8],"low_mc":8,"lower":[0,8,9],"lowest":[0,9],"ls":8,"lsei":8,"lsi":8,"lsi_ln":8,"lucill":0,"m":[0,2,6,8,9,10],"m0":8,"m1":8,"m2":8,"m2i":9,"m3":8,"m_gr":8,"ma":7,"machin":7,"maciek":8,"maco":[5,6,8],"made":[0,1,7,8,9],"mae":8,"magali":0,"mail":7,"main":[0,2,5,6,8,9],"major":7,"make":[0,3,5,6,7,8],"mal":8,"maldh":8,"malic":8,"mammalian":8,"manag":[0,5],"manchest":0,"mandatori":[2,5,8,9,10],"mani":[0,2,3,5,6,7,8],"manifest":[0,8,9],"manner":[2,8],"manual":[0,4,5,6],"map":[0,6,8,9,10],"mapper":8,"mar":8,"marc":0,"maria":0,"mark":[0,2],"mask":[8,9],"mass":[0,8,9],"mass_decomp":9,"mass_decomp_loc":9,"mass_mea":9,"mass_meas2matrix_vec_dev":9,"mass_measur":0,"mass_measures_vector":9,"massou":0,"mat":9,"mat2graph":9,"mat2pbm":9,"math":8,"mathemat":[1,8],"mathrm":9,"matric":[0,3,8,9],"matrix":[0,3,8,9],"matter":8,"matthieu":0,"matx_lab":9,"matx_mass":9,"matx_peak":9,"max":[8,9],"maxf":8,"maxim":8,"maximum":8,"maxit":[2,3,8],"maxmem":9,"maxprod":9,"maxstep":0,"may":[0,2,6,7,8,9],"mc":[0,3,8],"md":9,"mea":9,"mead":8,"mean":[0,3,5,7,8,9],"meaning":[0,8],"meaningless":[3,8],"meant":8,"measmat":9,"measur":[0,3,6,8,9,10],"measvec":9,"mecopars":9,"medium":7,"meet":7,"memaon":9,"membership":9,"memori":[0,3,8,9],"mention":[0,8],"menu":7,"merchant":7,"mere":7,"merg":8,"mes":9,"messag":[0,5,8,9,10],"met":[8,9],"meta_nam":2,"meta_s":2,"metab":[0,6,8,9],"metab1":9,"metab2":9,"metab_i":9,"metab_id":9,"metab_measur":[0,9],"metab_netw":9,"metab_pool_diag":9,"metab_scal":0,"metabilit":9,"metabilite_pool":0,"metabol":[0,2,6,8,10],"metabolit":[0,5,6,8,9,10],"metabolite_pool":0,"metabolom":8,"metasi":[6,8],"metatoul":[0,1,8,11],"metexplor":0,"meth":[0,8],"method":[0,2,5,9,10],"methodolog":[6,8],"mf":9,"mfa":8,"mflux":[9,10],"mi":9,"microbi":8,"mid":[0,8,9],"middl":9,"might":[3,5],"millard":[0,6,8],"min":8,"min_":9,"mind":8,"miniconda":5,"minim":[0,6,8,9],"minima":6,"minimum":8,"minor":0,"minput":9,"minut":8,"miso":[0,6,9,10],"miss":[0,2],"mix":[0,8],"mkfunlabl":9,"mm":[2,8],"mmet":[9,10],"mode":[0,6,7,8,9],"model":[0,2,6,8],"model_wt_bw_1":8,"model_wt_bw_2":8,"model_zwf_1":8,"modif":[6,7],"modifi":[0,7,8,9],"modul":[0,4,5,7,8,9],"moebius":9,"molecul":[0,2,8],"moment":[5,6,10],"mono":0,"monoton":[0,8],"mont":[0,3,8],"moreov":[6,8],"mottelet":0,"mous":7,"move":[0,9],"mpi":9,"mr":8,"ms":[0,6,8,9],"ms_frag_gath":9,"ms_nmr_data":8,"msgs":9,"mtf":[0,2,3,5,9,10],"mtime":9,"mu":[2,8],"much":[2,8],"mult_bxxc":0,"multbxxc":[0,5],"multi":[6,8],"multicor":0,"multipl":[0,2,5,6,8,9,10],"multiplex":[5,8],"multipli":9,"multiprocess":0,"mump":[0,3],"must":[0,2,7,8,9,10],"mutual":9,"my_r":3,"mynetwok":10,"mynetwok_net":8,"mynetwok_r":10,"mynetwork":[0,3,9,10],"mynetwork_fwd":8,"mynetwork_r":[8,10],"mynetwork_rev":8,"mynetwotk":8,"mytework":8,"m\u00e9taboliqu":1,"m\u00f6llney":6,"n":[6,8,9],"n1":9,"n_fort":9,"n_ftbl":9,"n_i":9,"n_r":9,"na":[0,3,8,10],"nadh":2,"nadp":[0,8],"nadph":[2,8],"name":[0,2,3,5,6,7,8,9],"nan":[8,9],"nas":8,"nativ":0,"natur":8,"natural_sort_key":9,"nb":[8,9],"nb_c":9,"nb_cumo":9,"nb_exp":9,"nb_f":8,"nb_fc":9,"nb_fcn":9,"nb_fcx":9,"nb_ff":9,"nb_ffn":9,"nb_ffx":9,"nb_fl":9,"nb_fln":9,"nb_flx":9,"nb_fmn":9,"nb_fwrv":9,"nb_ineq":9,"nb_input":9,"nb_param":9,"nb_rw":9,"nb_w":9,"ncol":9,"ncucumo":9,"ncumo":9,"near":8,"necessari":[2,3,7,8,9],"necessarili":0,"need":[0,1,3,5,7,8,9],"negat":[2,8,9],"neglect":8,"neighbor":8,"neighbour":9,"neither":[0,5,8],"nelder":8,"nest":9,"net":[0,2,3,8,9,10],"netan":[0,8,9],"netan2abcumo_coo":9,"netan2abcumo_spr":9,"netan2r_cumo":9,"netan2r_fl":9,"netan2r_ineq":9,"netan2r_mea":9,"netan2r_rcumo":9,"netan2rinit":9,"netan_key":9,"netan_measur":9,"netflux":[0,8,10],"netw":[0,3,9,10],"network":[0,2,3,6,9,10],"never":9,"nevertheless":8,"new":[0,1,2,3,6,7,8,9,11],"new_label":8,"new_na":3,"new_na_r":3,"new_na_sim1":3,"new_na_sim2":3,"newli":[0,3,5],"next":[2,6,9,10],"nh3":2,"nilsson":0,"nlen":9,"nlsic":[0,2,3,6],"nm":9,"nm_cumo":9,"nm_fallnx":9,"nm_fcn":9,"nm_fcx":9,"nm_ffn":9,"nm_ffx":9,"nm_fl":9,"nm_fln":9,"nm_flx":9,"nm_fmn":9,"nm_fwrv":9,"nm_list":8,"nm_mcumo":9,"nm_par":9,"nmask":9,"nmr":[0,6,8],"nnls":[0,5],"nnz":9,"nocalc":[0,8],"node":[3,8,9,10],"nois":8,"non":[0,3,6,9,10],"noncommerci":7,"none":[8,9],"nonstationari":9,"noo":8,"noopt":[0,3,8,10],"norm":[0,6,8],"normal":[0,5,7,8,9],"nos":8,"noscal":8,"notat":8,"note":[2,3,6,8,11],"noth":[7,8,9],"notic":[6,7],"notion":8,"notracer_network":0,"notrev":9,"novel":6,"now":[0,2,5,8],"no\u00e9mi":0,"np":[0,8,9],"npi":9,"nrow":[0,9],"nsubdiv_dt":[8,9],"ntime":9,"nu":8,"nul":9,"num_expr":9,"number":[0,2,3,7,8,9],"number_of_available_cor":0,"number_of_measur":8,"number_of_paramet":8,"numer":[0,3,5,6,8,9,10],"numpi":[0,8,9],"nutshel":8,"n\u00f6h":6,"o":[0,8,9],"o2":2,"o_mcumo":9,"o_mea":9,"o_sc":9,"obj":9,"object":[0,7,8,9],"oblig":7,"observ":[8,9],"obsolet":0,"obtain":[3,6,7,8,9],"obvious":[8,10],"occupi":[2,9],"occur":[0,5,8],"occurr":8,"ode":[6,8],"offer":[0,7,8],"offset":9,"often":[5,8],"ok":[5,9],"old":[0,6],"omit":[2,5,8,10],"onc":[0,8,9],"one":[0,2,3,5,6,7,8,9,11],"onli":[0,2,5,7,8,9,11],"open":[0,3,5,8,9],"openflux":6,"opensourc":[0,8],"oper":[0,5,7,8,9],"operand":0,"opp":9,"opportun":[6,8],"opposit":[8,9],"opt":[3,9,10],"opt_cumo_tool":3,"opt_icumo_tool":3,"optctrl":[0,2,3,8],"optctrl_":2,"optctrl_maxit":2,"optim":[0,6,9],"option":[0,2,3,5,6,7,9,10],"orang":0,"order":[0,6,7,8,9],"ordinari":[6,7],"org":[5,6,8,9],"organism":[8,9],"organiz":[2,8],"orgin":9,"origin":[6,7,8],"oset":9,"others":[0,2,6,7,8],"otherwis":[7,8,9],"outdat":[0,8],"outdir":0,"outgo":9,"outlier":[0,6,8],"outlin":3,"output":[0,2,5,6,7,9],"outs":9,"outsid":[0,7],"overcom":[2,8],"overrid":8,"overwrit":[8,9],"overwritten":[8,9],"owerriten":8,"oxid":8,"p":[0,3,6,8,9,10],"p2bfl":9,"packag":[0,5,6,8],"page":4,"pair":9,"pairwis":8,"palama":0,"panda":0,"paper":[6,7,8],"papyrus":[6,8],"par":8,"paragraph":[0,8],"parallel":[0,3,5,6,9],"param":[8,9],"param2fl":3,"paramet":[0,3,9,10],"parent":9,"parenthesi":[0,8],"pars":[0,9],"parse_cnstr":9,"parse_linp":9,"parse_mflux":9,"parse_miso":9,"parse_mmet":9,"parse_opt":9,"parse_tvar":9,"parse_vers":9,"parser":0,"parsimoni":0,"part":[0,2,5,6,7,8,9],"parti":[0,7,11],"partial":[0,8,9],"particip":[0,2,8],"particl":8,"particular":[0,2,3,5,6,7,8,11],"partit":[0,3,8,9],"partner":[8,11],"pass":[0,3,7,8,9],"past":8,"paste":[0,3,8],"patent":7,"path":[3,5,8,9,10],"pathway":[0,8,9],"pattern":[8,9],"pattern_of_x_and_1":8,"pbm":0,"pcach":9,"pdf":[0,5,8],"peak":[0,8,9],"peak_mea":9,"peak_meas2matrix_vec_dev":9,"peak_measur":[0,9],"peak_measures_vector":9,"peopl":7,"pep":[2,8],"per":[3,8,9],"percentag":8,"perfect":8,"perfetto":8,"perform":[0,7],"period":[6,8],"permiss":[6,7,8,9],"permit":7,"persist":[3,8],"person":[0,1,5],"pertin":7,"pfk":8,"pflux":9,"phenomenon":0,"phrase":8,"physic":7,"pi":8,"piec":[7,8],"pierr":[0,8],"pip":0,"pip3":5,"place":[0,2,7,8,9],"placement":0,"plain":[0,8,9],"plain_natural_key":9,"plan":8,"platform":[0,1,5,6,8,11],"plausibl":8,"play":8,"pleas":[8,11],"plos":6,"plot":[0,8],"plot_ilab":[0,8],"plot_im":0,"plot_imass":0,"plot_smea":[0,8],"plugin":8,"plus":7,"pm":8,"pmeco":9,"pocovi":0,"point":[0,6,8,9],"pointer":[7,8,9],"poirier":0,"pone":6,"pool":[0,2,6,8,9],"poolid":9,"poor":8,"pop":8,"popcount":9,"popul":9,"portai":6,"portion":[7,8],"pos":9,"posit":[2,8,9],"possibl":[0,3,6,7,8,9,10,11],"post":[0,3,6],"postfix":8,"postmortem":0,"posttreat_r":[0,3,8],"potenti":8,"powershel":5,"ppdk":8,"ppp2":8,"ppp3":8,"ppuls":8,"ppulseslinpath":8,"practic":[7,8],"preambl":[0,7,8],"prece":8,"preced":[0,5,6,8],"precis":[0,3,6,7,8],"precompil":[0,5],"predefin":8,"predict":9,"pref":[8,10],"prefer":[5,7,8],"prefix":[0,2,5,8,9,10],"prefus":8,"preliminari":[2,8],"prepar":[0,3],"pres":[0,8],"presenc":[2,6,9],"present":[0,2,5,6,7,8,9,10,11],"preserv":[0,7,8,9],"presid":7,"presum":[2,10],"prevail":0,"prevent":[0,7,8],"previous":[0,6,8,9],"price":[7,8],"prime":8,"principl":6,"print":[0,7,8,9],"prioriti":8,"privat":11,"prl":9,"prl_exp":[0,8],"prl_ftbl":9,"probabl":[3,8],"problem":[0,1,5,6,7,8,9,10,11],"problemat":0,"proc_kinopt":9,"proc_label_input":9,"proc_label_mea":9,"proc_mass_mea":9,"proc_peak_mea":9,"procedur":[0,5],"proceed":[0,5,8,9],"process":[0,5,6,8,9],"prod":9,"produc":[0,2,5,8,9,10],"product":[0,8,9],"product_1":2,"product_2":2,"prof":8,"profil":8,"program":[0,5,6,7,8,9],"programm":[0,4,6,7],"prohibit":7,"project":[0,1,5,6,8],"promin":7,"promot":7,"propag":[2,6,8],"proper":[0,2,8],"properti":[0,7,8],"proport":8,"proposit":[0,6],"proprietari":7,"protect":[7,8],"protocol":8,"prove":7,"provid":[0,5,6,7,8,10,11],"provok":8,"proxi":0,"pso":[0,6],"psock":0,"psoptim_":6,"pstat":8,"pterm":9,"pth":9,"public":[6,7,8,9],"publish":[2,6,7,8],"puls":8,"pure":5,"purpos":[0,6,7,8,11],"put":[0,2,3,8,9],"pvalu":8,"py":[0,3,5,8,9,10],"py_prof":8,"pyk":8,"pyr":[2,8],"python":[0,6,8,9],"python2":5,"python3":[5,8],"qrafl":9,"qualifi":8,"qualiti":7,"quantil":[0,8],"quantiti":[0,8],"question":[8,11],"queue":0,"quick":[4,5,6,8],"quit":5,"quot":[1,8],"r":[0,3,6,8,9],"r5p":2,"r5p_c":2,"r5p_m":2,"r_libs_us":8,"rab":9,"radic":8,"rais":[0,9],"ram":3,"rand":8,"random":[0,6,8],"rang":[0,7],"rank":[0,8],"rare":8,"rate":8,"rather":[7,8],"ratio":[0,8],"rbin":9,"rcond":8,"rcost":0,"rcpp_rmump":0,"rcumo_input":9,"rcumo_si":9,"rdata":[0,3,8],"re":[0,9],"re_labpat":9,"re_metab":9,"reac":9,"reac_nam":9,"reach":8,"reactant":8,"reaction":[0,6,8,9,10],"read":[0,2,5,7,8,9],"read_tabl":9,"readabl":[0,7],"readi":[8,9],"readthedoc":0,"real":[8,9],"realist":[0,2,3,8,10],"realiz":[8,11],"realli":[0,3],"rearrang":2,"reason":[2,7,8,9],"recal":8,"receiv":[7,8,9,11],"recipi":7,"recogn":[0,8],"recommend":[0,3,8],"recompil":[0,5],"record":9,"rectangular":8,"redirect":[0,8],"redistribut":7,"redistributor":7,"reduc":[0,3,8,9],"reduct":8,"redund":0,"refer":[6,7,8],"referenc":2,"refin":8,"reflect":7,"refrain":7,"regardless":7,"regroup":[0,2,8,9],"regular":[0,8],"relat":[0,1,8],"relax":[3,8],"releas":[0,1,11],"reliabl":[6,8],"relianc":7,"reltol":8,"remain":[6,7,8],"remind":5,"remov":[0,8,9],"renam":[0,8],"render":7,"renew":0,"renn":0,"rep_len":8,"repair":[0,7],"repeat":[0,8],"repetit":8,"replac":[0,2,8,9],"replic":9,"report":[0,2,5,8,9,11],"repres":[8,9],"represent":[0,9],"representd":9,"reproduc":[0,8,11],"reput":7,"request":[0,8],"requir":[0,5,6,7,8],"rerun":[5,8],"res":[3,8,9],"res2ftbl_mea":[0,3],"res_ftbl":9,"research":9,"resembl":8,"resid_mc":3,"residu":[0,3,8],"resolut":[6,8,9],"resolv":[8,9,11],"respect":[0,8,9],"respons":[7,8],"rest":[6,7,8,9],"restart":8,"restor":8,"restrict":[7,8,9],"result":[0,2,3,5,6,9,10],"resum":[0,5,6,8],"retr":0,"retri":10,"retriev":0,"retrun":9,"return":[0,8,9],"reus":[7,9],"reuse_ftbl":9,"rev":[8,9],"reveal":10,"rever":8,"revers":[0,8,9],"review":8,"revineq":9,"revis":7,"rework":0,"rewrit":2,"rewritten":[0,9],"rhs":9,"rib5p":8,"right":[0,7,8,9],"risk":7,"rmn":8,"rmump":[0,3,5],"rna":8,"robert":8,"robust":0,"rochell":0,"roland":0,"role":8,"romero":0,"ropt":9,"round":8,"routin":0,"row":[0,8,9],"royalti":7,"rprof":[0,8],"rres":8,"rsd":[0,8],"rstrbit":9,"rtool":0,"rub5p":8,"rule":[8,10],"run":[0,2,3,5,6,7,8,9,10],"runtim":9,"rv":9,"rvec":9,"rx":8,"r\u00e9seaux":1,"r\u00e9seauxm\u00e9taboliqu":11,"s":[0,2,3,5,6,7],"safe":[6,8,9],"safest":7,"sake":8,"sames":5,"sampl":[0,7,8],"sandbox":9,"saniti":0,"satisfactori":8,"satisfi":7,"save":[0,3,8,9],"save_al":[0,3,8],"save_minenv":0,"say":[0,7,8],"sb":8,"scalar":[8,9],"scale":[0,8,9],"scale_diag":9,"scale_nam":9,"scan":8,"scene":8,"scheme":[0,6,8],"school":7,"scientif":2,"scipi":[5,9],"scope":[0,7],"scrambl":8,"scre":9,"screen":2,"script":[0,5,6,7,8],"scrutin":8,"sd":[0,2,3,8,10],"sd_exp":8,"search":[4,8,11],"second":[0,2,6,8,9],"secondari":8,"secret":8,"section":[0,3,6,7,8,9,10],"see":[0,2,5,6,7,8,9,10,11],"seed":[0,8],"seem":8,"seen":[0,8],"select":8,"self":[0,2,8,9],"semicolon":8,"sen":[0,8,9],"send":[0,11],"sensit":8,"sep":9,"separ":[0,2,7,8,9],"septemb":5,"sequenc":8,"sequenti":[0,2,8,9],"ser":8,"serguei":[6,8,9],"seri":[0,8,9],"serv":8,"servic":[0,7],"session":[0,3,5,8],"set":[0,2,3,5,8,9,10],"setbit32":9,"setcharbit":9,"sever":[0,2,8],"sgsokol":11,"sh":[0,8],"shallow":9,"share":[6,7,8,9],"sharp":0,"shell":[0,5],"shift":[2,6],"shoot":0,"short":[5,6,7,8,9],"shorten":[0,8],"shorter":8,"show":[0,7,8,9],"shown":0,"shuffl":0,"si":0,"side":[0,8,9,11],"sidecar":9,"sight":5,"sigma":9,"sign":[0,2,7,8,9],"signal":[0,2,3,8],"signatur":7,"signific":[0,3,8],"silent":[0,8,9],"sim":[0,3,5,10],"simfmn":8,"similar":[3,5,7,8,10,11],"simlab":8,"simpl":[0,1,5,6,8,9],"simpli":[0,2,3,5,8,10],"simplifi":8,"simpool":8,"simul":[0,2,3,5,6,9,10],"simultan":[0,2,7,8],"sinc":[3,6,7,8],"sing":9,"singl":[8,9],"singlet":8,"singular":[0,3,8],"site":[0,1,8],"situat":[0,2,3,8,10],"size":[0,8,9],"skept":9,"skip":[6,9],"skip_blank_lin":9,"slam":[0,5],"slave":8,"sln":[0,8],"sm":9,"small":[5,6,8],"smallest":0,"smet":9,"snow":0,"so4":8,"sock":0,"softwar":[1,2,5,6,8,10,11],"sokol":[1,6,8,9],"sole":[0,7],"solid":8,"solut":[0,5,6,8],"solv":[0,5,6,8,9,11],"somedir":8,"someon":[7,10],"someth":[3,5,7,8],"sometim":[0,7,8],"somewhat":8,"somewher":0,"sort":[8,9],"sourc":[0,3,7,8,9],"sp":9,"spa":3,"space":[0,2,5,8,9],"spain":0,"spars":[0,9],"sparse2spa":3,"speak":[7,8],"speci":[0,6,8,9],"special":[0,7,8,9],"specie_concentr":8,"specif":[0,6,8],"specifi":[7,8],"speed":[0,8],"speedup":0,"spirit":7,"split":[2,8],"sprab":9,"spread":[0,2,6,8],"spreadsheet":8,"sprow_dens":9,"sprow_key":9,"sprows2csr":9,"spso2007":8,"spso2011":8,"sqrt":8,"squar":[0,8],"src_ind":9,"src_ind_tab":9,"src_ind_vec":9,"srcs":9,"ssign":9,"stabil":[6,8],"stabl":[0,6,8],"stack":8,"stage":8,"stagnat":8,"stall":0,"stamp":9,"stand":[8,9],"standalon":0,"standard":[0,2,8],"stare":8,"start":[0,2,3,4,5,6,7,8,9],"startup":0,"state":[0,7,8],"statement":8,"stationari":[0,2,5,6,8,9,10],"statist":[0,3,6,8],"status":7,"stay":8,"stderr":0,"stdin":[8,9],"stdout":[0,9],"stem":[8,9],"step":[0,2,3,5,6,7,8,10,11],"stephan":0,"stephanopoulo":6,"steplinpath":8,"steplinpath2":8,"still":[0,6,8,11],"sto_m_r":9,"sto_r_m":9,"stochast":8,"stocheometr":9,"stock":8,"stoechiometr":[0,2,9],"stoichiometr":[0,8,9],"stop":[3,8,9],"storag":7,"store":[0,8,9],"str":9,"strategi":[6,8],"strbit":9,"strbit2int":9,"strbit32":9,"stream":9,"street":7,"stress":10,"strict":8,"strin":9,"string":[0,2,8,9],"strip":[0,8],"strong":0,"strs":9,"struct_identif":8,"structur":[2,6,9],"stuani":0,"studi":[2,8],"stuff":11,"sturctur":9,"st\u00e9phane":0,"sub":[0,5,8,9],"subdir":8,"subdirectori":[0,5,8],"subfield":8,"subject":7,"sublicens":7,"submiss":1,"submit":0,"subprocess":[0,8],"subroutin":7,"subscrib":[1,11],"subsecond":0,"subsect":[2,7,8,9],"subset":[8,9],"substrat":[3,8,9],"suc":8,"success":[2,8],"succinct":8,"suff":9,"suffici":[0,3,8,10],"suffix":[0,8,9,10],"suggest":0,"suit":7,"suitabl":[0,8,9],"sum":[0,2,8,9],"sum_obj":9,"sumbit":9,"sumbit_vec":9,"summari":8,"superflu":0,"supersed":8,"superset":9,"supplementari":5,"suppli":[6,8],"support":6,"suppos":[0,2,3,8,10],"sure":[5,7,8],"surrend":7,"surround":8,"suspici":8,"sustain":7,"swap":3,"swarm":8,"sweden":0,"symbol":[0,2,5,8],"symmetr":8,"synonym":[6,8],"syntax":[5,10],"syntaxwarn":0,"synthes":8,"synthet":[3,8],"sys":[0,8],"system":[0,2,3,5,6,7,8,9],"sytem":9,"t":[0,1,2,3,5,8,9,11],"t1":8,"t2":8,"t_iso2cumo":9,"t_iso2m":9,"t_iso2po":9,"ta":8,"tab":[2,8,9],"tabl":[8,9],"tabul":[2,8],"tag":0,"tail":0,"take":[0,1,6,7,8],"taken":[8,9],"tappli":0,"target":[8,9],"task":[6,8],"tbi":[0,6],"tblimit":0,"teach":8,"team":[6,8],"techniqu":[6,8],"tell":7,"temporari":9,"ten":8,"tenth":8,"term":[0,2,6,7,8,9],"termin":[7,9],"test":[0,6,8,9,10],"text":[8,9],"textiowrapp":9,"textwrap":9,"tfallnx":9,"th":9,"thank":8,"themselv":[7,8],"theoret":[6,8],"theori":6,"therefor":7,"thereof":7,"theta":9,"thing":7,"think":[8,11],"third":[0,7,8,11],"thorough":7,"though":7,"thousand":8,"thread":[0,8,9],"threaten":7,"three":[5,7],"threshold":8,"throughout":8,"throughput":[5,6,8],"thumb":8,"thus":[0,2,6,7,8,9],"tier":8,"tikhonov":[0,8],"tikhreg":[0,8],"till":[2,3,5,8,9],"time":[0,3,5,6,7,8,9,10],"time_ord":8,"time_unit":2,"timeit":[0,8],"tini":8,"tint":8,"tip":8,"titl":[0,2],"tk1":8,"tk2":8,"tlist":9,"tmax":[0,8,9],"tmp":[0,3,8,9,10],"togeth":[2,9],"token":9,"toler":8,"tolineq":8,"toni":0,"tool":[0,2,5],"topic":1,"topolog":8,"tot":9,"total":9,"toulous":[0,1,6,8,9],"tp":8,"trace":[0,8],"tracer":2,"track":[2,8],"trail":8,"tran":9,"transfer":[0,2,7,8],"transform":[0,8,9],"transit":[0,8,9,10],"translat":[0,2,7,9],"transmit":11,"transpos":9,"trd":9,"treat":[5,8],"treatment":[0,3,6,9],"tri":[3,5,8,9,11],"tripl":8,"troubl":[0,8],"troubleshoot":[4,6],"true":[7,8,9],"truncat":8,"try_ext":9,"tsv":[0,8,9,10],"tsv2df":9,"tune":[2,8],"tupl":9,"turn":[0,8,10],"tutori":8,"tvar":[3,5,9,10],"twice":9,"two":[2,5,7,8,9],"txt":[0,8,9],"txt2ftbl":[0,10],"txt_pars":9,"ty":7,"type":[0,2,7,8,9],"typic":[0,8],"typo":0,"u":0,"uab":0,"ubuntu":5,"ucsd":0,"udr_dp":8,"ui":[8,9],"uk":0,"ulong":9,"unchang":9,"uncoment":3,"uncondit":6,"undefin":8,"underlying":[5,8],"understand":[7,8],"understood":8,"undertak":8,"undertaken":[0,8],"undetermin":8,"unenforc":7,"unexpect":0,"unfamiliar":8,"unfortun":8,"uniform":8,"uniqu":[0,8,9],"unit":[2,6,8],"univers":5,"universal":8,"universiti":0,"unix":[0,3,5,6,8],"unknown":9,"unlabel":[0,2,8],"unless":[6,7,9],"unlik":8,"unnam":0,"unreduc":8,"unsaf":0,"unscal":0,"unsolv":8,"unus":9,"up_mc":8,"updat":[0,9],"upgrad":0,"upper":[3,8],"upt":8,"ure":8,"us":[2,11],"usa":[0,7],"usabl":0,"usag":[0,2,6,9],"use":[0,2,3,5,6,7,8,9,10,11],"useless":[0,8],"user":[0,1,2,3,4,5,6,7,9],"userspac":5,"ussual":2,"usual":[0,8],"utf":[0,8,9],"utf16":0,"utf32":0,"utf8":0,"util":[0,8],"v":[0,8,9],"v1":[0,6,8],"v10":8,"v2":[0,6,8,9],"v3":[0,9],"v4":8,"v41":2,"v47":8,"v5":8,"v6":[2,5,8],"v61":2,"v7":[3,8],"v71":2,"v8":2,"val":2,"val_syn":2,"valid":[0,7,8],"valu":[0,2,3,5,6,9,10],"valuabl":8,"valval":9,"vanilla":8,"var":9,"vari":[0,2,8],"variabl":[0,2,3,5,8,9,10],"variant":[6,9],"variat":[0,5,8],"various":[0,8,9],"varnam":9,"vcumo":9,"vcumol":9,"vec":9,"vector":[0,3,8,9],"veloc":8,"vemu":9,"verbatim":7,"veri":[0,2,8,10],"versa":8,"version":[1,2,5,6,7,8,9,11],"vflt":9,"vflux":9,"vflux_fre":9,"vflux_fwrv":9,"via":[0,3,8],"vice":[7,8],"view":7,"viewabl":5,"violat":[2,8],"visibl":2,"visit":[1,9],"visostr":9,"visual":[0,5,10],"vkvh":8,"vmetab":9,"vmtf":[0,5,9],"vmtf_wt_bw_1":8,"vmtf_wt_bw_2":8,"vmtf_zwf_1":8,"vnan":9,"void":7,"volum":7,"vrcumo":9,"vrowafl":9,"vs":0,"w":[6,7,8,9],"wall":3,"want":[2,3,5,7,8],"warmo":0,"warn":[0,8,9,10],"warranti":[6,7,11],"washington":0,"way":[0,2,6,7,8,9],"web":1,"weight":[0,8,9],"weight1":9,"weight2":9,"weird":8,"welcom":[7,8],"well":[0,2,3,5,6,8,10],"went":5,"werr":9,"wet":8,"whatev":[2,3,7,8],"whether":[7,8],"whi":[5,8],"white":[8,9],"whole":[0,6,7,8,9],"whose":[7,8,9],"wide":[5,7],"widget":9,"width":[8,9,10],"wiechert":6,"will":[0,1,2,3,5,7,8,9,10,11],"window":[0,5,6,8,9],"wise":8,"wish":[1,5,7,8,11],"within":9,"without":[0,3,5,6,7,8,9,11],"witten":0,"wkvh":0,"wolfgang":6,"won":8,"word":[0,8],"work":[0,2,3,5,6,7,8,10],"work_compil":9,"work_star":9,"workabl":8,"workaround":[0,8,9],"worker":[0,9],"workflow":8,"workstat":6,"world":8,"worth":8,"worthwhil":10,"wout":9,"wrap":9,"wrapjoin":9,"writabl":[0,8],"write":[0,5,6,7,8,9],"writer":9,"written":[0,2,5,6,7,8,9,10],"wrong":[0,5,8],"wrote":7,"wurzel":6,"www":[2,5,6,8,9],"wxlay2pi":9,"wxwindow":9,"x":[8,9],"x1x":8,"x5p":2,"x64":5,"x_cumo":9,"xch":[3,8,9],"xch01":0,"xchflux":[8,10],"xeon":6,"xgmml":[0,8,9,10],"xi":9,"xl":9,"xml":[0,2,8,9],"xo":9,"xrang":[0,9],"xsim":8,"xul5p":8,"xx1":8,"xx1x":8,"xylos":8,"xylupt_1":8,"y":[8,9],"yanfen":0,"yani":9,"year":7,"yes":8,"yet":[2,6,8,9],"yflt":9,"yield":9,"ymben":8,"ynan":9,"youn":0,"yoyodyn":7,"z":[8,9],"z_":9,"za":9,"zc":[0,8],"zero":[0,6,8,9],"zeta_sup":9,"zip":0,"zone":8,"zwf":8,"\u00b2h":6,"\u00b5":8,"\u00b9\u00b3c":[6,8],"\u00b9\u2075n":[6,8],"\u03b1":8,"\u03b2":8},"titles":["Change Log for influx_si","Consulting and more","FTBL format evolution","How to \u2026","Welcome to influx_si\u2019s documentation!","Installation","Introduction","License for influx_si software","User\u2019s manual","Programmer\u2019s documentation for influx_si","Quick Start","Troubleshooting"],"titleterms":{"How":3,"Other":8,"Same":2,"abort":8,"addit":8,"bad":8,"basic":8,"c13_ftbl":9,"carbon":8,"carri":8,"case":8,"chang":0,"check":8,"cnstr":8,"cofactor":2,"command":8,"conda":5,"consult":1,"control":2,"converg":8,"convers":8,"custom":8,"cytoscap":8,"data":8,"defin":8,"depend":5,"document":[4,5,6,9],"equal":2,"equat":8,"err":8,"evolut":2,"exclus":8,"expa2ftbl":8,"experi":8,"ffres2ftbl":8,"field":8,"file":8,"flux":8,"format":[2,8],"free":8,"ftbl":[2,8],"ftbl2code":9,"ftbl2cumoab":8,"ftbl2kvh":8,"ftbl2metxml":8,"ftbl2mtf":[8,9],"ftbl2netan":[8,9],"ftbl2optr":9,"ftbl2xgmml":[8,9],"growth":8,"human":8,"identifi":8,"import":8,"indic":4,"inequ":2,"influx_":6,"influx_i":[6,8],"influx_si":[0,4,6,7,8,9],"input":8,"instal":5,"introduct":[2,6],"isodesign":8,"label":8,"licens":[6,7],"line":8,"linp":8,"log":[0,8],"long":2,"manual":8,"measur":2,"metab":2,"metab_measur":2,"metabolit":2,"metabolite_pool":2,"metexplor":8,"method":8,"mflux":8,"miso":8,"mmet":8,"mtf":8,"mynetwork":8,"na":2,"netw":8,"network":8,"nlsic":8,"non":8,"notracer_network":2,"old":8,"opt":8,"optim":[2,8],"option":8,"organiz":6,"output":8,"parallel":8,"paramet":[2,8],"pars":8,"pip":5,"post":8,"prepar":8,"problemat":8,"programm":9,"pso":8,"python":5,"quick":10,"r":5,"reaction":2,"readabl":8,"res2ftbl_mea":8,"result":8,"s":[4,8,9],"section":2,"side":2,"sim":8,"simul":8,"slow":8,"softwar":7,"start":10,"stat":8,"structur":8,"sub":2,"tabl":4,"test":5,"tool":8,"tools_ssg":9,"treatment":8,"troubleshoot":11,"tvar":8,"txt2ftbl":[8,9],"usag":8,"user":8,"v2":2,"v4":2,"v5":2,"valu":8,"version":0,"view":8,"visual":8,"vmtf":8,"welcom":4}})
\ No newline at end of file
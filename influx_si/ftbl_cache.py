@@ -0,0 +1,175 @@
+"""Content-addressed on-disk cache of analysed networks.
+
+ftbl2optR spends most of its python time in C13_ftbl.ftbl_parse(),
+ftbl_netan() and rcumo_sys(). Their results (netan, rAb) are stored
+here in pickle files named after a SHA-256 key made of:
+ - FTBL text and the text of its parallel experiment files (prl_exp option);
+ - FTBL base name;
+ - options influencing the network analysis (emu, fullsys, clownr, case_i, ffguess);
+ - package version and the source of C13_ftbl.py and tools_ssg.py.
+So an entry is never stale: any change in the inputs gives a new key.
+
+The total size of the cache directory is bounded by max_bytes. When it is
+exceeded, least recently used entries (by file mtime, updated at each hit)
+are removed.
+
+Input digests are also used to skip the regeneration of FTBL (txt2ftbl)
+and R code (ftbl2optR) when their inputs are unchanged. A digest is then written
+in output header as "Input digest: <hex>" (cf. inp_digest(), read_digest()).
+
+Typical usage:
+    key=ftbl_cache.ftbl_key(n_ftbl, {"emu": emu, ...})
+    res=ftbl_cache.load(key)
+    if res is None:
+        res=...
+        ftbl_cache.save(key, res)
+
+Copyright 2026, INRAE, INSA, CNRS
+License: Gnu Public License (GPL) v2 http://www.gnu.org/licenses/gpl.html
+"""
+
+import os
+import re
+import hashlib
+import pickle
+import tempfile
+from pathlib import Path
+
+import influx_si
+
+# default cache directory
+cache_dir=Path(os.environ.get("XDG_CACHE_HOME") or Path.home()/".cache")/"influx_si"
+# max total size of cache files (bytes)
+max_bytes=1<<30
+# suffix of cache entries
+suff=".netan.pkl"
+
+def hash_src(h, src=()):
+    "update hash h with package version and sources of C13_ftbl.py, tools_ssg.py and files in src"
+    h.update(("influx_si %s\n"%influx_si.__version__).encode())
+    dirsrc=Path(__file__).resolve().parent
+    for fsrc in [dirsrc/"C13_ftbl.py", dirsrc/"tools_ssg.py"]+[Path(v) for v in src]:
+        h.update(fsrc.read_bytes())
+
+def ftbl_key(n_ftbl, opts, src=()):
+    """SHA-256 hex digest identifying the analysis of FTBL file n_ftbl
+    with options opts (a dict of option name: value).
+    Source files in src are hashed too."""
+    h=hashlib.sha256()
+    hash_src(h, src)
+    h.update(repr(sorted((k, str(v)) for (k,v) in opts.items())).encode())
+    n_ftbl=Path(n_ftbl)
+    h.update(n_ftbl.name.encode()+b"\0")
+    inp=n_ftbl.read_bytes()
+    h.update(inp)
+    # parallel experiments are read by ftbl_netan() from the FTBL directory
+    for prl in re.findall(rb"^\tprl_exp\t(.*?)(?://.*)?$", inp, re.MULTILINE):
+        for fn in re.split(rb"\s*;\s*", prl.strip()):
+            if not fn:
+                continue
+            fn=fn.decode(errors="replace")
+            # same rule as in C13_ftbl.ftbl_parse()
+            if fn[-5:].lower() != ".ftbl":
+                fn+=".ftbl"
+            fp=n_ftbl.parent/fn
+            h.update(b"\0"+fn.encode()+b"\0")
+            h.update(fp.read_bytes() if fp.is_file() else b"\0missing\0")
+    return h.hexdigest()
+
+def inp_digest(inp, opts=(), src=()):
+    """SHA-256 hex digest of inputs inp (a list of file paths or strings),
+    options opts (a list of values) and source files src.
+    Items of inp which are existing files are taken by content, others by value."""
+    h=hashlib.sha256()
+    hash_src(h, src)
+    h.update(repr([str(v) for v in opts]).encode())
+    for v in inp:
+        fp=Path(str(v))
+        h.update(b"\0"+str(v).encode()+b"\0")
+        h.update(fp.read_bytes() if fp.is_file() else b"\0missing\0")
+    return h.hexdigest()
+
+def read_digest(fp, nline=10):
+    "Return input digest written in the first nline lines of file fp or None"
+    try:
+        with open(fp, "rb") as f:
+            for (i,l) in zip(range(nline), f):
+                m=re.search(rb"Input digest: ([0-9a-f]+)", l)
+                if m:
+                    return m.group(1).decode()
+    except OSError:
+        pass
+    return None
+
+def find_digest(fp, dig, dirs=()):
+    """Return the first path among fp and d/<name of fp> (d in dirs)
+    having input digest dig in its header, or None"""
+    fp=Path(fp)
+    for p in [fp]+[Path(d)/fp.name for d in dirs if d]:
+        if read_digest(p) == dig:
+            return p
+    return None
+
+def load(key, dirc=None):
+    """Return cached object for key or None if it is not in cache (or is unreadable).
+    A hit updates entry's mtime for LRU eviction."""
+    fp=Path(dirc or cache_dir)/(key+suff)
+    try:
+        with fp.open("rb") as f:
+            res=pickle.load(f)
+        os.utime(fp)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # corrupted or incompatible entry
+        try:
+            fp.unlink()
+        except OSError:
+            pass
+        return None
+    return res
+
+def save(key, obj, dirc=None):
+    """Store obj under key then evict least recently used entries
+    if the cache size exceeds max_bytes. Return the path of cache entry."""
+    dirc=Path(dirc or cache_dir)
+    dirc.mkdir(parents=True, exist_ok=True)
+    fp=dirc/(key+suff)
+    # write to a temporary file then rename to be safe with concurrent runs
+    fd,ftmp=tempfile.mkstemp(dir=dirc, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(ftmp, fp)
+    except BaseException:
+        try:
+            os.unlink(ftmp)
+        except OSError:
+            pass
+        raise
+    evict(dirc, keep=fp)
+    return fp
+
+def evict(dirc=None, nmax=None, keep=None):
+    """Remove least recently used entries from dirc till their total size is <= nmax
+    (max_bytes by default). Entry keep is never removed."""
+    nmax=max_bytes if nmax is None else nmax
+    li=[]
+    for fp in Path(dirc or cache_dir).glob("*"+suff):
+        try:
+            st=fp.stat()
+        except OSError:
+            continue
+        li.append((st.st_mtime, st.st_size, fp))
+    tot=sum(s for (_,s,_) in li)
+    for (_,s,fp) in sorted(li, key=lambda t: t[0]):
+        if tot <= nmax:
+            break
+        if keep is not None and fp == keep:
+            continue
+        try:
+            fp.unlink()
+            tot-=s
+        except OSError:
+            pass
+    return tot
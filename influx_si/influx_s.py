@@ -18,7 +18,9 @@ import influx_si
 import txt2ftbl
 import ftbl2optR
 import C13_ftbl
-from tools_ssg import join as myjoin
+import ftbl_cache
+import stage_trace
+import py_prof
 
 class ArgumentParser(argparse.ArgumentParser):
     def error(self, message):
@@ -53,8 +55,118 @@ class pvalAction(argparse.Action):
             setattr(namespace, self.dest, val)
 def now_s():
     return(dt.datetime.strftime(dt.datetime.now(), "%Y-%m-%d %H:%M:%S"))
-def move2tmp(dirres, fp):
-    "Move file fp to <dirres>/tmp dir"
+def ftbl_ldict(inp, parser, cmd_opts):
+    """Options from commandArgs of FTBL text inp updated by runtime options cmd_opts (they take precedence).
+    Return a tuple (ldict_opts, ignored): a dict of set options and a list of ignored
+    positional arguments from commandArgs."""
+    cmd=" ".join(re.findall("^\tcommandArgs\t(.*?)(?://.*)?$", inp, re.MULTILINE))
+    ftbl_opts=parser.parse_args(cmd.split())
+    ignored=ftbl_opts.ftbl
+    ftbl_opts=vars(ftbl_opts)
+    ftbl_opts.update(dict((k,v) for (k,v) in vars(cmd_opts).items() if not v is None and v is not False and k != "ftbl"))
+    ldict_opts=dict((k,v) for k,v in ftbl_opts.items() if v is not None and v is not False and k != "ftbl")
+    return (ldict_opts, ignored)
+def job_cost(ft, parser, cmd_opts, case_i=False, werr=sys.stderr.write):
+    """Cost estimate of FTBL ft (arbitrary units) used to run the longest jobs first.
+    It is the size of full cumomer systems (sum of 2^Clen over metabolites, Clen being
+    carbon length) times the number of experiments, the whole multiplied by
+    1+number of Monte-Carlo iterations (sens='mc=N').
+    Clen and experiments are taken from network analysis in on-disk cache (cf. ftbl_cache)
+    if any, otherwise from carbon transitions and prl_exp option of ft.
+    0 is returned (with a warning) if ft cannot be read."""
+    try:
+        inp=C13_ftbl.ftbl_text(str(ft))
+        ldict,ignored=ftbl_ldict(inp, parser, cmd_opts)
+        res=None
+        if not ldict.get("no_cache"):
+            key=ftbl2optR.netan_key(ft, *(k in ldict for k in ("emu", "fullsys", "clownr")), case_i, "ffguess" in ldict)
+            res=ftbl_cache.load(key, ldict.get("cache_dir"))
+        if res is not None:
+            netan=res[0]
+            clen=netan["Clen"]
+            nexp=len(netan["iso_input"])
+        else:
+            clen=dict()
+            nexp=1
+            prev=None
+            for (sec,subsec,row,irow) in C13_ftbl.ftbl_tokens(inp.splitlines(), str(ft)):
+                if not isinstance(row, dict):
+                    continue
+                if sec == "NETWORK":
+                    if prev is not None and not row.get("FLUX_NAME"):
+                        # carbon transitions of the previous row
+                        clen.update((prev[k], len(v)-1) for (k,v) in row.items() if k != "irow" and v.startswith("#") and prev.get(k))
+                        prev=None
+                    else:
+                        prev=row
+                elif sec == "OPTIONS" and row.get("OPT_NAME") == "prl_exp":
+                    nexp+=len([v for v in row.get("OPT_VALUE", "").split(";") if v.strip()])
+    except Exception as e:
+        werr("Warning: cost of '%s' cannot be estimated, it is scheduled last (%s)\n"%(ft, str(e).strip()))
+        return 0
+    m=re.match(r"mc(?:=(\d+))?", ldict.get("sens") or "")
+    nmc=(int(m.group(1)) if m.group(1) else 10) if m else 0
+    return sum(1<<n for n in clen.values())*nexp*(1+nmc)
+def res_logs(fR, dirres):
+    "Return paths of .log and .err files (or None, None) for R code fR"
+    fp=Path(fR)
+    if dirres == "default":
+        return (fp.parent/(fp.stem+"_res")/(fp.stem+".log"), fp.parent/(fp.stem+"_res")/(fp.stem+".err"))
+    elif not dirres:
+        return (None, None)
+    else:
+        return (Path(dirres)/(fp.stem+".log"), Path(dirres)/(fp.stem+".err"))
+def run_R(fR, flog=None, fpe=None, fshort=""):
+    """Execute R code fR in a separate R process. Start time and R warnings are written to
+    log file flog and R errors to fpe (stdout and stderr if None). Return R exit code."""
+    rcmd="--vanilla --slave"
+    if flog:
+        with flog.open("a") as flp: flp.write("executing: "+rcmd+' < '+fR+'"\n')
+    s="calcul  : "+now_s()+"\n"
+    sys.stdout.write(fshort+s)
+    if flog:
+        with flog.open("a") as flp: flp.write(s)
+    sp=subp.Popen([shutil.which("R")] + rcmd.split(), stdin=open(fR, "r"), stdout=subp.PIPE, stderr=subp.PIPE, start_new_session=True)
+    try:
+        with stage_trace.stage("R run"):
+            out,err=sp.communicate()
+        err=err.decode(errors="ignore")
+        if err:
+            if flog:
+                with flog.open("a") as fc:
+                    fc.write("***Warning: '"+fR+"' produced the following warnings:\n"+err+"\n")
+            else:
+                sys.stderr.write("***Warning: '"+fR+"' produced the following warnings:\n"+err+"\n")
+        retcode=sp.returncode
+    except KeyboardInterrupt:
+        os.killpg(os.getpgid(sp.pid), signal.SIGTERM)
+        err="Keyboard interupt"
+        retcode=1
+    if retcode != 0 and err:
+            if fpe:
+                with fpe.open("a") as fc:
+                    fc.write("Error: "+fR+" aborted with:\n"+err+"\n")
+            else:
+                sys.stderr.write("Error: "+fR+" aborted with:\n"+err+"\n")
+    return retcode
+def pipe_job(arg):
+    """Pipeline stage for multiple FTBLs: launch_job() followed by the execution of generated R code.
+    arg is a tuple (item, wdict) of keyword arguments for launch_job()"""
+    item,wdict=arg
+    res=launch_job(**item, **wdict)
+    if type(res) is int:
+        return (res, ("", False))
+    rc,(fR,noc)=res
+    if rc == 0 and fR and not noc and not wdict["dict_opts"]["nocalc"]:
+        flog,fpe=res_logs(fR, wdict["dirres"])
+        rc=run_R(fR, flog, fpe, item["fshort"])
+        s="end     : "+now_s()+"\n"
+        sys.stdout.write(item["fshort"]+s)
+        if flog:
+            with flog.open("a") as flp: flp.write(s)
+    return (rc, (fR, noc))
+def move2tmp(dirres, fp, stem=None):
+    "Move file fp to <dirres>/tmp dir. For default dirres, stem (fp.stem by default) gives <stem>_res dir"
     if fp:
         fp=Path(fp)
     else:
@@ -62,7 +174,7 @@ def move2tmp(dirres, fp):
     if not fp.exists():
         return
     if dirres == "default":
-        ft=fp.parent/(fp.stem+"_res")/"tmp"/fp.name
+        ft=fp.parent/((stem or fp.stem)+"_res")/"tmp"/fp.name
     elif dirres:
         ft=Path(dirres)/"tmp"/fp.name
     fp.chmod(fp.stat().st_mode | stat.S_IWRITE)
@@ -140,25 +252,13 @@ def launch_job(ft, fshort, cmd_opts, dict_opts, pyopta, pyoptnota, notropt, nb_f
                 flog.close()
                 ferr.close()
             return(retcode, ("", False));
-        # parse commandArgs from the FTBL file
+        # parse commandArgs from the FTBL file (decoded text is reused by ftbl_parse())
         #pdb.set_trace()
-        inp=ft.open("rb").read()
-        for co in ["utf-8", "latin9", "utf-16", "utf-32"]:
-            try:
-                inp=inp.decode(co)
-                break
-            except:
-                pass
-        inp=inp.encode("utf-8").decode("utf-8")
-        cmd=" ".join(re.findall("^\tcommandArgs\t(.*?)(?://.*)?$", inp, re.MULTILINE))
-        ftbl_opts=parser.parse_args(cmd.split())
-        if len(ftbl_opts.ftbl):
-            ferr.write("Warning: argument(s) '%s' from the field commandArgs of '%s' are ignored.\n"%(" ".join(ftbl_opts.ftbl), ft))
-
-        # update ftbl_opts with cmd_opts with runtime options so rt options take precedence
-        ftbl_opts=vars(ftbl_opts)
-        ftbl_opts.update(dict((k,v) for (k,v) in vars(cmd_opts).items() if not v is None and v is not False and k != "ftbl"))
-        ldict_opts=dict((k,v) for k,v in ftbl_opts.items() if v is not None and v is not False and k != "ftbl")
+        inp=C13_ftbl.ftbl_text(str(ft))
+        # runtime options take precedence over commandArgs
+        ldict_opts,ignored=ftbl_ldict(inp, parser, cmd_opts)
+        if len(ignored):
+            ferr.write("Warning: argument(s) '%s' from the field commandArgs of '%s' are ignored.\n"%(" ".join(ignored), ft))
         if "meth" in dict_opts and dict_opts["meth"]:
             ldict_opts["meth"]=",".join(ldict_opts["meth"])
 
@@ -173,7 +273,17 @@ def launch_job(ft, fshort, cmd_opts, dict_opts, pyopta, pyoptnota, notropt, nb_f
             (["--case_i"] if case_i else []) + ["--dirres", str(dres)] + [str(ft)]
         r_generated=True
         #breakpoint()
-        retcode=ftbl2optR.main(opt4py, wout=flog.write, werr=ferr.write)
+        if ldict_opts.get("TIMEIT"):
+            stage_trace.trace_open(stage_trace.res_trace(ft, str(dres)))
+        else:
+            stage_trace.trace_close()
+        with stage_trace.stage("code gen"):
+            if ldict_opts.get("prof"):
+                # python profile beside .Rprof, with txt2ftbl part if any
+                with py_prof.profile(stage_trace.res_trace(ft, str(dres), ".pstats"), add=[stage_trace.res_trace(ft, str(dres), ".txt2ftbl.pstats")]):
+                    retcode=ftbl2optR.main(opt4py, wout=flog.write, werr=ferr.write)
+            else:
+                retcode=ftbl2optR.main(opt4py, wout=flog.write, werr=ferr.write)
         if retcode != 0:
             r_generated=False
             if dirres:
@@ -245,10 +355,10 @@ Call influx_s.main(["-h"]) for a help message"""
     version=influx_si.__version__
 
     # valid options for python
-    pyopta=set(("tblimit",))
-    pyoptnota=set(("fullsys", "emu", "clownr", "ffguess"))
+    pyopta=set(("tblimit", "cache_dir"))
+    pyoptnota=set(("fullsys", "emu", "clownr", "ffguess", "no_cache"))
     # non valid options for R
-    notropt=set(("tblimit", "mtf", "prefix", "force"))
+    notropt=set(("tblimit", "mtf", "prefix", "force", "no_cache", "cache_dir"))
 
     # define a parser for command line options
     parser.register('type', None, identity) # to make parser serializable
@@ -333,6 +443,12 @@ Call influx_s.main(["-h"]) for a help message"""
         "--nocalc", action="store_true",
                help="generate an R code but not execute it.")
         parser.add_argument(
+        "--no_cache", "--no-cache", action="store_true",
+               help="do not use on-disk cache of network analysis when generating R code and regenerate R code even if its inputs are unchanged. By default, results of network analysis and R code from a previous run are reused if FTBL file (and its parallel experiments), relevant options and influx_si version are unchanged. FTBL files produced from MTF files are regenerated with --force.")
+        parser.add_argument(
+        "--cache_dir", "--cache-dir",
+               help="directory of on-disk cache of network analysis. Default: $XDG_CACHE_HOME/influx_si or ~/.cache/influx_si")
+        parser.add_argument(
         "--addnoise", action="store_true",
                help="Add centered gaussian noise to simulated measurements written to _res.kvh file. SD of this noise is taken from FTBL file"),
     if case_i:
@@ -372,7 +488,7 @@ Call influx_s.main(["-h"]) for a help message"""
             help="developer option: measure cpu time or not")
         parser.add_argument(
         "--prof", action="store_true",
-            help="developer option: do time profiling or not")
+            help="developer option: do time profiling or not. R profile is written to <name>.Rprof, python one to <name>.pstats (and .pstats.txt) in <dirres>/tmp. Use 'python3 -m influx_si.py_prof' to convert them to collapsed stacks for flamegraphs")
         parser.add_argument(
         "--tblimit", type=int, default=0,
             help="developer option: set trace back limit for python error messages")
@@ -485,6 +601,18 @@ Call influx_s.main(["-h"]) for a help message"""
         args=[l for f in lglob for l in f]
         # make args unique
         args=sorted(set(args))
+    if opts.out is None:
+        dirres="default"
+    elif len(opts.out) == 0:
+        dirres=""
+    else:
+        dirres=opts.out
+    if dict_opts["TIMEIT"]:
+        # run id shared by stage traces of txt2ftbl, ftbl2optR and R (cf. stage_trace)
+        os.environ["INFLUX_SI_TRACE"]="%d-%.3f"%(os.getpid(), time.time())
+    if dict_opts["prof"]:
+        # txt2ftbl profiles are written in result dirs (cf. py_prof)
+        os.environ["INFLUX_SI_PROF"]="1"
     # treat MTF options if any
     li_ftbl=[]
     prl_ftbl=dict()
@@ -508,7 +636,7 @@ Call influx_s.main(["-h"]) for a help message"""
             for t in ord_args:
                 tmp_ftbl=[]
                 try:
-                    txt2ftbl.main(mtf_opts+list(t)+([] if np is None else ["--np", str(np)]), tmp_ftbl, prl_ftbl)
+                    txt2ftbl.main(mtf_opts+list(t)+([] if np is None else ["--np", str(np)]), tmp_ftbl, prl_ftbl, dirres)
                 except Exception as e:
                     #pdb.set_trace()
                     ferr.write(("".join(traceback.format_exc())) + "\n")
@@ -524,7 +652,7 @@ Call influx_s.main(["-h"]) for a help message"""
             mtf_opts += [v for t in ord_args for v in t]
             #print("mtf_opts=", mtf_opts)
             try:
-                txt2ftbl.main(mtf_opts, li_ftbl, prl_ftbl)
+                txt2ftbl.main(mtf_opts, li_ftbl, prl_ftbl, dirres)
             except Exception as e:
                     #pdb.set_trace()
                     sys.tracebacklimit=dict_opts.get("tblimit", 0)
@@ -544,12 +672,6 @@ Call influx_s.main(["-h"]) for a help message"""
         parser.error("At least one FTBL_file or MTF set expected in argument")
     if len(args) > 1 and opts.out is not None and opts.out:
         parser.error("When several FTBL_files or MTF sets are given in argument, --out can not be set to non empty value (got '%s')"%opts.out)
-    if opts.out is None:
-        dirres="default"
-    elif len(opts.out) == 0:
-        dirres=""
-    else:
-        dirres=opts.out
     #import pdb; pdb.set_trace()
     #print((" ".join('"'+v+'"' for v in sys.argv)))
     #print("cpu=", cpu_count())
@@ -571,9 +693,13 @@ Call influx_s.main(["-h"]) for a help message"""
     # launch workers
     # worker dict
     wdict={"cmd_opts": cmd_opts, "dict_opts": dict_opts, "pyopta": pyopta, "pyoptnota": pyoptnota, "notropt": notropt, "nb_ftbl": nb_ftbl, "case_i": case_i, "dirres": dirres, "DEBUG": DEBUG, "parser": parser, "parR": parR, "path0": __file__, "argv": argv}
+    if len(ftpr) > 1:
+        # pipeline: R code of each FTBL is executed as soon as it is generated,
+        # the longest jobs (according to FTBL content) first
+        ftpr.sort(key=lambda item: job_cost(item["ft"], parser, cmd_opts, case_i), reverse=True)
     if DEBUG or min(np, len(args)) == 1:
         try:
-            rcodes, rfiles=zip(*[launch_job(**item, **wdict) for item in ftpr])
+            rcodes, rfiles=zip(*[pipe_job((item, wdict)) if len(ftpr) > 1 else launch_job(**item, **wdict) for item in ftpr])
         except:
             #breakpoint()
             if DEBUG:
@@ -586,114 +712,30 @@ Call influx_s.main(["-h"]) for a help message"""
             raise
 
     else:
-        with Pool(np) as p:
-            rcodes, rfiles=zip(*p.starmap(launch_job, [(*item.values(), *wdict.values()) for item in ftpr]))
+        # dynamic load balancing: next FTBL goes to the first free process
+        with Pool(min(np, len(ftpr))) as p:
+            rcodes, rfiles=zip(*p.imap_unordered(pipe_job, [(item, wdict) for item in ftpr]))
 
     if not rcodes:
         #import pdb; pdb.set_trace()
         sys.stderr.write("No return code after FTBL processing\n")
         return 1
     retcode=max(rcodes)
+    if len(ftpr) > 1 and dict_opts["TIMEIT"]:
+        # one trace file for the run (cf. stage_trace)
+        stage_trace.merge_trace([stage_trace.res_trace(item["ft"], dirres) for item in ftpr],
+            Path(os.path.commonpath([Path(item["ft"]).resolve().parent for item in ftpr]))/"influx_s.trace.json")
     if len(rfiles) > 1:
-        # prepare R code for parallel calculations and launch it
-        # //calcul on cluster
-        if not retcode and not dict_opts["nocalc"]:
-            #fpar=open("parallel.R", "w")
-            spar="""
-        suppressPackageStartupMessages(library(parallel))
-        dirx="%(dirx)s"
-        dirres="%(dirres)s" # can be "default" or empty
-        vdoit=function(fl)
-           return(max(abs(sapply(fl, doit))))
-        doit=function(fR) {
-           f=substr(fR, 1L, nchar(fR)-2L)
-           fshort=basename(f)
-           if (dirres == "default") {
-              nm_flog=sprintf("%%s_res/%%s.log", f, fshort)
-              nm_ferr=sprintf("%%s_res/%%s.err", f, fshort)
-              flog=file(nm_flog, "a")
-           } else {
-              flog=base::stdout()
-              ferr=base::stderr()
-           }
-           now=Sys.time()
-           
-           cat("calcul  : ", format(now, "%%Y-%%m-%%d %%H:%%M:%%S"), "\\n", sep="", file=flog)
-           if (dirres == "default")
-              close(flog)
-           source(fR, echo=FALSE)
-           now=Sys.time()
-           flog=if (dirres == "default") file(nm_flog, "a") else base::stdout()
-           cat("end     : ", format(now, "%%Y-%%m-%%d %%H:%%M:%%S"), "\\n", sep="", file=flog)
-           if (dirres == "default") {
-              if (file.info(nm_ferr)$size > 0L)
-                 cat("=>Check ", nm_ferr, "\\n", sep="", file=flog)
-              close(flog)
-           }
-           return(retcode)
-        }
-        # build dyn lib
-        nodes=%(np)d
-        flist=c(%(flist)s)
-        if (nodes > 1L || nodes == 0L) {
-            type="PSOCK"
-            cl=makeCluster(nodes, type)
-            clusterExport(cl, c("dirres", "doit"))
-            retcode=max(abs(parSapply(cl, suppressWarnings(split(flist, seq_len(nodes))), vdoit)))
-            stopCluster(cl)
-        } else {
-            retcode=max(abs(sapply(flist, doit)))
-        }
-        q("no", status=retcode)
-        """%{
-            "np": min(np, len([fr for fr,noc in rfiles if not noc])),
-            "flist": myjoin(", ", ('"'+f.replace(os.path.sep, "/")+'"' for f,noc in rfiles if not noc), width=80),
-            "dirx": os.path.join(dirinst, "R").replace(os.path.sep, "/"),
-            "dirres": dirres
-            }
-            #fpar.close()
-            # execute R code on cluster
-            s="//calcul:  "+now_s()+"\n"
-            sys.stdout.write(s)
-            rcmd="--vanilla --slave"
-            #import pdb; pdb.set_trace()
-            if os.name == "nt":
-                sp=subp.Popen([shutil.which("R")]+rcmd.split(), stdin=subp.PIPE, stdout=subp.PIPE, stderr=subp.PIPE, start_new_session=True)
-            else:
-                sp=subp.Popen([shutil.which("R")]+rcmd.split(), stdin=subp.PIPE, stdout=subp.PIPE, stderr=subp.PIPE, preexec_fn=os.setsid)
-            try:
-                sp.stdin.write(spar.encode())
-                sp.stdin.flush()
-                out,err=sp.communicate()
-                err=err.decode()
-                if err:
-                    sys.stderr.write("***Warning: parallel R produced the following warnings:\n"+err+"\n")
-                retcode=sp.returncode
-            except KeyboardInterrupt:
-                if os.name == "nt":
-                    sp.kill()
-                    #Popen("TASKKILL /F /PID {pid} /T".format(pid=sp.pid))
-                else:
-                    os.killpg(os.getpgid(sp.pid), signal.SIGTERM)
-                err="Keyboard interupt"
-                retcode=1
-            if retcode != 0:
-                sys.stderr.write("Error: parallel R aborted with:\n"+err+"\n")
-            # end up writing
-            s="//end   : "+now_s()+"\n"
-            sys.stdout.write(s)
+        # R codes are already executed in pipe_job()
         #pdb.set_trace()
         for fR,noc in rfiles:
             f=fR[:-2]
             fp=Path(fR)
-            if dirres == "default":
-                fpe=(fp.parent/(fp.stem+"_res")/(fp.stem+".err"))
-                flog=(fp.parent/(fp.stem+"_res")/(fp.stem+".log"))
-            else: # non empty dirres with multiple inputs cannot be
-                fpe=""
-                flog=None
+            flog,fpe=res_logs(fp, dirres)
             move2tmp(dirres, fp)
             move2tmp(dirres, fp.with_suffix(".Rprof"))
+            move2tmp(dirres, fp.with_suffix(".Rbin"))
+            move2tmp(dirres, fp.with_suffix(".Rbin.tsv"), fp.stem)
             fp=fp.with_suffix(".ftbl")
             if str(fp) in set_ftbl:
                 move_ftbl(dirres, fp, case_i)
@@ -704,47 +746,10 @@ Call influx_s.main(["-h"]) for a help message"""
                 sys.stdout.write(s)
     else:
         fp=Path(ftpr[0]["ft"]).with_suffix(".R")
-        if dirres == "default":
-            flog=(fp.parent/(fp.stem+"_res")/(fp.stem+".log"))
-            fpe=(fp.parent/(fp.stem+"_res")/(fp.stem+".err"))
-        elif not dirres:
-            flog=None
-            fpe=None
-        else:
-            flog=(Path(dirres)/(fp.stem+".log"))
-            fpe=(Path(dirres)/(fp.stem+".err"))
+        flog,fpe=res_logs(fp, dirres)
         # execute only one R code
         if not retcode and rfiles and not dict_opts["nocalc"]:
-            f=rfiles[0][0][:-2]
-            rcmd="--vanilla --slave"
-            #rarg=f"source('{rfiles[0][0]}',echo=FALSE)"
-            if flog:
-                with flog.open("a") as flp: flp.write("executing: "+rcmd+' < '+rfiles[0][0]+'"\n')
-            s="calcul  : "+now_s()+"\n"
-            sys.stdout.write(s)
-            if flog:
-                with flog.open("a") as flp: flp.write(s)
-            sp=subp.Popen([shutil.which("R")] + rcmd.split(), stdin=open(rfiles[0][0], "r"), stdout=subp.PIPE, stderr=subp.PIPE, start_new_session=True)
-            try:
-                out,err=sp.communicate()
-                err=err.decode(errors="ignore")
-                if err:
-                    if flog:
-                        with flog.open("a") as fc:
-                            fc.write("***Warning: '"+rfiles[0][0]+"' produced the following warnings:\n"+err+"\n")
-                    else:
-                        sys.stderr.write("***Warning: '"+rfiles[0][0]+"' produced the following warnings:\n"+err+"\n")
-                retcode=sp.returncode
-            except KeyboardInterrupt:
-                os.killpg(os.getpgid(sp.pid), signal.SIGTERM)
-                err="Keyboard interupt"
-                retcode=1
-            if retcode != 0 and err:
-                    if fpe:
-                        with fpe.open("a") as fc:
-                            fc.write("Error: "+rfiles[0][0]+" aborted with:\n"+err+"\n")
-                    else:
-                        sys.stderr.write("Error: "+rfiles[0][0]+" aborted with:\n"+err+"\n")
+            retcode=run_R(rfiles[0][0], flog, fpe)
         s="end     : "+now_s()+"\n"
         sys.stdout.write(s)
         if flog:
@@ -752,6 +757,8 @@ Call influx_s.main(["-h"]) for a help message"""
         # move .R (and .ftbl if --prefix)
         move2tmp(dirres, fp)
         move2tmp(dirres, fp.with_suffix(".Rprof"))
+        move2tmp(dirres, fp.with_suffix(".Rbin"))
+        move2tmp(dirres, fp.with_suffix(".Rbin.tsv"), fp.stem)
         if ftpr[0]["ft"] in set_ftbl:
             move_ftbl(dirres, ftpr[0]["ft"], case_i)
 
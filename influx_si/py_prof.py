@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Python side profiling (--prof option) and conversion of profiles to collapsed stacks.
+
+With influx_s --prof, R code is profiled by Rprof() (<name>.Rprof) and
+python code generation (txt2ftbl, ftbl2optR, C13_ftbl) by cProfile.
+Python profile is written to <dirres>/tmp/<name>.pstats (pstats
+data) and <name>.pstats.txt (text summary sorted by cumulative and own time).
+
+Both kinds of profile can be converted to one collapsed-stack file
+("frame1;frame2;... microseconds" per line) which is the input of flamegraph
+tools (flamegraph.pl, speedscope, inferno, ...). Python stacks are
+prefixed by "python", R stacks by "R". As pstats keeps only caller-callee
+times, python stacks are rebuilt from root functions, the time of a function
+being shared between its callers in proportion of their cumulative time.
+
+usage: py_prof.py [-h] [-o OUT] profile [profile ...]
+where profile is a .pstats or .Rprof file
+
+Copyright 2026, INRAE, INSA, CNRS
+License: Gnu Public License (GPL) v2 http://www.gnu.org/licenses/gpl.html
+"""
+
+import sys
+import os
+import re
+import argparse
+import cProfile
+import pstats
+from pathlib import Path
+from contextlib import contextmanager
+
+# number of lines in each part of text summary
+nline=100
+
+def dump(pr, fp, add=(), txt=True):
+    """Write pstats data of profiler pr to fp and, if txt, a sorted text summary to <fp>.txt.
+    Existing pstats files in add are merged then removed."""
+    fp=Path(fp)
+    fp.parent.mkdir(parents=True, exist_ok=True)
+    st=pstats.Stats(pr)
+    for f in add:
+        if Path(f).is_file():
+            st.add(str(f))
+            Path(f).unlink()
+    st.dump_stats(str(fp))
+    if txt:
+        with open(str(fp)+".txt", "w", encoding="utf8") as f:
+            st.stream=f
+            st.sort_stats("cumulative").print_stats(nline)
+            st.sort_stats("tottime").print_stats(nline)
+    return fp
+
+@contextmanager
+def profile(fp, add=(), txt=True):
+    "Profile the enclosed block and write results to fp (cf. dump())"
+    pr=cProfile.Profile()
+    pr.enable()
+    try:
+        yield pr
+    finally:
+        pr.disable()
+        dump(pr, fp, add, txt)
+
+def fname(func):
+    "Frame name of pstats function tuple (file, line, name)"
+    f,l,n=func
+    if f == "~":
+        return n.replace(";", ",")
+    return ("%s (%s:%d)"%(n, os.path.basename(f), l)).replace(";", ",")
+
+def pstats_stacks(fp, res=None, tmin=1.e-6):
+    """Collapsed stacks from pstats file fp added to dict res {stack: microseconds}.
+    Branches shorter than tmin seconds are dropped."""
+    res={} if res is None else res
+    st=pstats.Stats(str(fp)).stats
+    children={}
+    for func,(cc,nc,tt,ct,callers) in st.items():
+        for caller,v in callers.items():
+            children.setdefault(caller, []).append((func, v[3]))
+    def walk(func, path, seen, ct):
+        tot=st[func][3]
+        scale=ct/tot if tot > 0. else 0.
+        tt=st[func][2]*scale
+        if tt >= tmin:
+            res[path]=res.get(path, 0.)+tt*1.e6
+        for (ch,cct) in children.get(func, ()):
+            if ch in seen or ch not in st or cct*scale < tmin:
+                continue
+            walk(ch, path+";"+fname(ch), seen|{ch}, cct*scale)
+    for func,v in st.items():
+        if not v[4]:
+            walk(func, "python;"+fname(func), {func}, v[3])
+    return res
+
+def rprof_stacks(fp, res=None):
+    "Collapsed stacks from Rprof file fp added to dict res {stack: microseconds}"
+    res={} if res is None else res
+    with open(fp, encoding="utf8", errors="replace") as f:
+        m=re.search(r"sample\.interval=(\d+)", f.readline())
+        dt=int(m.group(1)) if m else 20000
+        for l in f:
+            if l.startswith("#"):
+                continue
+            # memory profiling fields and line numbers are not quoted
+            fr=re.findall(r'"([^"]*)"', l)
+            if not fr:
+                continue
+            k="R;"+";".join(v.replace(";", ",") for v in reversed(fr))
+            res[k]=res.get(k, 0.)+dt
+    return res
+
+def collapse(files, fout=sys.stdout):
+    "Write collapsed stacks of profiles in files (.Rprof or pstats) to file object fout"
+    res={}
+    for fp in files:
+        if str(fp).endswith(".Rprof"):
+            rprof_stacks(fp, res)
+        else:
+            pstats_stacks(fp, res)
+    for k in sorted(res):
+        v=int(round(res[k]))
+        if v > 0:
+            fout.write("%s %d\n"%(k, v))
+
+def main(argv=sys.argv[1:]):
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-o", "--out", help="output file (default: stdout)")
+    parser.add_argument("profile", nargs="+", help=".pstats or .Rprof file")
+    opts=parser.parse_args(argv)
+    if opts.out:
+        with open(opts.out, "w", encoding="utf8") as f:
+            collapse(opts.profile, f)
+    else:
+        collapse(opts.profile)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
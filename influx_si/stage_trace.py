@@ -0,0 +1,128 @@
+"""Stage timing in Chrome trace format (--TIMEIT option).
+
+Python stages (FTBL generation, network analysis, R code writing, R run)
+and R stages (cf. tchrono() in R/tools_ssg.R) of one network are appended
+as complete events ("ph": "X") to the same file <dirres>/tmp/<name>.trace.json
+which can be loaded in chrome://tracing or https://ui.perfetto.dev.
+The file is a JSON array whose closing ']' is omitted (as allowed by
+the format), so that each writer can append its events. Use read_trace() to load it
+in python.
+Times ("ts", "dur") are in microseconds since epoch, CPU time in
+"args": {"cpu": seconds}.
+
+The file is truncated at the first opening in a given run. A run is
+identified by environment variable INFLUX_SI_TRACE (set by influx_s)
+or by process id.
+For multiple networks, influx_s merges per-network files of the run
+in one file influx_s.trace.json (beside FTBLs) with one process track
+by network (cf. merge_trace()).
+
+Typical usage:
+    stage_trace.trace_open(stage_trace.res_trace(ftbl, dirres))
+    with stage_trace.stage("ftbl_parse"):
+        ...
+
+Copyright 2026, INRAE, INSA, CNRS
+License: Gnu Public License (GPL) v2 http://www.gnu.org/licenses/gpl.html
+"""
+
+import os
+import re
+import json
+import time
+from pathlib import Path
+from contextlib import contextmanager
+
+# current trace file (None => no tracing)
+ftrace=None
+
+def run_id():
+    "Identifier of the current run"
+    return os.environ.get("INFLUX_SI_TRACE") or "pid%d"%os.getpid()
+
+def res_trace(fp, dirres="", suff=".trace.json"):
+    """Trace file path (or another file <stem><suff>) for FTBL (or R code) fp and result dir
+    dirres as passed to ftbl2optR: "default" => <stem>_res/tmp/, "" => beside fp, otherwise <dirres>/tmp/"""
+    fp=Path(fp)
+    name=fp.stem+suff
+    if dirres == "default":
+        return fp.parent/(fp.stem+"_res")/"tmp"/name
+    elif not dirres:
+        return fp.parent/name
+    return Path(dirres)/"tmp"/name
+
+def trace_open(fp):
+    "Make fp the current trace file. It is truncated if it comes from another run"
+    global ftrace
+    fp=Path(fp)
+    fp.parent.mkdir(parents=True, exist_ok=True)
+    run=run_id()
+    try:
+        with fp.open("r", encoding="utf8") as f:
+            head=f.read(512)
+    except OSError:
+        head=""
+    m=re.search(r'"run": "([^"]*)"', head)
+    if not m or m.group(1) != run:
+        with fp.open("w", encoding="utf8") as f:
+            f.write("[\n"+json.dumps({"name": "process_name", "ph": "M", "pid": os.getpid(), "tid": 0, "args": {"name": "influx_si", "run": run}})+",\n")
+    ftrace=fp
+    return fp
+
+def trace_close():
+    "Stop tracing"
+    global ftrace
+    ftrace=None
+
+def event(name, ts, dur, cpu, cat="py"):
+    "Append a complete event to the current trace file. Times are in seconds"
+    if ftrace is None:
+        return
+    with open(ftrace, "a", encoding="utf8") as f:
+        f.write(json.dumps({"name": name, "cat": cat, "ph": "X", "ts": round(ts*1.e6), "dur": round(dur*1.e6), "pid": os.getpid(), "tid": 0, "args": {"cpu": round(cpu, 3)}})+",\n")
+
+@contextmanager
+def stage(name, cat="py"):
+    "Trace the enclosed block as stage 'name' (no-op if no trace file is open)"
+    if ftrace is None:
+        yield
+        return
+    t0=time.time()
+    c0=time.process_time()
+    try:
+        yield
+    finally:
+        event(name, t0, time.time()-t0, time.process_time()-c0, cat)
+
+def read_trace(fp):
+    "Return the list of events from trace file fp"
+    s=Path(fp).read_text(encoding="utf8").rstrip()
+    if s.endswith("]"):
+        s=s[:-1].rstrip()
+    return json.loads(s.rstrip(",")+"]")
+
+def merge_trace(fps, fout):
+    """Merge trace files fps of the current run in a complete JSON array written to fout.
+    Events of i-th file get pid=i+1 and its process is named after the network,
+    so that each job has its own track. Missing files and files of other runs are skipped.
+    Return the number of merged files (fout is not written if 0)."""
+    run=run_id()
+    res=[]
+    nb=0
+    for (i,fp) in enumerate(fps):
+        try:
+            ev=read_trace(fp)
+        except (OSError, ValueError):
+            continue
+        if not ev or ev[0].get("args", {}).get("run") != run:
+            continue
+        nb+=1
+        for e in ev:
+            e["pid"]=i+1
+            if e.get("ph") == "M" and e.get("name") == "process_name":
+                e["args"]["name"]=Path(fp).name[:-len(".trace.json")]
+        res += ev
+    if nb:
+        with open(fout, "w", encoding="utf8") as f:
+            f.write("[\n"+",\n".join(json.dumps(e) for e in res)+"\n]\n")
+    return nb
@@ -39,29 +39,55 @@ def asort(d):
     r"""sorts a dictionnary by value preserving key=value association the result is a list of tuples (key,value)"""
     return sorted(list(a.items()), key=operator.itemgetter(1))
 
+# popcount of an integer (int.bit_count() appeared in python 3.10)
+popcount=int.bit_count if hasattr(int, "bit_count") else lambda i: bin(i).count("1")
+# popcount, bits and set bit positions for all bytes
+popcnt8=np.array([bin(i).count("1") for i in range(256)], dtype=np.int8)
+bits8=tuple(tuple((i>>b) & 1 for b in range(8)) for i in range(256))
+bitpos8=tuple(tuple(b for b in range(8) if i & (1<<b)) for i in range(256))
+
 def iterbit(i, size=0):
     r"""iterator on bits in integer starting from 0-position. The iterator stops at highest non-zero bit"""
     i=int(i)
-    moveb=1
-    b_no=0
-    while (moveb <= i and size==0) or (b_no < size):
-        yield (1 if (moveb&i) else 0)
-        moveb<<=1
-        b_no+=1
+    if size > 0:
+        i&=(1<<size)-1
+        n=size
+    else:
+        n=i.bit_length() if i > 0 else 0
+    res=[]
+    while len(res) < n:
+        res += bits8[i & 255]
+        i>>=8
+    return iter(res[:n])
 
 def iternumbit(i, size=0):
     r"""iterator on bits and its number in integer starting from 0-position. The iterator yields tuples (n,bit). If optional size is zero then it stops at highest non-zero bit. If not, it will stop at bit number size-1."""
+    return enumerate(iterbit(i, size))
+
+def bitpos(i):
+    r""":returns: list of positions (0-based, increasing) of bits set in a non negative integer"""
     i=int(i)
-    moveb=1
-    b_no=0
-    while (moveb <= i and size==0) or (b_no < size):
-        yield (b_no, 1 if (moveb&i) else 0)
-        moveb<<=1
-        b_no+=1
+    res=[]
+    ba=0
+    while i:
+        res += [ba+b for b in bitpos8[i & 255]]
+        i>>=8
+        ba+=8
+    return res
 
 def sumbit(i):
     r""":returns: sum of bits in an integer"""
-    return sum(iterbit(i))
+    i=int(i)
+    return popcount(i) if i > 0 else 0
+
+def sumbit_vec(a):
+    r""":returns: array of bit sums for a non negative integer array a"""
+    a=np.asarray(a, dtype=np.int64)
+    res=np.zeros(a.shape, dtype=np.int64)
+    while a.any():
+        res+=popcnt8[a & 255]
+        a=a >> 8
+    return res
 
 def strbit32(i):
     r""":returns: a string of 0-1s (in chunk of 4) in an 32 bit integer"""
@@ -75,10 +101,13 @@ def strbit32(i):
     return res
 def strbit(i,size=0):
     r""":returns: the lowest part of integer as string binary representation"""
-    return ''.join(('1' if b else '0') for b in iterbit(i,size) )[::-1]
+    i=int(i)
+    if size > 0:
+        return format(i & ((1<<size)-1), "0%db"%size)
+    return bin(i)[2:] if i > 0 else ""
 def rstrbit(i,size=0):
     r""":returns: the integer as reversed string binary representation. The lowest bit is on the left side"""
-    return ''.join(('1' if b else '0') for b in iterbit(i,size) )
+    return strbit(i,size)[::-1]
 
 def setbit32(i, nb):
     r"""set a bit number nb (0 based) in an integer i"""
@@ -110,9 +139,40 @@ def valval(o, keepNone=True):
 
 def join(c, l, p='', s='', a='', width: int = 0, break_long_words: bool = False):
     r"""join the items of the list (or iterator) l separated by c. Each item is prefixed with p and suffixed with s. If the join result is empty for any reason, an alternative a is returned. p, s and a are optional.
-    if width is integer > 0, then textwrap.fill() is used to wrap the result with textwrap.fill(res, width, break_long_lines)."""
-    res=c.join(p+str(i)+s for i in l) or a
-    return res if width <= 0 else fill(res, width=width, break_long_words=break_long_words)
+    if width is integer > 0, then the result is wrapped in lines of at most width characters (cf. wrapjoin()).
+    With break_long_words=True, textwrap.fill(res, width, break_long_words) is used instead."""
+    if width <= 0:
+        return c.join(p+str(i)+s for i in l) or a
+    if break_long_words:
+        return fill(c.join(p+str(i)+s for i in l) or a, width=width, break_long_words=True)
+    return "".join(wrapjoin(c, l, p, s, width)) or a
+def wrapjoin(c, l, p='', s='', width=120):
+    r"""generator of chunks of joined items of l (cf. join()) wrapped in lines of at most width characters.
+    Lines are broken only between items and only if the separator c ends with white spaces which are replaced by a new line.
+    Items longer than width are put on their own line. Items are processed one by one, so the whole joined string is never built."""
+    cs=c.rstrip()
+    brk=len(cs) < len(c)
+    n=-1 # current line length (-1 for no item yet)
+    for i in l:
+        it=p+str(i)+s
+        if n < 0:
+            n=len(it)
+            yield it
+        elif brk and n+len(c)+len(it)+len(cs) > width:
+            n=len(it)
+            yield cs+"\n"+it
+        else:
+            n+=len(c)+len(it)
+            yield c+it
+def fjoin(f, c, l, p='', s='', a='', width=120):
+    r"""write join(c, l, p, s, a, width) to the file f chunk by chunk (cf. wrapjoin())"""
+    empty=True
+    for ch in wrapjoin(c, l, p, s, width) if width > 0 else (c*(ii > 0)+p+str(i)+s for (ii,i) in enumerate(l)):
+        if ch:
+            empty=False
+            f.write(ch)
+    if empty:
+        f.write(a)
 def joint(c,l,p='',s='',a=''):
     r"""join "true" items of the list (or iterator) l separated by c. Each item is prefixed with p and suffixed with s. If the join result is empty for any reason, an alternative a is returned. p, s and a are optional"""
     i=0
@@ -139,17 +199,25 @@ def strbit2int(s):
 
 def setcharbit(s,ch,i):
     r"""set character ch in a string s everywhere a corresponding bit of i is set"""
-    res=''.join((ch if b else s[-b_no-1]) for (b_no,b) in iternumbit(i))
-    #print 'in:', s, ch, strbit(i)
-    #print 'r', res
-    res=s[:len(s)-len(res)]+res[::-1]
-    #print 'final', res
-    return res
+    n=len(s)
+    l=list(s)
+    for b_no in bitpos(i):
+        if b_no >= n:
+            raise IndexError("setcharbit: bit %d of %d is out of string '%s'"%(b_no, i, s))
+        l[n-b_no-1]=ch
+    return "".join(l)
 
 def expandbit(i,pos):
     r"""copy bits set to 1 in i to the result position given in the list pos. length of pos must be greater or equal to bitlength of i"""
-    #print i, pos;##
-    return sum(b<<pos[b_no] for (b_no,b) in iternumbit(i))
+    return sum(1<<pos[b_no] for b_no in bitpos(i))
+
+def expandbit_vec(a,pos):
+    r"""vectorized expandbit() for a non negative integer array a"""
+    a=np.asarray(a, dtype=np.int64)
+    res=np.zeros(a.shape, dtype=np.int64)
+    for (b_no,p) in enumerate(pos):
+        res+=((a>>b_no) & 1)<<p
+    return res
 
 def isstr(s):
     r""":returns: True if the argument is a string"""
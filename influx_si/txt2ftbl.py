@@ -15,13 +15,17 @@ from pathlib import Path
 import pandas as pa
 import numpy as np
 import stat
+import time
 import argparse
 import datetime as dt
 from scipy import linalg
 from numpy import diag
-from multiprocessing import Pool, cpu_count, Manager
+from multiprocessing import Pool, cpu_count, get_start_method
 import influx_si
-from C13_ftbl import formula2dict, eval_expr
+import ftbl_cache
+import stage_trace
+import py_prof
+from C13_ftbl import formula2dict, eval_expr, ftbl_text
 from tools_ssg import valval, parse_version
 
 if parse_version(np.__version__) < (2,):
@@ -35,6 +39,8 @@ version=influx_si.__version__
 me="txt2ftbl"
 LOCAL_TIMEZONE=dt.datetime.now(dt.timezone.utc).astimezone().tzinfo
 invcomp={">=": "<=", "=>": "<=", "<=": ">=", "=<": ">="}
+# parsed input files of the current run (cf. cached_parse())
+pcache={}
 
 def natural_sort_key(s, _re=re.compile(r'(\d+)')):
     # last 2 fields are inverted for sorting
@@ -51,6 +57,15 @@ def warn(mes):
     sys.stderr.write(f"Warning! {me}: {mes}\n")
 def usage():
     sys.stderr.write(__doc__+"\n")
+def num_expr(s, skip=()):
+    """Convert a Series of strings s to floats (NaN if not possible).
+    Cells which are not plain numbers are evaluated as python expressions (cf. eval_expr())
+    unless their lower case is in skip."""
+    val=pa.to_numeric(s, errors="coerce").astype(float)
+    ie=np.where(val.isna() & ~s.str.lower().isin(skip))[0]
+    if len(ie):
+        val.iloc[ie]=pa.to_numeric(pa.Series([eval_expr(v) for v in s.iloc[ie]], dtype=object), errors="coerce").to_numpy(dtype=float)
+    return val
 def itvl2li(v):
     "convert interval like '2-5'  to ['2', '3', '4', '5']"
     li=v.split("-")
@@ -77,27 +92,28 @@ def dfconcat(df1, df2, **kw):
     else:
         return df1
 def tsv2df(f, sep="\t", comment="#", skip_blank_lines=True, append_iline="iline", encodings=["UTF-8", "windows-1250", "windows-1252"]):
-    "Read file 'f' as TSV and return a DataFrame. Separator is 'sep', comment char is 'comment', blank lines are skept, header is in the first row, file line numbers are stored in a column 'line_nb' if there is no a column with this name"
+    """Read file 'f' as TSV and return a DataFrame. Separator is 'sep', comment char is 'comment', blank lines are skept, header is in the first row, file line numbers are stored in a column 'line_nb' if there is no a column with this name.
+    The file is read once and decoded with the first fitting encoding. Columns are built in one pass (linear time in file size)."""
     if type(f) == str or type(f) == type(Path()):
+        b=Path(f).read_bytes()
         for i,e in enumerate(encodings):
             try:
-                li=Path(f).open(encoding=e).read().splitlines()
+                li=b.decode(e).splitlines()
                 break
             except UnicodeDecodeError:
-                if i == len(encodings):
+                if i == len(encodings)-1:
                     # it was the last chance
-                    raise()
-                else:
-                    continue
+                    raise
     else:
-        li=f.readlines
-    rows=np.array([], dtype=object)
-    irow=0
+        li=f.read().splitlines()
+    cols=None # list of columns
     cnm=[] # col names
     for ili,row in enumerate(li):
         # remove comments
         if comment:
-            row=re.sub("%s.*$"%comment, "", row)
+            ic=row.find(comment)
+            if ic >= 0:
+                row=row[:ic]
         if skip_blank_lines and not row.strip():
             continue
         if not cnm:
@@ -108,12 +124,10 @@ def tsv2df(f, sep="\t", comment="#", skip_blank_lines=True, append_iline="iline"
                     cnm.append(append_iline)
                 else:
                     append_iline=False
-            rows=np.empty((0, len(cnm)), dtype=object)
+            cols=[[] for v in cnm]
             continue
         # append rows
-#        if ili == 175:
-#            import pdb; pdb.set_trace()
-        rli=[v.strip() for i,v in enumerate(row.split(sep))]
+        rli=[v.strip() for v in row.split(sep)]
         if len(rli) > ncol and all(len(v) == 0 for v in rli[ncol:]):
             rli=rli[:ncol]
         if len(rli) != ncol:
@@ -121,9 +135,13 @@ def tsv2df(f, sep="\t", comment="#", skip_blank_lines=True, append_iline="iline"
             df.columns=list(range(1, len(rli)+1))
             werr("tsv2df: wrong column number %d, expected %d (%s: %d)\n%s"%(len(rli), ncol, f, ili+1, df.to_string(index=False)))
         if append_iline:
-            rli.append(ili+1)
-        rows=np.vstack((rows, rli))
-    df=pa.DataFrame(rows)
+            rli.append(str(ili+1))
+        for c,v in zip(cols, rli):
+            c.append(v)
+    if cols is None:
+        # no header
+        return pa.DataFrame(np.array([], dtype=object))
+    df=pa.DataFrame(dict(enumerate(np.array(c, dtype=object) for c in cols)))
     if len(df.columns) == len(cnm) and len(cnm) > 0:
         df.columns=cnm
     return df
@@ -149,6 +167,23 @@ def try_ext(f, li):
     else:
         raise Exception("try_ext: unknown type of 'f'. Expecting 'str' or 'Path'.")
     
+def _argkey(v):
+    "Hashable form of parser argument v"
+    if isinstance(v, dict):
+        return tuple(sorted(v.items()))
+    elif isinstance(v, (set, frozenset)):
+        return frozenset(v)
+    return v
+def cached_parse(fparse, pth, *args, **kw):
+    """Return the result of fparse() called on pth and other arguments. It is kept in 'pcache' for the current run and
+    reused while file 'pth' (resolved path) has the same mtime and size and arguments are the same.
+    Cached results are shared so they must not be modified."""
+    st=pth.stat()
+    key=(fparse.__name__, str(pth.resolve()), st.st_mtime_ns, st.st_size,
+        tuple(_argkey(v) for v in args), tuple(sorted((k, _argkey(v)) for k,v in kw.items())))
+    if key not in pcache:
+        pcache[key]=fparse(pth, *args, **kw)
+    return pcache[key]
 def revineq(ine):
     rev={">": "<", "<": ">", "=": "="}
     return "".join(rev[c] for c in ine)
@@ -414,19 +449,21 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
     # column: Value (empty, numeric or python expression giving a float)
     # check that non emty entries in 'Value' are NA, valid numbers or python expression giving a float
     #import pdb; pdb.set_trace()
-    val=pa.to_numeric(pa.Series(eval_expr(v) if v else "" for v in df.Value), errors="coerce")
+    val=num_expr(df.Value, skip=("", "na"))
     ibad=np.where(val.isna() & (df.Value.str.len() > 0) & ~(df.Value.str.lower() == "na"))[0]
     if len(ibad):
         werr("parse_miso: Column 'Value' must be one of\n - numeric value\n - python expression evaluationg to float number\n - NA (as not available) or\n - be emty,\ngot '%s' instead, in '%s': %s"%(df.iloc[ibad[0]].Value, fname, df.iloc[ibad[0]].iline))
     # column: SD (numeric or python expression giving a float)
     # check that entries in 'SD' are valid numbers or python expressions giving a float
     #import pdb; pdb.set_trace()
-    val=pa.to_numeric(pa.Series(eval_expr(v) for v in df.SD), errors="coerce")
+    val=num_expr(df.SD)
     ibad=np.where(val.isna())[0]
     if len(ibad):
         werr("parse_miso: Column 'SD' must be one of\n - numeric value\n - python expression evaluationg to float number\ngot '%s' instead, in '%s': %s"%(df.iloc[ibad[0]].SD, fname, df.iloc[ibad[0]].iline))
     # column: Fragment (either '1,2,4-6' or empty)
-    ibad=np.where([not (len(v) == 0 or v.lower() == "mean" or all(it.isnumeric() or (len(it.split("-")) == 2 and all(subit.isnumeric() for subit in it.split("-"))) for it in v.split(","))) for v in df.Fragment])[0]
+    # checked once per distinct value
+    badfrag=[v for v in df.Fragment.unique() if not (len(v) == 0 or v.lower() == "mean" or all(it.isnumeric() or (len(it.split("-")) == 2 and all(subit.isnumeric() for subit in it.split("-"))) for it in v.split(",")))]
+    ibad=np.where(df.Fragment.isin(badfrag))[0]
     if len(ibad):
         werr("parse_miso: Column 'Fragment' must be one of\n - list of integers or intervals '1,2,4-6,9'\n - be emty,\ngot '%s' instead, in '%s': %s"%(df.iloc[ibad[0]].Fragment, fname, df.iloc[ibad[0]].iline))
     # column: Isospecie is checked in subgroups
@@ -446,6 +483,20 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
         if "Time" in df and sum(df["Time"] == "") == 0:
             werr("parse_miso: we are in stationary case but 'Time' column is not empty in '%s'"%fname)
         df=df[df["Time"] == ""] if "Time" in df else df
+    # columns as arrays indexed by group positions
+    df=df.reset_index(drop=True)
+    a_iline=df["iline"].to_numpy()
+    a_val=df["Value"].to_numpy()
+    a_sdv=df["SD"].to_numpy()
+    a_iso=df["Isospecies"].to_numpy()
+    a_time=df["Time"].to_numpy() if "Time" in df else np.full(len(df), "", dtype=object)
+    # kind of isospecies for all rows at once
+    iso=df["Isospecies"]
+    is_ms=iso.str.match(r"^ *M\d+ *$").to_numpy(dtype=bool)
+    is_lab=iso.str.match(r"^[ 01x+]+$").to_numpy(dtype=bool)
+    is_peak=iso.str.contains("->", regex=False).to_numpy(dtype=bool)
+    is_peaku=iso.str.contains("→", regex=False).to_numpy(dtype=bool)
+    kin=[] # rows of df_kin
     # split into kind of measurements: ms, peak, lab
     last_met=last_frag=last_dset=""
     cgr=1
@@ -456,6 +507,7 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
         #   for all times for a given metab fragment
         #print("gr=", kgr, ligr)
         met,frag,dset=kgr # met can be a+b+ c
+        ligr=ligr.to_numpy()
         tmp=set(map(str.strip, met.split("+")))
         bad=tmp-itnal_met
         if bad:
@@ -463,8 +515,8 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
             continue
         #if met == "M_accoa_c":
             #pdb.set_trace()
-        ist=int(df.loc[ligr[0], "iline"])
-        iend=int(df.loc[ligr[-1], "iline"])
+        ist=int(a_iline[ligr[0]])
+        iend=int(a_iline[ligr[-1]])
         if not met:
             werr("parse_miso: metabolite name is missing in '%s':%d\n%s"%(fname, ist, "\t".join(df.loc[ligr[0], :])))
         mets=np.array([v.strip() for v in met.split("+")]) # met can be A+B+C, take just the first name
@@ -499,21 +551,21 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
             ffrag=""
         else:
             ffrag=frag.replace("-", "~")
-        val=df.loc[ligr, "Value"].to_numpy()
-        sdv=df.loc[ligr, "SD"].to_numpy()
+        val=a_val[ligr]
+        sdv=a_sdv[ligr]
         # detect kind of species
-        spec=df.loc[ligr, "Isospecies"]
-        if all(spec.str.match(r"^ *M\d+ *$")):
+        spec=a_iso[ligr]
+        if is_ms[ligr].all():
             kind="ms"
-        elif all(spec.str.match(r"^[ 01x+]+$")):
+        elif is_lab[ligr].all():
             kind="lab"
-        elif all(spec.str.contains("->")):
+        elif is_peak[ligr].all():
             sep="->"
             kind="peak"
-        elif all(spec.str.contains("→")):
+        elif is_peaku[ligr].all():
             sep="→"
             kind="peak"
-        elif len(ligr) == 1 and spec.iloc[0] == "mean":
+        elif len(ligr) == 1 and spec[0] == "mean":
             kind="mean"
         else:
             werr("parse_miso: unknown Isospecies '%s' in group %s in '%s': %d-%d"%(kgr, ", '".join(spec), fname, ist, iend))
@@ -521,21 +573,25 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
             dsp=dict() # {specie: times indexes}, e.g. "M0": vec("0.1", "0.2", ...)
             spli=[]
             ii0=[]
-            dfgr=df.loc[ligr,:]
-            for sp, spi in dfgr.groupby(["Isospecies"]).groups.items():
+            # isospecies in sorted order with their first position in ligr
+            usp,ifirst,inv=np.unique(spec.astype(str), return_index=True, return_inverse=True)
+            inv=inv.reshape(-1)
+            timed=(a_time[ligr] != "").any()
+            for k,sp in enumerate(usp):
+                spi=ligr[inv == k]
                 dsp[sp]=spi
                 spli.append(sp)
-                ii0.append(np.where(ligr == spi[0])[0][0])
+                ii0.append(ifirst[k])
                 # check that all SD are the same for all time points
-                u=np.unique(df.loc[spi, "SD"])
+                u=np.unique(a_sdv[spi])
                 if len(u) != 1:
-                    werr(f"parse_miso: SD must be the same at all time points for {kgr}, {sp}: '{fname}': "+", ".join(df.loc[spi, "iline"]))
+                    werr(f"parse_miso: SD must be the same at all time points for {kgr}, {sp}: '{fname}': "+", ".join(a_iline[spi]))
             ii0=sorted(ii0) # index in ligr with Time=min
             #pdb.set_trace()
         if kind == "ms":
             # ms group here, like M0, M1
             #print("ms gr=", kgr)
-            w=np.char.lstrip(df.loc[ligr, "Isospecies"].to_numpy().astype("str"), " M").astype(int)
+            w=np.char.lstrip(spec.astype("str"), " M").astype(int)
             # ms sanity check
             if any(w > flen):
                 werr("parse_miso: invalid MS weight '%s' in group %s in '%s':%d-%d"%(w[w>flen].astype(str)[0], kgr, fname, ist, iend))
@@ -546,20 +602,20 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
             #    frag=",".join(str(i) for i in range(1,flen+1))
             if case_i:
                 res["ms"] += [f"\t{met}\t{ffrag}\t{w[0]}\tNA\t{sdv[0]}"+"   // %s: %d"%(fname, ist)]
-                res["ms"] += [f"\t\t\t{w[i0]}\tNA\t{sdv[i0]}"+"   // %s: %s"%(fname, df.loc[ligr[i0], "iline"]) for i,i0 in zip(range(1, len(spli)), ii0[1:])]
+                res["ms"] += [f"\t\t\t{w[i0]}\tNA\t{sdv[i0]}"+"   // %s: %s"%(fname, a_iline[ligr[i0]]) for i,i0 in zip(range(1, len(spli)), ii0[1:])]
                 #pdb.set_trace()
-                if not dfgr[dfgr["Time"] != ""].empty:
+                if timed:
                     for sp,spi in dsp.items():
-                        df_kin=dfconcat(df_kin, pa.DataFrame(df.loc[spi, "Value"].to_numpy().reshape(1, -1), columns=df.loc[spi, "Time"], index=[f"m:{met}:{ffrag}:{sp[1:]}:{df.loc[spi[0],'iline']}"]))
+                        kin.append((f"m:{met}:{ffrag}:{sp[1:]}:{a_iline[spi[0]]}", spi))
             else:
                 #if met == "Phe":
                     #pdb.set_trace()
                 res["ms"] += [f"\t{met}\t{ffrag}\t{w[0]}\t{val[0]}\t{sdv[0]}"+"   // %s: %d"%(fname, ist)]
-                res["ms"] += [f"\t\t\t{w[i]}\t{val[i]}\t{sdv[i]}"+"   // %s: %s"%(fname, df.loc[ligr[i], "iline"]) for i in range(1, len(ligr))]
+                res["ms"] += [f"\t\t\t{w[i]}\t{val[i]}\t{sdv[i]}"+"   // %s: %s"%(fname, a_iline[ligr[i]]) for i in range(1, len(ligr))]
         elif kind == "lab" or kind == "mean":
             # label group (like 01x+1x1)
             if kind == "lab":
-                labs=[[vv.strip() for vv in v.split("+")] for v in df.loc[ligr, "Isospecies"]]
+                labs=[[vv.strip() for vv in v.split("+")] for v in spec]
             elif kind == "peak":
                 b=np.ones(mlen, str) # base where lab will be injected
                 b.fill("x")
@@ -582,16 +638,15 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
             for i,li in enumerate(labs):
                 for v in li:
                     if len(v) != flen:
-                        werr("parse_miso: entry '%s' has length %d different from fragment length %d, '%s': %s"%(v, len(v), flen, fname, df.loc[ligr[i], "iline"]))
+                        werr("parse_miso: entry '%s' has length %d different from fragment length %d, '%s': %s"%(v, len(v), flen, fname, a_iline[ligr[i]]))
             # inject fragment species into full molecule
             if flen < mlen:
-                b=np.ones(mlen, str) # base where lab will be injected
-                b.fill("x")
+                # position in full molecule of each fragment atom
+                pos=np.full(mlen, -1)
+                pos[ifr]=np.arange(flen)
                 for li in labs:
                     for i in range(len(li)):
-                        tmp=b.copy()
-                        tmp[ifr]=list(li[i])
-                        li[i]="".join(tmp)
+                        li[i]="".join("x" if j < 0 else li[i][j] for j in pos)
             # normalize or not?
             collab=sorted(v for li in labs for v in li) # will be collapsed labels.
             # the group is normalizable if collapsed labs is composed of only "x"
@@ -622,11 +677,11 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
             #   META_NAME   CUM_GROUP   VALUE   DEVIATION   CUM_CONSTRAINTS
             if case_i:
                 res["lab"] += [f"\t{met}\t1\t{val[0]}\t{sdv[0]}\t"+"+".join("#"+v for v in labs[0])+"   // %s: %d"%(fname, ist)]
-                res["lab"] += [f"\t\t{i+1 if norma else 1}\t{val[i0]}\t{sdv[i0]}\t"+"+".join("#"+v for v in labs[i0])+"   // %s: %s"%(fname, df.loc[ligr[i0], "iline"]) for i,i0 in zip(range(1, len(spli)), ii0[1:])]
-                if not dfgr[dfgr["Time"] != ""].empty:
+                res["lab"] += [f"\t\t{i+1 if norma else 1}\t{val[i0]}\t{sdv[i0]}\t"+"+".join("#"+v for v in labs[i0])+"   // %s: %s"%(fname, a_iline[ligr[i0]]) for i,i0 in zip(range(1, len(spli)), ii0[1:])]
+                if timed:
                     for i,(sp,spi) in enumerate(dsp.items()):
                         #pdb.set_trace()
-                        df_kin=dfconcat(df_kin, pa.DataFrame(df.loc[spi, "Value"].to_numpy().reshape(1, -1), columns=df.loc[spi, "Time"], index=[f"l:{met}:{'+'.join('#'+v for v in labs[0])}:{df.loc[spi[0],'iline']}"]))
+                        kin.append((f"l:{met}:{'+'.join('#'+v for v in labs[0])}:{a_iline[spi[0]]}", spi))
             else:
                 if met != last_met or frag != last_frag:
                     last_met=met
@@ -634,12 +689,12 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
                 elif dset != last_dset:
                     last_dset=dset
                 res["lab"] += [f"\t{met}\t{cgr}\t{val[0]}\t{sdv[0]}\t"+"+".join("#"+v for v in labs[0])+"   // %s: %d"%(fname, ist)]
-                res["lab"] += [f"\t\t{i+cgr if norma else cgr}\t{val[i]}\t{sdv[i]}\t"+"+".join("#"+v for v in labs[i])+"   // %s: %s"%(fname, df.loc[ligr[i], "iline"]) for i in range(1, len(ligr))]
+                res["lab"] += [f"\t\t{i+cgr if norma else cgr}\t{val[i]}\t{sdv[i]}\t"+"+".join("#"+v for v in labs[i])+"   // %s: %s"%(fname, a_iline[ligr[i]]) for i in range(1, len(ligr))]
                 cgr += len(ligr) if norma else 1
         elif kind == "peak":
             #pdb.set_trace()
             # peak group here, like 2->1,3
-            icarb=np.fromiter(dsp.keys(), "S1024").astype("str") if case_i else df.loc[ligr, "Isospecies"].to_numpy().astype("str")
+            icarb=np.fromiter(dsp.keys(), "S1024").astype("str") if case_i else spec.astype("str")
             icarb=np.char.split(icarb, sep)
             icarb=[np.array([int(vv) if vv else 0 for v in item for vv in v.split(",")]) for item in icarb]
             # peak sanity check
@@ -661,16 +716,16 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
                 icarb[i][1:]=np.sort(icarb[i][1:]) # 2->3,1 => 2->1,3
                 if len(icarb[i]) == 2 and not icarb[i][1]:
                     icarb[i][1]=icarb[i][0]
-                suf=str(np.char.join("", (str(v) for v in icarb[i][1:]-prow["center"])))
+                suf="".join(str(v) for v in icarb[i][1:]-prow["center"])
                 prow["v"+suf]=val[i]
                 prow["dev"+suf]=sdv[i]
             if case_i:
                 res["peak"] += [f"\t{met}\t{prow['center']}\t{'NA' if prow['v0'] else ''}\t{'NA' if prow['v-1'] else ''}\t{'NA' if prow['v1'] else ''}\t{'NA' if prow['v-11'] else ''}\t\t{prow['dev0']}\t{prow['dev-1']}\t{prow['dev1']}\t{prow['dev-11']}"+"   // %s: %d"%(fname, ist)]
-                if not dfgr[dfgr["Time"] != ""].empty:
-                    rowid=0
+                if timed:
+                    rowid=None
                     for sp,spi in dsp.items():
                         #pdb.set_trace()
-                        if not rowid:
+                        if rowid is None:
                             rowid=spi[0]
                         # ptype is one of: S, D-, D+, DD
                         li=sp.split(sep)
@@ -684,7 +739,7 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
                             ptype="D-"
                         else:
                             ptype="D+"
-                        df_kin=dfconcat(df_kin, pa.DataFrame(df.loc[spi, "Value"].to_numpy().reshape(1, -1), columns=df.loc[spi, "Time"], index=[f"p:{met}:{prow['center']}:{ptype}:{df.loc[rowid,'iline']}"]))
+                        kin.append((f"p:{met}:{prow['center']}:{ptype}:{a_iline[rowid]}", spi))
             else:
                 res["peak"] += [f"\t{met}\t{prow['center']}\t{prow['v0']}\t{prow['v-1']}\t{prow['v1']}\t{prow['v-11']}\t\t{prow['dev0']}\t{prow['dev-1']}\t{prow['dev1']}\t{prow['dev-11']}"+"   // %s: %d"%(fname, ist)]
 
@@ -692,6 +747,16 @@ def parse_miso(fmiso, clen, case_i=False, itnal_met=set()):
         #breakpoint()
         warn("parse_miso: the following metabolites are ignored as non internal to the network (%s):\n\t"%fname+"\n\t".join(sorted(ignored_metab)))
     if case_i:
+        # one row per timed isospecies, time moments in order of appearance
+        if kin:
+            tcol=dict()
+            for (nm,spi) in kin:
+                for t in a_time[spi]:
+                    tcol.setdefault(t, len(tcol))
+            m=np.full((len(kin), len(tcol)), np.nan, dtype=object)
+            for i,(nm,spi) in enumerate(kin):
+                m[i, [tcol[t] for t in a_time[spi]]]=a_val[spi]
+            df_kin=pa.DataFrame(m, index=[nm for (nm,spi) in kin], columns=list(tcol))
         # reorder time moments in df_kin
         #pdb.set_trace()
         cols = sorted(df_kin.columns.tolist(), key=lambda x: float(x))
@@ -874,8 +939,10 @@ def parse_mmet(f, smet=set()):
         res.append("\t%s\t%s\t%s   // %s: %s"%(met, df.loc[ligr[0], "Value"], df.loc[ligr[0], "SD"], fname, il[0]))
     return res
 
-def compile(mtf, cmd, case_i=False, clen=None, itnal_met=set()):
+def compile(mtf, cmd, case_i=False, clen=None, itnal_met=None):
     "Compile FTBL content from mtf names: netw, miso etc. Return a dict of ftbl lines"
+    if itnal_met is None:
+        itnal_met=set()
     # dict of ftbl sections. Contains list of lines to be completed by compilation
     dsec={
         "proj": [
@@ -984,7 +1051,7 @@ def compile(mtf, cmd, case_i=False, clen=None, itnal_met=set()):
     # Parse netw file if not empty
     if "netw" in mtf and mtf["netw"]:
         pth=try_ext(mtf["netw"], ["netw", "txt"])
-        (netw, notr_netw, eqs, ineqs, fluxes, (m_left, m_right), sto, dclen)=txt_parse(pth)
+        (netw, notr_netw, eqs, ineqs, fluxes, (m_left, m_right), sto, dclen)=cached_parse(txt_parse, pth)
         #pdb.set_trace()
         # build afl matrix: each row is a balance on an internal metabolite, each column is a flux values
         nb_flux=len(sto)
@@ -1081,7 +1148,7 @@ def compile(mtf, cmd, case_i=False, clen=None, itnal_met=set()):
     sfl=set(sto.keys()) # set of fluxes
     if "cnstr" in mtf and mtf["cnstr"]:
         pth=try_ext(mtf["cnstr"], ["cnstr", "tsv", "txt"])
-        ce,ci,df=parse_cnstr(pth)
+        ce,ci,df=cached_parse(parse_cnstr, pth)
         for k,v in ce.items():
             dsec["eq"][1][k] += v
         for k,v in ci.items():
@@ -1095,10 +1162,10 @@ def compile(mtf, cmd, case_i=False, clen=None, itnal_met=set()):
     if "miso" in mtf and mtf["miso"]:
         pth=try_ext(mtf["miso"], ["miso", "tsv", "txt"])
         if case_i:
-            meas, df_kin=parse_miso(pth, dclen, case_i=case_i, itnal_met=itnal_met)
+            meas, df_kin=cached_parse(parse_miso, pth, dclen, case_i=case_i, itnal_met=itnal_met)
             #import pdb; pdb.set_trace()
         else:
-            meas=parse_miso(pth, dclen, itnal_met=itnal_met)
+            meas=cached_parse(parse_miso, pth, dclen, itnal_met=itnal_met)
         dsec["meas_peak"] += meas["peak"]
         dsec["meas_lab"] += meas["lab"]
         dsec["meas_ms"] += meas["ms"]
@@ -1108,20 +1175,20 @@ def compile(mtf, cmd, case_i=False, clen=None, itnal_met=set()):
     # simple sections
     if "linp" in mtf and mtf["linp"]:
         pth=try_ext(mtf["linp"], ["linp", "tsv", "txt"])
-        dsec["linp"] += parse_linp(pth, dclen)
+        dsec["linp"] += cached_parse(parse_linp, pth, dclen)
     if "mflux" in mtf and mtf["mflux"]:
         pth=try_ext(mtf["mflux"], ["mflux", "tsv", "txt"])
-        dsec["mflux"] += parse_mflux(pth, sfl)
+        dsec["mflux"] += cached_parse(parse_mflux, pth, sfl)
     if "mmet" in mtf and mtf["mmet"]:
         pth=try_ext(mtf["mmet"], ["mmet", "tsv", "txt"])
-        dsec["mmet"] += parse_mmet(pth, lab_met)
+        dsec["mmet"] += cached_parse(parse_mmet, pth, lab_met)
     if "opt" in mtf and mtf["opt"]:
         pth=try_ext(mtf["opt"], ["opt", "tsv", "txt"])
-        dsec["opt"] += parse_opt(pth)
+        dsec["opt"] += cached_parse(parse_opt, pth)
     # with subsections NET/XCH/...
     if "tvar" in mtf and mtf["tvar"]:
         pth=try_ext(mtf["tvar"], ["tvar", "tsv", "txt"])
-        tf,tm=parse_tvar(pth, sfl, dclen)
+        tf,tm=cached_parse(parse_tvar, pth, sfl, dclen)
         #pdb.set_trace()
         stvar=dict((nx, dict((it[0], [it[1], it[2]]) for it in map(str.split, li))) for nx,li in tf.items())
         if "NET" in tf:
@@ -1171,14 +1238,47 @@ def compile(mtf, cmd, case_i=False, clen=None, itnal_met=set()):
         dfdef[k]=df.sort_values(defsort[k])
     return (dsec, dclen, dfdef, itnal_met) if not case_i else (dsec, dclen, dfdef, itnal_met, df_kin)
 #@background
-def work_compile(ftbl, ligr, vdf, mtf, force, case_i, cmd, prl, scre, scred, mpvar):
-    il=vdf.loc[ligr, "iline"].to_numpy() # strings
+def reuse_ftbl(ftbl, dig, prl, case_i, dirres=""):
+    """Check if FTBL file 'ftbl' with input digest 'dig' in its header and its parallel FTBLs from 'prl'
+    (and their .ikin files if case_i) exist from a previous run.
+    They can be found in place or in <dirres>/tmp where influx_si moves them after a run,
+    in which case they are moved back. Return True if they can be reused."""
+    if dirres == "default":
+        dtmp=[ftbl.parent/(ftbl.stem+"_res")/"tmp"]
+    elif dirres:
+        dtmp=[Path(dirres)/"tmp"]
+    else:
+        dtmp=[]
+    fp=ftbl_cache.find_digest(ftbl, dig, dtmp)
+    if fp is None:
+        return False
+    # (source, destination) pairs
+    li=[(fp, ftbl)]+[(p if fp == ftbl else fp.parent/p.name, p) for p in (Path(d["ftbl"]).resolve() for d in prl)]
+    if case_i:
+        for (src,dst) in li.copy():
+            if not src.is_file():
+                return False
+            m=re.search(r"^\tfile_labcin\t(\S+\.ikin)", src.read_text(encoding="UTF-8", errors="replace"), re.MULTILINE)
+            if m:
+                li.append((src.parent/m.group(1), dst.parent/m.group(1)))
+    if not all(src.is_file() for (src,dst) in li):
+        return False
+    for (src,dst) in li:
+        if src != dst:
+            src.chmod(src.stat().st_mode | stat.S_IWRITE)
+            src.replace(dst)
+    return True
+
+def work_compile(ftbl, il, row, mtf, force, case_i, cmd, prl, scre, dirres=""):
+    """Compile FTBL 'ftbl' from vmtf row 'row' (dict) found at file lines 'il' (strings).
+    Return a tuple (FTBL name, list of its parallel FTBLs, {path: DataFrame} of default mtf to write).
+    Nothing is shared with other workers, results are gathered by main()."""
     # sanity check
-    if len(ligr) > 1:
+    if len(il) > 1:
         werr("'ftbl' column has repeated values in '%s': %s"%(mtf["vmtf"], ", ".join(il)))
     # prepare running mtf, full mtf for one row
     rmtf=mtf.copy()
-    rmtf.update((k,v) for k,v in vdf.iloc[ligr[0], :].to_dict().items() if v)
+    rmtf.update((k,v) for k,v in row.items() if v)
 
     # what kind of output we have?
     p=Path(ftbl)
@@ -1194,6 +1294,30 @@ def work_compile(ftbl, ligr, vdf, mtf, force, case_i, cmd, prl, scre, scred, mpv
             with ftbl.open(mode="rb") as fc:
                  if scre[:23] != fc.read(23).decode():
                      werr(f"cannot overwrite '{fc.name}' as not created by this script. Use '--force' to go through.")
+    # reuse FTBL of a previous run if its inputs are unchanged
+    dig=None
+    if ftbl != sys.stdout and rmtf.get("netw") != sys.stdin:
+        dig=ftbl_cache.inp_digest([v for (k,v) in sorted(rmtf.items()) if k not in ("ftbl", "iline")]+
+            [v for d in prl for (k,v) in sorted(d.items()) if k != "ftbl"],
+            [case_i, ftbl]+[d["ftbl"] for d in prl], src=[__file__])
+        if not force and reuse_ftbl(ftbl, dig, prl, case_i, dirres):
+            wd=Path(ftbl).resolve().parent
+            prl_li=[str(p.relative_to(wd) if case_i else p.relative_to(wd).with_suffix("")) for p in (Path(d["ftbl"]).resolve() for d in prl)]
+            print(f"{me}: inputs of '{ftbl}' are unchanged, its generation is skipped.")
+            return (str(ftbl), prl_li, {})
+    # stage timing trace if influx_s runs with --TIMEIT
+    if os.environ.get("INFLUX_SI_TRACE") and ftbl != sys.stdout:
+        stage_trace.trace_open(stage_trace.res_trace(ftbl, dirres))
+        t0=time.time()
+        c0=time.process_time()
+    else:
+        stage_trace.trace_close()
+    # python profiling if influx_s runs with --prof
+    if os.environ.get("INFLUX_SI_PROF") and ftbl != sys.stdout:
+        pr=py_prof.cProfile.Profile()
+        pr.enable()
+    else:
+        pr=None
     ftbl.parent.mkdir(parents=True, exist_ok=True)
     # compile ftbl dict 'dsec'
     # make prl relative to main ftbl
@@ -1278,39 +1402,47 @@ def work_compile(ftbl, ligr, vdf, mtf, force, case_i, cmd, prl, scre, scred, mpv
     # output ftbl
     out=ftbl.open("w", encoding="UTF-8") if type(ftbl) == type(Path()) else ftbl
     #print(("out=", out))
-    out.write(scre%dtstamp())
-    dsec2out(dsec, out)
+    try:
+        out.write(scre%dtstamp())
+        if dig:
+            # placeholder, the digest is written when the FTBL is complete
+            pos=out.tell()
+            out.write("// Input digest: %s\n"%("-"*len(dig)))
+        dsec2out(dsec, out)
+        if dig:
+            out.seek(pos)
+            out.write("// Input digest: %s\n"%dig)
+    except:
+        # do not leave a partial FTBL
+        if out is not ftbl:
+            out.close()
+            ftbl.unlink(missing_ok=True)
+        raise
     out.close()
     if case_i and type(ftbl) == type(Path()):
         from ftbl2labcin import main as renum
         renum([str(ftbl)])
-    with mpvar["lock"]:
-        mpvar["rf"].append(out.name)
-        if prl_li:
-            mpvar["pf"][out.name]=prl_li
-    
-    # output default mtf
-    for k,df in dfdef.items():
-        if len(df) == 0:
-            continue
-        #import pdb; pdb.set_trace()
-        p=Path(mtf["netw"]).with_suffix("."+k+".def")
-        with mpvar["lock"]:
-            if p in mpvar["sdef"]:
-                continue
-            with p.open("w", encoding="UTF-8") as fc:
-                fc.write(scred%dtstamp())
-                df.to_csv(fc, sep="\t", index=False)
-                if __name__ == "__main__":
-                    print(str(p))
-            mpvar["sdef"][p]=None
+    # FTBLs are rewritten in place, their cached text can be stale
+    ftbl_text.cache_clear()
+    if stage_trace.ftrace is not None:
+        stage_trace.event("txt2ftbl", t0, time.time()-t0, time.process_time()-c0)
+    if pr is not None:
+        pr.disable()
+        # merged with ftbl2optR profile by influx_s
+        py_prof.dump(pr, stage_trace.res_trace(ftbl, dirres, ".txt2ftbl.pstats"), txt=False)
+    # default mtf are written by main()
+    return (out.name, prl_li, dict((Path(mtf["netw"]).with_suffix("."+k+".def"), df) for k,df in dfdef.items() if len(df)))
+def work_star(args):
+    "Pool worker: args=(i, work_compile() args), return (i, result)"
+    return args[0], work_compile(*args[1:])
 
-def main(argv=sys.argv[1:], res_ftbl=None, prl_ftbl=None):
+def main(argv=sys.argv[1:], res_ftbl=None, prl_ftbl=None, dirres=""):
     """translate MTF file(s) to FTBL format
     :param argv: list of CLI options and their arguments
     :param res_ftbl: if not None, a list of produced FTBL files. In case of parallel experiments, only main FTBL are returned in this list
     :param prl_ftbl: if not None, a dict() showing which parallel FTBLs correspond to each main FTBL. Applicable only in case of parallel experiments
     :param np: if not None, a number of parallel processes to proceed multiple FTBL files.
+    :param dirres: result directory of influx_si ("default", "" or a path). FTBL files of a previous run moved to <dirres>/tmp are reused if their inputs are unchanged.
     :return code: integer 0 - OK; non 0 - error"""
     #print(["argv=", argv])
     ord_args=[]
@@ -1423,6 +1555,9 @@ detects if it was the creator of a file by searching for a string "//
 Created by 'txt2ftbl" at the first line of the file. By removing or 
 editing this comment, user can protect a file from a silent 
 overwriting.
+Without this option, a result FTBL file having in its header the same 
+"// Input digest" as the current inputs (MTF files, options, script 
+version) is not regenerated.
 """)
         parser.add_argument("--np", type=float, help=
 """When integer >= 1, it is a number of parallel subprocesses for 
@@ -1462,6 +1597,7 @@ is the argument value that will take precedence.
         np=int(round(np))
     else:
         np=avaco
+    pcache.clear()
 
     for o,a in ord_args:
         if o == "mtf":
@@ -1610,25 +1746,43 @@ is the argument value that will take precedence.
     # run through all ftbls
     if dftbl is not None:
         # add dftbl to all fields in vmtf
-        vdf[vdf != ""]=[dftbl/v for v in vdf[vdf != ""].values.flatten() if v == v]
+        for k in vdf.columns:
+            if k != "iline":
+                vdf[k]=[dftbl/v if v else v for v in vdf[k]]
     #print("len=", len(vdf))
-    # prepare multiproc framework
-    mpvar=dict()
-    manager=Manager()
-    mpvar["lock"]=manager.Lock()
-    mpvar["rf"]=manager.list()
-    mpvar["pf"]=manager.dict()
-    mpvar["sdef"]=manager.dict()
-    if np == 1 or len(vdf) == 1:
-        for ftbl,ligr in vdf.groupby(["ftbl"]).groups.items():
-            work_compile(ftbl, ligr, vdf, mtf, force, case_i, cmd, prl, scre, scred, mpvar)
+    # tasks: one per FTBL, workers get only their own vmtf row
+    ili=vdf.columns.get_loc("iline")
+    tasks=[(i, ftbl, vdf.iloc[ligr, ili].to_list(), vdf.iloc[ligr[0], :].to_dict(), mtf, force, case_i, cmd, prl, scre, dirres)
+        for i,(ftbl,ligr) in enumerate((ftbl, vdf.index.get_indexer(ligr)) for ftbl,ligr in vdf.groupby("ftbl").groups.items())]
+    res=[None]*len(tasks)
+    if np == 1 or len(tasks) == 1:
+        for t in tasks:
+            res[t[0]]=work_compile(*t[1:])
     else:
-        with Pool(np) as p:
-            p.starmap(work_compile, [(ftbl, ligr, vdf, mtf, force, case_i, cmd, prl, scre, scred, mpvar) for ftbl,ligr in vdf.groupby(["ftbl"]).groups.items()])
-    if type(res_ftbl) is list:
-        res_ftbl += list(mpvar["rf"])
-    if type(prl_ftbl) is dict:
-        prl_ftbl.update(mpvar["pf"])
+        if get_start_method() == "fork":
+            # the first FTBL is compiled here so that forked workers inherit its parsed inputs (cf. pcache)
+            t=tasks.pop(0)
+            res[t[0]]=work_compile(*t[1:])
+        # results come in completion order, they are put back in vmtf order
+        with Pool(min(np, len(tasks))) as p:
+            for i,r in p.imap_unordered(work_star, tasks, chunksize=max(1, len(tasks)//(4*np))):
+                res[i]=r
+    # gather results, the first default mtf for a given path is written
+    sdef=set()
+    for (fname, prl_li, defs) in res:
+        if type(res_ftbl) is list:
+            res_ftbl.append(fname)
+        if type(prl_ftbl) is dict and prl_li:
+            prl_ftbl[fname]=prl_li
+        for p,df in defs.items():
+            if p in sdef:
+                continue
+            with p.open("w", encoding="UTF-8") as fc:
+                fc.write(scred%dtstamp())
+                df.to_csv(fc, sep="\t", index=False)
+            if __name__ == "__main__":
+                print(str(p))
+            sdef.add(p)
     return 0
 if __name__ == "__main__":
     sys.exit(main())
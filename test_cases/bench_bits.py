@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks of bit utilities from tools_ssg against their former
+generator based implementations (*_ref() hereafter).
+
+Results are checked for equality on random integers. The script stops with
+an error if some result differs or if a function is slower than its
+reference by more than a factor given by --tol.
+
+Usage: bench_bits.py [-b 16] [-n 100000] [--tol 1.2]
+"""
+
+import sys, os
+import argparse
+import random
+import timeit
+import numpy as np
+from pathlib import Path
+
+dirpkg=Path(__file__).resolve().parent.parent
+if str(dirpkg) not in sys.path:
+    sys.path.insert(0, str(dirpkg))
+import influx_si
+import tools_ssg
+
+def iterbit_ref(i, size=0):
+    i=int(i)
+    moveb=1
+    b_no=0
+    while (moveb <= i and size==0) or (b_no < size):
+        yield (1 if (moveb&i) else 0)
+        moveb<<=1
+        b_no+=1
+def iternumbit_ref(i, size=0):
+    i=int(i)
+    moveb=1
+    b_no=0
+    while (moveb <= i and size==0) or (b_no < size):
+        yield (b_no, 1 if (moveb&i) else 0)
+        moveb<<=1
+        b_no+=1
+def sumbit_ref(i):
+    return sum(iterbit_ref(i))
+def strbit_ref(i,size=0):
+    return ''.join(('1' if b else '0') for b in iterbit_ref(i,size) )[::-1]
+def setcharbit_ref(s,ch,i):
+    res=''.join((ch if b else s[-b_no-1]) for (b_no,b) in iternumbit_ref(i))
+    return s[:len(s)-len(res)]+res[::-1]
+def expandbit_ref(i,pos):
+    return sum(b<<pos[b_no] for (b_no,b) in iternumbit_ref(i))
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-b", type=int, default=16, help="bit length of random integers")
+    parser.add_argument("-n", type=int, default=100000, help="number of random integers")
+    parser.add_argument("--tol", type=float, default=1.2, help="max tolerated ratio time/time_ref")
+    opts=parser.parse_args()
+    rnd=random.Random(7)
+    nb=opts.b
+    ints=[rnd.randrange(1<<nb) for i in range(opts.n)]
+    pos=rnd.sample(range(2*nb), nb)
+    s="x"*nb
+    cases=[
+        ("iterbit", lambda i: list(tools_ssg.iterbit(i)), lambda i: list(iterbit_ref(i))),
+        ("iterbit(size)", lambda i: list(tools_ssg.iterbit(i, nb)), lambda i: list(iterbit_ref(i, nb))),
+        ("iternumbit", lambda i: list(tools_ssg.iternumbit(i)), lambda i: list(iternumbit_ref(i))),
+        ("sumbit", tools_ssg.sumbit, sumbit_ref),
+        ("strbit", tools_ssg.strbit, strbit_ref),
+        ("strbit(size)", lambda i: tools_ssg.strbit(i, nb), lambda i: strbit_ref(i, nb)),
+        ("setcharbit", lambda i: tools_ssg.setcharbit(s, "1", i), lambda i: setcharbit_ref(s, "1", i)),
+        ("expandbit", lambda i: tools_ssg.expandbit(i, pos), lambda i: expandbit_ref(i, pos)),
+    ]
+    print("function\tref (s)\tnew (s)\tspeedup")
+    bad=[]
+    for (nm,fnew,fref) in cases:
+        if [fnew(i) for i in ints] != [fref(i) for i in ints]:
+            raise Exception("bench_bits: %s() results differ from reference"%nm)
+        tref=min(timeit.repeat(lambda: [fref(i) for i in ints], number=1, repeat=3))
+        tnew=min(timeit.repeat(lambda: [fnew(i) for i in ints], number=1, repeat=3))
+        print("%s\t%.3f\t%.3f\t%.1f"%(nm, tref, tnew, tref/tnew))
+        if tnew > opts.tol*tref:
+            bad.append(nm)
+    # bits beyond the string length raise IndexError like in reference
+    for f in (tools_ssg.setcharbit, setcharbit_ref):
+        try:
+            f("xxx", "1", 32)
+        except IndexError:
+            continue
+        raise Exception("bench_bits: %s('xxx', '1', 32) did not raise IndexError"%f.__name__)
+    # vectorized versions
+    a=np.array(ints, dtype=np.int64)
+    for (nm,fvec,fref) in (("sumbit_vec", tools_ssg.sumbit_vec, sumbit_ref),
+            ("expandbit_vec", lambda a: tools_ssg.expandbit_vec(a, pos), lambda i: expandbit_ref(i, pos))):
+        if fvec(a).tolist() != [fref(i) for i in ints]:
+            raise Exception("bench_bits: %s() results differ from reference"%nm)
+        tref=min(timeit.repeat(lambda: [fref(i) for i in ints], number=1, repeat=3))
+        tnew=min(timeit.repeat(lambda: fvec(a), number=1, repeat=3))
+        print("%s\t%.3f\t%.4f\t%.1f"%(nm, tref, tnew, tref/tnew))
+    if bad:
+        raise Exception("bench_bits: slower than reference: %s"%", ".join(bad))
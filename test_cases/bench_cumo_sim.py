@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Reference check and benchmark of stationary cumomer simulation cumo_sim.fwrv2rcumo().
+
+On each FTBL (ex_i_2box_var and e_coli from influx_si/test by default):
+ - fully labelled input must give all cumomer fractions equal to 1;
+ - reduced cumomers must be equal to the same cumomers of full system
+   built by C13_ftbl.cumo_sys_coo() (solved with random input labelling);
+ - a matrix of NCO flux vectors must give the same results as NCO single
+   flux vectors (timings of both are reported).
+Flux vectors are balanced: net fluxes are computed from free and constrained
+fluxes of the FTBL and scaled by a random positive factor, exchange fluxes are random.
+An exception is raised if results differ by more than TOL.
+
+Usage: bench_cumo_sim.py [-n NCO] [--tol TOL] [FTBL ...]
+"""
+
+import sys, os
+import argparse
+import random
+import time
+from pathlib import Path
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import spsolve
+
+import synth_net
+import C13_ftbl
+import cumo_sim
+
+dirtest=Path(synth_net.dirpkg)/"influx_si"/"test"
+
+def net_flux(netan):
+    "dict of net fluxes from free and constrained ones (dependent fluxes are solved from Afl)"
+    fl=dict(netan["flux_free"]["net"])
+    fl.update(netan["flux_constr"]["net"])
+    val=dict(("f.n."+k, v) for (k,v) in netan["flux_free"]["net"].items())
+    val.update(("f.x."+k, v) for (k,v) in netan["flux_free"]["xch"].items())
+    val.update(("c.n."+k, v) for (k,v) in netan["flux_constr"]["net"].items())
+    val.update(("c.x."+k, v) for (k,v) in netan["flux_constr"]["xch"].items())
+    bfl=np.array([sum(co*(1. if k == "" else val[k]) for (k,co) in d.items()) for d in netan["bfl"]])
+    if len(bfl):
+        dep=np.atleast_1d(spsolve(sp.csc_matrix(netan["Afl"]), bfl))
+        fl.update(zip(netan["vflux"]["net"], dep))
+    return fl
+
+def fwrv_rand(netan, rnd, nco):
+    "matrix (nb_fwrv x nco) of balanced fwd-rev flux vectors"
+    fl=net_flux(netan)
+    fwrv=netan["vflux_fwrv"]["fwrv"]
+    res=np.empty((len(fwrv), nco))
+    for ico in range(nco):
+        sc=rnd.uniform(0.5, 2.)
+        xch=dict((reac, 0. if reac in netan["flux_inout"] else rnd.uniform(0., 1.)) for reac in fl)
+        for (i,nm) in enumerate(fwrv):
+            reac=nm[4:]
+            v=sc*fl[reac]
+            res[i,ico]=xch[reac]+(max(v, 0.) if nm[:4] == "fwd." else max(-v, 0.))
+    return res
+
+def full_spr(netan):
+    "the same dict as cumo_sim.rcumo_spr() but for full cumomer system (cf. C13_ftbl.cumo_sys_coo())"
+    coo=netan["cumo_sys_coo"]
+    cinput=netan["cumo_input"][0] if netan["cumo_input"] else {}
+    ind_b=[np.array(b) for b in coo["b"]]
+    for b in ind_b:
+        # 1-based incu indexes -> 0-based
+        b[:,2:]-=1
+    return {
+        "vrcumo": list(C13_ftbl.valval(netan["vcumo"])),
+        "vinput": list(cinput.keys()),
+        "fwrv": netan["vflux_fwrv"]["fwrv"],
+        "incu0": np.array([1.]+[v if v == v else 0. for v in cinput.values()]),
+        "nb_c": coo["nb_c"],
+        "ind_a": [np.array(a) for a in coo["A"]],
+        "ind_b": ind_b,
+    }
+
+def set_input(spr, vinput, d):
+    "set input cumomers in spr['incu0'] from dict d"
+    for (i,c) in enumerate(vinput):
+        spr["incu0"][i+1]=d[c]
+
+def check(nm, x, xref, tol):
+    err=np.max(np.abs(x-xref), initial=0.)
+    if not err <= tol:
+        raise Exception("bench_cumo_sim: %s: max deviation %g > %g"%(nm, err, tol))
+    return err
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-n", type=int, default=50, help="number of flux vectors in a batch")
+    parser.add_argument("--tol", type=float, default=1.e-10, help="max tolerated deviation")
+    parser.add_argument("ftbl", nargs="*", default=[str(dirtest/"ex_i_2box_var.ftbl"), str(dirtest/"e_coli.ftbl")], help="FTBL files")
+    opts=parser.parse_args()
+    C13_ftbl.clownr=False
+    rnd=random.Random(7)
+    print("ftbl\tcumomers\tfull\tsingle (s)\tbatch (s)\tspeedup")
+    for f in opts.ftbl:
+        ftbl=C13_ftbl.ftbl_parse(f)
+        netan=dict()
+        try:
+            C13_ftbl.ftbl_netan(ftbl, netan, False, True, False, wout=lambda s: None, werr=lambda s: None)
+        except Exception:
+            # label input is a function of time (instationary FTBL)
+            netan=dict()
+            C13_ftbl.ftbl_netan(ftbl, netan, False, True, True, wout=lambda s: None)
+        C13_ftbl.rcumo_sys(netan)
+        spr=cumo_sim.rcumo_spr(netan)
+        sfull=full_spr(netan)
+        vinput=list(netan["rcumo_input"][0].keys()) if netan["rcumo_input"] else []
+        fwrv=fwrv_rand(netan, rnd, opts.n)
+        nm=Path(f).stem
+        # fully labelled input
+        set_input(spr, vinput, dict.fromkeys(vinput, 1.))
+        check(nm+": fully labelled input", cumo_sim.fwrv2rcumo(spr, fwrv[:,0]), 1., opts.tol)
+        # reduced vs full system
+        inp=dict((c, rnd.uniform(0., 1.)) for c in sfull["vinput"])
+        set_input(spr, vinput, inp)
+        set_input(sfull, sfull["vinput"], inp)
+        x=cumo_sim.fwrv2rcumo(spr, fwrv[:,0])
+        xfull=dict(zip(sfull["vrcumo"], cumo_sim.fwrv2rcumo(sfull, fwrv[:,0])))
+        check(nm+": reduced vs full system", x, np.array([xfull[c] for c in spr["vrcumo"]]), opts.tol)
+        # batch vs single
+        t0=time.perf_counter()
+        xs=np.column_stack([cumo_sim.fwrv2rcumo(spr, fwrv[:,i]) for i in range(opts.n)])
+        tsingle=time.perf_counter()-t0
+        t0=time.perf_counter()
+        xb=cumo_sim.fwrv2rcumo(spr, fwrv)
+        tbatch=time.perf_counter()-t0
+        check(nm+": batch vs single", xb, xs, opts.tol)
+        print("%s\t%d\t%d\t%.3f\t%.3f\t%.1f"%(nm, len(spr["vrcumo"]), len(sfull["vrcumo"]), tsingle, tbatch, tsingle/tbatch))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""End-to-end benchmark of ftbl2optR.main() on synthetic networks (cf. synth_net.py).
+
+R code is generated twice for each network size: with the former
+tools_ssg.join() wrapping lines by textwrap.fill() on the whole joined
+string ("fill") and with the current chunked wrapping (tools_ssg.wrapjoin()).
+On-disk cache of network analysis is disabled (--no-cache).
+The time of join() calls with width > 0 alone is also reported.
+
+Usage: bench_ftbl2optR.py [-n 250,1000] [-o DIR] [--emu]
+"""
+
+import sys, os
+import argparse
+import time
+from pathlib import Path
+from textwrap import fill
+
+import synth_net
+dirpkg=Path(__file__).resolve().parent.parent
+dirbin=dirpkg/"influx_si"/"bin"
+if str(dirbin) not in sys.path:
+    sys.path.append(str(dirbin))
+import ftbl2optR
+import ftbl2code
+
+def join_fill(c, l, p='', s='', a='', width=0, break_long_words=False):
+    "former version of tools_ssg.join()"
+    res=c.join(p+str(i)+s for i in l) or a
+    return res if width <= 0 else fill(res, width=width, break_long_words=break_long_words)
+
+def run(f, fjoin, emu=False):
+    "return (total time, time in join() calls with width > 0) of ftbl2optR.main() with fjoin as join()"
+    tj=[0.]
+    def tjoin(*args, **kwargs):
+        if kwargs.get("width", 0) <= 0:
+            return fjoin(*args, **kwargs)
+        t0=time.perf_counter()
+        res=fjoin(*args, **kwargs)
+        tj[0]+=time.perf_counter()-t0
+        return res
+    sjoin=ftbl2code.join
+    ftbl2code.join=tjoin
+    try:
+        t0=time.perf_counter()
+        ftbl2optR.main(["--no-cache", "--dirres", str(f.parent)]+(["--emu"] if emu else [])+[str(f)], wout=lambda s: None, werr=lambda s: None)
+        t=time.perf_counter()-t0
+    finally:
+        ftbl2code.join=sjoin
+    return (t, tj[0])
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-n", default="250,1000", help="coma separated list of metabolite numbers")
+    parser.add_argument("-o", default="bench_synth", help="directory for synthetic networks")
+    parser.add_argument("--emu", action="store_true", help="generate code for EMU variables")
+    opts=parser.parse_args()
+    print("metabs\tfill (s)\tjoin fill (s)\tchunked (s)\tjoin chunked (s)")
+    for n in (int(v) for v in opts.n.split(",")):
+        f=Path(synth_net.synth_ftbl(n, opts.o))
+        tf,tjf=run(f, join_fill, opts.emu)
+        tc,tjc=run(f, ftbl2code.join, opts.emu)
+        print("%d\t%.3f\t%.3f\t%.3f\t%.3f"%(n, tf, tjf, tc, tjc))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Benchmark of FTBL reading (C13_ftbl.ftbl_text(), ftbl_tokens(), ftbl_parse()) on large synthetic networks.
+
+For each network size (cf. synth_net.py), the following times are reported
+(best of REPEAT runs):
+ - decode: reading and decoding of the file (ftbl_text() with empty cache);
+ - tokens: tokenizing of decoded lines (ftbl_tokens());
+ - parse: full ftbl_parse() with empty text cache;
+ - parse_cached: ftbl_parse() when the text was already decoded (e.g. by influx_s
+   reading commandArgs).
+
+Usage: bench_ftbl_parse.py [-n 1000,3000,10000] [-c 4] [--repeat 3] [-o DIR]
+"""
+
+import sys, os
+import argparse
+import time
+from pathlib import Path
+
+import synth_net
+dirpkg=Path(__file__).resolve().parent.parent
+dirbin=dirpkg/"influx_si"/"bin"
+if str(dirbin) not in sys.path:
+    sys.path.append(str(dirbin))
+import influx_si
+import C13_ftbl
+
+def best(f, repeat, clear=True):
+    "Best time of f() on repeat runs, text cache is cleared before each run if clear"
+    t=float("inf")
+    for i in range(repeat):
+        if clear:
+            C13_ftbl._ftbl_text.cache_clear()
+        t0=time.perf_counter()
+        f()
+        t=min(t, time.perf_counter()-t0)
+    return t
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-n", default="1000,3000,10000", help="coma separated list of metabolite numbers")
+    parser.add_argument("-c", type=int, default=4, help="carbon number in metabolites")
+    parser.add_argument("--repeat", type=int, default=3, help="repeat number (best time is reported)")
+    parser.add_argument("-o", default="bench_synth", help="directory for synthetic networks")
+    opts=parser.parse_args()
+    C13_ftbl.werr=lambda s: None
+    print("metabs\treactions\tlines\tdecode (s)\ttokens (s)\tparse (s)\tparse_cached (s)\tus/line")
+    for n in (int(v) for v in opts.n.split(",")):
+        f=str(synth_net.synth_ftbl(n, opts.o, clen=opts.c))
+        lines=C13_ftbl.ftbl_text(f).splitlines()
+        nreac=len(C13_ftbl.ftbl_parse(f)["NETWORK"])
+        td=best(lambda: C13_ftbl.ftbl_text(f), opts.repeat)
+        tt=best(lambda: sum(1 for r in C13_ftbl.ftbl_tokens(lines, f)), opts.repeat)
+        tp=best(lambda: C13_ftbl.ftbl_parse(f), opts.repeat)
+        C13_ftbl.ftbl_text(f)
+        tc=best(lambda: C13_ftbl.ftbl_parse(f), opts.repeat, clear=False)
+        print("%d\t%d\t%d\t%.4f\t%.4f\t%.4f\t%.4f\t%.2f"%(n, nreac, len(lines), td, tt, tp, tc, tp*1.e6/len(lines)))
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Benchmark of full cumomer system builders C13_ftbl.cumo_sys_coo() (index arrays)
+and C13_ftbl.cumo_sys_dict() (nested dicts) on synthetic networks (cf. synth_net.py).
+
+Both builders must give the same cumomer order. The dict builder is skipped
+for carbon lengths greater than --dmax as it becomes too slow.
+
+Usage: bench_fullsys.py [-n 30] [-c 4,8,12,16] [-o DIR] [--dmax 14]
+"""
+
+import sys, os
+import argparse
+import copy
+import time
+from pathlib import Path
+
+import synth_net
+import C13_ftbl
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-n", type=int, default=30, help="number of internal metabolites")
+    parser.add_argument("-c", default="4,8,12,16", help="coma separated list of carbon lengths")
+    parser.add_argument("-o", default="bench_synth", help="directory for synthetic networks")
+    parser.add_argument("--dmax", type=int, default=14, help="max carbon length for dict builder")
+    opts=parser.parse_args()
+    C13_ftbl.clownr=False
+    print("clen\tcumomers\tcoo (s)\tdict (s)\tspeedup")
+    for clen in (int(v) for v in opts.c.split(",")):
+        f=synth_net.synth_ftbl(opts.n, opts.o, clen=clen)
+        netan=dict()
+        C13_ftbl.ftbl_netan(C13_ftbl.ftbl_parse(str(f)), netan, False, False, False)
+        ncoo=copy.deepcopy(netan)
+        t0=time.perf_counter()
+        C13_ftbl.cumo_sys_coo(ncoo, wout=lambda s: None)
+        tcoo=time.perf_counter()-t0
+        nc=sum(len(l) for l in ncoo["vcumo"])
+        if clen > opts.dmax:
+            print("%d\t%d\t%.3f\t-\t-"%(clen, nc, tcoo))
+            continue
+        t0=time.perf_counter()
+        C13_ftbl.cumo_sys_dict(netan)
+        tdict=time.perf_counter()-t0
+        if netan["vcumo"] != ncoo["vcumo"]:
+            raise Exception("bench_fullsys: cumomer orders differ for carbon length %d"%clen)
+        print("%d\t%d\t%.3f\t%.3f\t%.1f"%(clen, nc, tcoo, tdict, tdict/tcoo))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Benchmark of zeta transforms C13_ftbl.iso2cumo_vec() and C13_ftbl.iso2mid_vec()
+against products with dense matrices from C13_ftbl.t_iso2cumo() and
+C13_ftbl.t_iso2m(). Isotopomer vectors are batched by columns.
+
+Dense matrices are skipped for carbon lengths greater than --dmax.
+
+Usage: bench_iso2cumo.py [-l 4,8,12,16,20] [-n 10] [--dmax 12]
+"""
+
+import sys, os
+import argparse
+import time
+import numpy as np
+from pathlib import Path
+
+dirpkg=Path(__file__).resolve().parent.parent
+if str(dirpkg) not in sys.path:
+    sys.path.insert(0, str(dirpkg))
+import influx_si
+import C13_ftbl
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-l", default="4,8,12,16,20", help="coma separated list of carbon lengths")
+    parser.add_argument("-n", type=int, default=10, help="number of isotopomer vectors per batch")
+    parser.add_argument("--dmax", type=int, default=12, help="max carbon length for dense matrices")
+    opts=parser.parse_args()
+    rnd=np.random.default_rng(7)
+    print("len\tmatrix (s)\tzeta (s)\tmid (s)\tspeedup")
+    for clen in (int(v) for v in opts.l.split(",")):
+        x=rnd.random((1<<clen, opts.n))
+        x/=x.sum(0)
+        t0=time.perf_counter()
+        c=C13_ftbl.iso2cumo_vec(x)
+        t1=time.perf_counter()
+        m=C13_ftbl.iso2mid_vec(x)
+        t2=time.perf_counter()
+        if not np.allclose(C13_ftbl.cumo2iso_vec(c), x):
+            raise Exception("bench_iso2cumo: cumo2iso_vec() is not inverse of iso2cumo_vec() for length %d"%clen)
+        if clen > opts.dmax:
+            print("%d\t-\t%.4f\t%.4f\t-"%(clen, t1-t0, t2-t1))
+            continue
+        t3=time.perf_counter()
+        cref=C13_ftbl.t_iso2cumo(clen)@x
+        t4=time.perf_counter()
+        if not np.allclose(c, cref) or not np.allclose(m, C13_ftbl.t_iso2m(clen)@x):
+            raise Exception("bench_iso2cumo: results differ from matrix products for length %d"%clen)
+        print("%d\t%.4f\t%.4f\t%.4f\t%.1f"%(clen, t4-t3, t1-t0, t2-t1, (t4-t3)/(t1-t0)))
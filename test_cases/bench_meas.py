@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark of cached bcumo decomposition used in C13_ftbl.*_meas2matrix_vec_dev():
+C13_ftbl.mass_decomp() (binomial subsets) against the former bcumo by bcumo
+decomposition (mass_decomp_ref() hereafter) for all fragments of a given
+carbon length and all their mass isotopomers.
+
+Results must be identical, including cumomer order. The time of the second
+call of mass_decomp() (i.e. from cache, as for parallel experiments) is
+also reported.
+
+Usage: bench_meas.py [-l 4,6,8,10]
+"""
+
+import sys, os
+import argparse
+import time
+from pathlib import Path
+
+dirpkg=Path(__file__).resolve().parent.parent
+if str(dirpkg) not in sys.path:
+    sys.path.insert(0, str(dirpkg))
+import influx_si
+import C13_ftbl
+from tools_ssg import *
+
+def bcumo_decomp_ref(bcumo):
+    zpos=[ i for i in range(len(bcumo)-1) if bcumo[-i-1]=="0" ]
+    icumo_base=0
+    for i in range(len(bcumo)-1):
+        if bcumo[-i-1]=="1":
+            icumo_base|=1<<i
+    res={"+": [], "-": []}
+    for zmask in range(1<<len(zpos)):
+        res["-" if sumbit(zmask)%2 else "+"].append(icumo_base|expandbit(zmask,zpos))
+    return res
+def mass_decomp_ref(fmask, weight, n):
+    onepos=bitpos(fmask)
+    nmask=sumbit(fmask)
+    fmask0x=setcharbit("x"*n,"0",fmask)
+    bcumos=["#"+setcharbit(fmask0x,"1",expandbit(iw,onepos))
+            for iw in range(1<<nmask) if sumbit(iw)==weight]
+    res=dict()
+    for cumostr in bcumos:
+        decomp=bcumo_decomp_ref(cumostr)
+        for icumo in decomp["+"]:
+            res[icumo]=res.get(icumo, 0)+1
+        for icumo in decomp["-"]:
+            res[icumo]=res.get(icumo, 0)-1
+    return (bcumos, res)
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-l", default="4,6,8,10", help="coma separated list of carbon lengths")
+    opts=parser.parse_args()
+    print("len\tref (s)\tnew (s)\tcached (s)\tspeedup")
+    for n in (int(v) for v in opts.l.split(",")):
+        cases=[(fmask, w) for fmask in range(1, 1<<n) for w in range(sumbit(fmask)+1)]
+        t0=time.perf_counter()
+        ref=[mass_decomp_ref(fmask, w, n) for (fmask,w) in cases]
+        t1=time.perf_counter()
+        res=[C13_ftbl.mass_decomp(fmask, w, n) for (fmask,w) in cases]
+        t2=time.perf_counter()
+        [C13_ftbl.mass_decomp(fmask, w, n) for (fmask,w) in cases]
+        t3=time.perf_counter()
+        if any(r[0] != v[0] or [*r[1].items()] != [*v[1].items()] for (r,v) in zip(ref, res)):
+            raise Exception("bench_meas: results differ from reference for length %d"%n)
+        print("%d\t%.3f\t%.3f\t%.4f\t%.1f"%(n, t1-t0, t2-t1, t3-t2, (t1-t0)/(t2-t1)))
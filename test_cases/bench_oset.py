@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark of ordered set C13_ftbl.oset and of network analysis (ftbl_netan()) on synthetic networks.
+
+The former oset (copying its argument in every set operation, "ref") is
+compared to the current one on set operations with N elements, then
+ftbl_netan() is timed on synthetic networks (cf. synth_net.py) with
+both classes. The "ref" timing of ftbl_netan() keeps the current
+code of C13_ftbl (loop hoisting), so the difference is due to oset only.
+The time of the former ftbl_netan() can be read in the baseline of
+bench_stages.py.
+
+Usage: bench_oset.py [-e 1000,10000] [-n 300,1000,3000] [--repeat 3] [-o DIR]
+"""
+
+import sys, os
+import argparse
+import time
+from pathlib import Path
+
+import synth_net
+dirpkg=Path(__file__).resolve().parent.parent
+dirbin=dirpkg/"influx_si"/"bin"
+if str(dirbin) not in sys.path:
+    sys.path.append(str(dirbin))
+import influx_si
+import C13_ftbl
+
+class oset_ref(dict):
+    "former C13_ftbl.oset"
+    def __init__(*args, **kwds):
+        self, *args = args
+        if len(args) == 1:
+            for k in args[0]:
+                self[k]=1
+        elif len(args) > 1:
+            raise TypeError('expected at most 1 arguments, got %d' % len(args))
+    def copy(self):
+        tmp=oset_ref()
+        tmp.update(self)
+        return(tmp)
+    def add(self, x):
+        self[x]=1
+    def difference_update(self, x):
+        for k in x:
+            if k in self:
+                del(self[k])
+    def difference(self, x):
+        return(self - oset_ref(x))
+    def update(self, x):
+        if x:
+            for i in x:
+                self[i]=1
+    def intersection(self, x):
+        return self & oset_ref(x)
+    def __sub__(self, x):
+        tmp=oset_ref(x)
+        return oset_ref(i for i in self if i not in tmp)
+    def __and__(self, x):
+        tmp=oset_ref(x)
+        return oset_ref(i for i in self if i in tmp)
+    def __or__(self, x):
+        tmp=oset_ref(x)
+        tmp.update(self)
+        return tmp
+
+def best(f, repeat):
+    "Best time of f() on repeat runs"
+    t=float("inf")
+    for i in range(repeat):
+        t0=time.perf_counter()
+        f()
+        t=min(t, time.perf_counter()-t0)
+    return t
+
+def ops(cls, n):
+    "Set operations typical of ftbl_netan() on ordered sets of n elements"
+    a=cls("r%d"%i for i in range(n))
+    b=cls("r%d"%i for i in range(0, 2*n, 2))
+    s=set(b)
+    def f():
+        a|b
+        a-b
+        a&s
+        a.intersection(s)
+        a.difference(s)
+        c=a.copy()
+        c.update(b)
+        cls(a)
+    return f
+
+def netan(fftbl):
+    "Run ftbl_netan() on FTBL fftbl"
+    quiet=lambda s: None
+    ftbl=C13_ftbl.ftbl_parse(fftbl, wout=quiet, werr=quiet)
+    return lambda: C13_ftbl.ftbl_netan(ftbl, dict(), False, False, False, wout=quiet, werr=quiet)
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-e", default="1000,10000", help="coma separated list of set sizes")
+    parser.add_argument("-n", default="300,1000,3000", help="coma separated list of metabolite numbers")
+    parser.add_argument("--repeat", type=int, default=3, help="repeat number (best time is reported)")
+    parser.add_argument("-o", default="bench_synth", help="directory for synthetic networks")
+    opts=parser.parse_args()
+    C13_ftbl.clownr=False
+    C13_ftbl.ffguess=False
+    C13_ftbl.wout=C13_ftbl.werr=lambda s: None
+    oset=C13_ftbl.oset
+    print("test\tsize\tref (s)\toset (s)\tspeedup")
+    for n in (int(v) for v in opts.e.split(",")):
+        tr=best(ops(oset_ref, n), opts.repeat)
+        t=best(ops(oset, n), opts.repeat)
+        print("set ops\t%d\t%.4f\t%.4f\t%.1f"%(n, tr, t, tr/t))
+    for n in (int(v) for v in opts.n.split(",")):
+        f=netan(str(synth_net.synth_ftbl(n, opts.o)))
+        try:
+            C13_ftbl.oset=oset_ref
+            tr=best(f, opts.repeat)
+        finally:
+            C13_ftbl.oset=oset
+        t=best(f, opts.repeat)
+        print("ftbl_netan\t%d\t%.4f\t%.4f\t%.1f"%(n, tr, t, tr/t))
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Scaling benchmark for C13_ftbl.rcumo_sys() on synthetic networks (cf. synth_net.py).
+
+For each network size, the time of rcumo_sys() is reported together with
+the number of reachable cumomers and the time per cumomer, which should
+stay roughly constant if the traversal is linear in cumomer number.
+
+Usage: bench_rcumo_sys.py [-n 250,500,1000] [-o DIR] [-r REPEAT]
+"""
+
+import sys, os
+import argparse
+import time
+from pathlib import Path
+
+import synth_net
+import C13_ftbl
+
+def bench(n, dirout, repeat=3):
+    "return (number of cumomers, best time of rcumo_sys() over 'repeat' runs)"
+    f=synth_net.synth_ftbl(n, dirout)
+    C13_ftbl.clownr=False
+    ftbl=C13_ftbl.ftbl_parse(str(f))
+    tbest=float("inf")
+    for i in range(repeat):
+        netan=dict()
+        C13_ftbl.ftbl_netan(ftbl, netan, False, False, False)
+        t0=time.perf_counter()
+        C13_ftbl.rcumo_sys(netan)
+        tbest=min(tbest, time.perf_counter()-t0)
+    return (len(netan["rcumo2i0"]), tbest)
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-n", default="250,500,1000", help="coma separated list of metabolite numbers")
+    parser.add_argument("-o", default="bench_synth", help="directory for synthetic networks")
+    parser.add_argument("-r", type=int, default=3, help="repeat number (best time is reported)")
+    opts=parser.parse_args()
+    print("metabs\tcumomers\ttime (s)\tus/cumomer")
+    for n in (int(v) for v in opts.n.split(",")):
+        nc,t=bench(n, opts.o, opts.r)
+        print("%d\t%d\t%.3f\t%.1f"%(n, nc, t, 1.e6*t/nc))
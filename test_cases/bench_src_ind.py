@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Benchmark of C13_ftbl.src_ind() (cached bit-permutation tables) and
+its batch version src_ind_vec() against the former bit by bit walk
+through carbon strings (src_ind_ref() hereafter).
+
+Usage: bench_src_ind.py [-l 4,6,8,12,16] [-n 200000]
+"""
+
+import sys, os
+import argparse
+import random
+import time
+import numpy as np
+from pathlib import Path
+
+dirpkg=Path(__file__).resolve().parent.parent
+if str(dirpkg) not in sys.path:
+    sys.path.insert(0, str(dirpkg))
+import influx_si
+import C13_ftbl
+
+def src_ind_ref(substrate, product, iprod):
+    "former implementation of src_ind() used as reference"
+    movbit=1
+    isubstr=0
+    substrate=substrate[::-1]
+    product=product[::-1]
+    for nb in range(len(product)):
+        if (movbit & iprod):
+            try:
+                isubstr|=1<<substrate.find(product[nb])
+            except ValueError:
+                pass
+        movbit<<=1
+    return isubstr if (isubstr or
+        (iprod==0 and (C13_ftbl.oset(product) & C13_ftbl.oset(substrate)))) else None
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-l", default="4,6,8,12,16", help="coma separated list of carbon string lengths")
+    parser.add_argument("-n", type=int, default=200000, help="number of masks to map per length")
+    opts=parser.parse_args()
+    rnd=random.Random(7)
+    letters="ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    print("len\tref (s)\tsrc_ind (s)\tsrc_ind_vec (s)\tspeedup\tspeedup_vec")
+    for clen in (int(v) for v in opts.l.split(",")):
+        substr=letters[:clen]
+        prod="".join(rnd.sample(substr, clen))
+        masks=[rnd.randrange(1<<clen) for i in range(opts.n)]
+        t0=time.perf_counter()
+        ref=[src_ind_ref(substr, prod, m) for m in masks]
+        t1=time.perf_counter()
+        res=[C13_ftbl.src_ind(substr, prod, m) for m in masks]
+        t2=time.perf_counter()
+        resv=C13_ftbl.src_ind_vec(substr, prod, masks)
+        t3=time.perf_counter()
+        if res != ref or any((-1 if r is None else r) != v for (r,v) in zip(ref, resv.tolist())):
+            raise Exception("bench_src_ind: results differ from reference for length %d"%clen)
+        print("%d\t%.3f\t%.3f\t%.4f\t%.1f\t%.1f"%(clen, t1-t0, t2-t1, t3-t2, (t1-t0)/(t2-t1), (t1-t0)/(t3-t2)))
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark of python stages on synthetic networks (cf. synth_net.py) compared to a stored baseline.
+
+For each network size, the following stages are timed (best of REPEAT runs)
+and their peak of allocated memory is measured by tracemalloc (in a separate run):
+ - txt2ftbl: MTF to FTBL compilation (txt2ftbl.main());
+ - ftbl_parse, ftbl_netan: network analysis (C13_ftbl);
+ - measures: label, mass and peak measurement matrices (ftbl2code.netan_measures());
+ - rcumo_sys: reduced cumomer (EMU) systems (C13_ftbl);
+ - ftbl2code: writing of R code (ftbl2code.netan2Rinit()).
+
+Results are compared to the baseline stored in a JSON file (bench_stages.json
+by default) if it has the same network parameters. A stage is reported as a
+regression (and exit code is 1) if its time is greater than TOL times the
+baseline and by more than 10 ms. The baseline is (re)written with --save.
+As times depend on the machine, save a new baseline before comparing on another one.
+
+Usage: bench_stages.py [-n 100,300,1000] [-c 4] [-b 5] [-r 1.] [-m KINDS] [-p 1] [--repeat 3]
+  [--emu] [--no-mem] [-o DIR] [--baseline FILE] [--save] [--tol 1.5]
+"""
+
+import sys, os
+import argparse
+import time
+import json
+import platform
+import tracemalloc
+from pathlib import Path
+
+import synth_net
+dirpkg=Path(__file__).resolve().parent.parent
+dirbin=dirpkg/"influx_si"/"bin"
+if str(dirbin) not in sys.path:
+    sys.path.append(str(dirbin))
+import influx_si
+import txt2ftbl
+import C13_ftbl
+import ftbl2code
+
+stages=("txt2ftbl", "ftbl_parse", "ftbl_netan", "measures", "rcumo_sys", "ftbl2code")
+
+def run(pre, emu=False, mem=False):
+    """Run all stages on MTF prefix pre (FTBL is already compiled).
+    Return a dict {stage: time (s)} or {stage: peak memory (MB)} if mem"""
+    res={}
+    quiet=lambda s: None
+    def stage(nm, f, *args):
+        if mem:
+            tracemalloc.reset_peak()
+            m0=tracemalloc.get_traced_memory()[0]
+        t0=time.perf_counter()
+        out=f(*args)
+        res[nm]=(tracemalloc.get_traced_memory()[1]-m0)/2**20 if mem else time.perf_counter()-t0
+        return out
+    fftbl=pre.with_suffix(".ftbl")
+    fR=pre.with_suffix(".R")
+    ftbl2code.case_i=False
+    ftbl2code.digest=None
+    C13_ftbl.clownr=False
+    C13_ftbl.ffguess=False
+    C13_ftbl.wout=quiet
+    C13_ftbl.werr=quiet
+    stage("txt2ftbl", txt2ftbl.main, ["--force", "--np", "1", "--prefix", str(pre)])
+    ftbl=stage("ftbl_parse", lambda: C13_ftbl.ftbl_parse(str(fftbl), wout=quiet, werr=quiet))
+    netan=dict()
+    stage("ftbl_netan", lambda: C13_ftbl.ftbl_netan(ftbl, netan, emu, False, False, wout=quiet, werr=quiet))
+    # measures are built before rcumo_sys() which needs them
+    stage("measures", ftbl2code.netan_measures, netan)
+    stage("rcumo_sys", C13_ftbl.rcumo_sys, netan, emu)
+    def code():
+        with open(fR, "w") as f:
+            ftbl2code.bin_open(str(fR))
+            ftbl2code.netan2Rinit(netan, pre.name, f, False, emu, ['""'], "")
+            ftbl2code.bin_close()
+    stage("ftbl2code", code)
+    return res
+
+def bench(pre, emu=False, repeat=3, mem=True):
+    "Return {stage: [best time (s), peak memory (MB) or None]}"
+    res={k: [float("inf"), None] for k in stages}
+    for i in range(repeat):
+        for k,v in run(pre, emu).items():
+            res[k][0]=min(res[k][0], v)
+    if mem:
+        tracemalloc.start()
+        try:
+            for k,v in run(pre, emu, mem=True).items():
+                res[k][1]=v
+        finally:
+            tracemalloc.stop()
+    return res
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-n", default="100,300,1000", help="coma separated list of metabolite numbers")
+    parser.add_argument("-c", type=int, default=4, help="carbon number in metabolites")
+    parser.add_argument("-b", type=int, default=5, help="branching step (cf. synth_net.py)")
+    parser.add_argument("-r", type=float, default=1., help="fraction of reversible reactions")
+    parser.add_argument("-m", default=",".join(synth_net.meas_kinds), help="measurement kinds (cf. synth_net.py)")
+    parser.add_argument("-p", type=int, default=1, help="number of parallel experiments")
+    parser.add_argument("--repeat", type=int, default=3, help="repeat number (best time is reported)")
+    parser.add_argument("--emu", action="store_true", help="use EMU variables")
+    parser.add_argument("--no-mem", action="store_true", help="do not measure memory")
+    parser.add_argument("-o", default="bench_synth", help="directory for synthetic networks")
+    parser.add_argument("--baseline", default=str(Path(__file__).resolve().parent/"bench_stages.json"), help="JSON file with baseline results")
+    parser.add_argument("--save", action="store_true", help="save results as new baseline")
+    parser.add_argument("--tol", type=float, default=1.5, help="tolerated ratio of time to baseline")
+    opts=parser.parse_args()
+    params={"c": opts.c, "b": opts.b, "r": opts.r, "m": opts.m, "p": opts.p, "emu": opts.emu}
+    base={}
+    if Path(opts.baseline).is_file() and not opts.save:
+        base=json.loads(Path(opts.baseline).read_text())
+        if base.get("params") != params:
+            print("# baseline '%s' has other parameters %s, it is not used"%(opts.baseline, base.get("params")))
+            base={}
+    results={}
+    nreg=0
+    print("metabs\tstage\ttime (s)\tmem (MB)\tbase time (s)\tbase mem (MB)\ttime ratio")
+    for n in (int(v) for v in opts.n.split(",")):
+        f=synth_net.synth_ftbl(n, opts.o, clen=opts.c, branch=opts.b, rev=opts.r, meas=opts.m, nprl=opts.p)
+        res=bench(f.with_suffix(""), opts.emu, opts.repeat, not opts.no_mem)
+        results[str(n)]=res
+        bres=base.get("results", {}).get(str(n), {})
+        for k,(t,m) in res.items():
+            bt,bm=bres.get(k, [None, None])
+            ratio=t/bt if bt else None
+            reg=ratio is not None and ratio > opts.tol and t-bt > 0.01
+            nreg+=reg
+            print("%d\t%s\t%.4f\t%s\t%s\t%s\t%s%s"%(n, k, t, "NA" if m is None else "%.2f"%m,
+                "NA" if bt is None else "%.4f"%bt, "NA" if bm is None else "%.2f"%bm,
+                "NA" if ratio is None else "%.2f"%ratio, "\tREGRESSION" if reg else ""))
+    if opts.save:
+        Path(opts.baseline).write_text(json.dumps({"params": params, "python": platform.python_version(),
+            "influx_si": influx_si.__version__, "date": time.strftime("%Y-%m-%d"), "results": results}, indent=1)+"\n")
+        print("# baseline is written to '%s'"%opts.baseline)
+    sys.exit(1 if nreg else 0)
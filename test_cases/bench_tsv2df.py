@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark of txt2ftbl.tsv2df() and parse_miso() on large synthetic instationary .miso files.
+
+A .miso file is made of M metabolites of 6 carbons, each having an MS
+group on the whole molecule and on fragment 1-3, measured at T time
+points, i.e. (7+4)*M*T rows. It is read by the former tsv2df() growing
+its rows by np.vstack() ("ref", only for files of less than 50000 rows)
+and by the current one which builds columns in one pass. Time per row of the
+current one should stay roughly constant (linear time in file size).
+The time of parse_miso() (instationary case) on the same file is also reported.
+
+Usage: bench_tsv2df.py [-m 10,100] [-t 10,50] [-o DIR]
+"""
+
+import sys, os
+import re
+import argparse
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pa
+
+dirpkg=Path(__file__).resolve().parent.parent
+if str(dirpkg) not in sys.path:
+    sys.path.insert(0, str(dirpkg))
+import influx_si
+import txt2ftbl
+
+def tsv2df_ref(f, sep="\t", comment="#", append_iline="iline"):
+    "former version of txt2ftbl.tsv2df() (simplified: no encoding fallback, no column number check)"
+    li=Path(f).open(encoding="UTF-8").read().splitlines()
+    rows=np.array([], dtype=object)
+    cnm=[]
+    for ili,row in enumerate(li):
+        row=re.sub("%s.*$"%comment, "", row)
+        if not row.strip():
+            continue
+        if not cnm:
+            cnm=[v.strip() for v in row.split(sep) if v.strip()]
+            ncol=len(cnm)
+            cnm.append(append_iline)
+            rows=np.empty((0, len(cnm)), dtype=object)
+            continue
+        rli=[v.strip() for v in row.split(sep)]
+        if len(rli) > ncol and all(len(v) == 0 for v in rli[ncol:]):
+            rli=rli[:ncol]
+        rli.append(ili+1)
+        rows=np.vstack((rows, rli))
+    df=pa.DataFrame(rows)
+    df.columns=cnm
+    return df
+
+def synth_miso(nmet, ntime, dirout="."):
+    "write a synthetic instationary .miso file and return its path"
+    d=Path(dirout)
+    d.mkdir(parents=True, exist_ok=True)
+    fp=d/("bench_m%d_t%d.miso"%(nmet, ntime))
+    times=["%g"%(0.5*(i+1)) for i in range(ntime)]
+    with fp.open("w") as f:
+        f.write("# synthetic instationary measurements\nId\tComment\tSpecie\tFragment\tDataset\tIsospecies\tValue\tSD\tTime\n")
+        for m in range(1, nmet+1):
+            for (frag,n) in (("", 6), ("1-3", 3)):
+                for w in range(n+1):
+                    for t in times:
+                        f.write("\t\tM%d\t%s\tMS-%d%s\tM%d\t%.4f\t0.01\t%s\n"%(m, frag, m, "a" if frag else "", w, 1./(n+1), t))
+    return fp
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-m", default="10,100", help="coma separated list of metabolite numbers")
+    parser.add_argument("-t", default="10,50", help="coma separated list of time point numbers")
+    parser.add_argument("-o", default="bench_synth", help="directory for synthetic files")
+    opts=parser.parse_args()
+    print("metabs\ttimes\trows\tref (s)\ttsv2df (s)\tus/row\tparse_miso (s)")
+    for nmet in (int(v) for v in opts.m.split(",")):
+        clen=dict(("M%d"%m, 6) for m in range(1, nmet+1))
+        for ntime in (int(v) for v in opts.t.split(",")):
+            fp=synth_miso(nmet, ntime, opts.o)
+            nrow=11*nmet*ntime
+            if nrow < 50000:
+                t0=time.perf_counter()
+                ref=tsv2df_ref(fp)
+                tref="%.3f"%(time.perf_counter()-t0)
+            else:
+                ref=None
+                tref="NA"
+            t0=time.perf_counter()
+            df=txt2ftbl.tsv2df(fp)
+            t=time.perf_counter()-t0
+            if ref is not None and not (ref.astype(str).values == df.values).all():
+                raise Exception("bench_tsv2df: results differ from reference for '%s'"%fp)
+            t0=time.perf_counter()
+            txt2ftbl.parse_miso(fp, clen, True, set(clen))
+            tp=time.perf_counter()-t0
+            print("%d\t%d\t%d\t%s\t%.3f\t%.2f\t%.3f"%(nmet, ntime, nrow, tref, t, t*1.e6/nrow, tp))
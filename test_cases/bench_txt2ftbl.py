@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark of txt2ftbl on large vmtf batches with a growing number of processes.
+
+A synthetic network (cf. synth_net.py) is written and a .vmtf file with R
+rows is made, each row giving its own FTBL name and sharing the other
+inputs (netw, linp, miso, ...). The whole batch is compiled by
+txt2ftbl.main() with --np P for each P and the time, the speedup relative
+to the first P and the efficiency (speedup/P*P0) are reported. On a machine with
+enough cores, the time should decrease nearly in proportion to P.
+
+Usage: bench_txt2ftbl.py [-n 30] [-r 1000] [-p 1,2,4] [-o DIR]
+"""
+
+import sys, os
+import io
+import argparse
+import time
+import contextlib
+from pathlib import Path
+from multiprocessing import cpu_count
+
+import synth_net
+dirpkg=Path(__file__).resolve().parent.parent
+dirbin=dirpkg/"influx_si"/"bin"
+if str(dirbin) not in sys.path:
+    sys.path.append(str(dirbin))
+import influx_si
+import txt2ftbl
+
+def synth_vmtf(pre, nrow):
+    "write <pre>_r<nrow>.vmtf with nrow FTBLs in subdirectory <pre>_r<nrow>/ and return its path"
+    fv=pre.parent/("%s_r%d.vmtf"%(pre.name, nrow))
+    (pre.parent/fv.stem).mkdir(exist_ok=True)
+    with fv.open("w") as f:
+        f.write("ftbl\n")
+        for i in range(nrow):
+            f.write("%s/row%d.ftbl\n"%(fv.stem, i+1))
+    return fv
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-n", type=int, default=30, help="metabolite number in synthetic network")
+    parser.add_argument("-r", default="1000", help="coma separated list of vmtf row numbers")
+    parser.add_argument("-p", default="", help="coma separated list of process numbers (default: 1,2,4,... up to core number)")
+    parser.add_argument("-o", default="bench_synth", help="directory for synthetic files")
+    opts=parser.parse_args()
+    if opts.p:
+        lnp=[int(v) for v in opts.p.split(",")]
+    else:
+        lnp=[1]
+        while lnp[-1]*2 <= cpu_count():
+            lnp.append(lnp[-1]*2)
+    pre=synth_net.synth_mtf(opts.n, opts.o)
+    mtf=",".join(str(pre.with_suffix(s)) for s in (".netw", ".linp", ".miso", ".mflux", ".mmet", ".tvar", ".cnstr", ".opt") if pre.with_suffix(s).is_file())
+    print("# cores: %d"%cpu_count())
+    print("rows\tnp\ttime (s)\tspeedup\tefficiency")
+    for nrow in (int(v) for v in opts.r.split(",")):
+        fv=synth_vmtf(pre, nrow)
+        t1=None
+        for np in lnp:
+            t0=time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                txt2ftbl.main(["--force", "--np", str(np), "--mtf", mtf+","+str(fv)])
+            t=time.perf_counter()-t0
+            if t1 is None:
+                t1,np1=t,np
+            print("%d\t%d\t%.3f\t%.2f\t%.2f"%(nrow, np, t, t1/t, t1/t*np1/np))
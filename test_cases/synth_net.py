@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Generate a synthetic scalable network in MTF format and compile it to FTBL.
+
+The network has N internal metabolites M1..MN of C carbons each (4 by default), organized
+in a chain fed by a labeled input 'Gin'. Every B-th metabolite (5 by default)
+exchanges carbon pairs with a metabolite taken earlier in the chain (which
+creates cycles and condensations) and every 10th metabolite has an efflux.
+A fraction R of reactions (1 by default) is reversible.
+
+Measurement kinds (-m, coma separated list):
+ - ms: MS on every 10th metabolite and on the last one (default);
+ - lab: label measurements on metabolites 5, 15, ...;
+ - peak: NMR peaks on carbon 2 of metabolites 3, 13, ... (C >= 3);
+ - flux: measured effluxes (.mflux);
+ - metab: measured concentrations of every 10th metabolite (.mmet, .tvar).
+With -p P > 0, P parallel experiments with their own label input and
+measurements are added (files DIR/<name>_p1.{linp,miso}, ... declared in DIR/<name>.opt).
+
+Usage: synth_net.py [-n N] [-c C] [-b B] [-r R] [-m KINDS] [-p P] [-o DIR] [--seed SEED]
+Files DIR/synthN[_cC][_bB][_r<100*R>][_m<kinds>][_pP].{netw,linp,miso,...,ftbl} are (re)written.
+"""
+
+import sys, os
+import argparse
+import random
+from pathlib import Path
+
+dirpkg=Path(__file__).resolve().parent.parent
+if str(dirpkg) not in sys.path:
+    sys.path.insert(0, str(dirpkg))
+import influx_si
+import txt2ftbl
+
+# measurement kinds
+meas_kinds=("ms", "lab", "peak", "flux", "metab")
+
+def synth_name(n, clen=4, branch=5, rev=1., meas="ms", nprl=0):
+    "base name of synthetic network, non default parameters are encoded in it"
+    return "synth%d"%n+("" if clen == 4 else "_c%d"%clen)+("" if branch == 5 else "_b%d"%branch)+\
+        ("" if rev >= 1. else "_r%d"%round(100*rev))+("" if meas == "ms" else "_m"+meas.replace(",", ""))+("" if not nprl else "_p%d"%nprl)
+
+def miso_rows(n, clen, meas, val=lambda: 0.2):
+    "rows of .miso file for measurement kinds in meas (coma separated). Values are given by val()"
+    meas=meas.split(",")
+    up="ABCDEFGHIJKLMNOPQRSTUVWXYZ"[:clen]
+    miso=["Id\tComment\tSpecie\tFragment\tDataset\tIsospecies\tValue\tSD\tTime"]
+    if "ms" in meas:
+        for i in [*range(10, n, 10), n]:
+            miso += ["\t\tM%d\t\tMS-%d\tM%d\t%s\t0.01\t"%(i, i, k, val()) for k in range(clen+1)]
+    if "lab" in meas:
+        for i in range(5, n, 10):
+            miso += ["\t\tM%d\t\tLAB-%d\t%s\t%s\t0.01\t"%(i, i, lab, val()) for lab in ("1"+"x"*(clen-1), "x1"+"x"*(clen-2))]
+    if "peak" in meas and clen >= 3:
+        for i in range(3, n, 10):
+            miso += ["\t\tM%d\t\tPEAK-%d\t%s\t%s\t0.01\t"%(i, i, pk, val()) for pk in ("2->", "2->1", "2->3", "2->1,3")]
+    return miso
+
+def synth_mtf(n, dirout=".", seed=1, clen=4, branch=5, rev=1., meas="ms", nprl=0):
+    """write synthetic network <name>.{netw,linp,miso,...} in 'dirout' and return the path prefix
+    (cf. synth_name() and module doc for parameters)"""
+    if n < 10:
+        raise Exception("synth_mtf: n must be >= 10, got %d"%n)
+    if clen < 2 or clen > 26:
+        raise Exception("synth_mtf: carbon length must be in [2; 26], got %d"%clen)
+    if branch < 0 or branch in (1, 2):
+        raise Exception("synth_mtf: branching step must be 0 (no branching) or >= 3, got %d"%branch)
+    if rev < 0. or rev > 1.:
+        raise Exception("synth_mtf: fraction of reversible reactions must be in [0; 1], got %g"%rev)
+    meas=",".join(v.strip() for v in meas.split(",") if v.strip())
+    if any(v not in meas_kinds for v in meas.split(",")):
+        raise Exception("synth_mtf: measurement kinds must be among '%s', got '%s'"%(", ".join(meas_kinds), meas))
+    rnd=random.Random(seed)
+    d=Path(dirout)
+    d.mkdir(parents=True, exist_ok=True)
+    pre=d/synth_name(n, clen, branch, rev, meas, nprl)
+    # reversibility is drawn only if some reactions are irreversible
+    arrow=lambda: "<->" if rev >= 1. or rnd.random() < rev else "->"
+    up="ABCDEFGHIJKLMNOPQRSTUVWXYZ"[:clen]
+    lo=up.lower()
+    h=clen//2
+    perms=[up, up[::-1], up[1:]+up[0], up[0]+up[:0:-1]]
+    netw=["upt:\tGin (%s) -> M1 (%s)"%(up, up)]
+    for i in range(1, n):
+        netw.append("r%d:\tM%d (%s) %s M%d (%s)"%(i, i, up, arrow(), i+1, perms[i%len(perms)]))
+        if branch and i%branch == 0:
+            j=rnd.randrange(1, i-1)
+            netw.append("x%d:\tM%d (%s) + M%d (%s) %s M%d (%s) + M%d (%s)"%(i, i, up, j, lo, arrow(), j+1, up[:h]+lo[h:], i+1, lo[:h]+up[h:]))
+        if i%10 == 0:
+            netw.append("e%d:\tM%d (%s) -> X%d (%s)"%(i, i, up, i, up))
+    netw.append("out:\tM%d (%s) -> Gout (%s)"%(n, up, up))
+    pre.with_suffix(".netw").write_text("\n".join(netw)+"\n")
+    pre.with_suffix(".linp").write_text("Id\tComment\tSpecie\tIsotopomer\tValue\n\t\tGin\t%s\t0.5\n\t\tGin\t%s\t0.5\n"%("1"+"0"*(clen-1), "1"*clen))
+    pre.with_suffix(".miso").write_text("\n".join(miso_rows(n, clen, meas))+"\n")
+    if "flux" in meas.split(","):
+        pre.with_suffix(".mflux").write_text("Id\tComment\tFlux\tValue\tSD\n"+
+            "".join("\t\te%d\t0.1\t0.01\n"%i for i in range(10, n, 10))+"\t\tout\t0.5\t0.01\n")
+    if "metab" in meas.split(","):
+        imet=range(10, n+1, 10)
+        pre.with_suffix(".mmet").write_text("Id\tComment\tSpecie\tValue\tSD\n"+"".join("\t\tM%d\t1\t0.1\n"%i for i in imet))
+    # .tvar is made by synth_ftbl() from default one
+    pre.with_suffix(".tvar").unlink(missing_ok=True)
+    # parallel experiments: Gin labeled on its k first carbons (mod clen)
+    for k in range(1, nprl+1):
+        nl=(k-1)%clen+1
+        pk=pre.parent/(pre.name+"_p%d"%k)
+        pk.with_suffix(".linp").write_text("Id\tComment\tSpecie\tIsotopomer\tValue\n\t\tGin\t%s\t1\n"%("1"*nl+"0"*(clen-nl)))
+        pk.with_suffix(".miso").write_text("\n".join(miso_rows(n, clen, meas, lambda: "%.3f"%rnd.random()))+"\n")
+    if nprl:
+        pre.with_suffix(".opt").write_text("Id\tComment\tName\tValue\n\t\tprl_exp\t%s\n"%"; ".join(pre.name+"_p%d"%k for k in range(1, nprl+1)))
+    return pre
+
+def synth_ftbl(n, dirout=".", seed=1, clen=4, branch=5, rev=1., meas="ms", nprl=0):
+    """write MTF files and FTBL compiled from them. Return FTBL path"""
+    pre=synth_mtf(n, dirout, seed, clen, branch, rev, meas, nprl)
+    txt2ftbl.main(["--force", "--np", "1", "--prefix", str(pre)])
+    if "metab" in meas.split(","):
+        # measured metabolites get free pools in .tvar made from default .tvar.def
+        smet=set("M%d"%i for i in range(10, n+1, 10))
+        tvar=[]
+        for l in pre.with_suffix(".tvar.def").read_text().splitlines():
+            v=l.split("\t")
+            if len(v) > 4 and v[3] == "METAB" and v[2] in smet:
+                v[4]="F"
+            tvar.append("\t".join(v))
+        pre.with_suffix(".tvar").write_text("\n".join(tvar)+"\n")
+        txt2ftbl.main(["--force", "--np", "1", "--prefix", str(pre)])
+    return pre.with_suffix(".ftbl")
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("-n", type=int, default=100, help="number of internal metabolites (>= 10)")
+    parser.add_argument("-c", type=int, default=4, help="carbon number in metabolites")
+    parser.add_argument("-b", type=int, default=5, help="branching step: every b-th metabolite has an exchange reaction (0 for none)")
+    parser.add_argument("-r", type=float, default=1., help="fraction of reversible reactions")
+    parser.add_argument("-m", default="ms", help="coma separated list of measurement kinds among: "+", ".join(meas_kinds))
+    parser.add_argument("-p", type=int, default=0, help="number of parallel experiments")
+    parser.add_argument("-o", default=".", help="output directory")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    opts=parser.parse_args()
+    print(synth_ftbl(opts.n, opts.o, opts.seed, opts.c, opts.b, opts.r, opts.m, opts.p))